@@ -1,20 +1,96 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
 
+# Signs cursors in local development only; check_settings refuses it elsewhere
+DEFAULT_CURSOR_SECRET = 'resumetry-local-cursor-secret'
+
 
 class Settings(BaseSettings):
     app_name: str = 'Resumetry API'
     debug: bool = False
     cors_origins: list[str] = ['http://localhost:4200', 'http://localhost:3000']
+    docs_enabled: bool = True  # serve /api/docs, /api/redoc and /api/openapi.json
 
     # DynamoDB settings
     dynamodb_endpoint: Optional[str] = None  # None = use real AWS, set for local
     dynamodb_region: str = 'us-east-1'
     dynamodb_table: str = 'resumetry-job-applications'
 
+    # Data path used by the routers: 'sync' runs boto3 in the threadpool,
+    # 'async' uses the aiobotocore client on the event loop.
+    dynamodb_backend: Literal['sync', 'async'] = 'sync'
+
+    # DynamoDB client settings (botocore.config.Config)
+    dynamodb_max_pool_connections: int = 50
+    dynamodb_tcp_keepalive: bool = True
+    dynamodb_connect_timeout: float = 2.0
+    dynamodb_read_timeout: float = 5.0
+    dynamodb_retry_mode: Literal['legacy', 'standard', 'adaptive'] = 'standard'
+    dynamodb_max_attempts: int = 3
+
+    # Write sharding: items are spread over this many partition keys.
+    # 1 keeps the original single 'JOB_APPS' partition.
+    shard_count: int = 1
+    fanout_max_workers: int = 8
+
+    # Batch operations
+    batch_max_items: int = 1000
+    batch_max_retries: int = 5
+    batch_backoff_base: float = 0.05  # seconds, doubled on every retry
+
+    # In-process read cache for get/list. Each process (uvicorn worker or
+    # Lambda container) has its own cache and only sees its own writes, so
+    # keep the TTL short when several processes serve traffic.
+    cache_enabled: bool = False
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 16 * 1024 * 1024
+    cache_ttl_seconds: float = 30.0
+
+    # List pagination
+    list_default_page_size: int = 50
+    list_max_page_size: int = 100
+    cursor_secret: str = DEFAULT_CURSOR_SECRET  # required outside local mode
+
+    # Change feed. Deletion tombstones are kept this long; older sync tokens
+    # get 410 Gone and need a full refresh. Changes younger than the lag are
+    # held back until the changes index has caught up with them.
+    change_retention_days: int = 30
+    change_feed_lag_seconds: float = 2.0
+
+    # Per-request instrumentation: a Server-Timing header and one JSON log
+    # line (logger resumetry.requests) per request. metrics_enabled also
+    # serves process-wide counters at /metrics in the Prometheus text format,
+    # which suits the long-running uvicorn deployment rather than Lambda.
+    instrumentation_enabled: bool = True
+    metrics_enabled: bool = False
+
+    # Response compression: brotli (when installed) or gzip, as the client's
+    # Accept-Encoding prefers, for text and MessagePack bodies of at least
+    # compression_min_size bytes. Smaller bodies gain little and cost CPU.
+    compression_enabled: bool = True
+    compression_min_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4  # 0-11; higher levels are too slow for dynamic responses
+
+    # Storage compression of the description and login hints (see
+    # app.db.compression): values of at least storage_compression_min_size
+    # bytes are written compressed. Reads handle both forms whatever these
+    # say; 'zstd' needs the zstandard package in every process.
+    storage_compression_enabled: bool = True
+    storage_compression_min_size: int = 1024
+    storage_compression_codec: Literal['zlib', 'zstd'] = 'zlib'
+
     class Config:
         env_prefix = 'RESUMETRY_'
 
 
 settings = Settings()
+
+
+def check_settings() -> None:
+    """Refuse to serve real AWS (no dynamodb_endpoint) with settings that are only safe locally."""
+    if settings.dynamodb_endpoint is None and settings.cursor_secret == DEFAULT_CURSOR_SECRET:
+        raise RuntimeError(
+            'RESUMETRY_CURSOR_SECRET is not set: cursors would be signed with the public default secret'
+        )
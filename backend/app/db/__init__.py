@@ -1 +1,8 @@
-from .dynamodb import get_dynamodb_resource, get_table, create_table_if_not_exists
+from .dynamodb import (
+    get_dynamodb_resource,
+    get_table,
+    get_executor,
+    init_dynamodb,
+    reset_dynamodb,
+    create_table_if_not_exists,
+)
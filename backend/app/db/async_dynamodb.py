@@ -0,0 +1,91 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from app.config import settings
+from app.db.dynamodb import _client_config
+from app.instrumentation import install_hooks
+
+if TYPE_CHECKING:
+    from types_aiobotocore_dynamodb import DynamoDBClient
+else:
+    DynamoDBClient = Any
+
+# One aiobotocore client per process and event loop. The client owns an
+# aiohttp connection pool bound to the loop it was created on, so it is
+# rebuilt if a different loop asks for it.
+_client: DynamoDBClient | None = None
+_client_context: Any = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_lock: asyncio.Lock | None = None
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def to_attribute_values(item: dict[str, Any]) -> dict[str, Any]:
+    """Marshal a plain item into DynamoDB AttributeValue form."""
+    return {key: _serializer.serialize(value) for key, value in item.items()}
+
+
+def from_attribute_values(item: dict[str, Any]) -> dict[str, Any]:
+    """Unmarshal a DynamoDB AttributeValue item into plain Python values."""
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
+
+
+async def _create_client() -> DynamoDBClient:
+    # Imported here: aiobotocore pulls in aiohttp, which is only worth
+    # paying for at startup when the async backend is actually used.
+    from aiobotocore.session import get_session
+
+    global _client_context
+    kwargs: dict[str, Any] = {
+        'region_name': settings.dynamodb_region,
+        'config': _client_config(),
+    }
+    if settings.dynamodb_endpoint:
+        kwargs['endpoint_url'] = settings.dynamodb_endpoint
+        # Local DynamoDB requires dummy credentials
+        kwargs['aws_access_key_id'] = 'local'
+        kwargs['aws_secret_access_key'] = 'local'
+
+    _client_context = get_session().create_client('dynamodb', **kwargs)
+    client = await _client_context.__aenter__()
+    install_hooks(client)
+    return client
+
+
+async def get_async_client() -> DynamoDBClient:
+    """Get the process-wide async DynamoDB client, creating it on first use."""
+    global _client, _client_loop, _lock
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client_loop is loop:
+        return _client
+
+    if _client_loop is not loop:
+        # Bound to another (finished) loop; its connections can't be reused
+        # or closed from here, so just drop the references.
+        _drop_client()
+        _lock = asyncio.Lock()
+        _client_loop = loop
+    assert _lock is not None
+    async with _lock:
+        if _client is None:
+            _client = await _create_client()
+    return _client
+
+
+def _drop_client() -> None:
+    global _client, _client_context, _client_loop
+    _client = None
+    _client_context = None
+    _client_loop = None
+
+
+async def close_async_client() -> None:
+    """Close the shared async client. The next call builds a fresh one."""
+    context = _client_context
+    _drop_client()
+    if context is not None:
+        await context.__aexit__(None, None, None)
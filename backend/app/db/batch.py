@@ -0,0 +1,99 @@
+import time
+from typing import Any, Iterator, Sequence, TypeVar
+
+from botocore.exceptions import ClientError
+
+from app.config import settings
+from app.db.dynamodb import get_executor, get_table
+
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+
+T = TypeVar('T')
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[list[T]]:
+    """Split a sequence into lists of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(settings.batch_backoff_base * (2 ** attempt))
+
+
+def write_chunk(requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Send one BatchWriteItem chunk, retrying UnprocessedItems with exponential backoff.
+
+    Returns the write requests that still failed.
+    """
+    table = get_table()
+    pending = requests
+    for attempt in range(settings.batch_max_retries + 1):
+        if attempt:
+            _backoff(attempt - 1)
+        try:
+            response = table.meta.client.batch_write_item(
+                RequestItems={table.name: pending},
+            )
+        except ClientError:
+            if attempt == settings.batch_max_retries:
+                return pending
+            continue
+        pending = response.get('UnprocessedItems', {}).get(table.name, [])
+        if not pending:
+            return []
+    return pending
+
+
+def _get_chunk(keys: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Send one BatchGetItem chunk, retrying UnprocessedKeys with exponential backoff.
+
+    Returns the items found and the keys that still could not be read.
+    """
+    table = get_table()
+    found: list[dict[str, Any]] = []
+    pending = keys
+    for attempt in range(settings.batch_max_retries + 1):
+        if attempt:
+            _backoff(attempt - 1)
+        try:
+            response = table.meta.client.batch_get_item(
+                RequestItems={table.name: {'Keys': pending}},
+            )
+        except ClientError:
+            if attempt == settings.batch_max_retries:
+                return found, pending
+            continue
+        found.extend(response.get('Responses', {}).get(table.name, []))
+        pending = response.get('UnprocessedKeys', {}).get(table.name, {}).get('Keys', [])
+        if not pending:
+            return found, []
+    return found, pending
+
+
+def batch_write(requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run PutRequest/DeleteRequest write requests in parallel chunks of 25.
+
+    Returns the requests that could not be written after retries.
+    """
+    chunks = list(chunked(requests, BATCH_WRITE_LIMIT))
+    if len(chunks) <= 1:
+        return [failed for chunk in chunks for failed in write_chunk(chunk)]
+    return [failed for result in get_executor().map(write_chunk, chunks) for failed in result]
+
+
+def batch_get(keys: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Read keys in parallel chunks of 100.
+
+    Returns the items found and the keys that could not be read after retries.
+    Keys must be unique.
+    """
+    chunks = list(chunked(keys, BATCH_GET_LIMIT))
+    if len(chunks) <= 1:
+        results = [_get_chunk(chunk) for chunk in chunks]
+    else:
+        results = list(get_executor().map(_get_chunk, chunks))
+    found = [item for items, _ in results for item in items]
+    failed = [key for _, keys in results for key in keys]
+    return found, failed
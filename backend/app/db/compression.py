@@ -0,0 +1,94 @@
+"""Compression of large text attributes in stored application items.
+
+Free-text fields (a pasted job posting in ``description``, say) are billed
+on every read of their item. Values of COMPRESSED_FIELDS of at least
+settings.storage_compression_min_size UTF-8 bytes are stored as Binary: one
+format byte (ZLIB or ZSTD) followed by the compressed text, and only when
+that is smaller than the text. Shorter values stay plain strings, so items
+written before the codec existed, or under a higher threshold, read as they
+are and no migration is needed.
+
+zstandard is optional and only used when storage_compression_codec asks for
+it. Every process that reads the table needs it before any writes zstd.
+"""
+import zlib
+from typing import Any
+
+from boto3.dynamodb.types import Binary
+
+from app.config import settings
+
+try:
+    import zstandard
+except ImportError:  # zlib only
+    zstandard = None
+
+COMPRESSED_FIELDS = frozenset({'description', 'login_hints'})
+
+# Format byte at the start of a compressed value
+ZLIB = 1
+ZSTD = 2
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+class UnknownFormatError(ValueError):
+    """A Binary value with a format byte this process cannot read."""
+
+
+def _compressor() -> tuple[int, Any]:
+    if settings.storage_compression_codec == 'zstd' and zstandard is not None:
+        return ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+    return ZLIB, lambda data: zlib.compress(data, ZLIB_LEVEL)
+
+
+def compress_text(value: str, min_size: int | None = None) -> str | bytes:
+    """``value`` compressed with its format byte, or unchanged when short or incompressible."""
+    if min_size is None:
+        min_size = settings.storage_compression_min_size
+    data = value.encode()
+    if len(data) < min_size:
+        return value
+    marker, compress = _compressor()
+    packed = bytes([marker]) + compress(data)
+    return packed if len(packed) < len(data) else value
+
+
+def decompress_text(value: Any) -> Any:
+    """Text of a value compress_text wrote. Anything that is not Binary is returned unchanged."""
+    if isinstance(value, Binary):
+        value = value.value
+    elif not isinstance(value, (bytes, bytearray)):
+        return value
+    marker, data = value[0], bytes(value[1:])
+    if marker == ZLIB:
+        return zlib.decompress(data).decode()
+    if marker == ZSTD:
+        if zstandard is None:
+            raise UnknownFormatError('Value is zstd-compressed but zstandard is not installed')
+        return zstandard.ZstdDecompressor().decompress(data).decode()
+    raise UnknownFormatError(f'Unknown compressed value format: {marker}')
+
+
+def compress_fields(item: dict[str, Any]) -> dict[str, Any]:
+    """``item`` with its large COMPRESSED_FIELDS text compressed. Returns ``item`` itself when nothing is."""
+    if not settings.storage_compression_enabled:
+        return item
+    compressed = {
+        field: compress_text(item[field])
+        for field in COMPRESSED_FIELDS
+        if isinstance(item.get(field), str)
+    }
+    changed = {field: value for field, value in compressed.items() if value is not item[field]}
+    return {**item, **changed} if changed else item
+
+
+def decompress_fields(item: dict[str, Any]) -> dict[str, Any]:
+    """``item`` with its COMPRESSED_FIELDS as text. Returns ``item`` itself when none is compressed."""
+    changed = {
+        field: decompress_text(item[field])
+        for field in COMPRESSED_FIELDS
+        if field in item and not isinstance(item[field], str)
+    }
+    return {**item, **changed} if changed else item
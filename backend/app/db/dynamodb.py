@@ -1,14 +1,133 @@
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
 
 from app.config import settings
+from app.instrumentation import install_hooks
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
+
+# Global secondary indexes used for server-side filtering. Each one is keyed
+# by a derived attribute kept in sync by the service layer, with the applied
+# date as range key for date-bounded queries. Under write sharding the hash
+# key values end in the application's shard (#<shard>), and reads query
+# every shard.
+STATUS_INDEX = 'status-applied-index'        # current_status
+COMPANY_INDEX = 'company-applied-index'      # company_key (lower-cased company)
+TOP_JOB_INDEX = 'top-job-applied-index'      # top_job_key, only set on top jobs
+APPLIED_INDEX = 'applied-index'              # item_type, set on every application
+
+INDEX_HASH_KEYS = {
+    STATUS_INDEX: 'current_status',
+    COMPANY_INDEX: 'company_key',
+    TOP_JOB_INDEX: 'top_job_key',
+    APPLIED_INDEX: 'item_type',
+}
+INDEX_RANGE_KEY = 'applied_date'
+
+# Change feed: every application and deletion tombstone in write-time order,
+# one hash key per shard like the filter indexes
+CHANGES_INDEX = 'changes-index'
+CHANGES_HASH_KEY = 'change_feed'
+CHANGES_RANGE_KEY = 'updated_at'
+
+# Application items without their status and note children (see
+# app.services.job_application_service). Only application items carry
+# header_sk, so listing the index per shard partition reads header-sized
+# items rather than whole item collections.
+HEADERS_INDEX = 'headers-index'
+HEADERS_RANGE_KEY = 'header_sk'
+
+# Epoch-seconds attribute DynamoDB's TTL deletes expired tombstones by
+TTL_ATTRIBUTE = 'expires_at'
+
+
+def global_secondary_indexes() -> list[dict[str, Any]]:
+    """GlobalSecondaryIndexes definitions for create_table / update_table."""
+    indexes = [
+        {
+            'IndexName': index_name,
+            'KeySchema': [
+                {'AttributeName': hash_key, 'KeyType': 'HASH'},
+                {'AttributeName': INDEX_RANGE_KEY, 'KeyType': 'RANGE'},
+            ],
+            'Projection': {'ProjectionType': 'ALL'},
+        }
+        for index_name, hash_key in INDEX_HASH_KEYS.items()
+    ]
+    indexes.append({
+        'IndexName': CHANGES_INDEX,
+        'KeySchema': [
+            {'AttributeName': CHANGES_HASH_KEY, 'KeyType': 'HASH'},
+            {'AttributeName': CHANGES_RANGE_KEY, 'KeyType': 'RANGE'},
+        ],
+        'Projection': {'ProjectionType': 'ALL'},
+    })
+    indexes.append({
+        'IndexName': HEADERS_INDEX,
+        'KeySchema': [
+            {'AttributeName': 'pk', 'KeyType': 'HASH'},
+            {'AttributeName': HEADERS_RANGE_KEY, 'KeyType': 'RANGE'},
+        ],
+        'Projection': {'ProjectionType': 'ALL'},
+    })
+    return indexes
+
+
+def table_definition() -> dict[str, Any]:
+    """Key schema, attribute definitions and indexes of the applications table."""
+    return {
+        'KeySchema': [
+            {'AttributeName': 'pk', 'KeyType': 'HASH'},
+            {'AttributeName': 'sk', 'KeyType': 'RANGE'},
+        ],
+        'AttributeDefinitions': [
+            {'AttributeName': name, 'AttributeType': 'S'}
+            for name in [
+                'pk', 'sk', INDEX_RANGE_KEY, *INDEX_HASH_KEYS.values(),
+                CHANGES_HASH_KEY, CHANGES_RANGE_KEY, HEADERS_RANGE_KEY,
+            ]
+        ],
+        'GlobalSecondaryIndexes': global_secondary_indexes(),
+        'BillingMode': 'PAY_PER_REQUEST',
+    }
+
+
+# One resource and table handle per process. They are created on first use
+# (or eagerly from the FastAPI lifespan) and reused across requests and warm
+# Lambda invocations, so the session, endpoint resolver and HTTP connection
+# pool are only built once.
+_lock = threading.Lock()
+_resource: 'DynamoDBServiceResource | None' = None
+_table: 'Table | None' = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def _client_config() -> Config:
+    """Build the botocore client config from settings."""
+    return Config(
+        max_pool_connections=settings.dynamodb_max_pool_connections,
+        tcp_keepalive=settings.dynamodb_tcp_keepalive,
+        connect_timeout=settings.dynamodb_connect_timeout,
+        read_timeout=settings.dynamodb_read_timeout,
+        retries={
+            'mode': settings.dynamodb_retry_mode,
+            'max_attempts': settings.dynamodb_max_attempts,
+        },
+    )
 
 
-def get_dynamodb_resource() -> DynamoDBServiceResource:
-    """Get DynamoDB resource, configured for local or AWS."""
+def _create_dynamodb_resource() -> 'DynamoDBServiceResource':
+    """Create a new DynamoDB resource, configured for local or AWS."""
     kwargs = {
         'region_name': settings.dynamodb_region,
+        'config': _client_config(),
     }
     if settings.dynamodb_endpoint:
         kwargs['endpoint_url'] = settings.dynamodb_endpoint
@@ -16,16 +135,75 @@ def get_dynamodb_resource() -> DynamoDBServiceResource:
         kwargs['aws_access_key_id'] = 'local'
         kwargs['aws_secret_access_key'] = 'local'
 
-    return boto3.resource('dynamodb', **kwargs)
+    # A dedicated session keeps the shared resource independent of the
+    # (non thread-safe) default boto3 session.
+    session = boto3.session.Session()
+    return session.resource('dynamodb', **kwargs)
 
 
-def get_table() -> Table:
-    """Get the job applications table."""
-    dynamodb = get_dynamodb_resource()
-    return dynamodb.Table(settings.dynamodb_table)
+def get_dynamodb_resource() -> 'DynamoDBServiceResource':
+    """Get the process-wide DynamoDB resource, creating it on first use."""
+    global _resource
+    if _resource is None:
+        with _lock:
+            if _resource is None:
+                _resource = _create_dynamodb_resource()
+    return _resource
+
+
+def get_table() -> 'Table':
+    """Get the process-wide job applications table handle."""
+    global _table
+    if _table is None:
+        dynamodb = get_dynamodb_resource()
+        with _lock:
+            if _table is None:
+                install_hooks(dynamodb.meta.client)
+                _table = dynamodb.Table(settings.dynamodb_table)
+    return _table
+
+
+class _ContextExecutor(ThreadPoolExecutor):
+    """Runs each task in a copy of the submitting thread's context, so per-request state follows it."""
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future:
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide worker pool used to fan out DynamoDB calls."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = _ContextExecutor(
+                    max_workers=settings.fanout_max_workers,
+                    thread_name_prefix='dynamodb',
+                )
+    return _executor
+
 
+def init_dynamodb() -> 'Table':
+    """Eagerly create the shared resource and table handle."""
+    return get_table()
 
-def create_table_if_not_exists() -> Table:
+
+def reset_dynamodb() -> None:
+    """Drop the shared resource, table handle and worker pool.
+
+    The next call to get_dynamodb_resource() or get_table() builds fresh ones.
+    Used by tests that swap in a mocked resource, and after settings change.
+    """
+    global _resource, _table, _executor
+    with _lock:
+        _resource = None
+        _table = None
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def create_table_if_not_exists() -> 'Table':
     """Create the job applications table if it doesn't exist."""
     dynamodb = get_dynamodb_resource()
 
@@ -40,17 +218,23 @@ def create_table_if_not_exists() -> Table:
     # Table doesn't exist, create it
     table = dynamodb.create_table(
         TableName=settings.dynamodb_table,
-        KeySchema=[
-            {'AttributeName': 'pk', 'KeyType': 'HASH'},
-            {'AttributeName': 'sk', 'KeyType': 'RANGE'},
-        ],
-        AttributeDefinitions=[
-            {'AttributeName': 'pk', 'AttributeType': 'S'},
-            {'AttributeName': 'sk', 'AttributeType': 'S'},
-        ],
-        BillingMode='PAY_PER_REQUEST',
+        **table_definition(),
     )
 
     # Wait for table to be created
     table.wait_until_exists()
+    enable_ttl(table)
     return table
+
+
+def enable_ttl(table: 'Table') -> None:
+    """Let DynamoDB delete items once their TTL_ATTRIBUTE time has passed."""
+    client = table.meta.client
+    description = client.describe_time_to_live(TableName=table.name)['TimeToLiveDescription']
+    # Enabling it again is an error
+    if description.get('TimeToLiveStatus') in ('ENABLED', 'ENABLING'):
+        return
+    client.update_time_to_live(
+        TableName=table.name,
+        TimeToLiveSpecification={'Enabled': True, 'AttributeName': TTL_ATTRIBUTE},
+    )
@@ -0,0 +1,134 @@
+"""Conversion of Python and pydantic values into DynamoDB-ready values.
+
+Dispatches on the exact type of each value through a converter table that
+learns subclasses (enums, datetimes) on first sight, and walks models through
+a per-class plan of their fields instead of going through model_dump(). None
+is dropped from maps and models; floats become Decimal, which is the only
+number type boto3 accepts.
+"""
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from operator import methodcaller
+from types import NoneType, UnionType
+from typing import Any, Callable, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+Converter = Callable[[Any], Any]
+
+
+def _float(value: float) -> Decimal:
+    # repr is the shortest string that round-trips, so 0.1 stays Decimal('0.1')
+    return Decimal(repr(value))
+
+
+def _enum(value: Enum) -> Any:
+    return to_dynamo(value.value)
+
+
+def _dict(value: dict[Any, Any]) -> dict[Any, Any]:
+    return {key: to_dynamo(item) for key, item in value.items() if item is not None}
+
+
+def _sequence(value: list[Any] | tuple[Any, ...]) -> list[Any]:
+    return [to_dynamo(item) for item in value]
+
+
+def _set(value: set[Any] | frozenset[Any]) -> set[Any]:
+    return {to_dynamo(item) for item in value}
+
+
+_isoformat = methodcaller('isoformat')
+
+# Exact type -> converter; None means the value is stored as is
+_CONVERTERS: dict[type, Converter | None] = {
+    str: None,
+    int: None,
+    bool: None,
+    Decimal: None,
+    bytes: None,
+    NoneType: None,
+    float: _float,
+    dict: _dict,
+    list: _sequence,
+    tuple: _sequence,
+    set: _set,
+    frozenset: _set,
+}
+
+# Base classes tried, in order, for types missing from _CONVERTERS
+_BASES: tuple[tuple[type, Converter | None], ...] = (
+    (BaseModel, lambda value: model_to_dynamo(value)),
+    (Enum, _enum),
+    # Covers datetime too; both store their ISO format
+    (date, _isoformat),
+    (bool, None),
+    (int, None),
+    (str, None),
+    (float, _float),
+    (dict, _dict),
+    (list, _sequence),
+    (tuple, _sequence),
+)
+
+
+def _resolve(cls: type) -> Converter | None:
+    for base, converter in _BASES:
+        if issubclass(cls, base):
+            break
+    else:
+        raise TypeError(f'Cannot store {cls.__name__} values in DynamoDB')
+    _CONVERTERS[cls] = converter
+    return converter
+
+
+def to_dynamo(value: Any) -> Any:
+    """Convert a value to what boto3 can store."""
+    cls = value.__class__
+    try:
+        converter = _CONVERTERS[cls]
+    except KeyError:
+        converter = _resolve(cls)
+    return value if converter is None else converter(value)
+
+
+_PASSTHROUGH = frozenset((str, int, bool))
+_plans: dict[type[BaseModel], tuple[tuple[str, Converter | None], ...]] = {}
+
+
+def _field_converter(annotation: Any) -> Converter | None:
+    """Pick the converter of a field from its annotation when it is fixed, else dispatch per value."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            annotation = args[0]
+    if annotation in _PASSTHROUGH:
+        return None
+    if annotation is date:
+        return _isoformat
+    return to_dynamo
+
+
+def _plan(cls: type[BaseModel]) -> tuple[tuple[str, Converter | None], ...]:
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _plans[cls] = tuple(
+            (name, _field_converter(field.annotation)) for name, field in cls.model_fields.items()
+        )
+    return plan
+
+
+def model_to_dynamo(model: BaseModel, exclude_unset: bool = False) -> dict[str, Any]:
+    """Convert a model's fields, keyed by field name, to a DynamoDB map. None fields are left out."""
+    values = model.__dict__
+    fields_set = model.model_fields_set if exclude_unset else None
+    result: dict[str, Any] = {}
+    for name, converter in _plan(type(model)):
+        if fields_set is not None and name not in fields_set:
+            continue
+        value = values[name]
+        if value is None:
+            continue
+        result[name] = value if converter is None else converter(value)
+    return result
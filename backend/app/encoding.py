@@ -0,0 +1,226 @@
+"""Negotiated response encodings: compression and the MessagePack representation.
+
+CompressionMiddleware compresses text and MessagePack responses with brotli
+or gzip, whichever the request's Accept-Encoding prefers, once the body
+reaches the size threshold. Streamed responses are compressed chunk by
+chunk and flushed after each one, so clients still receive them
+progressively.
+
+brotli and msgpack are optional, and imported on first use rather than with
+the app, to keep them off the Lambda cold start. Without brotli only gzip is
+offered; without msgpack every representation is JSON.
+
+Under Lambda the response body goes back to API Gateway as a string. Mangum
+base64-encodes it only when it has a non-text content type or does not
+decode as UTF-8, so ``base64_encoded_bodies`` wraps the handler to
+base64-encode every content-encoded body. REST APIs also need a binary media
+type to decode them again, which template.yaml sets to ``*/*``; HTTP APIs
+and ALB do this anyway.
+"""
+import base64
+import zlib
+from functools import cache
+from types import ModuleType
+from typing import Any, Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+@cache
+def _brotli() -> ModuleType | None:
+    try:
+        import brotli
+    except ImportError:  # gzip only
+        return None
+    return brotli
+
+
+@cache
+def _msgpack() -> ModuleType | None:
+    try:
+        import msgpack
+    except ImportError:  # JSON only
+        return None
+    return msgpack
+
+
+JSON = 'application/json'
+NDJSON = 'application/x-ndjson'
+MSGPACK = 'application/msgpack'
+_MSGPACK_TYPES = (MSGPACK, 'application/vnd.msgpack', 'application/x-msgpack')
+_TEXT_TYPES = (JSON, NDJSON, 'application/*', '*/*')
+
+COMPRESSIBLE_TYPES = ('text/', JSON, NDJSON, MSGPACK, 'application/javascript', 'application/xml')
+
+# Statuses whose responses have no body to compress
+_NO_BODY_STATUSES = frozenset({204, 304})
+
+
+def _qualities(header: str) -> dict[str, float]:
+    """Quality value of each item of an Accept or Accept-Encoding header."""
+    qualities: dict[str, float] = {}
+    for part in header.split(','):
+        value, *params = (piece.strip() for piece in part.split(';'))
+        if not value:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, raw = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        qualities.setdefault(value.lower(), quality)
+    return qualities
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Content codings this process can produce, most preferred first."""
+    return ('br', 'gzip') if _brotli() is not None else ('gzip',)
+
+
+def preferred_encoding(accept_encoding: str) -> str | None:
+    """The content coding to use for a request's Accept-Encoding, or None for identity."""
+    qualities = _qualities(accept_encoding)
+    wildcard = qualities.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for coding in available_encodings():
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def wants_msgpack(accept: str | None) -> bool:
+    """Whether an Accept header prefers MessagePack to JSON. JSON wins ties."""
+    if not accept or not msgpack_available():
+        return False
+    qualities = _qualities(accept)
+    packed = max((qualities[name] for name in _MSGPACK_TYPES if name in qualities), default=0.0)
+    text = max((qualities[name] for name in _TEXT_TYPES if name in qualities), default=0.0)
+    return packed > text
+
+
+def msgpack_available() -> bool:
+    return _msgpack() is not None
+
+
+def packb(content: Any) -> bytes:
+    return _msgpack().packb(content)
+
+
+class _Compressor:
+    """Streaming gzip or brotli compressor."""
+
+    def __init__(self, coding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.coding = coding
+        if coding == 'br':
+            self._brotli = _brotli().Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compressed ``data``, flushed so the client can decode everything sent so far."""
+        if self.coding == 'br':
+            return self._brotli.process(data) + (self._brotli.finish() if final else self._brotli.flush())
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """Compresses response bodies of at least ``minimum_size`` bytes; see the module docstring."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        coding = preferred_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        start: Message | None = None
+        compressor: _Compressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message['type'] == 'http.response.start':
+                # Held back until the first body chunk shows whether to compress
+                start = message
+                return
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if compressor is None:
+                headers = MutableHeaders(raw=list(start['headers']))
+                if not self._compressible(start['status'], headers):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                headers.add_vary_header('Accept-Encoding')
+                if coding is None or (not more_body and len(body) < self.minimum_size):
+                    passthrough = True
+                    await send({**start, 'headers': headers.raw})
+                    await send(message)
+                    return
+                compressor = _Compressor(coding, self.gzip_level, self.brotli_quality)
+                headers['Content-Encoding'] = coding
+                # The compressed bytes differ, so a strong validator would be wrong
+                etag = headers.get('etag')
+                if etag and not etag.startswith('W/'):
+                    headers['ETag'] = 'W/' + etag
+                if more_body:
+                    del headers['Content-Length']
+                    await send({**start, 'headers': headers.raw})
+                else:
+                    body = compressor.compress(body, final=True)
+                    headers['Content-Length'] = str(len(body))
+                    await send({**start, 'headers': headers.raw})
+                    await send({'type': 'http.response.body', 'body': body})
+                    return
+            await send({
+                'type': 'http.response.body',
+                'body': compressor.compress(body, final=not more_body),
+                'more_body': more_body,
+            })
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _compressible(status: int, headers: MutableHeaders) -> bool:
+        if status in _NO_BODY_STATUSES or 'content-encoding' in headers or 'content-range' in headers:
+            return False
+        content_type = headers.get('content-type', '')
+        return any(content_type.startswith(prefix) for prefix in COMPRESSIBLE_TYPES)
+
+
+LambdaHandler = Callable[[dict[str, Any], Any], dict[str, Any]]
+
+
+def base64_encoded_bodies(handler: LambdaHandler) -> LambdaHandler:
+    """Wrap a Mangum handler so content-encoded response bodies are always base64-encoded."""
+    def wrapped(event: dict[str, Any], context: Any) -> dict[str, Any]:
+        response = handler(event, context)
+        names = {*response.get('headers', {}), *response.get('multiValueHeaders', {})}
+        encoded = any(name.lower() == 'content-encoding' for name in names)
+        if encoded and response.get('body') and not response.get('isBase64Encoded'):
+            # Mangum decoded the body as UTF-8, so encoding it again restores the bytes
+            response['body'] = base64.b64encode(response['body'].encode()).decode()
+            response['isBase64Encoded'] = True
+        return response
+    return wrapped
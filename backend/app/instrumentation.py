@@ -0,0 +1,285 @@
+"""Per-request instrumentation: DynamoDB calls, consumed capacity and time spent.
+
+The middleware opens a RequestMetrics for every HTTP request in a context
+variable. botocore event hooks on the shared clients add each DynamoDB call,
+its duration and the capacity it consumed; ``timed`` adds the time spent in
+model validation and response serialization. When the response starts, the
+totals go out as a Server-Timing header; once the body is sent they are
+logged as one JSON line and, with settings.metrics_enabled, added to the
+process-wide counters served at /metrics in the Prometheus text format.
+
+Worker threads (run_in_threadpool, the DynamoDB fan-out pool) run in a copy
+of the request's context, so their calls land on the same RequestMetrics.
+"""
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Literal, ParamSpec, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger('resumetry.requests')
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+Phase = Literal['validation', 'serialization']
+
+# Operations that accept ReturnConsumedCapacity, and which of them read
+CAPACITY_OPERATIONS = (
+    'GetItem', 'PutItem', 'UpdateItem', 'DeleteItem', 'Query', 'Scan',
+    'BatchGetItem', 'BatchWriteItem', 'TransactGetItems', 'TransactWriteItems',
+)
+READ_OPERATIONS = frozenset({'GetItem', 'Query', 'Scan', 'BatchGetItem', 'TransactGetItems'})
+
+_HOOK_ID = 'resumetry-instrumentation'
+
+
+class RequestMetrics:
+    """What one request spent. Updated from the request's task and its worker threads."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.dynamodb_calls: Counter[str] = Counter()
+        self.dynamodb_seconds = 0.0
+        self.read_units = 0.0
+        self.write_units = 0.0
+        self.phases: dict[Phase, float] = {'validation': 0.0, 'serialization': 0.0}
+        self.response_bytes = 0
+        self._lock = threading.Lock()
+
+    def add_call(self, operation: str, seconds: float, capacity: Any) -> None:
+        units = sum(float(entry.get('CapacityUnits', 0)) for entry in _capacity_entries(capacity))
+        with self._lock:
+            self.dynamodb_calls[operation] += 1
+            self.dynamodb_seconds += seconds
+            if operation in READ_OPERATIONS:
+                self.read_units += units
+            else:
+                self.write_units += units
+
+    def add_phase(self, phase: Phase, seconds: float) -> None:
+        with self._lock:
+            self.phases[phase] += seconds
+
+    def server_timing(self) -> str:
+        calls = sum(self.dynamodb_calls.values())
+        return ', '.join([
+            f'dynamodb;dur={self.dynamodb_seconds * 1000:.1f};'
+            f'desc="{calls} calls, {self.read_units:g} RCU, {self.write_units:g} WCU"',
+            f'validation;dur={self.phases["validation"] * 1000:.1f}',
+            f'serialization;dur={self.phases["serialization"] * 1000:.1f}',
+            f'app;dur={(time.perf_counter() - self.started) * 1000:.1f}',
+        ])
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar('request_metrics', default=None)
+
+
+def current_metrics() -> RequestMetrics | None:
+    return _current.get()
+
+
+def _capacity_entries(capacity: Any) -> list[dict[str, Any]]:
+    if not capacity:
+        return []
+    return capacity if isinstance(capacity, list) else [capacity]
+
+
+def timed(phase: Phase) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Add the decorated function's run time to the current request's ``phase``."""
+    def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        @wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            metrics = _current.get()
+            if metrics is None:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                metrics.add_phase(phase, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+# botocore hooks. The request context dict travels from before-call to after-call.
+
+def _request_capacity(params: dict[str, Any], **kwargs: Any) -> None:
+    if _current.get() is not None:
+        params.setdefault('ReturnConsumedCapacity', 'TOTAL')
+
+
+def _before_call(context: dict[str, Any], **kwargs: Any) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        context['resumetry_metrics'] = (metrics, time.perf_counter())
+
+
+def _after_call(model: Any, parsed: dict[str, Any], context: dict[str, Any], **kwargs: Any) -> None:
+    started = context.pop('resumetry_metrics', None)
+    if started is not None:
+        metrics, t0 = started
+        metrics.add_call(model.name, time.perf_counter() - t0, parsed.get('ConsumedCapacity'))
+
+
+def install_hooks(client: Any) -> None:
+    """Register the instrumentation hooks on a boto3 or aiobotocore DynamoDB client. Idempotent."""
+    events = client.meta.events
+    for operation in CAPACITY_OPERATIONS:
+        events.register(
+            f'provide-client-params.dynamodb.{operation}', _request_capacity,
+            unique_id=f'{_HOOK_ID}-capacity-{operation}',
+        )
+    events.register('before-call.dynamodb', _before_call, unique_id=f'{_HOOK_ID}-before')
+    events.register('after-call.dynamodb', _after_call, unique_id=f'{_HOOK_ID}-after')
+
+
+class MetricsRegistry:
+    """Process-wide request counters, rendered in the Prometheus text format."""
+
+    DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests: Counter[tuple[str, str, str]] = Counter()
+            self.duration_buckets: Counter[tuple[str, int]] = Counter()
+            self.duration_sum: Counter[str] = Counter()
+            self.duration_count: Counter[str] = Counter()
+            self.dynamodb_calls: Counter[str] = Counter()
+            self.totals: Counter[str] = Counter()
+
+    def observe(self, method: str, route: str, status: int, seconds: float, metrics: RequestMetrics) -> None:
+        bucket = bisect_left(self.DURATION_BUCKETS, seconds)
+        with self._lock:
+            self.requests[(method, route, str(status))] += 1
+            self.duration_buckets[(route, bucket)] += 1
+            self.duration_sum[route] += seconds
+            self.duration_count[route] += 1
+            self.dynamodb_calls.update(metrics.dynamodb_calls)
+            self.totals.update({
+                'dynamodb_seconds': metrics.dynamodb_seconds,
+                'read_units': metrics.read_units,
+                'write_units': metrics.write_units,
+                'validation_seconds': metrics.phases['validation'],
+                'serialization_seconds': metrics.phases['serialization'],
+                'response_bytes': metrics.response_bytes,
+            })
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                '# HELP resumetry_requests_total HTTP requests handled.',
+                '# TYPE resumetry_requests_total counter',
+                *(
+                    f'resumetry_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}'
+                    for (method, route, status), count in sorted(self.requests.items())
+                ),
+                '# HELP resumetry_request_duration_seconds Time to the end of the response body.',
+                '# TYPE resumetry_request_duration_seconds histogram',
+            ]
+            for route in sorted(self.duration_count):
+                cumulative = 0
+                for index, bound in enumerate(self.DURATION_BUCKETS):
+                    cumulative += self.duration_buckets[(route, index)]
+                    lines.append(f'resumetry_request_duration_seconds_bucket{{route="{route}",le="{bound}"}} {cumulative}')
+                lines.append(
+                    f'resumetry_request_duration_seconds_bucket{{route="{route}",le="+Inf"}} {self.duration_count[route]}'
+                )
+                lines.append(f'resumetry_request_duration_seconds_sum{{route="{route}"}} {self.duration_sum[route]}')
+                lines.append(f'resumetry_request_duration_seconds_count{{route="{route}"}} {self.duration_count[route]}')
+            lines += [
+                '# HELP resumetry_dynamodb_calls_total DynamoDB API calls made while handling requests.',
+                '# TYPE resumetry_dynamodb_calls_total counter',
+                *(
+                    f'resumetry_dynamodb_calls_total{{operation="{operation}"}} {count}'
+                    for operation, count in sorted(self.dynamodb_calls.items())
+                ),
+            ]
+            for name, kind, help_text in (
+                ('dynamodb_seconds', 'dynamodb_seconds_total', 'Time spent in DynamoDB calls.'),
+                ('read_units', 'dynamodb_read_capacity_units_total', 'Read capacity consumed.'),
+                ('write_units', 'dynamodb_write_capacity_units_total', 'Write capacity consumed.'),
+                ('validation_seconds', 'validation_seconds_total', 'Time spent building and validating models.'),
+                ('serialization_seconds', 'serialization_seconds_total', 'Time spent serializing responses.'),
+                ('response_bytes', 'response_bytes_total', 'Response body bytes sent.'),
+            ):
+                lines += [
+                    f'# HELP resumetry_{kind} {help_text}',
+                    f'# TYPE resumetry_{kind} counter',
+                    f'resumetry_{kind} {self.totals[name]:g}',
+                ]
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+def _route(scope: Scope) -> str:
+    """Path template of the matched route; raw paths would give unbounded label values."""
+    route = scope.get('route')
+    return getattr(route, 'path', None) or 'unmatched'
+
+
+class InstrumentationMiddleware:
+    """Measures each HTTP request; see the module docstring."""
+
+    def __init__(self, app: ASGIApp, record_metrics: bool = False) -> None:
+        self.app = app
+        self.record_metrics = record_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        status = 500
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+                headers = list(message.get('headers', []))
+                headers.append((b'server-timing', metrics.server_timing().encode('latin-1')))
+                message = {**message, 'headers': headers}
+            elif message['type'] == 'http.response.body':
+                metrics.response_bytes += len(message.get('body', b''))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _current.reset(token)
+            self._finish(scope, status, metrics)
+
+    def _finish(self, scope: Scope, status: int, metrics: RequestMetrics) -> None:
+        seconds = time.perf_counter() - metrics.started
+        route = _route(scope)
+        if self.record_metrics:
+            registry.observe(scope['method'], route, status, seconds, metrics)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                'method': scope['method'],
+                'path': scope['path'],
+                'route': route,
+                'status': status,
+                'duration_ms': round(seconds * 1000, 2),
+                'dynamodb_calls': dict(metrics.dynamodb_calls),
+                'dynamodb_ms': round(metrics.dynamodb_seconds * 1000, 2),
+                'read_units': metrics.read_units,
+                'write_units': metrics.write_units,
+                'validation_ms': round(metrics.phases['validation'] * 1000, 2),
+                'serialization_ms': round(metrics.phases['serialization'] * 1000, 2),
+                'response_bytes': metrics.response_bytes,
+            }, separators=(',', ':')))
@@ -1,26 +1,46 @@
+import os
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
 
-from .config import settings
-from .db.dynamodb import create_table_if_not_exists
-from .routers import health, api_v1, job_applications
+from .config import check_settings, settings
+from .db.async_dynamodb import close_async_client, get_async_client
+from .db.dynamodb import create_table_if_not_exists, init_dynamodb, reset_dynamodb
+from .encoding import CompressionMiddleware, base64_encoded_bodies
+from .instrumentation import InstrumentationMiddleware
+from .routers import health, api_v1, job_applications, metrics, reports
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    check_settings()
     create_table_if_not_exists()
+    init_dynamodb()
+    if settings.dynamodb_backend == 'async':
+        await get_async_client()
     yield
+    await close_async_client()
+    reset_dynamodb()
+
+
+def _docs_urls() -> dict[str, Any]:
+    """Docs and OpenAPI routes, or None for each when docs are disabled."""
+    if not settings.docs_enabled:
+        return {'docs_url': None, 'redoc_url': None, 'openapi_url': None}
+    return {
+        'docs_url': '/api/docs',
+        'redoc_url': '/api/redoc',
+        'openapi_url': '/api/openapi.json',
+    }
 
 
 app = FastAPI(
     title=settings.app_name,
-    docs_url='/api/docs',
-    redoc_url='/api/redoc',
-    openapi_url='/api/openapi.json',
     lifespan=lifespan,
+    **_docs_urls(),
 )
 
 app.add_middleware(
@@ -31,9 +51,32 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_min_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+
+# Added last so it wraps CORS and compression: it times the whole request
+# and counts the bytes actually sent
+if settings.instrumentation_enabled:
+    app.add_middleware(InstrumentationMiddleware, record_metrics=settings.metrics_enabled)
+
 app.include_router(health.router)
 app.include_router(api_v1.router)
 app.include_router(job_applications.router)
+app.include_router(reports.router)
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
+
+# AWS Lambda handler. The lifespan is off under Lambda, so build the pooled
+# DynamoDB resource here: module import runs in the init phase, before the
+# first event is billed against the request's latency.
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    check_settings()
+    init_dynamodb()
 
-# AWS Lambda handler
-handler = Mangum(app, lifespan='off')
+# Compressed bodies must go back to API Gateway base64-encoded
+handler = base64_encoded_bodies(Mangum(app, lifespan='off'))
@@ -7,4 +7,28 @@ from .job_application import (
     JobApplicationCreate,
     JobApplicationUpdate,
     JobApplicationResponse,
+    JobApplicationPartial,
+    JobApplicationPage,
+    ApplicationNotePage,
+    StatusHistoryPage,
+    ApplicationFilters,
+    ApplicationStats,
+    WeeklyCount,
+    SearchHit,
+    SearchResults,
+    ApplicationChange,
+    ApplicationChanges,
+    BatchCreateRequest,
+    BatchIdsRequest,
+    BatchItemResult,
+    BatchResponse,
+)
+from .reports import (
+    ApplicationReports,
+    FunnelReport,
+    FunnelStage,
+    SankeyLink,
+    SankeyNode,
+    SankeyReport,
+    StageDuration,
 )
@@ -1,3 +1,5 @@
+from typing import Any, Self
+
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
@@ -9,3 +11,12 @@ class BaseSchema(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
     )
+
+    @classmethod
+    def from_trusted(cls, values: dict[str, Any]) -> Self:
+        """Build an instance from values that are already valid, without validation.
+
+        For hot read paths: ``values`` must hold every field, by name and with
+        its final type. They all count as set, as after validation.
+        """
+        return cls.model_construct(_fields_set=set(values), **values)
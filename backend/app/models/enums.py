@@ -9,4 +9,10 @@ class ApplicationStatus(str, Enum):
     INTERVIEW = 'INTERVIEW'
     OFFER = 'OFFER'
     WITHDRAWN = 'WITHDRAWN'
-    NOOFFER = 'NOOFFER'
\ No newline at end of file
+    NOOFFER = 'NOOFFER'
+
+
+class SortOrder(str, Enum):
+    """Direction of an ordered list."""
+    ASC = 'asc'
+    DESC = 'desc'
@@ -1,7 +1,7 @@
 from datetime import date
-from typing import Optional
+from typing import Any, Optional, Self
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from .base import BaseSchema
 from .enums import ApplicationStatus
@@ -19,6 +19,25 @@ class StatusItem(BaseSchema):
     status: ApplicationStatus
 
 
+class StoredRecord(BaseSchema):
+    """Carries storage metadata of the item a model was read from, without serializing it."""
+    _item_version: int = PrivateAttr(default=0)
+    _updated_at: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def item_version(self) -> int:
+        return self._item_version
+
+    @property
+    def updated_at(self) -> Optional[str]:
+        return self._updated_at
+
+    def with_storage_metadata(self, item_version: int, updated_at: Optional[str]) -> Self:
+        self._item_version = item_version
+        self._updated_at = updated_at
+        return self
+
+
 class JobApplicationBase(BaseSchema):
     """Base schema with common job application fields."""
     company: str = Field(..., min_length=1, max_length=255)
@@ -56,10 +75,130 @@ class JobApplicationUpdate(BaseSchema):
     notes: Optional[list[ApplicationNote]] = None
 
 
-class JobApplicationResponse(JobApplicationBase):
+class JobApplicationResponse(JobApplicationBase, StoredRecord):
     """Schema for API responses."""
     id: str
     applied_date: date
     status: list[StatusItem] = Field(default_factory=lambda: [])
     notes: list[ApplicationNote] = Field(default_factory=lambda: [])
+    note_count: int = 0  # filled in list responses, which leave the notes out
+
+
+class JobApplicationPartial(StoredRecord):
+    """Sparse response holding only the requested fields.
+
+    Serialize with exclude_unset=True so omitted fields stay omitted.
+    """
+    id: str
+    company: Optional[str] = None
+    role: Optional[str] = None
+    description: Optional[str] = None
+    salary: Optional[str] = None
+    top_job: Optional[bool] = None
+    source_page: Optional[str] = None
+    review_page: Optional[str] = None
+    login_hints: Optional[str] = None
+    recruiter_name: Optional[str] = None
+    recruiter_company: Optional[str] = None
+    applied_date: Optional[date] = None
+    status: Optional[list[StatusItem]] = None
+    notes: Optional[list[ApplicationNote]] = None
+    note_count: Optional[int] = None
+
+
+class JobApplicationPage(BaseSchema):
+    """One page of job applications with an opaque cursor for the next page."""
+    items: list[JobApplicationResponse] | list[JobApplicationPartial]
+    next_cursor: Optional[str] = None
+
+
+class ApplicationNotePage(BaseSchema):
+    """One page of an application's notes, oldest first, with a cursor for the next page."""
+    items: list[ApplicationNote]
+    next_cursor: Optional[str] = None
+
+
+class StatusHistoryPage(BaseSchema):
+    """One page of an application's status history, oldest first, with a cursor for the next page."""
+    items: list[StatusItem]
+    next_cursor: Optional[str] = None
+
+
+class BatchCreateRequest(BaseSchema):
+    """Request body for batch create. Items are validated one by one."""
+    items: list[dict[str, Any]] = Field(..., min_length=1)
+
+
+class BatchIdsRequest(BaseSchema):
+    """Request body for batch get and batch delete."""
+    ids: list[str] = Field(..., min_length=1)
+
+
+class BatchItemResult(BaseSchema):
+    """Outcome of one item in a batch request, in request order."""
+    index: int
+    id: Optional[str] = None
+    success: bool
+    error: Optional[str] = None
+    application: Optional[JobApplicationResponse] = None
+
+
+class BatchResponse(BaseSchema):
+    """Per-item outcomes of a batch request."""
+    results: list[BatchItemResult]
+
+
+class ApplicationFilters(BaseSchema):
+    """Server-side filters for listing applications. Unset fields don't filter."""
+    status: Optional[ApplicationStatus] = None
+    company: Optional[str] = None
+    applied_from: Optional[date] = None
+    applied_to: Optional[date] = None
+    top_job: Optional[bool] = None
+
+    def is_empty(self) -> bool:
+        return not self.model_dump(exclude_none=True)
+
+
+class WeeklyCount(BaseSchema):
+    """Applications sent in one ISO week."""
+    week: str
+    applied: int
+
+
+class ApplicationStats(BaseSchema):
+    """Dashboard statistics over all applications."""
+    total: int
+    by_status: dict[str, int]
+    per_week: list[WeeklyCount]
+    responded: int
+    response_rate: float
+    screened: int
+    average_days_to_screen: Optional[float] = None
+
+
+class SearchHit(BaseSchema):
+    """One search match with its BM25 relevance score."""
+    score: float
+    application: JobApplicationResponse
+
+
+class SearchResults(BaseSchema):
+    """Best search matches first, and how many applications matched in total."""
+    total: int
+    items: list[SearchHit]
+
+
+class ApplicationChange(BaseSchema):
+    """An application created or updated since a sync token, with its current state, or deleted."""
+    id: str
+    changed_at: str
+    deleted: bool = False
+    application: Optional[JobApplicationResponse] = None
+
 
+class ApplicationChanges(BaseSchema):
+    """Changes in write order, and the token to pass as ``since`` next time."""
+    items: list[ApplicationChange]
+    next_token: str
+    has_more: bool
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from .base import BaseSchema
+from .enums import ApplicationStatus
+
+
+class SankeyNode(BaseSchema):
+    """A status (or RESPONDED / NO RESPONSE) and the number of applications flowing through it."""
+    status: str
+    value: int
+
+
+class SankeyLink(BaseSchema):
+    """Number of applications that moved from one node to another."""
+    source: str
+    target: str
+    value: int
+
+
+class SankeyReport(BaseSchema):
+    """Status flow diagram over all applications; links largest first."""
+    total: int
+    nodes: list[SankeyNode]
+    links: list[SankeyLink]
+
+
+class FunnelStage(BaseSchema):
+    """Applications that reached a stage, and the share of the previous stage's that did."""
+    status: ApplicationStatus
+    reached: int
+    conversion_rate: Optional[float] = None
+
+
+class StageDuration(BaseSchema):
+    """Days from entering a status to the next status, over the applications that moved on."""
+    status: ApplicationStatus
+    count: int
+    average_days: float
+    median_days: float
+    p90_days: int
+
+
+class FunnelReport(BaseSchema):
+    """Funnel conversion and time in stage over all applications."""
+    total: int
+    stages: list[FunnelStage]
+    time_in_stage: list[StageDuration]
+
+
+class ApplicationReports(BaseSchema):
+    sankey: SankeyReport
+    funnel: FunnelReport
@@ -13,3 +13,12 @@ class PingResponse(BaseSchema):
 
 class ErrorResponse(BaseSchema):
     detail: str
+
+
+class CacheStatsResponse(BaseSchema):
+    enabled: bool
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
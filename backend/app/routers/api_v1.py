@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
-from ..models.responses import PingResponse
+from ..models.responses import CacheStatsResponse, PingResponse
+from ..services.cache import cache_stats
 
 router = APIRouter(prefix='/api/v1', tags=['API v1'])
 
@@ -8,3 +9,8 @@ router = APIRouter(prefix='/api/v1', tags=['API v1'])
 @router.get('/ping', response_model=PingResponse)
 async def ping():
     return PingResponse(message='pong', version='1.0.0')
+
+
+@router.get('/cache/stats', response_model=CacheStatsResponse)
+async def get_cache_stats():
+    return cache_stats()
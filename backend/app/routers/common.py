@@ -0,0 +1,74 @@
+"""Helpers the API routers share: backend dispatch and HTTP validators."""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.services import async_job_application_service as async_svc
+from app.services import job_application_service as svc
+from app.services.job_application_service import WriteConflictError
+
+
+# Service functions async_job_application_service implements. The others
+# run on the sync backend whatever settings.dynamodb_backend says.
+ASYNC_FUNCTIONS = frozenset({
+    'append_notes',
+    'append_status',
+    'create_application',
+    'delete_application',
+    'get_application',
+    'get_stats',
+    'list_applications',
+    'list_applications_page',
+    'update_application',
+})
+
+
+async def service_call(name: str, *args: Any) -> Any:
+    """Run a service function on the backend selected by settings.dynamodb_backend.
+
+    Functions not in ASYNC_FUNCTIONS run on the sync backend. Writes that
+    keep losing to concurrent writers are reported as 409 Conflict.
+    """
+    try:
+        if settings.dynamodb_backend == 'async' and name in ASYNC_FUNCTIONS:
+            return await getattr(async_svc, name)(*args)
+        return await run_in_threadpool(getattr(svc, name), *args)
+    except WriteConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+def etag(*parts: Any) -> str:
+    digest = hashlib.sha256('|'.join(str(part) for part in parts).encode()).hexdigest()[:24]
+    return f'"{digest}"'
+
+
+def validators(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if last_modified is not None:
+        headers['Last-Modified'] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no If-None-Match was sent."""
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*':
+            return True
+        return etag in {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified <= since
+    return False
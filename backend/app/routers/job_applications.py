@@ -1,11 +1,43 @@
-from fastapi import APIRouter, HTTPException, status
+from datetime import date, datetime, timezone
+from typing import Any, Iterator, Literal, Optional
 
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
+from fastapi.responses import StreamingResponse
+
+from app import encoding
+from app.config import settings
+from app.instrumentation import timed
+from app.models.enums import ApplicationStatus, SortOrder
 from app.models.job_application import (
+    ApplicationChanges,
+    ApplicationFilters,
+    ApplicationNote,
+    ApplicationNotePage,
+    ApplicationStats,
+    BatchCreateRequest,
+    BatchIdsRequest,
+    BatchItemResult,
+    BatchResponse,
     JobApplicationCreate,
+    JobApplicationPage,
+    JobApplicationPartial,
     JobApplicationUpdate,
     JobApplicationResponse,
+    SearchResults,
+    StatusHistoryPage,
+    StatusItem,
 )
+from app.routers.common import etag, is_not_modified, service_call, validators
 from app.services import job_application_service as svc
+from app.services.cursor import InvalidCursorError
+from app.services.job_application_service import (
+    ChangesExpiredError,
+    UnknownFieldError,
+    VersionConflictError,
+    parse_fields,
+)
 
 router = APIRouter(
     prefix='/api/v1/applications',
@@ -13,57 +45,471 @@ router = APIRouter(
 )
 
 
+def _parse_fields(fields: str | None) -> list[str] | None:
+    try:
+        return parse_fields(fields)
+    except UnknownFieldError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+# Read responses are serialized straight to JSON bytes. Returning a Response
+# skips FastAPI's response_model pass, which would validate the models again;
+# response_model still documents the schema.
+_APPLICATION_LIST = TypeAdapter(list[JobApplicationResponse])
+_PARTIAL_LIST = TypeAdapter(list[JobApplicationPartial])
+
+
+def _json(content: bytes, headers: dict[str, str] | None = None) -> Response:
+    return Response(content, media_type='application/json', headers=headers)
+
+
+def _msgpack(content: Any, headers: dict[str, str] | None = None) -> Response:
+    return Response(_pack(content), media_type=encoding.MSGPACK, headers=headers)
+
+
+@timed('serialization')
+def _dump_application(app: JobApplicationResponse | JobApplicationPartial, sparse: bool) -> bytes:
+    return app.model_dump_json(by_alias=True, exclude_unset=sparse).encode()
+
+
+@timed('serialization')
+def _dump_applications(apps: list[JobApplicationResponse] | list[JobApplicationPartial], sparse: bool) -> bytes:
+    if sparse:
+        return _PARTIAL_LIST.dump_json(apps, by_alias=True, exclude_unset=True)
+    return _APPLICATION_LIST.dump_json(apps, by_alias=True)
+
+
+@timed('serialization')
+def _application_objects(
+    apps: list[JobApplicationResponse] | list[JobApplicationPartial],
+    sparse: bool,
+) -> list[dict[str, Any]]:
+    """Applications as JSON-compatible objects, for the MessagePack representation."""
+    if sparse:
+        return _PARTIAL_LIST.dump_python(apps, mode='json', by_alias=True, exclude_unset=True)
+    return _APPLICATION_LIST.dump_python(apps, mode='json', by_alias=True)
+
+
+@timed('serialization')
+def _pack(content: Any) -> bytes:
+    return encoding.packb(content)
+
+
+def _application_etag(app: JobApplicationResponse | JobApplicationPartial, fields: list[str] | None = None) -> str:
+    """Entity tag of one application representation: ``"<item version>-<digest>"``.
+
+    The leading item version is what If-Match is checked against.
+    """
+    digest = etag(app.id, app.updated_at, ','.join(fields or [])).strip('"')
+    return f'"{app.item_version}-{digest}"'
+
+
+def _expected_version(if_match: str | None) -> int | None:
+    """Item version required by an If-Match header; None when absent or ``*``."""
+    if if_match is None or if_match.strip() == '*':
+        return None
+    tag = if_match.split(',')[0].strip().removeprefix('W/').strip('"')
+    try:
+        return int(tag.split('-')[0])
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail='If-Match must be an ETag returned by this API or an item version',
+        )
+
+
+def _version_conflict(e: VersionConflictError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e))
+
+
+def _not_found(app_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f'Application {app_id} not found',
+    )
+
+
+def _last_modified(app: JobApplicationResponse | JobApplicationPartial) -> datetime | None:
+    """Last write time of an application. Stored timestamps without a zone are UTC."""
+    if not app.updated_at:
+        return None
+    modified = datetime.fromisoformat(app.updated_at)
+    if modified.tzinfo is None:
+        modified = modified.replace(tzinfo=timezone.utc)
+    return modified.replace(microsecond=0)
+
+
+FIELDS_DESCRIPTION = 'Comma-separated fields to return, e.g. company,role,appliedDate. Defaults to all.'
+
+
+def _check_batch_size(count: int) -> None:
+    if count > settings.batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f'Batch requests are limited to {settings.batch_max_items} items',
+        )
+
+
 @router.post(
     '',
     response_model=JobApplicationResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_application(data: JobApplicationCreate) -> JobApplicationResponse:
-    return svc.create_application(data)
+async def create_application(data: JobApplicationCreate, response: Response) -> JobApplicationResponse:
+    app = await service_call('create_application', data)
+    response.headers.update(validators(_application_etag(app), _last_modified(app)))
+    return app
 
 
 @router.get(
     '',
-    response_model=list[JobApplicationResponse],
+    response_model=JobApplicationPage | list[JobApplicationResponse],
+    responses={200: {'content': {'application/json': {}, encoding.MSGPACK: {}}}},
+)
+async def list_applications(
+    request: Request,
+    limit: int = Query(settings.list_default_page_size, ge=1),
+    cursor: Optional[str] = None,
+    return_all: bool = Query(
+        False,
+        alias='all',
+        description='Return every application as a plain list (deprecated, unpaginated).',
+    ),
+    status_filter: Optional[ApplicationStatus] = Query(
+        None, alias='status', description='Current (latest) status.',
+    ),
+    company: Optional[str] = Query(None, description='Company name, case-insensitive exact match.'),
+    applied_from: Optional[date] = Query(None, alias='appliedFrom'),
+    applied_to: Optional[date] = Query(None, alias='appliedTo'),
+    top_job: Optional[bool] = Query(None, alias='topJob'),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    order: SortOrder = Query(SortOrder.ASC, description='By applied date; same-day applications by creation.'),
+) -> Response:
+    """List applications as JSON, or as MessagePack when the Accept header prefers it."""
+    selected = _parse_fields(fields)
+    packed = encoding.wants_msgpack(request.headers.get('accept'))
+    # The collection tag only depends on the table-wide data version, the
+    # query and the representation, so an unchanged collection is answered
+    # from one small read.
+    data_version = await service_call('get_data_version')
+    tag = etag('list', data_version, packed, sorted(request.query_params.multi_items()))
+    headers = {**validators(tag), 'Vary': 'Accept'}
+    if is_not_modified(request, tag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    filters = ApplicationFilters(
+        status=status_filter,
+        company=company,
+        applied_from=applied_from,
+        applied_to=applied_to,
+        top_job=top_job,
+    )
+    if return_all:
+        apps = await service_call('list_applications', filters, selected, order)
+        if packed:
+            return _msgpack(_application_objects(apps, bool(selected)), headers)
+        return _json(_dump_applications(apps, bool(selected)), headers)
+    try:
+        page = await service_call(
+            'list_applications_page', min(limit, settings.list_max_page_size), cursor, filters, selected, order,
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid cursor',
+        )
+    if packed:
+        return _msgpack(
+            {'items': _application_objects(page.items, bool(selected)), 'nextCursor': page.next_cursor},
+            headers,
+        )
+    return _json(
+        b'{"items":' + _dump_applications(page.items, bool(selected))
+        + b',"nextCursor":' + to_json(page.next_cursor) + b'}',
+        headers,
+    )
+
+
+@router.post(
+    ':batchCreate',
+    response_model=BatchResponse,
+)
+async def batch_create_applications(body: BatchCreateRequest) -> BatchResponse:
+    """Create many applications. Each item is validated and reported on separately."""
+    _check_batch_size(len(body.items))
+    results: list[BatchItemResult | None] = [None] * len(body.items)
+    valid: list[JobApplicationCreate] = []
+    valid_indexes: list[int] = []
+    for index, raw in enumerate(body.items):
+        try:
+            valid.append(JobApplicationCreate.model_validate(raw))
+            valid_indexes.append(index)
+        except ValidationError as e:
+            results[index] = BatchItemResult(index=index, success=False, error=str(e))
+
+    if valid:
+        for result in await service_call('batch_create_applications', valid):
+            result.index = valid_indexes[result.index]
+            results[result.index] = result
+    return BatchResponse(results=[result for result in results if result is not None])
+
+
+@router.post(
+    ':batchGet',
+    response_model=BatchResponse,
+)
+async def batch_get_applications(body: BatchIdsRequest) -> BatchResponse:
+    _check_batch_size(len(body.ids))
+    return BatchResponse(results=await service_call('batch_get_applications', body.ids))
+
+
+@router.post(
+    ':batchDelete',
+    response_model=BatchResponse,
+)
+async def batch_delete_applications(body: BatchIdsRequest) -> BatchResponse:
+    _check_batch_size(len(body.ids))
+    return BatchResponse(results=await service_call('batch_delete_applications', body.ids))
+
+
+def _export_ndjson() -> Iterator[bytes]:
+    for page in svc.iter_applications():
+        if page:
+            yield b''.join(app.model_dump_json(by_alias=True).encode() + b'\n' for app in page)
+
+
+def _export_json() -> Iterator[bytes]:
+    yield b'['
+    first = True
+    for page in svc.iter_applications():
+        chunk: list[bytes] = []
+        for app in page:
+            if not first:
+                chunk.append(b',')
+            chunk.append(app.model_dump_json(by_alias=True).encode())
+            first = False
+        if chunk:
+            yield b''.join(chunk)
+    yield b']'
+
+
+def _export_msgpack() -> Iterator[bytes]:
+    for page in svc.iter_applications():
+        if page:
+            yield b''.join(encoding.packb(app.model_dump(mode='json', by_alias=True)) for app in page)
+
+
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    responses={200: {'content': {'application/x-ndjson': {}, 'application/json': {}, encoding.MSGPACK: {}}}},
 )
-def list_applications() -> list[JobApplicationResponse]:
-    return svc.list_applications()
+def export_applications(
+    request: Request,
+    export_format: Optional[Literal['ndjson', 'json', 'msgpack']] = Query(
+        None,
+        alias='format',
+        description='Defaults to msgpack when the Accept header prefers it, else ndjson.',
+    ),
+) -> StreamingResponse:
+    """Stream every application, one DynamoDB page at a time.
+
+    msgpack is a sequence of concatenated MessagePack maps, one per application.
+    """
+    if export_format is None:
+        export_format = 'msgpack' if encoding.wants_msgpack(request.headers.get('accept')) else 'ndjson'
+    if export_format == 'msgpack':
+        if not encoding.msgpack_available():
+            raise HTTPException(
+                status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                detail='MessagePack is not available on this server',
+            )
+        return StreamingResponse(_export_msgpack(), media_type=encoding.MSGPACK)
+    if export_format == 'json':
+        return StreamingResponse(_export_json(), media_type='application/json')
+    return StreamingResponse(_export_ndjson(), media_type='application/x-ndjson')
+
+
+@router.get(
+    '/changes',
+    response_model=ApplicationChanges,
+    responses={410: {'description': 'Sync token too old; reload the full list'}},
+)
+async def list_changes(
+    since: Optional[str] = Query(None, description='nextToken of the previous call; omit for the first sync'),
+    limit: int = Query(settings.list_default_page_size, ge=1),
+) -> ApplicationChanges:
+    """Applications created, updated or deleted since a sync token, oldest first.
+
+    Keep calling with the returned nextToken while hasMore is true.
+    """
+    try:
+        return await service_call('list_changes', since, min(limit, settings.list_max_page_size))
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid sync token')
+    except ChangesExpiredError as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e))
+
+
+@router.get(
+    '/search',
+    response_model=SearchResults,
+)
+async def search_applications(
+    q: str = Query(..., min_length=1, max_length=500, description='Words to look for in company, role, description and notes'),
+    limit: int = Query(20, ge=1, le=100),
+) -> SearchResults:
+    """Keyword search, best matches first (BM25 over an inverted index)."""
+    return await service_call('search_applications', q, limit)
+
+
+@router.get(
+    '/stats',
+    response_model=ApplicationStats,
+)
+async def get_stats() -> ApplicationStats:
+    """Dashboard statistics: totals, counts by status, applications per ISO week and response rates."""
+    return await service_call('get_stats')
 
 
 @router.get(
     '/{app_id}',
     response_model=JobApplicationResponse,
 )
-def get_application(app_id: str) -> JobApplicationResponse | None:
-    app = svc.get_application(app_id)
+async def get_application(
+    app_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+) -> Response:
+    selected = _parse_fields(fields)
+    app = await service_call('get_application', app_id, selected)
     if app is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'Application {app_id} not found',
         )
-    return app
+
+    last_modified = _last_modified(app)
+    headers = validators(_application_etag(app, selected), last_modified)
+    if is_not_modified(request, headers['ETag'], last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return _json(_dump_application(app, bool(selected)), headers)
 
 
 @router.patch(
     '/{app_id}',
     response_model=JobApplicationResponse,
 )
-def update_application(app_id: str, data: JobApplicationUpdate) -> JobApplicationResponse:
-    app = svc.update_application(app_id, data)
+async def update_application(
+    app_id: str,
+    data: JobApplicationUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, description='Only update this ETag (or item version).'),
+) -> JobApplicationResponse:
+    try:
+        app = await service_call('update_application', app_id, data, _expected_version(if_match))
+    except VersionConflictError as e:
+        raise _version_conflict(e)
     if app is None:
+        raise _not_found(app_id)
+    response.headers.update(validators(_application_etag(app), _last_modified(app)))
+    return app
+
+
+async def _append(
+    name: str,
+    app_id: str,
+    entries: list[ApplicationNote] | list[StatusItem],
+    response: Response,
+    if_match: str | None,
+) -> JobApplicationPartial:
+    try:
+        delta = await service_call(name, app_id, entries, _expected_version(if_match))
+    except VersionConflictError as e:
+        raise _version_conflict(e)
+    if delta is None:
+        raise _not_found(app_id)
+    response.headers['ETag'] = _application_etag(delta)
+    return delta
+
+
+@router.post(
+    '/{app_id}/notes',
+    response_model=JobApplicationPartial,
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_201_CREATED,
+)
+async def append_notes(
+    app_id: str,
+    response: Response,
+    notes: list[ApplicationNote] = Body(..., min_length=1),
+    if_match: Optional[str] = Header(None),
+) -> JobApplicationPartial:
+    """Append notes to an application. Returns only the appended notes."""
+    return await _append('append_notes', app_id, notes, response, if_match)
+
+
+@router.post(
+    '/{app_id}/status',
+    response_model=JobApplicationPartial,
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_201_CREATED,
+)
+async def append_status(
+    app_id: str,
+    response: Response,
+    entries: list[StatusItem] = Body(..., min_length=1),
+    if_match: Optional[str] = Header(None),
+) -> JobApplicationPartial:
+    """Append status history entries. Returns only the appended entries."""
+    return await _append('append_status', app_id, entries, response, if_match)
+
+
+async def _history_page(name: str, app_id: str, limit: int, cursor: str | None) -> Any:
+    try:
+        page = await service_call(name, app_id, min(limit, settings.list_max_page_size), cursor)
+    except InvalidCursorError:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f'Application {app_id} not found',
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid cursor',
         )
-    return app
+    if page is None:
+        raise _not_found(app_id)
+    return page
+
+
+@router.get(
+    '/{app_id}/notes',
+    response_model=ApplicationNotePage,
+)
+async def list_notes(
+    app_id: str,
+    limit: int = Query(settings.list_default_page_size, ge=1),
+    cursor: Optional[str] = None,
+) -> ApplicationNotePage:
+    """One page of an application's notes, oldest first."""
+    return await _history_page('list_notes', app_id, limit, cursor)
+
+
+@router.get(
+    '/{app_id}/status',
+    response_model=StatusHistoryPage,
+)
+async def list_status(
+    app_id: str,
+    limit: int = Query(settings.list_default_page_size, ge=1),
+    cursor: Optional[str] = None,
+) -> StatusHistoryPage:
+    """One page of an application's status history, oldest first."""
+    return await _history_page('list_status', app_id, limit, cursor)
 
 
 @router.delete(
     '/{app_id}',
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_application(app_id: str):
-    existed = svc.delete_application(app_id)
+async def delete_application(app_id: str):
+    existed = await service_call('delete_application', app_id)
     if not existed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
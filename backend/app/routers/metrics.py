@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..instrumentation import registry
+
+router = APIRouter(tags=['Metrics'])
+
+
+@router.get('/metrics', response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Request and DynamoDB counters of this process, in the Prometheus text format."""
+    return PlainTextResponse(registry.render(), media_type='text/plain; version=0.0.4')
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Request, Response, status
+
+from app.models.reports import ApplicationReports, FunnelReport, SankeyReport
+from app.routers.common import etag, is_not_modified, service_call, validators
+
+router = APIRouter(
+    prefix='/api/v1/reports',
+    tags=['Reports'],
+)
+
+
+async def _report(request: Request, name: str | None = None) -> Response:
+    """One report, or all of them, as JSON tagged with the data version they reflect."""
+    data_version, reports = await service_call('get_reports')
+    tag = etag('report', name, data_version)
+    headers = validators(tag)
+    if is_not_modified(request, tag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    report = getattr(reports, name) if name else reports
+    return Response(report.model_dump_json(by_alias=True), media_type='application/json', headers=headers)
+
+
+@router.get('', response_model=ApplicationReports)
+async def get_reports(request: Request) -> Response:
+    """Every report in one response."""
+    return await _report(request)
+
+
+@router.get('/sankey', response_model=SankeyReport)
+async def get_sankey_report(request: Request) -> Response:
+    """Status flows from applied through responses and interviews to the outcome."""
+    return await _report(request, 'sankey')
+
+
+@router.get('/funnel', response_model=FunnelReport)
+async def get_funnel_report(request: Request) -> Response:
+    """Applications reaching each stage, conversion between stages and time spent in each status."""
+    return await _report(request, 'funnel')
@@ -0,0 +1,456 @@
+"""Asyncio counterpart of job_application_service.
+
+Builds the same items and update expressions as the sync service and sends
+them through the shared aiobotocore client, so the two backends store and
+return identical data and can be benchmarked side by side.
+"""
+import asyncio
+import heapq
+from typing import Any, Callable, Iterable
+
+from app.config import settings
+from app.db.async_dynamodb import from_attribute_values, get_async_client, to_attribute_values
+from app.db.batch import BATCH_WRITE_LIMIT, chunked
+from app.db.dynamodb import HEADERS_RANGE_KEY
+from app.db.serialization import model_to_dynamo
+from app.models.enums import SortOrder
+from app.models.job_application import (
+    ApplicationFilters,
+    ApplicationNote,
+    ApplicationStats,
+    JobApplicationCreate,
+    JobApplicationPage,
+    JobApplicationPartial,
+    JobApplicationResponse,
+    JobApplicationUpdate,
+    StatusItem,
+)
+from app.services import search, stats
+from app.services.cache import (
+    LIST_KEY,
+    application_key,
+    estimate_item_size,
+    get_cache,
+    invalidate_applications,
+)
+from app.services.job_application_service import (
+    HISTORY_FIELDS,
+    PageMerge,
+    STATS_WRITE_ATTEMPTS,
+    VersionConflictError,
+    WriteConflictError,
+    app_id_of,
+    app_key,
+    append_response,
+    append_transaction,
+    appended_status,
+    assemble,
+    check_failed_write,
+    collection_of,
+    collection_query,
+    data_version_update,
+    delete_transaction,
+    history_writes,
+    index_transaction,
+    new_item,
+    newer_document,
+    normalize_filters,
+    ordered,
+    projected_item,
+    projection,
+    query_sources,
+    shard_keys,
+    stats_transaction,
+    stats_update,
+    stored_items,
+    to_response,
+    to_responses,
+    update_request,
+    with_child_writes,
+)
+
+
+def _to_response(
+    item: dict[str, Any],
+    fields: list[str] | None = None,
+) -> JobApplicationResponse | JobApplicationPartial:
+    return to_response(from_attribute_values(item), fields)
+
+
+def _to_responses(
+    items: Iterable[dict[str, Any]],
+    fields: list[str] | None = None,
+) -> list[JobApplicationResponse] | list[JobApplicationPartial]:
+    return to_responses([from_attribute_values(item) for item in items], fields)
+
+
+def _marshal_update(request: dict[str, Any]) -> dict[str, Any]:
+    """Marshal the values of request arguments built by the sync service."""
+    for name in ('Key', 'Item', 'ExpressionAttributeValues'):
+        if name in request:
+            request[name] = to_attribute_values(request[name])
+    return request
+
+
+async def _bump_data_version(app_id: str | None = None) -> None:
+    client = await get_async_client()
+    await client.update_item(TableName=settings.dynamodb_table, **_marshal_update(data_version_update(app_id)))
+
+
+async def _transact(items: list[dict[str, Any]]) -> bool:
+    """Run a transaction. Returns False when a condition or a concurrent transaction cancelled it."""
+    client = await get_async_client()
+    try:
+        await client.transact_write_items(TransactItems=[
+            {operation: _marshal_update(dict(request)) for operation, request in item.items()}
+            for item in items
+        ])
+    except client.exceptions.TransactionCanceledException:
+        return False
+    return True
+
+
+async def _write_requests(requests: list[dict[str, Any]]) -> None:
+    """BatchWriteItem requests in chunks of 25, retrying unprocessed ones with backoff."""
+    client = await get_async_client()
+    table = settings.dynamodb_table
+    for chunk in chunked(requests, BATCH_WRITE_LIMIT):
+        pending = [
+            {'PutRequest': {'Item': to_attribute_values(request['PutRequest']['Item'])}} if 'PutRequest' in request
+            else {'DeleteRequest': {'Key': to_attribute_values(request['DeleteRequest']['Key'])}}
+            for request in chunk
+        ]
+        for attempt in range(settings.batch_max_retries + 1):
+            if attempt:
+                await asyncio.sleep(settings.batch_backoff_base * (2 ** (attempt - 1)))
+            response = await client.batch_write_item(RequestItems={table: pending})
+            pending = response.get('UnprocessedItems', {}).get(table, [])
+            if not pending:
+                break
+
+
+async def _reindex(app_id: str, item: dict[str, Any] | None, created: bool = False) -> None:
+    """Bring the search index of one application up to date; see job_application_service._reindex."""
+    try:
+        await _update_index(app_id, item, created)
+    except Exception:
+        search.logger.exception('Search index update failed for application %s', app_id)
+
+
+async def _read_document(app_id: str) -> dict[str, Any] | None:
+    client = await get_async_client()
+    response = await client.get_item(
+        TableName=settings.dynamodb_table,
+        Key=to_attribute_values(search.doc_key(app_id)),
+        ConsistentRead=True,
+    )
+    return from_attribute_values(response['Item']) if 'Item' in response else None
+
+
+async def _update_index(app_id: str, item: dict[str, Any] | None, created: bool) -> None:
+    """See job_application_service._index_document."""
+    doc = None if created else await _read_document(app_id)
+    for attempt in range(STATS_WRITE_ATTEMPTS):
+        if attempt:
+            doc = await _read_document(app_id)
+        if newer_document(doc, item):
+            return
+        postings, document, change = search.index_writes(app_id, doc, item)
+        if document is None or await _transact(index_transaction(app_id, doc, document, change)):
+            await _write_requests(postings)
+            return
+    raise WriteConflictError(f'Search document of application {app_id} kept changing')
+
+
+async def _read_counters(partition: str) -> list[dict[str, Any]]:
+    client = await get_async_client()
+    kwargs: dict[str, Any] = {
+        'TableName': settings.dynamodb_table,
+        'KeyConditionExpression': 'pk = :pk',
+        'ExpressionAttributeValues': {':pk': {'S': partition}},
+        'ConsistentRead': True,
+    }
+    items: list[dict[str, Any]] = []
+    while True:
+        response = await client.query(**kwargs)
+        items.extend(from_attribute_values(item) for item in response['Items'])
+        if 'LastEvaluatedKey' not in response:
+            return items
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+async def get_stats() -> ApplicationStats:
+    """Dashboard statistics, read from the counter items of every shard."""
+    shard_items = await asyncio.gather(*map(_read_counters, shard_keys(stats.STATS_PARTITION)))
+    return stats.summarize([item for items in shard_items for item in items])
+
+
+async def create_application(data: JobApplicationCreate) -> JobApplicationResponse:
+    """Create a new job application in DynamoDB, counting it in the statistics."""
+    item_data = new_item(data)
+    header, *children = stored_items(item_data)
+    transaction, overflow = with_child_writes(
+        stats_transaction('Put', {'Item': header}, None, item_data),
+        [{'PutRequest': {'Item': child}} for child in children],
+    )
+    for _ in range(STATS_WRITE_ATTEMPTS):
+        if await _transact(transaction):
+            break
+    else:
+        raise WriteConflictError('Could not create the application')
+    await _write_requests(overflow)
+    invalidate_applications()
+    await _reindex(app_id_of(item_data), item_data, created=True)
+
+    return to_response(item_data)
+
+
+async def get_application(
+    app_id: str,
+    fields: list[str] | None = None,
+) -> JobApplicationResponse | JobApplicationPartial | None:
+    """Get a single job application by ID, optionally only the given fields."""
+    if fields and not HISTORY_FIELDS.intersection(fields):
+        client = await get_async_client()
+        response = await client.get_item(
+            TableName=settings.dynamodb_table,
+            Key=to_attribute_values(app_key(app_id)),
+            **projection(fields),
+        )
+        item = response.get('Item')
+        return _to_response(item, fields) if item else None
+    if fields:
+        collection = await _read_collection(app_id)
+        if collection is None:
+            return None
+        return to_response(projected_item(assemble(collection), fields), fields)
+
+    cache = get_cache()
+    if cache is not None:
+        cached = cache.get(application_key(app_id))
+        if cached is not None:
+            return cached
+
+    collection = await _read_collection(app_id)
+    if collection is None:
+        return None
+    item = assemble(collection)
+    app = to_response(item)
+    if cache is not None:
+        cache.set(application_key(app_id), app, estimate_item_size(item))
+    return app
+
+
+def _marshal_query(query_kwargs: dict[str, Any]) -> dict[str, Any]:
+    query = {
+        **query_kwargs,
+        'TableName': settings.dynamodb_table,
+        'ExpressionAttributeValues': to_attribute_values(query_kwargs['ExpressionAttributeValues']),
+    }
+    if 'ExclusiveStartKey' in query:
+        query['ExclusiveStartKey'] = to_attribute_values(query['ExclusiveStartKey'])
+    return query
+
+
+async def _read_query(query_kwargs: dict[str, Any]) -> list[dict[str, Any]]:
+    client = await get_async_client()
+    paginator = client.get_paginator('query')
+    items: list[dict[str, Any]] = []
+    async for page in paginator.paginate(**_marshal_query(query_kwargs)):
+        items.extend(page.get('Items', []))
+    return items
+
+
+async def list_applications(
+    filters: ApplicationFilters | None = None,
+    fields: list[str] | None = None,
+    order: SortOrder = SortOrder.ASC,
+) -> list[JobApplicationResponse] | list[JobApplicationPartial]:
+    """List all job applications, reading the shards concurrently. See job_application_service.list_applications."""
+    filters = normalize_filters(filters)
+    if filters is not None or fields:
+        sources = [
+            {**source, **projection(fields, source['ExpressionAttributeNames'])}
+            for source in query_sources(filters, order)
+        ]
+        shard_items = await asyncio.gather(*(_read_query(source) for source in sources))
+        merged = heapq.merge(
+            *shard_items, key=lambda item: item[HEADERS_RANGE_KEY]['S'], reverse=order is SortOrder.DESC,
+        )
+        return _to_responses(merged, fields)
+
+    cache = get_cache()
+    if cache is not None:
+        cached = cache.get(LIST_KEY)
+        if cached is not None:
+            return ordered(cached, order)
+
+    shard_items = await asyncio.gather(*(_read_query(source) for source in query_sources(None)))
+    merged = list(heapq.merge(*shard_items, key=lambda item: item[HEADERS_RANGE_KEY]['S']))
+    apps = _to_responses(merged)
+    if cache is not None:
+        cache.set(LIST_KEY, apps, sum(estimate_item_size(item) for item in merged))
+    return ordered(apps, order)
+
+
+async def list_applications_page(
+    limit: int,
+    cursor: str | None = None,
+    filters: ApplicationFilters | None = None,
+    fields: list[str] | None = None,
+    order: SortOrder = SortOrder.ASC,
+) -> JobApplicationPage:
+    """List one page of job applications. See job_application_service.list_applications_page."""
+    client = await get_async_client()
+    merge = PageMerge(query_sources(normalize_filters(filters), order), cursor, limit, fields)
+    while requests := merge.requests():
+        responses = await asyncio.gather(*(client.query(**_marshal_query(query)) for _, query in requests))
+        for (number, _), response in zip(requests, responses):
+            last_key = response.get('LastEvaluatedKey')
+            merge.add(
+                number,
+                [from_attribute_values(item) for item in response.get('Items', [])],
+                from_attribute_values(last_key) if last_key else None,
+            )
+
+    return JobApplicationPage(
+        items=to_responses(merge.items, fields),
+        next_cursor=merge.next_cursor(),
+    )
+
+
+async def _read_collection(app_id: str, consistent: bool = False) -> list[dict[str, Any]] | None:
+    """An application item followed by its history children, or None when it does not exist."""
+    items = await _read_query({**collection_query(app_id), 'ConsistentRead': consistent})
+    return collection_of(app_id, [from_attribute_values(item) for item in items])
+
+
+async def _update_with_stats(
+    app_id: str,
+    fields_for: Callable[[dict[str, Any]], dict[str, Any]],
+    expected_version: int | None,
+) -> dict[str, Any] | None:
+    """Update an application, its children and its statistics in one transaction, retrying from the read."""
+    for _ in range(STATS_WRITE_ATTEMPTS):
+        collection = await _read_collection(app_id, consistent=True)
+        if collection is None:
+            return None
+        old = assemble(collection)
+        version = int(old.get('version', 0))
+        if expected_version is not None and version != expected_version:
+            raise VersionConflictError(version)
+        fields = fields_for(old)
+        request, new = stats_update(app_id, old, fields)
+        transaction, overflow = with_child_writes(
+            stats_transaction('Update', request, old, new),
+            history_writes(app_id, collection, fields),
+        )
+        if await _transact(transaction):
+            await _write_requests(overflow)
+            return new
+    raise WriteConflictError(f'Application {app_id} kept changing during the update')
+
+
+async def update_application(
+    app_id: str,
+    data: JobApplicationUpdate,
+    expected_version: int | None = None,
+) -> JobApplicationResponse | None:
+    """Partially update a job application, optionally only at ``expected_version``."""
+    fields = model_to_dynamo(data, exclude_unset=True)
+    if not fields:
+        current = await get_application(app_id)
+        if current is not None and expected_version is not None and current.item_version != expected_version:
+            raise VersionConflictError(current.item_version)
+        return current
+
+    if stats.STATS_FIELDS.intersection(fields) or HISTORY_FIELDS.intersection(fields):
+        try:
+            item = await _update_with_stats(app_id, lambda old: fields, expected_version)
+        finally:
+            invalidate_applications(app_id)
+        if item and search.TEXT_FIELDS.intersection(fields):
+            await _reindex(app_id, item)
+        return to_response(item) if item else None
+
+    request = _marshal_update(update_request(app_id, fields, expected_version))
+    client = await get_async_client()
+    try:
+        await client.update_item(TableName=settings.dynamodb_table, **request)
+    except client.exceptions.ConditionalCheckFailedException as e:
+        check_failed_write(e.response.get('Item'), expected_version)
+        return None
+    finally:
+        invalidate_applications(app_id)
+
+    await _bump_data_version(app_id)
+    collection = await _read_collection(app_id, consistent=True)
+    if collection is None:
+        return None
+    item = assemble(collection)
+    if search.TEXT_FIELDS.intersection(fields):
+        await _reindex(app_id, item)
+    return to_response(item)
+
+
+async def append_notes(
+    app_id: str,
+    notes: list[ApplicationNote],
+    expected_version: int | None = None,
+) -> JobApplicationPartial | None:
+    """Append notes as new child items, without reading the stored ones."""
+    client = await get_async_client()
+    transaction, overflow = append_transaction(app_id, notes, expected_version)
+    try:
+        for _ in range(STATS_WRITE_ATTEMPTS):
+            if await _transact(transaction):
+                break
+            response = await client.get_item(
+                TableName=settings.dynamodb_table,
+                Key=to_attribute_values(app_key(app_id)),
+                ConsistentRead=True,
+            )
+            if not check_failed_write(response.get('Item'), expected_version):
+                return None
+        else:
+            raise WriteConflictError(f'Application {app_id} kept changing while appending notes')
+        await _write_requests(overflow)
+    finally:
+        invalidate_applications(app_id)
+
+    collection = await _read_collection(app_id, consistent=True)
+    if collection is None:
+        return None
+    item = assemble(collection)
+    await _reindex(app_id, item)
+    return append_response(app_id, 'notes', notes, item)
+
+
+async def append_status(
+    app_id: str,
+    entries: list[StatusItem],
+    expected_version: int | None = None,
+) -> JobApplicationPartial | None:
+    """Append status history entries in a stats transaction."""
+    try:
+        item = await _update_with_stats(app_id, appended_status(entries), expected_version)
+    finally:
+        invalidate_applications(app_id)
+    return append_response(app_id, 'status', entries, item) if item else None
+
+
+async def delete_application(app_id: str) -> bool:
+    """Delete a job application, leaving a change-feed tombstone. Returns True if it existed."""
+    try:
+        for _ in range(STATS_WRITE_ATTEMPTS):
+            collection = await _read_collection(app_id, consistent=True)
+            if collection is None:
+                return False
+            transaction, overflow = delete_transaction(app_id, collection)
+            if await _transact(transaction):
+                await _write_requests(overflow)
+                await _reindex(app_id, None)
+                return True
+    finally:
+        invalidate_applications(app_id)
+    raise WriteConflictError(f'Application {app_id} kept changing during the delete')
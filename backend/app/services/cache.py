@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Hashable
+
+from boto3.dynamodb.types import Binary
+
+from app.config import settings
+from app.models.responses import CacheStatsResponse
+
+
+def estimate_item_size(value: Any) -> int:
+    """Approximate the DynamoDB size in bytes of an item or attribute value."""
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, Binary):
+        return len(value.value)
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float, Decimal)):
+        return len(str(value)) // 2 + 1
+    if isinstance(value, dict):
+        return 3 + sum(len(str(key)) + estimate_item_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return 3 + sum(1 + estimate_item_size(item) for item in value)
+    return len(str(value))
+
+
+class TTLCache:
+    """Thread-safe LRU cache bounded by entry count and total bytes, with a TTL per entry."""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, _, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStatsResponse:
+        with self._lock:
+            return CacheStatsResponse(
+                enabled=True,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+LIST_KEY = ('list',)
+
+_cache: TTLCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> TTLCache | None:
+    """Get the process-wide application cache, or None when caching is disabled."""
+    global _cache
+    if not settings.cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TTLCache(
+                    max_entries=settings.cache_max_entries,
+                    max_bytes=settings.cache_max_bytes,
+                    ttl_seconds=settings.cache_ttl_seconds,
+                )
+    return _cache
+
+
+def reset_cache() -> None:
+    """Drop the cache and its counters. The next get_cache() builds a new one from settings."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def application_key(app_id: str) -> tuple[str, str]:
+    return ('app', app_id)
+
+
+def invalidate_applications(*app_ids: str) -> None:
+    """Forget cached reads affected by a write to the given applications."""
+    cache = get_cache()
+    if cache is not None:
+        cache.invalidate(LIST_KEY, *(application_key(app_id) for app_id in app_ids))
+
+
+def cache_stats() -> CacheStatsResponse:
+    cache = get_cache()
+    if cache is None:
+        return CacheStatsResponse(enabled=False)
+    return cache.stats()
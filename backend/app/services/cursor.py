@@ -0,0 +1,50 @@
+import base64
+import hashlib
+import hmac
+import json
+from typing import Any
+
+from app.config import settings
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or has been tampered with."""
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(settings.cursor_secret.encode(), payload, hashlib.sha256).digest()
+
+
+def encode_cursor(key: dict[str, Any]) -> str:
+    """Wrap a DynamoDB LastEvaluatedKey in an opaque, signed cursor."""
+    payload = json.dumps(key, separators=(',', ':'), sort_keys=True).encode()
+    return f'{_b64encode(payload)}.{_b64encode(_sign(payload))}'
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Unwrap a cursor produced by encode_cursor() into an ExclusiveStartKey."""
+    try:
+        payload_part, signature_part = cursor.split('.', 1)
+        payload = _b64decode(payload_part)
+        signature = _b64decode(signature_part)
+    except ValueError as e:
+        raise InvalidCursorError('Malformed cursor') from e
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursorError('Cursor signature mismatch')
+
+    try:
+        key = json.loads(payload)
+    except ValueError as e:
+        raise InvalidCursorError('Malformed cursor') from e
+    if not isinstance(key, dict):
+        raise InvalidCursorError('Malformed cursor')
+    return key
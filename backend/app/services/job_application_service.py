@@ -1,52 +1,382 @@
-from datetime import date, datetime
-from typing import Any, cast
-from uuid import uuid4
+import heapq
+import logging
+import os
+import random
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Literal, cast
+from uuid import UUID
 
 from boto3.dynamodb.conditions import Key
 
-from app.db.dynamodb import get_table
+from app.config import settings
+from app.db.batch import batch_get, batch_write, chunked
+from app.db.compression import COMPRESSED_FIELDS, compress_fields, decompress_fields, decompress_text
+from app.db.serialization import model_to_dynamo, to_dynamo
+from app.db.dynamodb import (
+    APPLIED_INDEX,
+    CHANGES_HASH_KEY,
+    CHANGES_INDEX,
+    CHANGES_RANGE_KEY,
+    COMPANY_INDEX,
+    HEADERS_INDEX,
+    HEADERS_RANGE_KEY,
+    INDEX_HASH_KEYS,
+    INDEX_RANGE_KEY,
+    STATUS_INDEX,
+    TOP_JOB_INDEX,
+    TTL_ATTRIBUTE,
+    get_executor,
+    get_table,
+)
+from app.instrumentation import timed
+from app.models.enums import ApplicationStatus, SortOrder
+from app.models.reports import ApplicationReports
 from app.models.job_application import (
+    ApplicationChange,
+    ApplicationChanges,
+    ApplicationFilters,
+    ApplicationNote,
+    ApplicationNotePage,
+    ApplicationStats,
+    BatchItemResult,
+    JobApplicationBase,
     JobApplicationCreate,
+    JobApplicationPage,
+    JobApplicationPartial,
     JobApplicationResponse,
     JobApplicationUpdate,
+    SearchHit,
+    SearchResults,
+    StatusHistoryPage,
+    StatusItem,
+)
+from app.services import reports, search, stats
+from app.services.cache import (
+    LIST_KEY,
+    application_key,
+    estimate_item_size,
+    get_cache,
+    invalidate_applications,
 )
+from app.services.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+try:
+    from uuid import uuid7
+except ImportError:  # Python < 3.14
+    def uuid7() -> UUID:
+        """A version 7 UUID: Unix time in milliseconds, then random bits."""
+        value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+        value = value & ~(0xF << 76) | 0x7 << 76  # version
+        value = value & ~(0x3 << 62) | 0x2 << 62  # variant
+        return UUID(int=value)
+
+logger = logging.getLogger(__name__)
 
 PARTITION_KEY = 'JOB_APPS'
 SK_PREFIX = 'APP#'
 
+# Table-wide data version, bumped after every write. Lets clients and caches
+# tell whether anything changed without reading the applications. Sharded
+# like the statistics counters: META#<shard> with write sharding, read as the
+# sum over the shards.
+DATA_VERSION_PARTITION = 'META'
+DATA_VERSION_SK = 'DATA_VERSION'
 
-def _serialize_for_dynamo(data: dict[str, Any]) -> dict[str, Any]:
-    """Convert Python types to DynamoDB-compatible types."""
-    serialized: dict[str, Any] = {}
-    for key, value in data.items():
-        if value is None:
+# Tries of a transactional write (see app.services.stats) before giving up on
+# concurrent writers
+STATS_WRITE_ATTEMPTS = 3
+
+# Derived attributes that back the filter indexes (see app.db.dynamodb). With
+# write sharding their values carry the application's shard, e.g. JOB_APP#3
+# or SCREEN#3, so the applications of one status don't share a single index
+# partition; filtered reads query every shard.
+ITEM_TYPE = 'JOB_APP'
+TOP_JOB_KEY = 'TOP'
+INDEX_ATTRIBUTES = set(INDEX_HASH_KEYS.values())
+
+# Change feed (see app.db.dynamodb.CHANGES_INDEX): applications and the
+# tombstones deletes leave behind share this hash key value, which with
+# write sharding carries the application's shard like the filter index keys.
+# Tombstones are stored in the TOMBSTONE partition of the shard.
+CHANGE_FEED = 'CHANGES'
+TOMBSTONE_PARTITION = 'TOMBSTONE'
+
+# Status and note entries are child items in their application's item
+# collection, next to the application item APP#<id>:
+# APP#<id>#STATUS#<occur date>#<seq> and APP#<id>#NOTE#<occur date>#<seq>.
+# The application item keeps the latest status (latest_status and
+# current_status), which is all lists and the change feed return.
+HISTORY_TYPES = {'status': 'STATUS', 'notes': 'NOTE'}
+HISTORY_FIELDS = frozenset(HISTORY_TYPES)
+_HISTORY_FIELD_OF = {entry_type: field for field, entry_type in HISTORY_TYPES.items()}
+
+# Most actions one TransactWriteItems call may carry
+TRANSACT_ITEMS_LIMIT = 100
+
+
+# Fields clients may select with a sparse projection, by camelCase alias and name
+PROJECTABLE_FIELDS: dict[str, str] = {
+    alias: name
+    for name, field in JobApplicationResponse.model_fields.items()
+    for alias in (name, field.alias or name)
+}
+
+
+class UnknownFieldError(ValueError):
+    """Raised when a sparse projection names a field the response doesn't have."""
+
+
+class WriteConflictError(Exception):
+    """Raised when a write kept being cancelled by concurrent writes."""
+
+
+class ChangesExpiredError(Exception):
+    """Raised when a sync token predates the tombstones still kept, so deletions may be missing."""
+
+
+class VersionConflictError(Exception):
+    """Raised when a conditional write expected a different item version."""
+
+    def __init__(self, current_version: int):
+        super().__init__(f'Application is at version {current_version}')
+        self.current_version = current_version
+
+
+def parse_fields(value: str | None) -> list[str] | None:
+    """Parse a comma-separated `fields` parameter into response field names.
+
+    Accepts camelCase aliases or snake_case names. Returns None when no
+    projection was requested.
+    """
+    if not value:
+        return None
+    fields: list[str] = []
+    for raw in value.split(','):
+        raw = raw.strip()
+        if not raw:
             continue
-        if isinstance(value, (date, datetime)):
-            serialized[key] = value.isoformat()
-        elif isinstance(value, list):
-            serialized[key] = [
-                _serialize_for_dynamo(cast(dict[str, Any], item)) if isinstance(item, dict) else item
-                for item in cast(list[Any], value)
-            ]
-        elif isinstance(value, dict):
-            serialized[key] = _serialize_for_dynamo(cast(dict[str, Any], value))
-        elif hasattr(value, 'value'):
-            # Enum
-            serialized[key] = value.value
-        else:
-            serialized[key] = value
-    return serialized
+        if raw not in PROJECTABLE_FIELDS:
+            raise UnknownFieldError(f'Unknown field: {raw}')
+        fields.append(PROJECTABLE_FIELDS[raw])
+    return list(dict.fromkeys(fields)) or None
+
+
+def projection(fields: list[str] | None, names: dict[str, str] | None = None) -> dict[str, Any]:
+    """ProjectionExpression arguments reading only the given fields (plus the key).
+
+    Merges into the ExpressionAttributeNames of an existing request if given.
+    """
+    if not fields:
+        return {}
+    # header_sk orders the shards when they are merged; pages resume from pk, sk and header_sk
+    attributes = ['pk', 'sk', HEADERS_RANGE_KEY, *(field for field in fields if field != 'id')]
+    if 'status' in fields:
+        # Application items only carry the latest status (see _status_entries)
+        attributes.append('latest_status')
+    placeholders = {f'#p{i}': attribute for i, attribute in enumerate(attributes)}
+    return {
+        'ProjectionExpression': ', '.join(placeholders),
+        'ExpressionAttributeNames': {**(names or {}), **placeholders},
+    }
+
+
+# Scalar response fields copied from the item as stored, with their defaults
+_PLAIN_FIELDS = {
+    name: field.default
+    for name, field in JobApplicationBase.model_fields.items()
+    if name not in {'applied_date', 'status', 'notes'}
+}
+
+
+def _status_entries(item: dict[str, Any]) -> list[dict[str, Any]]:
+    """Status history of an assembled item, or the latest status of an application item alone."""
+    if 'status' in item:
+        return item['status'] or []
+    latest = item.get('latest_status')
+    return [latest] if latest else []
+
+
+def _note_count(item: dict[str, Any]) -> int:
+    """Notes of an assembled item, or the count an application item alone stores."""
+    if 'notes' in item:
+        return len(item['notes'] or ())
+    return int(item.get('note_count', 0))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    # Applications share few distinct dates, so parsing is mostly a cache hit
+    return date.fromisoformat(value)
+
+
+def _construct_response(item: dict[str, Any]) -> JobApplicationResponse | None:
+    """Build a response from an item this service wrote, skipping validation.
+
+    Items are validated on the way in, so reads only restore types: dates, the
+    status enum and the nested models. Returns None for items that don't have
+    the shape the service writes, which take the validating path instead.
+    """
+    applied_date = item.get('applied_date')
+    if not isinstance(applied_date, str) or 'company' not in item or 'role' not in item:
+        return None
+
+    values = {name: item.get(name, default) for name, default in _PLAIN_FIELDS.items()}
+    for name in COMPRESSED_FIELDS:
+        values[name] = decompress_text(values[name])
+    values['id'] = item['sk'].removeprefix(SK_PREFIX)
+    values['applied_date'] = _parse_date(applied_date)
+    values['status'] = [
+        StatusItem.from_trusted({
+            'occur_date': _parse_date(entry['occur_date']),
+            'status': ApplicationStatus(entry['status']),
+        })
+        for entry in _status_entries(item)
+    ]
+    values['notes'] = [
+        ApplicationNote.from_trusted({
+            'occur_date': _parse_date(note['occur_date']),
+            'description': note['description'],
+        })
+        for note in item.get('notes') or ()
+    ]
+    values['note_count'] = _note_count(item)
+    return JobApplicationResponse.from_trusted(values)
+
 
+def projected_item(item: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+    """The attributes of an assembled item a sparse projection of ``fields`` would read."""
+    return {key: item[key] for key in ('sk', *fields, 'version', 'updated_at') if key in item}
 
-def _deserialize_from_dynamo(item: dict[str, Any]) -> dict[str, Any]:
-    """Convert DynamoDB item to application dict."""
+
+def _response(
+    item: dict[str, Any],
+    fields: list[str] | None = None,
+) -> JobApplicationResponse | JobApplicationPartial:
+    """Build the full response model, or the sparse one when fields were projected."""
+    app = None if fields else _construct_response(item)
+    if app is None:
+        model = JobApplicationPartial if fields else JobApplicationResponse
+        values = _deserialize_from_dynamo(item, fields)
+        # Application items hold no notes, nor a status before the first one
+        values.update((field, []) for field in HISTORY_FIELDS.intersection(fields or ()) if field not in values)
+        app = model(**values)
+    return app.with_storage_metadata(int(item.get('version', 0)), item.get('updated_at'))
+
+
+@timed('validation')
+def to_response(
+    item: dict[str, Any],
+    fields: list[str] | None = None,
+) -> JobApplicationResponse | JobApplicationPartial:
+    return _response(item, fields)
+
+
+@timed('validation')
+def to_responses(
+    items: Iterable[dict[str, Any]],
+    fields: list[str] | None = None,
+) -> list[JobApplicationResponse] | list[JobApplicationPartial]:
+    """Response models of a list of items, timed once rather than per item."""
+    return [_response(item, fields) for item in items]
+
+
+def _shard_key(key: str, shard: int, shard_count: int) -> str:
+    """Partition key of one shard. A single shard keeps the legacy unsuffixed key."""
+    if shard_count <= 1:
+        return key
+    return f'{key}#{shard}'
+
+
+def _shard_partition(shard: int, shard_count: int) -> str:
+    return _shard_key(PARTITION_KEY, shard, shard_count)
+
+
+def _partitions(shard_count: int | None = None) -> list[str]:
+    """All partition keys applications are written under, in shard order."""
+    count = shard_count or settings.shard_count
+    return [_shard_partition(shard, count) for shard in range(max(count, 1))]
+
+
+def _shard_of(app_id: str, shard_count: int) -> int:
+    return zlib.crc32(app_id.encode()) % max(shard_count, 1)
+
+
+def _partition_for(app_id: str, shard_count: int | None = None) -> str:
+    """Partition key an application id is written under."""
+    count = shard_count or settings.shard_count
+    return _shard_partition(_shard_of(app_id, count), count)
+
+
+def _index_key(value: str, app_id: str) -> str:
+    """Hash key value of a filter index for an application: ``value`` in the application's shard."""
+    count = settings.shard_count
+    return _shard_key(value, _shard_of(app_id, count), count)
+
+
+def _counter_partition(key: str, app_id: str | None = None) -> str:
+    """Shard of a counter partition a write adds to: the application's shard, or any for batch writes."""
+    count = settings.shard_count
+    shard = _shard_of(app_id, count) if app_id else random.randrange(max(count, 1))
+    return _shard_key(key, shard, count)
+
+
+def shard_keys(key: str) -> list[str]:
+    """Every shard of a sharded key (counter partition, change feed), after the unsuffixed one.
+
+    Reads go over all of them. Counters are only ever added to, so their
+    value is the sum over the shards; the unsuffixed key holds what was
+    written before write sharding and stays part of the sum and the feed.
+    """
+    count = settings.shard_count
+    return list(dict.fromkeys([key, *(_shard_key(key, shard, count) for shard in range(max(count, 1)))]))
+
+
+def _new_id() -> str:
+    """Id of a new application. Ids are time-ordered (UUIDv7), so newer ids sort after older ones.
+
+    Ids created before were random (uuid4); they keep resolving, as lookups
+    only ever use the id as a whole.
+    """
+    return str(uuid7())
+
+
+def _header_sk(applied_date: str, app_id: str) -> str:
+    """Headers index range key: lists come in applied date order, then in id (creation) order.
+
+    The applied date is set at creation only, so the key never changes.
+    """
+    return f'{applied_date}#{app_id}'
+
+
+def app_key(app_id: str) -> dict[str, str]:
+    """Primary key of an application item."""
+    return {
+        'pk': _partition_for(app_id),
+        'sk': f'{SK_PREFIX}{app_id}',
+    }
+
+
+def _serialize_for_dynamo(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert Python types to DynamoDB-compatible types, compressing large text (see app.db.compression)."""
+    return compress_fields(to_dynamo(data))
+
+
+def _deserialize_from_dynamo(item: dict[str, Any], fields: list[str] | None = None) -> dict[str, Any]:
+    """Convert DynamoDB item to application dict, limited to the projected ``fields`` if given."""
     app_id = item['sk'].removeprefix(SK_PREFIX)
+    # Only the fields read are decompressed; sparse reads project the others away
+    item = decompress_fields(item)
 
     result: dict[str, Any] = {
         'id': app_id,
     }
 
-    skip_keys = {'pk', 'sk', 'created_at', 'updated_at'}
+    skip_keys = {
+        'pk', 'sk', 'created_at', 'updated_at', 'version', 'latest_status', HEADERS_RANGE_KEY, *INDEX_ATTRIBUTES,
+    }
     date_fields = {'applied_date', 'status_date'}
 
     for key, value in item.items():
@@ -66,12 +396,21 @@ def _deserialize_from_dynamo(item: dict[str, Any]) -> dict[str, Any]:
             ]
         else:
             result[key] = value
+    if 'status' not in item and 'latest_status' in item:
+        result['status'] = _status_entries(item)
+    if fields is None or 'note_count' in fields:
+        # The same count _construct_response gives, whether or not the notes were read
+        result['note_count'] = _note_count(item)
 
     return result
 
 
-def _build_update_expression(data: dict[str, Any]) -> tuple[str, dict[str, str], dict[str, Any]]:
-    """Build DynamoDB SET UpdateExpression with attribute name placeholders."""
+def _build_update_expression(
+    data: dict[str, Any],
+    remove: list[str] | None = None,
+    add: dict[str, Any] | None = None,
+) -> tuple[str, dict[str, str], dict[str, Any]]:
+    """Build DynamoDB SET (plus optional REMOVE and ADD) UpdateExpression with attribute name placeholders."""
     set_parts: list[str] = []
     expression_names: dict[str, str] = {}
     expression_values: dict[str, Any] = {}
@@ -84,104 +423,1432 @@ def _build_update_expression(data: dict[str, Any]) -> tuple[str, dict[str, str],
         expression_values[value_placeholder] = value
 
     expression = 'SET ' + ', '.join(set_parts)
+
+    remove_parts: list[str] = []
+    for i, key in enumerate(remove or []):
+        name_placeholder = f'#rm{i}'
+        remove_parts.append(name_placeholder)
+        expression_names[name_placeholder] = key
+    if remove_parts:
+        expression += ' REMOVE ' + ', '.join(remove_parts)
+
+    add_parts: list[str] = []
+    for i, (key, value) in enumerate((add or {}).items()):
+        add_parts.append(f'#add{i} :add{i}')
+        expression_names[f'#add{i}'] = key
+        expression_values[f':add{i}'] = value
+    if add_parts:
+        expression += ' ADD ' + ', '.join(add_parts)
+
     return expression, expression_names, expression_values
 
 
-def create_application(data: JobApplicationCreate) -> JobApplicationResponse:
-    """Create a new job application in DynamoDB."""
-    table = get_table()
-    app_id = str(uuid4())
+def _latest_status(status: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Latest status entry by occur date; later entries win ties."""
+    if not status:
+        return None
+    _, latest = max(enumerate(status), key=lambda entry: (str(entry[1].get('occur_date', '')), entry[0]))
+    return {'occur_date': latest['occur_date'], 'status': latest['status']}
+
+
+def _current_status(status: list[dict[str, Any]]) -> str:
+    """Latest status by occur date; later entries win ties. APPLIED when there is no history."""
+    latest = _latest_status(status)
+    return str(latest['status']) if latest else ApplicationStatus.APPLIED.value
+
+
+def _company_key(company: str) -> str:
+    return company.strip().lower()
+
+
+def _index_attributes(app_id: str, fields: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+    """Derived attributes (index keys, latest status, note count) for the serialized fields present.
+
+    Returns the attributes to set and the attribute names to remove.
+    """
+    values: dict[str, Any] = {}
+    remove: list[str] = []
+    if 'status' in fields:
+        latest = _latest_status(fields['status'])
+        values['current_status'] = _index_key(
+            str(latest['status']) if latest else ApplicationStatus.APPLIED.value, app_id,
+        )
+        if latest:
+            values['latest_status'] = latest
+        else:
+            remove.append('latest_status')
+    if 'notes' in fields:
+        # Lists read application items only, so they show the count instead of the notes
+        values['note_count'] = len(fields['notes'] or ())
+    if 'company' in fields:
+        values['company_key'] = _index_key(_company_key(fields['company']), app_id)
+    if 'top_job' in fields:
+        if fields['top_job']:
+            values['top_job_key'] = _index_key(TOP_JOB_KEY, app_id)
+        else:
+            remove.append('top_job_key')
+    return values, remove
+
+
+def new_item(data: JobApplicationCreate, app_id: str | None = None) -> dict[str, Any]:
+    """Build the assembled item of a new application; stored_items gives the items to write."""
+    app_id = app_id or _new_id()
     now = datetime.now().isoformat()
 
-    item_data = _serialize_for_dynamo(data.model_dump())
-    item_data['pk'] = PARTITION_KEY
-    item_data['sk'] = f'{SK_PREFIX}{app_id}'
+    item_data = model_to_dynamo(data)
+    item_data.update(_index_attributes(app_id, item_data)[0])
+    item_data['item_type'] = _index_key(ITEM_TYPE, app_id)
+    item_data[CHANGES_HASH_KEY] = _index_key(CHANGE_FEED, app_id)
+    item_data.update(app_key(app_id))
+    item_data[HEADERS_RANGE_KEY] = _header_sk(item_data['applied_date'], app_id)
     item_data['created_at'] = now
     item_data['updated_at'] = now
+    item_data['version'] = 1
+    return item_data
+
+
+def _entry_type(item: dict[str, Any]) -> str | None:
+    """STATUS or NOTE for a history child item, None for an application item."""
+    _, _, entry = item['sk'].removeprefix(SK_PREFIX).partition('#')
+    return entry.partition('#')[0] or None
+
+
+def item_key(item: dict[str, Any]) -> dict[str, str]:
+    """Primary key of a stored item."""
+    return {'pk': item['pk'], 'sk': item['sk']}
+
+
+def _entry(item: dict[str, Any]) -> dict[str, Any]:
+    """The status or note entry a child item stores."""
+    return {key: value for key, value in item.items() if key not in ('pk', 'sk')}
+
+
+def _history_items(app_id: str, fields: dict[str, Any], stamp: int | None = None) -> list[dict[str, Any]]:
+    """Child items storing the status and note entries among serialized ``fields``.
+
+    Sort keys order the entries by occur date, then by when they were
+    written (``stamp``, nanoseconds, default now), so entries of the same
+    date keep their order.
+    """
+    partition = _partition_for(app_id)
+    stamp = stamp or time.time_ns()
+    items: list[dict[str, Any]] = []
+    for field, entry_type in HISTORY_TYPES.items():
+        for entry in fields.get(field) or ():
+            items.append({
+                **entry,
+                'pk': partition,
+                'sk': f'{SK_PREFIX}{app_id}#{entry_type}#{entry["occur_date"]}#{stamp:016x}{len(items):04x}',
+            })
+    return items
+
+
+def _header(item: dict[str, Any]) -> dict[str, Any]:
+    """The application item of an assembled item: everything but the history lists."""
+    return {key: value for key, value in item.items() if key not in HISTORY_FIELDS}
+
+
+def stored_items(item: dict[str, Any], stamp: int | None = None) -> list[dict[str, Any]]:
+    """Items that store an assembled item: the application item, then its history children."""
+    return [compress_fields(_header(item)), *_history_items(app_id_of(item), item, stamp)]
+
+
+def _assembled(items: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Assembled items of item collections read in sort key order.
+
+    An assembled item is the application item with its ``status`` and
+    ``notes`` lists filled in from the children, after any entries an older
+    item still stores inline. Children without their application item (left
+    by a delete that did not finish) are skipped.
+    """
+    current: dict[str, Any] | None = None
+    for item in items:
+        entry_type = _entry_type(item)
+        if entry_type is None:
+            if current is not None:
+                yield current
+            current = {**item, **{field: list(item.get(field) or []) for field in HISTORY_FIELDS}}
+        elif current is not None and app_id_of(item) == app_id_of(current):
+            current[_HISTORY_FIELD_OF[entry_type]].append(_entry(item))
+    if current is not None:
+        yield current
+
+
+def assemble(collection: list[dict[str, Any]]) -> dict[str, Any]:
+    return next(_assembled(collection))
+
+
+def collection_query(app_id: str) -> dict[str, Any]:
+    """Query arguments reading an application's item collection."""
+    key = app_key(app_id)
+    return {
+        'KeyConditionExpression': '#pk = :pk AND begins_with(#sk, :sk)',
+        'ExpressionAttributeNames': {'#pk': 'pk', '#sk': 'sk'},
+        'ExpressionAttributeValues': {':pk': key['pk'], ':sk': key['sk']},
+    }
+
+
+def collection_of(app_id: str, items: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+    """The items of an application's collection query that belong to it; None without the application item."""
+    sk = f'{SK_PREFIX}{app_id}'
+    # begins_with also matches longer ids starting with this one
+    items = [item for item in items if item['sk'] == sk or item['sk'].startswith(sk + '#')]
+    return items if items and items[0]['sk'] == sk else None
+
+
+def history_writes(app_id: str, collection: list[dict[str, Any]], serialized: dict[str, Any]) -> list[dict[str, Any]]:
+    """BatchWriteItem requests storing the history fields of ``serialized`` as child items.
+
+    When the stored entries are the start of the new list, only the entries
+    after them are written, so appends leave the stored children alone.
+    Otherwise the stored children (and any inline list) are replaced.
+    """
+    parent, children = collection[0], collection[1:]
+    writes: list[dict[str, Any]] = []
+    added: dict[str, list[dict[str, Any]]] = {}
+    for field, entry_type in HISTORY_TYPES.items():
+        if field not in serialized:
+            continue
+        stored = [child for child in children if _entry_type(child) == entry_type]
+        entries = serialized[field] or []
+        if field not in parent and entries[:len(stored)] == [_entry(child) for child in stored]:
+            added[field] = entries[len(stored):]
+        else:
+            writes.extend({'DeleteRequest': {'Key': item_key(child)}} for child in stored)
+            added[field] = entries
+    writes.extend({'PutRequest': {'Item': item}} for item in _history_items(app_id, added))
+    return writes
+
+
+def with_child_writes(
+    transaction: list[dict[str, Any]],
+    requests: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Add child item writes (BatchWriteItem requests) to a transaction, as many as it can carry.
+
+    Returns the transaction and the requests left over, which are written
+    once the transaction has committed.
+    """
+    table_name = settings.dynamodb_table
+    room = TRANSACT_ITEMS_LIMIT - len(transaction)
+    actions = [
+        {'Put': {'Item': request['PutRequest']['Item'], 'TableName': table_name}} if 'PutRequest' in request
+        else {'Delete': {'Key': request['DeleteRequest']['Key'], 'TableName': table_name}}
+        for request in requests[:room]
+    ]
+    return [*transaction, *actions], requests[room:]
+
+
+def _with_condition(request: dict[str, Any], expected_version: int | None = None) -> dict[str, Any]:
+    """Require the item to exist, optionally at ``expected_version``."""
+    conditions = ['attribute_exists(pk)']
+    if expected_version is not None:
+        request['ExpressionAttributeNames']['#ver'] = 'version'
+        if expected_version:
+            conditions.append('#ver = :expected_version')
+            request['ExpressionAttributeValues'][':expected_version'] = expected_version
+        else:
+            # Items written before versioning have no version attribute
+            conditions.append('attribute_not_exists(#ver)')
+    request['ConditionExpression'] = ' AND '.join(conditions)
+    # The stored item comes back on failure, telling a missing item from a stale version
+    request['ReturnValuesOnConditionCheckFailure'] = 'ALL_OLD'
+    if not request['ExpressionAttributeValues']:
+        del request['ExpressionAttributeValues']
+    return request
+
+
+def _update_values(app_id: str, serialized: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+    """Attributes an update sets on the application item (fields, derived index attributes, updated_at) and removes.
+
+    History fields are written as child items instead (see history_writes);
+    lists an older item still stores inline are removed.
+    """
+    index_values, remove = _index_attributes(app_id, serialized)
+    values = compress_fields({key: value for key, value in serialized.items() if key not in HISTORY_FIELDS})
+    history = sorted(HISTORY_FIELDS.intersection(serialized))
+    return {**values, **index_values, 'updated_at': datetime.now().isoformat()}, [*remove, *history]
+
+
+def _changes_request(
+    app_id: str,
+    values: dict[str, Any],
+    remove: list[str],
+    expected_version: int | None,
+) -> dict[str, Any]:
+    expression, names, expression_values = _build_update_expression(values, remove, add={'version': 1})
+    return _with_condition({
+        'Key': app_key(app_id),
+        'UpdateExpression': expression,
+        'ExpressionAttributeNames': names,
+        'ExpressionAttributeValues': expression_values,
+        'ReturnValues': 'ALL_NEW',
+    }, expected_version)
+
+
+def update_request(app_id: str, serialized: dict[str, Any], expected_version: int | None = None) -> dict[str, Any]:
+    """Build the UpdateItem arguments for a partial update of existing, serialized fields."""
+    return _changes_request(app_id, *_update_values(app_id, serialized), expected_version)
+
+
+def stats_update(app_id: str, old: dict[str, Any], serialized: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Transactional update of ``serialized`` fields over assembled item ``old``, and the item it results in.
+
+    The update only applies while the item is still at the version that was
+    read. The history children are written separately, see history_writes.
+    """
+    version = int(old.get('version', 0))
+    values, remove = _update_values(app_id, serialized)
+    request = _changes_request(app_id, values, remove, version)
+    del request['ReturnValues']  # Not allowed in transactions
+    new = {key: value for key, value in old.items() if key not in remove}
+    new.update(values)
+    new.update((field, serialized[field]) for field in HISTORY_FIELDS.intersection(serialized))
+    new['version'] = version + 1
+    return request, new
+
+
+def _delete_request(app_id: str, version: int) -> dict[str, Any]:
+    """Transactional delete of an application that is still at ``version``."""
+    return _with_condition({
+        'Key': app_key(app_id),
+        'ExpressionAttributeNames': {},
+        'ExpressionAttributeValues': {},
+    }, version)
+
+
+def _tombstone(app_id: str) -> dict[str, Any]:
+    """Change-feed record of a deletion, removed by TTL after the retention period."""
+    return {
+        'pk': _index_key(TOMBSTONE_PARTITION, app_id),
+        'sk': f'{SK_PREFIX}{app_id}',
+        CHANGES_HASH_KEY: _index_key(CHANGE_FEED, app_id),
+        CHANGES_RANGE_KEY: datetime.now().isoformat(),
+        TTL_ATTRIBUTE: int(time.time()) + settings.change_retention_days * 86400,
+    }
+
+
+def delete_transaction(
+    app_id: str,
+    collection: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """TransactItems deleting an application still at the version read and its children, leaving a tombstone.
+
+    Returns the transaction and the child deletes it had no room for.
+    """
+    old = assemble(collection)
+    request = _delete_request(app_id, int(old.get('version', 0)))
+    return with_child_writes([
+        *stats_transaction('Delete', request, old, None),
+        {'Put': {'Item': _tombstone(app_id), 'TableName': settings.dynamodb_table}},
+    ], [{'DeleteRequest': {'Key': item_key(child)}} for child in collection[1:]])
+
+
+def append_transaction(
+    app_id: str,
+    notes: list[ApplicationNote],
+    expected_version: int | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """TransactItems adding notes as child items without reading the stored ones.
+
+    The application item only gets a new version, updated_at and note_count.
+    Returns the transaction and the child puts it had no room for.
+    """
+    expression, names, values = _build_update_expression(
+        {'updated_at': datetime.now().isoformat()}, add={'version': 1, 'note_count': len(notes)},
+    )
+    request = _with_condition({
+        'Key': app_key(app_id),
+        'UpdateExpression': expression,
+        'ExpressionAttributeNames': names,
+        'ExpressionAttributeValues': values,
+    }, expected_version)
+    table_name = settings.dynamodb_table
+    children = _history_items(app_id, {'notes': [model_to_dynamo(note) for note in notes]})
+    return with_child_writes([
+        {'Update': {**request, 'TableName': table_name}},
+        {'Update': {**data_version_update(app_id), 'TableName': table_name}},
+    ], [{'PutRequest': {'Item': child}} for child in children])
+
+
+def data_version_update(app_id: str | None = None) -> dict[str, Any]:
+    return {
+        'Key': {'pk': _counter_partition(DATA_VERSION_PARTITION, app_id), 'sk': DATA_VERSION_SK},
+        'UpdateExpression': 'ADD #v :one',
+        'ExpressionAttributeNames': {'#v': 'version'},
+        'ExpressionAttributeValues': {':one': 1},
+    }
+
+
+def stats_transaction(
+    operation: Literal['Put', 'Update', 'Delete'],
+    request: dict[str, Any],
+    old: dict[str, Any] | None,
+    new: dict[str, Any] | None,
+) -> list[dict[str, Any]]:
+    """TransactItems writing one application together with its statistics and the data version.
+
+    The counters are added to in the application's shard, so that concurrent
+    writes to different shards don't contend for the same counter items.
+    """
+    table_name = settings.dynamodb_table
+    app_id = app_id_of(cast(dict[str, Any], new or old))
+    updates = [
+        *stats.counter_updates(stats.delta(old, new), _counter_partition(stats.STATS_PARTITION, app_id)),
+        data_version_update(app_id),
+    ]
+    return [
+        {operation: {**request, 'TableName': table_name}},
+        *({'Update': {**update, 'TableName': table_name}} for update in updates),
+    ]
+
+
+def check_failed_write(old_item: dict[str, Any] | None, expected_version: int | None) -> bool:
+    """Classify a failed conditional write from the stored item (low-level format).
+
+    Returns False when the item does not exist and raises VersionConflictError
+    on a stale version.
+    """
+    if not old_item:
+        return False
+    current = int(old_item.get('version', {}).get('N', 0))
+    if expected_version is not None and current != expected_version:
+        raise VersionConflictError(current)
+    return True
+
+
+def append_response(
+    app_id: str,
+    field: str,
+    entries: list[ApplicationNote] | list[StatusItem],
+    attributes: dict[str, Any],
+) -> JobApplicationPartial:
+    """The appended entries only, carrying the item's new version."""
+    return JobApplicationPartial(id=app_id, **{field: entries}).with_storage_metadata(
+        int(attributes.get('version', 0)), attributes.get('updated_at'),
+    )
+
+
+def _read_data_version(partition: str) -> int:
+    response = get_table().get_item(Key={'pk': partition, 'sk': DATA_VERSION_SK}, ConsistentRead=True)
+    return int(response.get('Item', {}).get('version', 0))
+
+
+def get_data_version() -> int:
+    """Current table-wide data version (0 before the first write), summed over the shards."""
+    partitions = shard_keys(DATA_VERSION_PARTITION)
+    if len(partitions) == 1:
+        return _read_data_version(partitions[0])
+    return sum(get_executor().map(_read_data_version, partitions))
+
+
+def bump_data_version(app_id: str | None = None) -> None:
+    """Record that applications changed. Called after writes outside a stats transaction."""
+    get_table().update_item(**data_version_update(app_id))
+
+
+def _transact(items: list[dict[str, Any]]) -> bool:
+    """Run a transaction. Returns False when a condition or a concurrent transaction cancelled it."""
+    client = get_table().meta.client
+    try:
+        client.transact_write_items(TransactItems=items)
+    except client.exceptions.TransactionCanceledException:
+        return False
+    return True
+
+
+def _add_stats(changes: dict[str, stats.Counters]) -> None:
+    """Apply counter changes outside a transaction (batch writes)."""
+    table = get_table()
+    for update in stats.counter_updates(changes, _counter_partition(stats.STATS_PARTITION)):
+        table.update_item(**update)
+
+
+def app_id_of(item: dict[str, Any]) -> str:
+    """Id of the application an item belongs to (or a tombstone records)."""
+    return item['sk'].removeprefix(SK_PREFIX).partition('#')[0]
 
-    table.put_item(Item=item_data)
 
-    return JobApplicationResponse(**_deserialize_from_dynamo(item_data))
+def _reindex(items: dict[str, dict[str, Any] | None], created: bool = False) -> None:
+    """Bring the search index of applications (id -> stored item, None once deleted) up to date.
+
+    Runs after the application write, which has succeeded by then: an index
+    update that fails is logged and leaves search stale until
+    app.tools.rebuild_search runs. ``created`` skips reading the document
+    items of applications that cannot have one yet.
+    """
+    try:
+        _update_index(items, created)
+    except Exception:
+        search.logger.exception('Search index update failed for %d application(s)', len(items))
 
 
-def get_application(app_id: str) -> JobApplicationResponse | None:
-    """Get a single job application by ID."""
+def _update_index(items: dict[str, dict[str, Any] | None], created: bool) -> None:
     table = get_table()
-    response = table.get_item(
-        Key={
-            'pk': PARTITION_KEY,
-            'sk': f'{SK_PREFIX}{app_id}',
+    docs: dict[str, dict[str, Any]] = {}
+    if len(items) == 1 and not created:
+        [app_id] = items
+        doc = table.get_item(Key=search.doc_key(app_id), ConsistentRead=True).get('Item')
+        docs = {app_id: doc} if doc else {}
+    elif not created:
+        found, _ = batch_get([search.doc_key(app_id) for app_id in items])
+        docs = {doc['sk'].removeprefix(search.DOC_PREFIX): doc for doc in found}
+
+    writes: list[dict[str, Any]] = []
+    # One item of each transaction adds to the corpus counters
+    for chunk in chunked(list(items), TRANSACT_ITEMS_LIMIT - 1):
+        writes.extend(_index_documents({app_id: items[app_id] for app_id in chunk}, docs))
+    batch_write(writes)
+
+
+def _document_write(doc: dict[str, Any] | None, document: dict[str, Any]) -> dict[str, Any]:
+    """TransactItem writing a search document, conditioned on the document read before (``doc``)."""
+    if doc is None:
+        condition: dict[str, Any] = {'ConditionExpression': 'attribute_not_exists(pk)'}
+    elif 'version' in doc:
+        condition = {
+            'ConditionExpression': '#v = :v',
+            'ExpressionAttributeNames': {'#v': 'version'},
+            'ExpressionAttributeValues': {':v': doc['version']},
         }
+    else:
+        condition = {'ConditionExpression': 'attribute_not_exists(#v)', 'ExpressionAttributeNames': {'#v': 'version'}}
+    table_name = settings.dynamodb_table
+    if 'PutRequest' in document:
+        return {'Put': {'TableName': table_name, 'Item': document['PutRequest']['Item'], **condition}}
+    return {'Delete': {'TableName': table_name, 'Key': document['DeleteRequest']['Key'], **condition}}
+
+
+def _corpus_write(change: dict[str, int], app_id: str | None = None) -> list[dict[str, Any]]:
+    """TransactItems adding a change to the corpus counters of the application's shard (any for batches)."""
+    if not change:
+        return []
+    update = search.corpus_update(change, _counter_partition(search.SEARCH_PARTITION, app_id))
+    return [{'Update': {'TableName': settings.dynamodb_table, **update}}]
+
+
+def index_transaction(
+    app_id: str,
+    doc: dict[str, Any] | None,
+    document: dict[str, Any],
+    change: dict[str, int],
+) -> list[dict[str, Any]]:
+    """TransactItems writing the search document of an application with its corpus counter change.
+
+    The write is conditioned on the document read before, so two index
+    updates of the same application can't both count their change.
+    """
+    return [_document_write(doc, document), *_corpus_write(change, app_id)]
+
+
+def _index_documents(items: dict[str, dict[str, Any] | None], docs: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """Write the search documents and corpus counters of many applications in one transaction.
+
+    Returns their posting writes. A cancelled transaction falls back to one
+    transaction per application.
+    """
+    if len(items) == 1:
+        [(app_id, item)] = items.items()
+        return _index_document(app_id, docs.get(app_id), item)
+    postings: list[dict[str, Any]] = []
+    documents: list[dict[str, Any]] = []
+    changes: list[dict[str, int]] = []
+    for app_id, item in items.items():
+        if newer_document(docs.get(app_id), item):
+            continue
+        writes, document, change = search.index_writes(app_id, docs.get(app_id), item)
+        postings.extend(writes)
+        if document is not None:
+            documents.append(_document_write(docs.get(app_id), document))
+        changes.append(change)
+    if not documents or _transact([*documents, *_corpus_write(search.combine(changes))]):
+        return postings
+    return [request for app_id, item in items.items() for request in _index_document(app_id, docs.get(app_id), item)]
+
+
+def newer_document(doc: dict[str, Any] | None, item: dict[str, Any] | None) -> bool:
+    """Whether the search document already indexes a later version than ``item``."""
+    return bool(doc and item and int(doc.get('version', 0)) > int(item.get('version', 0)))
+
+
+def _index_document(
+    app_id: str,
+    doc: dict[str, Any] | None,
+    item: dict[str, Any] | None,
+) -> list[dict[str, Any]]:
+    """Write the search document and corpus counters of one application. Returns its posting writes.
+
+    A transaction cancelled by a concurrent index update reads the document
+    again and recomputes the change from it. An update that finds a later
+    version already indexed leaves the index alone.
+    """
+    for attempt in range(STATS_WRITE_ATTEMPTS):
+        if attempt:
+            doc = get_table().get_item(Key=search.doc_key(app_id), ConsistentRead=True).get('Item')
+        if newer_document(doc, item):
+            return []
+        postings, document, change = search.index_writes(app_id, doc, item)
+        if document is None or _transact(index_transaction(app_id, doc, document, change)):
+            return postings
+    raise WriteConflictError(f'Search document of application {app_id} kept changing')
+
+
+def search_applications(query: str, limit: int = 20) -> SearchResults:
+    """Applications matching the words of ``query``, ranked with BM25."""
+    terms = search.query_terms(query)
+    if not terms:
+        return SearchResults(total=0, items=[])
+    table = get_table()
+    counters, _ = batch_get([search.corpus_key(partition) for partition in shard_keys(search.SEARCH_PARTITION)])
+    corpus = search.corpus_totals(counters)
+    postings: dict[str, list[dict[str, Any]]] = {}
+    for term in terms:
+        kwargs: dict[str, Any] = {
+            'KeyConditionExpression': Key('pk').eq(search.TERM_PREFIX + term),
+            'ProjectionExpression': 'sk, tf, dl',
+        }
+        postings[term] = []
+        while True:
+            response = table.query(**kwargs)
+            postings[term].extend(response['Items'])
+            if 'LastEvaluatedKey' not in response:
+                break
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    best, total = search.rank(postings, corpus, limit)
+    found, _ = batch_get([app_key(app_id) for app_id, _ in best])
+    by_id = {app_id_of(item): item for item in found}
+    # Postings can outlive an application whose index update failed
+    hits = [
+        SearchHit(score=score, application=to_response(by_id[app_id]))
+        for app_id, score in best
+        if app_id in by_id
+    ]
+    return SearchResults(total=total - len(best) + len(hits), items=hits)
+
+
+def get_stats() -> ApplicationStats:
+    """Dashboard statistics, read from the counter items of every shard."""
+    sources = [
+        {'KeyConditionExpression': Key('pk').eq(partition), 'ConsistentRead': True}
+        for partition in shard_keys(stats.STATS_PARTITION)
+    ]
+    if len(sources) == 1:
+        shard_items = [_read_query(sources[0])]
+    else:
+        shard_items = list(get_executor().map(_read_query, sources))
+    return stats.summarize([item for items in shard_items for item in items])
+
+
+def get_reports() -> tuple[int, ApplicationReports]:
+    """Sankey and funnel reports, and the data version they reflect.
+
+    Reports are computed from the status histories alone and reused until
+    the data version changes. The version is read before the histories, so
+    a write that lands during the read only makes the next call recompute.
+    Each shard partition is read for its application items and status
+    children only, with the note children filtered out.
+    """
+    data_version = get_data_version()
+    cached = reports.cached(data_version)
+    if cached is not None:
+        return data_version, cached
+
+    sources = [
+        {
+            'KeyConditionExpression': '#pk = :pk',
+            # item_type carries the shard, see ITEM_TYPE
+            'FilterExpression': 'attribute_exists(#status) OR begins_with(#type, :type)',
+            'ProjectionExpression': '#sk, #status, #date, #type',
+            'ExpressionAttributeNames': {
+                '#pk': 'pk', '#sk': 'sk', '#status': 'status', '#date': 'occur_date', '#type': 'item_type',
+            },
+            'ExpressionAttributeValues': {':pk': partition, ':type': ITEM_TYPE},
+        }
+        for partition in _partitions()
+    ]
+    if len(sources) == 1:
+        shard_items = [_read_query(sources[0])]
+    else:
+        shard_items = list(get_executor().map(_read_query, sources))
+    result = reports.build(reports.StatusColumns.from_items(
+        item for items in shard_items for item in _assembled(items)
+    ))
+    reports.store(data_version, result)
+    return data_version, result
+
+
+def create_application(data: JobApplicationCreate) -> JobApplicationResponse:
+    """Create a new job application in DynamoDB, counting it in the statistics."""
+    item_data = new_item(data)
+    header, *children = stored_items(item_data)
+    transaction, overflow = with_child_writes(
+        stats_transaction('Put', {'Item': header}, None, item_data),
+        [{'PutRequest': {'Item': child}} for child in children],
     )
-    item = response.get('Item')
-    if not item:
+    for _ in range(STATS_WRITE_ATTEMPTS):
+        if _transact(transaction):
+            break
+    else:
+        raise WriteConflictError('Could not create the application')
+    batch_write(overflow)
+    invalidate_applications()
+    _reindex({app_id_of(item_data): item_data}, created=True)
+
+    return to_response(item_data)
+
+
+def get_application(
+    app_id: str,
+    fields: list[str] | None = None,
+) -> JobApplicationResponse | JobApplicationPartial | None:
+    """Get a single job application by ID, optionally only the given fields.
+
+    The full application comes from one query of its item collection. Fields
+    other than the history lists are read from the application item alone.
+    """
+    if fields and not HISTORY_FIELDS.intersection(fields):
+        response = get_table().get_item(Key=app_key(app_id), **projection(fields))
+        item = response.get('Item')
+        return to_response(item, fields) if item else None
+    if fields:
+        collection = _read_collection(app_id)
+        if collection is None:
+            return None
+        return to_response(projected_item(assemble(collection), fields), fields)
+
+    cache = get_cache()
+    if cache is not None:
+        cached = cache.get(application_key(app_id))
+        if cached is not None:
+            return cached
+
+    collection = _read_collection(app_id)
+    if collection is None:
         return None
-    return JobApplicationResponse(**_deserialize_from_dynamo(item))
+    item = assemble(collection)
+    app = to_response(item)
+    if cache is not None:
+        cache.set(application_key(app_id), app, estimate_item_size(item))
+    return app
 
 
-def list_applications() -> list[JobApplicationResponse]:
-    """List all job applications."""
+def _history_page(
+    app_id: str,
+    field: Literal['status', 'notes'],
+    limit: int,
+    cursor: str | None,
+) -> tuple[list[dict[str, Any]], str | None] | None:
+    """One page of an application's status or note entries, oldest first, and the cursor of the next.
+
+    Returns None when the application does not exist. The first page also
+    reads the application item, for its existence and any entries it still
+    stores inline (see app.tools.split_histories), which come first. Raises
+    InvalidCursorError for a cursor of another application or list.
+    """
+    table = get_table()
+    key = app_key(app_id)
+    prefix = f'{key["sk"]}#{HISTORY_TYPES[field]}#'
+    query: dict[str, Any] = {
+        'KeyConditionExpression': Key('pk').eq(key['pk']) & Key('sk').begins_with(prefix),
+        'Limit': limit,
+    }
+    entries: list[dict[str, Any]] = []
+    if cursor:
+        start = decode_cursor(cursor).get('key')
+        if not isinstance(start, dict) or not str(start.get('sk', '')).startswith(prefix):
+            raise InvalidCursorError('Cursor does not match the list')
+        query['ExclusiveStartKey'] = start
+    else:
+        parent = table.get_item(
+            Key=key, ProjectionExpression='sk, #field', ExpressionAttributeNames={'#field': field},
+        ).get('Item')
+        if parent is None:
+            return None
+        entries.extend(parent.get(field) or [])
+
+    response = table.query(**query)
+    entries.extend(_entry(item) for item in response['Items'])
+    last_key = response.get('LastEvaluatedKey')
+    return entries, encode_cursor({'key': last_key}) if last_key else None
+
+
+def list_notes(app_id: str, limit: int, cursor: str | None = None) -> ApplicationNotePage | None:
+    """One page of an application's notes, oldest first. None when the application does not exist."""
+    page = _history_page(app_id, 'notes', limit, cursor)
+    if page is None:
+        return None
+    entries, next_cursor = page
+    return ApplicationNotePage(items=[ApplicationNote(**entry) for entry in entries], next_cursor=next_cursor)
+
+
+def list_status(app_id: str, limit: int, cursor: str | None = None) -> StatusHistoryPage | None:
+    """One page of an application's status history, oldest first. None when the application does not exist."""
+    page = _history_page(app_id, 'status', limit, cursor)
+    if page is None:
+        return None
+    entries, next_cursor = page
+    return StatusHistoryPage(items=[StatusItem(**entry) for entry in entries], next_cursor=next_cursor)
+
+
+def _query_partition(partition: str) -> Iterator[list[dict[str, Any]]]:
+    """Yield raw DynamoDB items of one partition, one query page at a time."""
     table = get_table()
-    items: list[dict[str, Any]] = []
     last_key: dict[str, Any] | None = None
 
     while True:
         if last_key:
             response = table.query(
-                KeyConditionExpression=Key('pk').eq(PARTITION_KEY),
+                KeyConditionExpression=Key('pk').eq(partition),
                 ExclusiveStartKey=last_key,
             )
         else:
             response = table.query(
-                KeyConditionExpression=Key('pk').eq(PARTITION_KEY),
+                KeyConditionExpression=Key('pk').eq(partition),
             )
-        items.extend(response.get('Items', []))
+        yield response.get('Items', [])
 
         last_key = response.get('LastEvaluatedKey')
         if not last_key:
             break
 
-    return [JobApplicationResponse(**_deserialize_from_dynamo(item)) for item in items]
 
+def iter_application_pages() -> Iterator[list[dict[str, Any]]]:
+    """Yield assembled items one query page at a time, shard by shard.
+
+    An application's children can continue on the next page, so the last
+    application of each page is held back until the page after it is read.
+    """
+    for partition in _partitions():
+        held: list[dict[str, Any]] = []
+        for page in _query_partition(partition):
+            items = [*held, *page]
+            last = max((i for i, item in enumerate(items) if _entry_type(item) is None), default=0)
+            held = items[last:]
+            if last:
+                yield list(_assembled(items[:last]))
+        if held:
+            yield list(_assembled(held))
+
+
+def iter_applications() -> Iterator[list[JobApplicationResponse]]:
+    """Yield job applications one DynamoDB page at a time.
+
+    Only a single page is held in memory, so callers can stream the whole
+    table without materializing it.
+    """
+    for items in iter_application_pages():
+        yield to_responses(items)
+
+
+def _read_query(query_kwargs: dict[str, Any]) -> list[dict[str, Any]]:
+    """Read every page of a query."""
+    table = get_table()
+    items: list[dict[str, Any]] = []
+    last_key: dict[str, Any] | None = None
+    while True:
+        if last_key:
+            response = table.query(**query_kwargs, ExclusiveStartKey=last_key)
+        else:
+            response = table.query(**query_kwargs)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return items
+
+
+def _read_collection(app_id: str, consistent: bool = False) -> list[dict[str, Any]] | None:
+    """An application item followed by its history children, or None when it does not exist."""
+    return collection_of(app_id, _read_query({**collection_query(app_id), 'ConsistentRead': consistent}))
+
+
+def _read_collections(app_ids: list[str]) -> dict[str, list[dict[str, Any]] | None]:
+    """Item collections of many applications (None where missing), queried in parallel."""
+    return dict(zip(app_ids, get_executor().map(_read_collection, app_ids)))
+
+
+def ordered(apps: list[Any], order: SortOrder) -> list[Any]:
+    return apps[::-1] if order is SortOrder.DESC else list(apps)
+
+
+def list_applications(
+    filters: ApplicationFilters | None = None,
+    fields: list[str] | None = None,
+    order: SortOrder = SortOrder.ASC,
+) -> list[JobApplicationResponse] | list[JobApplicationPartial]:
+    """List all job applications, optionally filtered and projected, by applied date in ``order``.
+
+    Shards are read in parallel, from the headers index or, filtered, from
+    one filter index, and merged by the headers index range key (applied
+    date, then id), so the order by applied date is the same for any shard
+    count. Either way only the application items are read, so each
+    application carries its latest status and no notes; get_application
+    returns the whole history.
+    """
+    filters = normalize_filters(filters)
+    if filters is not None or fields:
+        sources = [
+            {**source, **projection(fields, source['ExpressionAttributeNames'])}
+            for source in query_sources(filters, order)
+        ]
+        if len(sources) == 1:
+            shard_items = [_read_query(sources[0])]
+        else:
+            shard_items = list(get_executor().map(_read_query, sources))
+        merged = heapq.merge(*shard_items, key=lambda item: item[HEADERS_RANGE_KEY], reverse=order is SortOrder.DESC)
+        return to_responses(merged, fields)
+
+    # The whole list is read either way, so it is read and cached in ascending order only
+    cache = get_cache()
+    if cache is not None:
+        cached = cache.get(LIST_KEY)
+        if cached is not None:
+            return ordered(cached, order)
+
+    sources = query_sources(None)
+    if len(sources) == 1:
+        shard_items = [_read_query(sources[0])]
+    else:
+        shard_items = list(get_executor().map(_read_query, sources))
 
-def update_application(app_id: str, data: JobApplicationUpdate) -> JobApplicationResponse | None:
-    """Partially update a job application."""
-    fields = data.model_dump(exclude_unset=True)
+    merged = list(heapq.merge(*shard_items, key=lambda item: item[HEADERS_RANGE_KEY]))
+    apps = to_responses(merged)
+    if cache is not None:
+        cache.set(LIST_KEY, apps, sum(estimate_item_size(item) for item in merged))
+    return ordered(apps, order)
+
+
+def normalize_filters(filters: ApplicationFilters | None) -> ApplicationFilters | None:
+    if filters is None or filters.is_empty():
+        return None
+    return filters
+
+
+def _filtered_query(filters: ApplicationFilters, shard: int) -> dict[str, Any]:
+    """Query arguments that read the applications of one shard matching the filters from a GSI.
+
+    The most selective filter picks the index; the rest become a FilterExpression.
+    """
+    names: dict[str, str] = {}
+    values: dict[str, Any] = {}
+    filter_parts: list[str] = []
+
+    candidates: list[tuple[str, str]] = []
+    if filters.status is not None:
+        candidates.append((STATUS_INDEX, filters.status.value))
+    if filters.company is not None:
+        candidates.append((COMPANY_INDEX, _company_key(filters.company)))
+    if filters.top_job:
+        candidates.append((TOP_JOB_INDEX, TOP_JOB_KEY))
+    candidates.append((APPLIED_INDEX, ITEM_TYPE))
+    # All index keys of an application are in its shard
+    candidates = [(index, _shard_key(value, shard, settings.shard_count)) for index, value in candidates]
+
+    index_name, hash_value = candidates[0]
+    names['#hk'] = INDEX_HASH_KEYS[index_name]
+    values[':hk'] = hash_value
+    key_condition = '#hk = :hk'
+
+    if filters.applied_from or filters.applied_to:
+        names['#rk'] = INDEX_RANGE_KEY
+    if filters.applied_from and filters.applied_to:
+        key_condition += ' AND #rk BETWEEN :from AND :to'
+        values[':from'] = filters.applied_from.isoformat()
+        values[':to'] = filters.applied_to.isoformat()
+    elif filters.applied_from:
+        key_condition += ' AND #rk >= :from'
+        values[':from'] = filters.applied_from.isoformat()
+    elif filters.applied_to:
+        key_condition += ' AND #rk <= :to'
+        values[':to'] = filters.applied_to.isoformat()
+
+    for i, (other_index, other_value) in enumerate(candidates[1:-1]):
+        names[f'#f{i}'] = INDEX_HASH_KEYS[other_index]
+        values[f':f{i}'] = other_value
+        filter_parts.append(f'#f{i} = :f{i}')
+    if filters.top_job is False:
+        names['#tj'] = INDEX_HASH_KEYS[TOP_JOB_INDEX]
+        filter_parts.append('attribute_not_exists(#tj)')
+
+    query: dict[str, Any] = {
+        'IndexName': index_name,
+        'KeyConditionExpression': key_condition,
+        'ExpressionAttributeNames': names,
+        'ExpressionAttributeValues': values,
+    }
+    if filter_parts:
+        query['FilterExpression'] = ' AND '.join(filter_parts)
+    return query
+
+
+def query_sources(filters: ApplicationFilters | None, order: SortOrder = SortOrder.ASC) -> list[dict[str, Any]]:
+    """Query arguments to read, in order, when listing applications.
+
+    Unfiltered lists read every shard partition of the headers index;
+    filtered lists read every shard of one global secondary index. Both are
+    ranged by applied date, which each source returns in ``order``.
+    """
+    forward = order is SortOrder.ASC
+    if filters is None:
+        return [
+            {
+                'IndexName': HEADERS_INDEX,
+                'KeyConditionExpression': '#pk = :pk',
+                'ExpressionAttributeNames': {'#pk': 'pk'},
+                'ExpressionAttributeValues': {':pk': partition},
+                'ScanIndexForward': forward,
+            }
+            for partition in _partitions()
+        ]
+    return [
+        {**_filtered_query(filters, shard), 'ScanIndexForward': forward}
+        for shard in range(max(settings.shard_count, 1))
+    ]
+
+
+def _encode_position(sources: list[dict[str, Any]], keys: list[dict[str, Any] | None], done: set[int]) -> str:
+    return encode_cursor({
+        'index': sources[0].get('IndexName'),
+        'forward': sources[0]['ScanIndexForward'],
+        'keys': keys,
+        'done': sorted(done),
+    })
+
+
+def _decode_position(sources: list[dict[str, Any]], cursor: str | None) -> tuple[list[dict[str, Any] | None], set[int]]:
+    """ExclusiveStartKey of every source a cursor points at, and the sources it has read to the end.
+
+    Raises InvalidCursorError if the cursor belongs to a different filter set, order or shard count.
+    """
+    if not cursor:
+        return [None] * len(sources), set()
+    position = decode_cursor(cursor)
+    if position.get('index') != sources[0].get('IndexName'):
+        raise InvalidCursorError('Cursor does not match the filters')
+    if position.get('forward', True) != sources[0]['ScanIndexForward']:
+        raise InvalidCursorError('Cursor does not match the order')
+    keys, done = position.get('keys'), position.get('done')
+    if not isinstance(keys, list) or len(keys) != len(sources) or not isinstance(done, list):
+        raise InvalidCursorError('Cursor does not match the shards')
+    return keys, {int(source) for source in done}
+
+
+def _start_key(source: dict[str, Any], item: dict[str, Any]) -> dict[str, Any]:
+    """ExclusiveStartKey that resumes a list source right after ``item``."""
+    values = source['ExpressionAttributeValues']
+    key = {'pk': item['pk'], 'sk': item['sk']}
+    if source['IndexName'] == HEADERS_INDEX:
+        key[HEADERS_RANGE_KEY] = item[HEADERS_RANGE_KEY]
+    else:
+        # Projections leave out the applied date, which starts header_sk
+        key[INDEX_HASH_KEYS[source['IndexName']]] = values[':hk']
+        key[INDEX_RANGE_KEY] = item[HEADERS_RANGE_KEY].partition('#')[0]
+    return key
+
+
+class PageMerge:
+    """One page of a list, merged across its sources (shards) by header_sk.
+
+    Each source is queried ``limit`` items at a time. An item is only taken
+    while every source that is not read to the end has a fetched item to
+    compare it with, so pages follow the overall order. The cursor keeps a
+    position per source: after its last item taken, or where the next query
+    of it starts. The caller runs the queries of ``requests()`` and hands
+    the responses to ``add()`` until there are none left.
+    """
+
+    def __init__(self, sources: list[dict[str, Any]], cursor: str | None, limit: int, fields: list[str] | None):
+        self.sources = sources
+        self.limit = limit
+        self.fields = fields
+        self.positions, self.done = _decode_position(sources, cursor)
+        self.resume = list(self.positions)
+        self.buffers: list[list[dict[str, Any]]] = [[] for _ in sources]
+        self.items: list[dict[str, Any]] = []
+
+    def requests(self) -> list[tuple[int, dict[str, Any]]]:
+        """Source numbers and query arguments to read before more items can be taken."""
+        if len(self.items) >= self.limit:
+            return []
+        requests = []
+        for number, source in enumerate(self.sources):
+            if number in self.done or self.buffers[number]:
+                continue
+            query = {**source, **projection(self.fields, source['ExpressionAttributeNames']), 'Limit': self.limit}
+            if self.positions[number]:
+                query['ExclusiveStartKey'] = self.positions[number]
+            requests.append((number, query))
+        return requests
+
+    def add(self, number: int, items: list[dict[str, Any]], last_key: dict[str, Any] | None) -> None:
+        """Record the response to a request, then take the items that can be taken."""
+        self.buffers[number].extend(items)
+        if last_key is None:
+            self.done.add(number)
+        else:
+            self.positions[number] = last_key
+        self._take()
+
+    def _take(self) -> None:
+        choose = min if self.sources[0]['ScanIndexForward'] else max
+        while len(self.items) < self.limit:
+            if any(not buffer and number not in self.done for number, buffer in enumerate(self.buffers)):
+                return
+            fetched = [number for number, buffer in enumerate(self.buffers) if buffer]
+            if not fetched:
+                return
+            number = choose(fetched, key=lambda number: self.buffers[number][0][HEADERS_RANGE_KEY])
+            item = self.buffers[number].pop(0)
+            self.items.append(item)
+            self.resume[number] = _start_key(self.sources[number], item)
+
+    def next_cursor(self) -> str | None:
+        done = {number for number in self.done if not self.buffers[number]}
+        if len(done) == len(self.sources):
+            return None
+        # Fetched items not taken are read again from the last item taken
+        keys = [
+            self.resume[number] if buffer else self.positions[number]
+            for number, buffer in enumerate(self.buffers)
+        ]
+        return _encode_position(self.sources, keys, done)
+
+
+def list_applications_page(
+    limit: int,
+    cursor: str | None = None,
+    filters: ApplicationFilters | None = None,
+    fields: list[str] | None = None,
+    order: SortOrder = SortOrder.ASC,
+) -> JobApplicationPage:
+    """List one page of job applications, optionally filtered and projected, by applied date in ``order``.
+
+    The shards are read in parallel and merged by the headers index range
+    key (applied date, then id), like list_applications, with the position
+    in every shard in the cursor (see PageMerge). Raises
+    InvalidCursorError if the cursor was not issued for the same filters and order.
+    """
+    table = get_table()
+    merge = PageMerge(query_sources(normalize_filters(filters), order), cursor, limit, fields)
+    while requests := merge.requests():
+        if len(requests) == 1:
+            responses = [table.query(**requests[0][1])]
+        else:
+            responses = list(get_executor().map(lambda request: table.query(**request[1]), requests))
+        for (number, _), response in zip(requests, responses):
+            merge.add(number, response.get('Items', []), response.get('LastEvaluatedKey'))
+
+    return JobApplicationPage(
+        items=to_responses(merge.items, fields),
+        next_cursor=merge.next_cursor(),
+    )
+
+
+def _change_position(since: str | None) -> tuple[str, str]:
+    """(changed_at, app id) of the last change a sync token covers; empty for the first sync."""
+    if not since:
+        return '', ''
+    position = decode_cursor(since)
+    changed_at, app_id = position.get('t'), position.get('id')
+    if not isinstance(changed_at, str) or not isinstance(app_id, str):
+        raise InvalidCursorError('Malformed sync token')
+    return changed_at, app_id
+
+
+def _iter_query(query_kwargs: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    table = get_table()
+    kwargs = dict(query_kwargs)
+    while True:
+        response = table.query(**kwargs)
+        yield from response['Items']
+        if 'LastEvaluatedKey' not in response:
+            return
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def list_changes(since: str | None = None, limit: int | None = None) -> ApplicationChanges:
+    """Applications created, updated or deleted after the ``since`` sync token, oldest first.
+
+    Reads every shard of the changes index from the token's position,
+    merged by change time, so the cost follows the number of changes rather
+    than the number of applications. A page
+    never ends between changes with the same timestamp, which keeps the
+    (timestamp, id) position in the token unambiguous. Changes younger than
+    settings.change_feed_lag_seconds are left for the next call, since the
+    index is only eventually consistent. Applications come back as in
+    lists, with their latest status and no notes. Raises ChangesExpiredError
+    when the token is older than the tombstones.
+    """
+    limit = limit or settings.list_default_page_size
+    after = _change_position(since)
+    now = datetime.now()
+    if after[0] and after[0] < (now - timedelta(days=settings.change_retention_days)).isoformat():
+        raise ChangesExpiredError('Sync token is older than the change retention; do a full refresh')
+    until = (now - timedelta(seconds=settings.change_feed_lag_seconds)).isoformat()
+
+    items: list[dict[str, Any]] = []
+    has_more = False
+    if after[0] <= until:
+        window = Key(CHANGES_RANGE_KEY).between(after[0], until) if after[0] else Key(CHANGES_RANGE_KEY).lte(until)
+        feeds = [
+            _iter_query({'IndexName': CHANGES_INDEX, 'KeyConditionExpression': Key(CHANGES_HASH_KEY).eq(feed) & window})
+            for feed in shard_keys(CHANGE_FEED)
+        ]
+        for item in heapq.merge(*feeds, key=lambda item: item[CHANGES_RANGE_KEY]):
+            if (item[CHANGES_RANGE_KEY], app_id_of(item)) <= after:
+                continue
+            if len(items) >= limit and item[CHANGES_RANGE_KEY] != items[-1][CHANGES_RANGE_KEY]:
+                has_more = True
+                break
+            items.append(item)
+    items.sort(key=lambda item: (item[CHANGES_RANGE_KEY], app_id_of(item)))
+
+    changes = [
+        ApplicationChange(id=app_id_of(item), changed_at=item[CHANGES_RANGE_KEY], deleted=True)
+        if item['pk'].partition('#')[0] == TOMBSTONE_PARTITION
+        else ApplicationChange(id=app_id_of(item), changed_at=item[CHANGES_RANGE_KEY], application=to_response(item))
+        for item in items
+    ]
+    last = (changes[-1].changed_at, changes[-1].id) if changes else after
+    return ApplicationChanges(
+        items=changes,
+        next_token=encode_cursor({'t': last[0], 'id': last[1]}),
+        has_more=has_more,
+    )
+
+
+def _update_with_stats(
+    app_id: str,
+    fields_for: Callable[[dict[str, Any]], dict[str, Any]],
+    expected_version: int | None,
+) -> dict[str, Any] | None:
+    """Update an application, its history children and its statistics in one transaction.
+
+    Reads the item collection first to know the current contribution to the
+    statistics and the stored children. ``fields_for`` gets the assembled
+    item and returns the serialized fields to set. The transaction only
+    applies while the item is still at the version read, and is retried
+    from the read otherwise. Returns the updated assembled item, or None
+    when the application does not exist.
+    """
+    for _ in range(STATS_WRITE_ATTEMPTS):
+        collection = _read_collection(app_id, consistent=True)
+        if collection is None:
+            return None
+        old = assemble(collection)
+        version = int(old.get('version', 0))
+        if expected_version is not None and version != expected_version:
+            raise VersionConflictError(version)
+        fields = fields_for(old)
+        request, new = stats_update(app_id, old, fields)
+        transaction, overflow = with_child_writes(
+            stats_transaction('Update', request, old, new),
+            history_writes(app_id, collection, fields),
+        )
+        if _transact(transaction):
+            batch_write(overflow)
+            return new
+    raise WriteConflictError(f'Application {app_id} kept changing during the update')
+
+
+def update_application(
+    app_id: str,
+    data: JobApplicationUpdate,
+    expected_version: int | None = None,
+) -> JobApplicationResponse | None:
+    """Partially update a job application.
+
+    With ``expected_version`` the update only applies to that item version and
+    raises VersionConflictError otherwise. Updates of the status or notes
+    rewrite the history children in the same transaction as the item.
+    """
+    fields = model_to_dynamo(data, exclude_unset=True)
     if not fields:
-        return get_application(app_id)
+        current = get_application(app_id)
+        if current is not None and expected_version is not None and current.item_version != expected_version:
+            raise VersionConflictError(current.item_version)
+        return current
 
-    serialized = _serialize_for_dynamo(fields)
-    serialized['updated_at'] = datetime.now().isoformat()
+    if stats.STATS_FIELDS.intersection(fields) or HISTORY_FIELDS.intersection(fields):
+        try:
+            item = _update_with_stats(app_id, lambda old: fields, expected_version)
+        finally:
+            invalidate_applications(app_id)
+        if item and search.TEXT_FIELDS.intersection(fields):
+            _reindex({app_id: item})
+        return to_response(item) if item else None
 
-    expression, names, values = _build_update_expression(serialized)
+    table = get_table()
+    try:
+        table.update_item(**update_request(app_id, fields, expected_version))
+    except table.meta.client.exceptions.ConditionalCheckFailedException as e:
+        check_failed_write(e.response.get('Item'), expected_version)
+        return None
+    finally:
+        invalidate_applications(app_id)
 
+    bump_data_version(app_id)
+    # The response carries the history, which only the item collection has
+    collection = _read_collection(app_id, consistent=True)
+    if collection is None:
+        return None
+    item = assemble(collection)
+    if search.TEXT_FIELDS.intersection(fields):
+        _reindex({app_id: item})
+    return to_response(item)
+
+
+def append_notes(
+    app_id: str,
+    notes: list[ApplicationNote],
+    expected_version: int | None = None,
+) -> JobApplicationPartial | None:
+    """Append notes as new child items, without reading the stored ones. Returns only the appended notes.
+
+    A cancelled transaction is told apart from a missing item or a stale
+    version by reading the application item.
+    """
     table = get_table()
+    transaction, overflow = append_transaction(app_id, notes, expected_version)
     try:
-        response = table.update_item(
-            Key={
-                'pk': PARTITION_KEY,
-                'sk': f'{SK_PREFIX}{app_id}',
-            },
-            UpdateExpression=expression,
-            ExpressionAttributeNames=names,
-            ExpressionAttributeValues=values,
-            ConditionExpression='attribute_exists(pk)',
-            ReturnValues='ALL_NEW',
-        )
-    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        for _ in range(STATS_WRITE_ATTEMPTS):
+            if _transact(transaction):
+                break
+            current = table.get_item(Key=app_key(app_id), ConsistentRead=True).get('Item')
+            if current is None:
+                return None
+            version = int(current.get('version', 0))
+            if expected_version is not None and version != expected_version:
+                raise VersionConflictError(version)
+        else:
+            raise WriteConflictError(f'Application {app_id} kept changing while appending notes')
+        batch_write(overflow)
+    finally:
+        invalidate_applications(app_id)
+
+    # The search document covers every note, so it needs the whole collection
+    collection = _read_collection(app_id, consistent=True)
+    if collection is None:
         return None
+    item = assemble(collection)
+    _reindex({app_id: item})
+    return append_response(app_id, 'notes', notes, item)
+
 
-    return JobApplicationResponse(**_deserialize_from_dynamo(response['Attributes']))
+def appended_status(entries: list[StatusItem]) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    serialized = [model_to_dynamo(entry) for entry in entries]
+    return lambda old: {'status': [*(old.get('status') or []), *serialized]}
+
+
+def append_status(
+    app_id: str,
+    entries: list[StatusItem],
+    expected_version: int | None = None,
+) -> JobApplicationPartial | None:
+    """Append status history entries. Returns only the appended entries.
+
+    Status drives the statistics, so this reads the item collection and adds
+    the child items in a stats transaction instead of writing them blindly.
+    """
+    try:
+        item = _update_with_stats(app_id, appended_status(entries), expected_version)
+    finally:
+        invalidate_applications(app_id)
+    return append_response(app_id, 'status', entries, item) if item else None
 
 
 def delete_application(app_id: str) -> bool:
-    """Delete a job application. Returns True if it existed."""
-    table = get_table()
-    response = table.delete_item(
-        Key={
-            'pk': PARTITION_KEY,
-            'sk': f'{SK_PREFIX}{app_id}',
-        },
-        ReturnValues='ALL_OLD',
-    )
-    return bool(response.get('Attributes'))
+    """Delete a job application, leaving a change-feed tombstone. Returns True if it existed."""
+    try:
+        for _ in range(STATS_WRITE_ATTEMPTS):
+            collection = _read_collection(app_id, consistent=True)
+            if collection is None:
+                return False
+            transaction, overflow = delete_transaction(app_id, collection)
+            if _transact(transaction):
+                batch_write(overflow)
+                _reindex({app_id: None})
+                return True
+    finally:
+        invalidate_applications(app_id)
+    raise WriteConflictError(f'Application {app_id} kept changing during the delete')
+
+
+def batch_create_applications(data: list[JobApplicationCreate]) -> list[BatchItemResult]:
+    """Create many job applications with parallel BatchWriteItem chunks."""
+    items = [new_item(entry) for entry in data]
+    stored = {app_id_of(item): stored_items(item) for item in items}
+    failed = batch_write([{'PutRequest': {'Item': entry}} for entries in stored.values() for entry in entries])
+    invalidate_applications()
+    failed_ids = {app_id_of(request['PutRequest']['Item']) for request in failed}
+    if failed_ids:
+        # An application missing any of its items failed; take back what was written of it
+        batch_write([{'DeleteRequest': {'Key': item_key(entry)}} for app_id in failed_ids for entry in stored[app_id]])
+    # BatchWriteItem can't join a transaction: the counters follow in one ADD per stats item
+    written = [item for item in items if app_id_of(item) not in failed_ids]
+    _add_stats(stats.combine(stats.contribution(item) for item in written))
+    bump_data_version()
+    _reindex({app_id_of(item): item for item in written}, created=True)
+
+    results: list[BatchItemResult] = []
+    for index, item in enumerate(items):
+        if app_id_of(item) in failed_ids:
+            results.append(BatchItemResult(index=index, success=False, error='Write was not processed'))
+        else:
+            app = to_response(item)
+            results.append(BatchItemResult(index=index, id=app.id, success=True, application=app))
+    return results
+
+
+def batch_get_applications(app_ids: list[str]) -> list[BatchItemResult]:
+    """Get many job applications, querying their item collections in parallel."""
+    by_id = _read_collections(list(dict.fromkeys(app_ids)))
+
+    results: list[BatchItemResult] = []
+    for index, app_id in enumerate(app_ids):
+        collection = by_id[app_id]
+        if collection is not None:
+            app = to_response(assemble(collection))
+            results.append(BatchItemResult(index=index, id=app_id, success=True, application=app))
+        else:
+            results.append(BatchItemResult(index=index, id=app_id, success=False, error='Not found'))
+    return results
+
+
+def batch_delete_applications(app_ids: list[str]) -> list[BatchItemResult]:
+    """Delete many job applications with parallel BatchWriteItem chunks.
+
+    BatchWriteItem does not report whether an item existed, so ids that were
+    already absent are reported as deleted. The item collections are read
+    first to find the history children and take the applications out of the
+    statistics. The application items are deleted first; only the
+    applications whose delete went through then lose their children and
+    get a change-feed tombstone, so a failed delete leaves the application
+    whole. Children left over by a failed child delete are skipped by reads.
+    """
+    ids = list(dict.fromkeys(app_ids))
+    collections = _read_collections(ids)
+    failed = batch_write([{'DeleteRequest': {'Key': app_key(app_id)}} for app_id in ids])
+    invalidate_applications(*app_ids)
+    failed_sks = {request['DeleteRequest']['Key']['sk'] for request in failed}
+    removed = [
+        collection for app_id, collection in collections.items()
+        if collection is not None and f'{SK_PREFIX}{app_id}' not in failed_sks
+    ]
+    deleted = [assemble(collection) for collection in removed]
+    left = batch_write([
+        *({'DeleteRequest': {'Key': item_key(child)}} for collection in removed for child in collection[1:]),
+        *({'PutRequest': {'Item': _tombstone(app_id_of(item))}} for item in deleted),
+    ])
+    if left:
+        logger.warning('Batch delete left %d history item(s) or tombstone(s) unwritten', len(left))
+    _add_stats(stats.combine(stats.delta(item, None) for item in deleted))
+    bump_data_version()
+    _reindex({app_id_of(item): None for item in deleted})
+
+    return [
+        BatchItemResult(index=index, id=app_id, success=False, error='Delete was not processed')
+        if f'{SK_PREFIX}{app_id}' in failed_sks
+        else BatchItemResult(index=index, id=app_id, success=True)
+        for index, app_id in enumerate(app_ids)
+    ]
@@ -0,0 +1,197 @@
+"""Status flow reports computed from the application status histories.
+
+The histories are loaded into columns (one entry per status: owning
+application, status code and date ordinal, as typed arrays) and the reports
+are computed over the columns in bulk. The Sankey rules are evaluated once
+per distinct combination of statuses seen rather than once per application,
+and the time-in-stage figures come from the date differences of adjacent
+entries. A computed report is kept per process until the table's data
+version moves on, so repeated reads cost one small item read.
+"""
+import statistics
+import threading
+from array import array
+from collections import Counter, defaultdict
+from datetime import date
+from itertools import pairwise
+from typing import Any, Iterable
+
+from app.models.enums import ApplicationStatus
+from app.models.reports import (
+    ApplicationReports,
+    FunnelReport,
+    FunnelStage,
+    SankeyLink,
+    SankeyNode,
+    SankeyReport,
+    StageDuration,
+)
+
+STATUSES = list(ApplicationStatus)
+CODES = {status.value: code for code, status in enumerate(STATUSES)}
+
+# Sankey nodes that are not statuses
+RESPONDED = 'RESPONDED'
+NO_RESPONSE = 'NO RESPONSE'
+
+# Funnel stages in order; reaching a later stage counts as passing the earlier ones
+FUNNEL = (ApplicationStatus.APPLIED, ApplicationStatus.SCREEN, ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER)
+
+
+def _bits(*statuses: ApplicationStatus) -> int:
+    return sum(1 << CODES[status.value] for status in statuses)
+
+
+RESPONSE_BITS = _bits(ApplicationStatus.REJECTED, ApplicationStatus.SCREEN, ApplicationStatus.INTERVIEW)
+INTERVIEW_BITS = _bits(ApplicationStatus.SCREEN, ApplicationStatus.INTERVIEW)
+REJECTED_BIT = _bits(ApplicationStatus.REJECTED)
+OFFER_BIT = _bits(ApplicationStatus.OFFER)
+
+
+class StatusColumns:
+    """Status histories of many applications as parallel columns.
+
+    Entry ``i`` is a status of application ``owners[i]``, with the status
+    code ``codes[i]`` (an index into STATUSES) and the date ordinal
+    ``days[i]``. Each application's entries are adjacent and in date order.
+    """
+
+    def __init__(self) -> None:
+        self.applications = 0
+        self.owners = array('L')
+        self.codes = array('B')
+        self.days = array('l')
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict[str, Any]]) -> 'StatusColumns':
+        """Columns of stored application items (only their ``status`` is read)."""
+        columns = cls()
+        for owner, item in enumerate(items):
+            entries = sorted(
+                (date.fromisoformat(str(entry['occur_date'])).toordinal(), CODES[entry['status']])
+                for entry in item.get('status') or []
+            )
+            columns.owners.extend([owner] * len(entries))
+            columns.days.extend(day for day, _ in entries)
+            columns.codes.extend(code for _, code in entries)
+            columns.applications += 1
+        return columns
+
+    def histories(self) -> Counter[tuple[int, int]]:
+        """Applications by (history length capped at 2, bit mask of the statuses seen)."""
+        masks = [0] * self.applications
+        lengths = [0] * self.applications
+        for owner, code in zip(self.owners, self.codes):
+            masks[owner] |= 1 << code
+            lengths[owner] += 1
+        return Counter((min(length, 2), mask) for length, mask in zip(lengths, masks) if length)
+
+
+def _flows(length: int, mask: int) -> list[tuple[str, str]]:
+    """Sankey links one application follows, from its history length and statuses seen."""
+    applied = ApplicationStatus.APPLIED.value
+    if length == 1:
+        return [(applied, NO_RESPONSE)]
+    flows = []
+    if mask & RESPONSE_BITS:
+        flows.append((applied, RESPONDED))
+    if mask & REJECTED_BIT:
+        return [*flows, (RESPONDED, ApplicationStatus.REJECTED.value)]
+    if mask & INTERVIEW_BITS:
+        flows.append((RESPONDED, ApplicationStatus.INTERVIEW.value))
+    outcome = ApplicationStatus.OFFER if mask & OFFER_BIT else ApplicationStatus.NOOFFER
+    return [*flows, (ApplicationStatus.INTERVIEW.value, outcome.value)]
+
+
+def sankey(columns: StatusColumns) -> SankeyReport:
+    """Flows from applied through responses and interviews to the outcome."""
+    links: Counter[tuple[str, str]] = Counter()
+    for (length, mask), count in columns.histories().items():
+        for flow in _flows(length, mask):
+            links[flow] += count
+
+    inflow: Counter[str] = Counter()
+    outflow: Counter[str] = Counter()
+    for (source, target), count in links.items():
+        outflow[source] += count
+        inflow[target] += count
+    nodes = list(dict.fromkeys(name for link in links for name in link))
+    return SankeyReport(
+        total=columns.applications,
+        nodes=[SankeyNode(status=name, value=max(inflow[name], outflow[name])) for name in nodes],
+        links=[
+            SankeyLink(source=source, target=target, value=count)
+            for (source, target), count in sorted(links.items(), key=lambda link: -link[1])
+        ],
+    )
+
+
+def _stage_durations(columns: StatusColumns) -> list[StageDuration]:
+    """Days from entering each status to the application's next status."""
+    durations: defaultdict[int, list[int]] = defaultdict(list)
+    owners, codes, days = columns.owners, columns.codes, columns.days
+    for i, (owner, next_owner) in enumerate(pairwise(owners)):
+        if owner == next_owner:
+            durations[codes[i]].append(days[i + 1] - days[i])
+
+    stages = []
+    for code, values in sorted(durations.items()):
+        values.sort()
+        stages.append(StageDuration(
+            status=STATUSES[code],
+            count=len(values),
+            average_days=round(statistics.fmean(values), 1),
+            median_days=statistics.median(values),
+            p90_days=values[min(len(values) - 1, int(0.9 * len(values)))],
+        ))
+    return stages
+
+
+def funnel(columns: StatusColumns) -> FunnelReport:
+    """How many applications reached each funnel stage, and the time spent in each status."""
+    histories = columns.histories()
+    stages = []
+    previous = None
+    for index, stage in enumerate(FUNNEL):
+        later = _bits(*FUNNEL[index:])
+        reached = sum(count for (_, mask), count in histories.items() if index == 0 or mask & later)
+        stages.append(FunnelStage(
+            status=stage,
+            reached=reached,
+            conversion_rate=round(reached / previous, 4) if previous else None,
+        ))
+        previous = reached
+    return FunnelReport(
+        total=columns.applications,
+        stages=stages,
+        time_in_stage=_stage_durations(columns),
+    )
+
+
+def build(columns: StatusColumns) -> ApplicationReports:
+    return ApplicationReports(sankey=sankey(columns), funnel=funnel(columns))
+
+
+_cached: tuple[int, ApplicationReports] | None = None
+_cache_lock = threading.Lock()
+
+
+def cached(data_version: int) -> ApplicationReports | None:
+    """Reports computed at ``data_version``, if this process has them."""
+    entry = _cached
+    if entry is not None and entry[0] == data_version:
+        return entry[1]
+    return None
+
+
+def store(data_version: int, reports: ApplicationReports) -> None:
+    global _cached
+    with _cache_lock:
+        if _cached is None or _cached[0] <= data_version:
+            _cached = (data_version, reports)
+
+
+def reset() -> None:
+    global _cached
+    with _cache_lock:
+        _cached = None
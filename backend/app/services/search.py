@@ -0,0 +1,168 @@
+"""Keyword search over applications with an inverted index stored in the table.
+
+Each indexed application has a document item (pk SEARCH, sk DOC#<id>) with
+its term frequencies and length, and one posting item per distinct term
+(pk TERM#<term>, sk <id>) holding the term frequency and the document
+length. CORPUS items count the indexed documents and their total length;
+like the statistics counters they are sharded (pk SEARCH#<n>) and added to,
+and the corpus is their sum.
+A search reads one posting partition per query term and ranks the matches
+with BM25, so its cost depends on how many applications use the query terms,
+not on how many applications exist.
+"""
+import heapq
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Iterable
+
+from app.db.compression import decompress_text
+
+# Index updates that fail after the application write are logged here
+logger = logging.getLogger('resumetry.search')
+
+SEARCH_PARTITION = 'SEARCH'
+DOC_PREFIX = 'DOC#'
+TERM_PREFIX = 'TERM#'
+CORPUS_SK = 'CORPUS'
+
+# Item fields the index is built from; other updates leave it as it is
+TEXT_FIELDS = frozenset({'company', 'role', 'description', 'notes'})
+
+# BM25 term-frequency saturation and document-length normalization
+K1 = 1.2
+B = 0.75
+
+MAX_TERM_LENGTH = 64
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'of', 'on', 'or', 'that', 'the', 'to', 'was', 'we', 'with', 'you',
+))
+
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased words of a text, without stopwords and single characters."""
+    return [
+        word for word in _WORD.findall(text.casefold())
+        if 1 < len(word) <= MAX_TERM_LENGTH and word not in STOPWORDS
+    ]
+
+
+def document_terms(item: dict[str, Any]) -> Counter[str]:
+    """Term frequencies of a stored application's searchable text."""
+    terms: Counter[str] = Counter()
+    for field in ('company', 'role', 'description'):
+        if item.get(field):
+            terms.update(tokenize(decompress_text(item[field])))
+    for note in item.get('notes') or []:
+        if note.get('description'):
+            terms.update(tokenize(note['description']))
+    return terms
+
+
+def doc_key(app_id: str) -> dict[str, str]:
+    return {'pk': SEARCH_PARTITION, 'sk': DOC_PREFIX + app_id}
+
+
+def posting_key(term: str, app_id: str) -> dict[str, str]:
+    return {'pk': TERM_PREFIX + term, 'sk': app_id}
+
+
+def corpus_key(partition: str = SEARCH_PARTITION) -> dict[str, str]:
+    return {'pk': partition, 'sk': CORPUS_SK}
+
+
+def index_writes(
+    app_id: str,
+    old_doc: dict[str, Any] | None,
+    item: dict[str, Any] | None,
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None, dict[str, int]]:
+    """Move the index of one application from its document item to the stored ``item``.
+
+    ``old_doc`` is the application's current document item and ``item`` the
+    application as now stored; either is None when absent. Returns the
+    BatchWriteItem requests for the postings, the one for the document item
+    (None when it stays as it is) and the change to the corpus counters.
+    The document records the version of the application it indexes.
+    """
+    old_terms: dict[str, int] = {term: int(tf) for term, tf in (old_doc or {}).get('terms', {}).items()}
+    old_length = int((old_doc or {}).get('length', 0))
+    new_terms = document_terms(item) if item else Counter()
+    new_length = sum(new_terms.values())
+
+    requests: list[dict[str, Any]] = [
+        {'DeleteRequest': {'Key': posting_key(term, app_id)}} for term in old_terms.keys() - new_terms.keys()
+    ]
+    # The document length is stored on every posting, so a length change rewrites all of them
+    for term, tf in new_terms.items():
+        if old_terms.get(term) != tf or old_length != new_length:
+            requests.append({'PutRequest': {'Item': {**posting_key(term, app_id), 'tf': tf, 'dl': new_length}}})
+    document = None
+    if new_terms:
+        if old_terms != new_terms:
+            version = int((item or {}).get('version', 0))
+            fields = {'terms': dict(new_terms), 'length': new_length, 'version': version}
+            document = {'PutRequest': {'Item': {**doc_key(app_id), **fields}}}
+    elif old_doc:
+        document = {'DeleteRequest': {'Key': doc_key(app_id)}}
+
+    corpus = {'docs': bool(new_terms) - bool(old_terms), 'length': new_length - old_length}
+    return requests, document, {name: value for name, value in corpus.items() if value}
+
+
+def combine(changes: Iterable[dict[str, int]]) -> dict[str, int]:
+    """Sum corpus counter changes, dropping the ones that cancel out."""
+    total: Counter[str] = Counter()
+    for change in changes:
+        total.update(change)
+    return {name: value for name, value in total.items() if value}
+
+
+def corpus_update(change: dict[str, int], partition: str = SEARCH_PARTITION) -> dict[str, Any]:
+    """UpdateItem arguments adding a change to the corpus counters in ``partition``."""
+    return {
+        'Key': corpus_key(partition),
+        'UpdateExpression': 'ADD ' + ', '.join(f'#c{i} :c{i}' for i in range(len(change))),
+        'ExpressionAttributeNames': {f'#c{i}': name for i, name in enumerate(change)},
+        'ExpressionAttributeValues': {f':c{i}': value for i, value in enumerate(change.values())},
+    }
+
+
+def corpus_totals(items: Iterable[dict[str, Any]]) -> dict[str, int]:
+    """The corpus counters, summed over the counter items of every shard."""
+    return combine({name: int(item.get(name, 0)) for name in ('docs', 'length')} for item in items)
+
+
+def query_terms(query: str) -> list[str]:
+    """Distinct terms of a search query, in order."""
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def rank(
+    postings: dict[str, list[dict[str, Any]]],
+    corpus: dict[str, Any],
+    limit: int,
+) -> tuple[list[tuple[str, float]], int]:
+    """Score the documents in ``postings`` (posting items by query term) with BM25.
+
+    Returns the best ``limit`` (app id, score) pairs, best first, and the
+    number of documents that matched any term.
+    """
+    # The corpus counters can trail the postings after a failed index write
+    docs = max(int(corpus.get('docs', 0)), *(len(entries) for entries in postings.values()), 1)
+    average_length = max(int(corpus.get('length', 0)) / docs, 1.0)
+    scores: dict[str, float] = {}
+    for entries in postings.values():
+        if not entries:
+            continue
+        idf = math.log(1 + (docs - len(entries) + 0.5) / (len(entries) + 0.5))
+        for posting in entries:
+            tf = int(posting['tf'])
+            norm = K1 * (1 - B + B * int(posting['dl']) / average_length)
+            app_id = posting['sk']
+            scores[app_id] = scores.get(app_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+    best = heapq.nlargest(limit, scores.items(), key=lambda entry: (entry[1], entry[0]))
+    return best, len(scores)
@@ -0,0 +1,129 @@
+"""Dashboard statistics kept as counter items next to the applications.
+
+Every application contributes to a TOTALS item (application count, count by
+current status, responses, first screens and the days it took to reach them)
+and to the WEEK#<ISO week> item of its applied date. Writes add the
+difference between an application's old and new contribution to those items
+in the same transaction as the application itself, so reading the statistics
+is one query over a handful of items however many applications exist.
+
+With write sharding every shard has its own STATS#<shard> partition of
+counter items, which writes to the shard's applications add to. Reads add
+up the items of the same sort key over all the partitions.
+"""
+from datetime import date
+from typing import Any, Iterable
+
+from app.models.enums import ApplicationStatus
+from app.models.job_application import ApplicationStats, WeeklyCount
+
+STATS_PARTITION = 'STATS'
+TOTALS_SK = 'TOTALS'
+WEEK_PREFIX = 'WEEK#'
+
+# Item fields the statistics are derived from; other updates leave them as they are
+STATS_FIELDS = frozenset({'status', 'applied_date'})
+
+# Any of these in the history means the employer answered
+RESPONSE_STATUSES = frozenset(status.value for status in (
+    ApplicationStatus.REJECTED,
+    ApplicationStatus.SCREEN,
+    ApplicationStatus.INTERVIEW,
+    ApplicationStatus.OFFER,
+    ApplicationStatus.NOOFFER,
+))
+# Reaching any of these means the application got past the first screen
+SCREEN_STATUSES = RESPONSE_STATUSES - {ApplicationStatus.REJECTED.value}
+
+Counters = dict[str, int]
+
+
+def week_of(applied_date: str) -> str:
+    """ISO week of a stored date, e.g. 2025-W09."""
+    year, week, _ = date.fromisoformat(applied_date).isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+def contribution(item: dict[str, Any] | None) -> dict[str, Counters]:
+    """Counters one stored application adds, by stats item sort key."""
+    if not item:
+        return {}
+    status = item.get('status') or []
+    applied = item.get('applied_date')
+    # current_status is an index key, which carries the application's shard after a '#'
+    current = str(item.get('current_status', ApplicationStatus.APPLIED.value)).partition('#')[0]
+    totals: Counters = {'total': 1, f'status_{current}': 1}
+    if any(entry['status'] in RESPONSE_STATUSES for entry in status):
+        totals['responded'] = 1
+    screens = [str(entry['occur_date']) for entry in status if entry['status'] in SCREEN_STATUSES]
+    if screens and applied:
+        totals['screened'] = 1
+        totals['screen_days'] = max(0, (date.fromisoformat(min(screens)) - date.fromisoformat(applied)).days)
+
+    counters = {TOTALS_SK: totals}
+    if applied:
+        counters[WEEK_PREFIX + week_of(applied)] = {'applied': 1}
+    return counters
+
+
+def combine(changes: Iterable[dict[str, Counters]]) -> dict[str, Counters]:
+    """Sum counter changes, dropping the ones that cancel out."""
+    combined: dict[str, Counters] = {}
+    for change in changes:
+        for sk, counters in change.items():
+            target = combined.setdefault(sk, {})
+            for name, value in counters.items():
+                target[name] = target.get(name, 0) + value
+    return {
+        sk: nonzero
+        for sk, counters in combined.items()
+        if (nonzero := {name: value for name, value in counters.items() if value})
+    }
+
+
+def delta(old: dict[str, Any] | None, new: dict[str, Any] | None) -> dict[str, Counters]:
+    """Counter changes for replacing stored item ``old`` with ``new`` (None when absent)."""
+    removed = {
+        sk: {name: -value for name, value in counters.items()}
+        for sk, counters in contribution(old).items()
+    }
+    return combine([removed, contribution(new)])
+
+
+def counter_updates(changes: dict[str, Counters], partition: str = STATS_PARTITION) -> list[dict[str, Any]]:
+    """UpdateItem arguments adding each change to its counter item in ``partition``."""
+    updates = []
+    for sk, counters in changes.items():
+        updates.append({
+            'Key': {'pk': partition, 'sk': sk},
+            'UpdateExpression': 'ADD ' + ', '.join(f'#c{i} :c{i}' for i in range(len(counters))),
+            'ExpressionAttributeNames': {f'#c{i}': name for i, name in enumerate(counters)},
+            'ExpressionAttributeValues': {f':c{i}': value for i, value in enumerate(counters.values())},
+        })
+    return updates
+
+
+def summarize(items: list[dict[str, Any]]) -> ApplicationStats:
+    """Build the statistics response from the stored counter items of every shard."""
+    counters = combine(
+        {item['sk']: {name: int(value) for name, value in item.items() if name not in ('pk', 'sk')}}
+        for item in items
+    )
+    totals = counters.get(TOTALS_SK, {})
+    total = totals.get('total', 0)
+    responded = totals.get('responded', 0)
+    screened = totals.get('screened', 0)
+    weeks = [
+        WeeklyCount(week=sk.removeprefix(WEEK_PREFIX), applied=values['applied'])
+        for sk, values in counters.items()
+        if sk.startswith(WEEK_PREFIX) and values.get('applied')
+    ]
+    return ApplicationStats(
+        total=total,
+        by_status={status.value: totals.get(f'status_{status.value}', 0) for status in ApplicationStatus},
+        per_week=sorted(weeks, key=lambda week: week.week),
+        responded=responded,
+        response_rate=responded / total if total else 0.0,
+        screened=screened,
+        average_days_to_screen=totals.get('screen_days', 0) / screened if screened else None,
+    )
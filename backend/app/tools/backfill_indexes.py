@@ -0,0 +1,100 @@
+"""Add the filter indexes to an existing table and backfill their attributes.
+
+Tables created before the filter indexes existed have neither the global
+secondary indexes nor the derived attributes (current_status, company_key,
+top_job_key, item_type, change_feed, header_sk) they are keyed on, nor the
+note_count lists show. This creates any missing index, one at a time as
+DynamoDB requires, turns on TTL for the change-feed tombstones, and rewrites
+the derived attributes of every application. Run it again on tables whose header_sk predates the applied
+date prefix, which lists are ordered by. Safe to run repeatedly.
+
+    python -m app.tools.backfill_indexes [--skip-indexes] [--dry-run]
+"""
+import argparse
+
+from app.config import settings
+from app.db.dynamodb import (
+    CHANGES_HASH_KEY,
+    HEADERS_RANGE_KEY,
+    enable_ttl,
+    get_table,
+    global_secondary_indexes,
+    table_definition,
+)
+from app.services.job_application_service import (
+    CHANGE_FEED,
+    ITEM_TYPE,
+    _build_update_expression,
+    _header_sk,
+    _index_attributes,
+    _index_key,
+    app_id_of,
+    iter_application_pages,
+)
+
+
+def create_missing_indexes(dry_run: bool = False) -> list[str]:
+    """Create the indexes the table lacks and enable TTL. Returns the created index names."""
+    table = get_table()
+    table.load()
+    existing = {index['IndexName'] for index in table.global_secondary_indexes or []}
+    missing = [index for index in global_secondary_indexes() if index['IndexName'] not in existing]
+
+    if not dry_run:
+        enable_ttl(table)
+    for index in missing:
+        if dry_run:
+            continue
+        table.meta.client.update_table(
+            TableName=table.name,
+            AttributeDefinitions=table_definition()['AttributeDefinitions'],
+            GlobalSecondaryIndexUpdates=[{'Create': index}],
+        )
+        table.meta.client.get_waiter('table_exists').wait(TableName=table.name)
+    return [index['IndexName'] for index in missing]
+
+
+def backfill(dry_run: bool = False) -> int:
+    """Rewrite the derived index attributes of every application. Returns the item count."""
+    table = get_table()
+    count = 0
+    for items in iter_application_pages():
+        for item in items:
+            count += 1
+            if dry_run:
+                continue
+            app_id = app_id_of(item)
+            values, remove = _index_attributes(app_id, {
+                'status': item.get('status', []),
+                'company': item.get('company', ''),
+                'top_job': item.get('top_job', False),
+                'notes': item.get('notes', []),
+            })
+            values['item_type'] = _index_key(ITEM_TYPE, app_id)
+            values[CHANGES_HASH_KEY] = _index_key(CHANGE_FEED, app_id)
+            values[HEADERS_RANGE_KEY] = _header_sk(item.get('applied_date', ''), app_id)
+            expression, names, expression_values = _build_update_expression(values, remove)
+            table.update_item(
+                Key={'pk': item['pk'], 'sk': item['sk']},
+                UpdateExpression=expression,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=expression_values,
+            )
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--skip-indexes', action='store_true', help='only backfill attributes')
+    parser.add_argument('--dry-run', action='store_true', help='report without writing')
+    args = parser.parse_args(argv)
+
+    if not args.skip_indexes:
+        created = create_missing_indexes(dry_run=args.dry_run)
+        print(f'{settings.dynamodb_table}: indexes created: {", ".join(created) or "none"}')
+    count = backfill(dry_run=args.dry_run)
+    print(f'{settings.dynamodb_table}: backfilled {count} applications{" (dry run)" if args.dry_run else ""}')
+
+
+if __name__ == '__main__':
+    main()
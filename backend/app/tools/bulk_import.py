@@ -0,0 +1,381 @@
+"""Import applications from a CSV or JSON-lines file.
+
+The file is read as a stream, in chunks of rows that a process pool
+validates against JobApplicationCreate and turns into the items
+create_application writes (the application item, with large text
+compressed, and its history children). Writer threads send those in
+BatchWriteItem requests of 25, retrying unprocessed items with backoff.
+Reading waits while too many chunks are being validated or too many
+requests wait for a writer, so memory stays bounded whatever the file size.
+
+Rows that fail validation, or whose items could not all be written, are
+not imported: they go to the rejected-rows report (JSON lines with the row
+number, the errors and the row as read), and whatever was written of them
+is deleted again.
+
+The checkpoint file records the row up to which every row has been
+imported or rejected; running the same command again resumes after it.
+Row ids are UUIDv7s built from the import's start time and the row number,
+and history children are stamped with that start time, so rows written
+after the checkpoint are written again under the same keys rather than
+duplicated. Once the file is done the statistics and the
+search index are rebuilt (see app.tools.rebuild_stats and rebuild_search),
+so run it while nothing else writes to the table.
+
+CSV columns are the API field names, camelCase or snake_case; empty cells
+are left out. A status or notes cell holds a JSON array of entries, or a
+single status or note text dated on the applied date.
+
+    python -m app.tools.import FILE [--format csv|jsonl] [--workers N] [--writers N]
+        [--chunk-size 500] [--checkpoint PATH] [--rejected PATH] [--restart] [--skip-rebuild] [--dry-run]
+"""
+import argparse
+import csv
+import json
+import os
+import time
+import zlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from app.config import settings
+from app.db.batch import BATCH_WRITE_LIMIT, batch_write, write_chunk
+from app.models.job_application import JobApplicationCreate
+from app.services.cache import invalidate_applications
+from app.services.job_application_service import app_id_of, bump_data_version, item_key, new_item, stored_items
+from app.tools.rebuild_search import rebuild as rebuild_search
+from app.tools.rebuild_stats import rebuild as rebuild_stats
+
+FORMATS = ('csv', 'jsonl')
+_SUFFIXES = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.json': 'jsonl'}
+
+# Column of single-entry history cells, and the entry key their text goes to
+_HISTORY_CELLS = {'status': 'status', 'notes': 'description'}
+
+WRITE_FAILED = 'Write was not processed'
+
+# Seconds between checkpoint saves; one is always saved at the end
+CHECKPOINT_INTERVAL = 2.0
+
+# (row number, row as read: a dict of CSV cells or a JSON line)
+Record = tuple[int, Any]
+
+# A valid row: its number, the row as read, and the items storing it
+Valid = tuple[int, Any, list[dict[str, Any]]]
+
+
+def detect_format(path: Path) -> str:
+    try:
+        return _SUFFIXES[path.suffix.lower()]
+    except KeyError:
+        raise SystemExit(f'{path}: cannot tell the format from the extension, pass --format') from None
+
+
+def read_rows(path: Path, fmt: str) -> Iterator[Record]:
+    """Rows of the file with their numbers: CSV records after the header, or non-blank JSON lines."""
+    with path.open(newline='', encoding='utf-8-sig') as f:
+        if fmt == 'csv':
+            yield from enumerate(csv.DictReader(f), start=1)
+        else:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield number, line
+
+
+def _csv_values(row: dict[str | None, Any]) -> dict[str, Any]:
+    """Field values of a CSV record, without empty cells."""
+    values: dict[str, Any] = {
+        key.strip(): value.strip()
+        for key, value in row.items()
+        if key and isinstance(value, str) and value.strip()
+    }
+    applied = values.get('appliedDate') or values.get('applied_date') or date.today().isoformat()
+    for column, entry_key in _HISTORY_CELLS.items():
+        text = values.get(column)
+        if text is None:
+            continue
+        if text.startswith('['):
+            values[column] = json.loads(text)
+        else:
+            values[column] = [{'occurDate': applied, entry_key: text}]
+    return values
+
+
+def row_id(run: int, source: str, row: int) -> str:
+    """UUIDv7 of an imported row: the import's start in milliseconds, then the row number and a hash of the file.
+
+    The same import gives a row the same id every time it runs, and ids follow row order.
+    """
+    payload = row << 32 | zlib.crc32(source.encode())
+    value = run << 80 | 0x7 << 76 | (payload >> 62) << 64 | 0x2 << 62 | payload & ((1 << 62) - 1)
+    return str(UUID(int=value))
+
+
+def _rejection(row: int, raw: Any, errors: list[dict[str, Any]]) -> dict[str, Any]:
+    return {'row': row, 'errors': errors, 'data': raw if isinstance(raw, dict) else raw.rstrip('\r\n')}
+
+
+def validate_chunk(
+    records: list[Record],
+    fmt: str,
+    run: int,
+    source: str,
+) -> tuple[list[Valid], list[dict[str, Any]]]:
+    """Each valid row of a chunk with its items to write, and report entries of the others. Runs in the pool."""
+    valid: list[Valid] = []
+    rejected: list[dict[str, Any]] = []
+    for row, raw in records:
+        try:
+            values = json.loads(raw) if fmt == 'jsonl' else _csv_values(raw)
+            if not isinstance(values, dict):
+                raise ValueError('Row is not a JSON object')
+            data = JobApplicationCreate.model_validate(values)
+        except ValidationError as e:
+            errors = [{'loc': list(error['loc']), 'msg': error['msg']} for error in e.errors()]
+            rejected.append(_rejection(row, raw, errors))
+        except ValueError as e:
+            rejected.append(_rejection(row, raw, [{'msg': str(e)}]))
+        else:
+            # Written again on resume, so child sort keys must not change either
+            valid.append((row, raw, stored_items(new_item(data, row_id(run, source, row)), run * 1_000_000)))
+    return valid, rejected
+
+
+class _Chunk:
+    """Rows ``first`` to ``last`` of the file, from validation until every write of them finished."""
+
+    def __init__(self, first: int, last: int) -> None:
+        self.first = first
+        self.last = last
+        self.rows: dict[str, Valid] = {}  # by app id
+        self.rejected: list[dict[str, Any]] = []
+        self.failed: set[str] = set()
+        self.pending = 0  # write requests not finished
+        self.settled = False
+
+
+class Importer:
+    """One run of an import; see the module docstring."""
+
+    def __init__(
+        self,
+        path: Path,
+        fmt: str,
+        checkpoint: Path,
+        rejected: Path,
+        workers: int,
+        writers: int,
+        chunk_size: int,
+        dry_run: bool = False,
+    ) -> None:
+        self.path = path
+        self.fmt = fmt
+        self.checkpoint_path = checkpoint
+        self.rejected_path = rejected
+        self.workers = workers
+        self.writers = writers
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.counts = {'imported': 0, 'rejected': 0}
+        self._saved_at = 0.0
+
+    # Checkpoint and report
+
+    def load_checkpoint(self, restart: bool = False) -> dict[str, Any]:
+        """The checkpoint to resume from, or a fresh one. Raises SystemExit for another file's checkpoint."""
+        source = str(self.path.resolve())
+        size = self.path.stat().st_size
+        if restart or self.dry_run or not self.checkpoint_path.exists():
+            self.rejected_path.write_text('')
+            return {'source': source, 'size': size, 'run': time.time_ns() // 1_000_000, 'row': 0}
+        checkpoint = json.loads(self.checkpoint_path.read_text())
+        if (checkpoint['source'], checkpoint['size']) != (source, size):
+            raise SystemExit(f'{self.checkpoint_path} belongs to another input file; pass --restart to start over')
+        self._trim_report(checkpoint['row'])
+        return checkpoint
+
+    def _trim_report(self, row: int) -> None:
+        """Drop report entries after the checkpoint; the resumed run reports those rows again."""
+        if not self.rejected_path.exists():
+            return
+        with self.rejected_path.open() as f:
+            kept = [line for line in f if line.strip() and json.loads(line)['row'] <= row]
+        self.rejected_path.write_text(''.join(kept))
+
+    def _save(self, checkpoint: dict[str, Any], force: bool = False) -> None:
+        now = time.monotonic()
+        if self.dry_run or (not force and now - self._saved_at < CHECKPOINT_INTERVAL):
+            return
+        self._saved_at = now
+        temporary = self.checkpoint_path.with_name(self.checkpoint_path.name + '.tmp')
+        temporary.write_text(json.dumps(checkpoint))
+        os.replace(temporary, self.checkpoint_path)
+
+    def _report(self, entries: list[dict[str, Any]]) -> None:
+        if entries:
+            with self.rejected_path.open('a') as f:
+                f.writelines(json.dumps(entry, default=str) + '\n' for entry in sorted(entries, key=lambda e: e['row']))
+
+    # Pipeline
+
+    def _validation_pool(self) -> Executor:
+        if self.workers <= 0:
+            # In this process; for small files and debugging
+            return ThreadPoolExecutor(max_workers=1)
+        return ProcessPoolExecutor(max_workers=self.workers)
+
+    def run(self, restart: bool = False) -> dict[str, int]:
+        """Import the rows after the checkpoint. Returns the counts of this run."""
+        checkpoint = self.load_checkpoint(restart)
+        rows = ((row, raw) for row, raw in read_rows(self.path, self.fmt) if row > checkpoint['row'])
+        max_validating = max(2, 2 * self.workers)
+        self._open: deque[_Chunk] = deque()
+        self._writes: dict[Future[list[dict[str, Any]]], _Chunk] = {}
+        validating: deque[tuple[_Chunk, Future[Any]]] = deque()
+
+        try:
+            with self._validation_pool() as pool, ThreadPoolExecutor(max_workers=self.writers) as writer_pool:
+                self._writer_pool = writer_pool
+                for records in _batched(rows, self.chunk_size):
+                    chunk = _Chunk(records[0][0], records[-1][0])
+                    self._open.append(chunk)
+                    validating.append((chunk, pool.submit(
+                        validate_chunk, records, self.fmt, checkpoint['run'], checkpoint['source'],
+                    )))
+                    # Chunks are written in file order, as soon as they are validated
+                    while validating and (len(validating) >= max_validating or validating[0][1].done()):
+                        self._write(*validating.popleft())
+                    self._advance(checkpoint)
+                while validating:
+                    self._write(*validating.popleft())
+                while self._writes:
+                    self._finish(wait(self._writes, return_when=FIRST_COMPLETED).done)
+                    self._advance(checkpoint)
+        finally:
+            # Also on errors and interrupts: the rows settled so far are not imported again
+            self._advance(checkpoint, force=True)
+        return self.counts
+
+    def _write(self, chunk: _Chunk, validation: Future[Any]) -> None:
+        """Queue the writes of a validated chunk, waiting for writers while too many are queued."""
+        valid, chunk.rejected = validation.result()
+        requests: list[dict[str, Any]] = []
+        for row, raw, items in valid:
+            chunk.rows[app_id_of(items[0])] = (row, raw, items)
+            requests.extend({'PutRequest': {'Item': item}} for item in items)
+        if self.dry_run:
+            requests = []
+        chunk.pending = (len(requests) + BATCH_WRITE_LIMIT - 1) // BATCH_WRITE_LIMIT
+        if not chunk.pending:
+            self._settle(chunk)
+        for start in range(0, len(requests), BATCH_WRITE_LIMIT):
+            while len(self._writes) >= 2 * self.writers:
+                self._finish(wait(self._writes, return_when=FIRST_COMPLETED).done)
+            future = self._writer_pool.submit(write_chunk, requests[start:start + BATCH_WRITE_LIMIT])
+            self._writes[future] = chunk
+
+    def _finish(self, done: Iterable[Future[list[dict[str, Any]]]]) -> None:
+        for future in done:
+            chunk = self._writes.pop(future)
+            chunk.failed.update(app_id_of(request['PutRequest']['Item']) for request in future.result())
+            chunk.pending -= 1
+            if not chunk.pending:
+                self._settle(chunk)
+
+    def _settle(self, chunk: _Chunk) -> None:
+        """Account for a chunk whose writes all finished, taking back what was written of failed rows."""
+        if chunk.failed:
+            batch_write([
+                {'DeleteRequest': {'Key': item_key(item)}}
+                for app_id in chunk.failed
+                for item in chunk.rows[app_id][2]
+            ])
+            chunk.rejected.extend(
+                _rejection(*chunk.rows[app_id][:2], [{'msg': WRITE_FAILED}])
+                for app_id in chunk.failed
+            )
+        self._report(chunk.rejected)
+        self.counts['imported'] += len(chunk.rows) - len(chunk.failed)
+        self.counts['rejected'] += len(chunk.rejected)
+        chunk.rows.clear()
+        chunk.settled = True
+
+    def _advance(self, checkpoint: dict[str, Any], force: bool = False) -> None:
+        """Move the checkpoint past the leading chunks that are settled."""
+        while self._open and self._open[0].settled:
+            checkpoint['row'] = self._open.popleft().last
+        self._save(checkpoint, force)
+
+
+def _batched(records: Iterable[Record], size: int) -> Iterator[list[Record]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def import_file(
+    path: Path,
+    fmt: str | None = None,
+    checkpoint: Path | None = None,
+    rejected: Path | None = None,
+    workers: int | None = None,
+    writers: int = 16,
+    chunk_size: int = 500,
+    restart: bool = False,
+    rebuild: bool = True,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """Import a file (see the module docstring). Returns the imported and rejected counts of this run."""
+    importer = Importer(
+        path,
+        fmt or detect_format(path),
+        checkpoint or path.with_name(path.name + '.checkpoint.json'),
+        rejected or path.with_name(path.name + '.rejected.jsonl'),
+        (os.cpu_count() or 1) if workers is None else workers,
+        writers,
+        chunk_size,
+        dry_run,
+    )
+    counts = importer.run(restart)
+    if counts['imported'] and not dry_run:
+        invalidate_applications()
+        bump_data_version()
+        if rebuild:
+            rebuild_stats()
+            rebuild_search()
+    return counts
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('file', type=Path, help='CSV or JSON-lines file')
+    parser.add_argument('--format', choices=FORMATS, help='default: from the file extension')
+    parser.add_argument('--workers', type=int, help='validation processes (default: CPU count, 0: in process)')
+    parser.add_argument('--writers', type=int, default=16, help='BatchWriteItem threads')
+    parser.add_argument('--chunk-size', type=int, default=500, help='rows per validation chunk')
+    parser.add_argument('--checkpoint', type=Path, help='default: FILE.checkpoint.json')
+    parser.add_argument('--rejected', type=Path, help='rejected-rows report, default: FILE.rejected.jsonl')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint and start from the first row')
+    parser.add_argument('--skip-rebuild', action='store_true', help='leave the statistics and search index as they are')
+    parser.add_argument('--dry-run', action='store_true', help='validate and report without writing')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    counts = import_file(
+        args.file, args.format, args.checkpoint, args.rejected, args.workers, args.writers, args.chunk_size,
+        restart=args.restart, rebuild=not args.skip_rebuild, dry_run=args.dry_run,
+    )
+    seconds = time.perf_counter() - started
+    rows = counts['imported'] + counts['rejected']
+    print(
+        f'{settings.dynamodb_table}: imported {counts["imported"]} rows, rejected {counts["rejected"]} '
+        f'in {seconds:.1f} s ({rows / seconds if seconds else 0:.0f} rows/s)'
+        f'{" (dry run)" if args.dry_run else ""}'
+    )
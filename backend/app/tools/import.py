@@ -0,0 +1,8 @@
+"""Entry point of ``python -m app.tools.import``; the importer is app.tools.bulk_import.
+
+``import`` is a keyword, so code and tests import bulk_import instead.
+"""
+from app.tools.bulk_import import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""Rewrite job application items into the configured shard layout.
+
+Reads every item from the legacy ``JOB_APPS`` partition (and from any
+shards of a previous layout), writes it under the partition chosen for its
+id by the current ``shard_count`` and deletes the old copy. The status and
+note children of an application move with it, and application items get
+the filter index keys of their new shard. Items are copied before they are
+deleted, so an interrupted run can simply be started again. Change-feed
+tombstones move to the shards of the new layout as well. Statistics, data
+version and search corpus counters of shards the new layout drops are added
+to the unsuffixed counter partitions, which reads always include.
+
+    python -m app.tools.migrate_shards [--from-shards N] [--dry-run]
+"""
+import argparse
+from typing import Any
+
+from app.config import settings
+from app.db.dynamodb import CHANGES_HASH_KEY, get_table
+from app.services import search, stats
+from app.services.job_application_service import (
+    CHANGE_FEED,
+    DATA_VERSION_PARTITION,
+    ITEM_TYPE,
+    TOMBSTONE_PARTITION,
+    _entry_type,
+    _index_attributes,
+    _index_key,
+    _partition_for,
+    _partitions,
+    _query_partition,
+    _shard_key,
+    _status_entries,
+    app_id_of,
+    shard_keys,
+)
+
+
+def _moved(item: dict[str, Any]) -> dict[str, Any]:
+    """An item under the partition of its shard; application items also get that shard's index keys."""
+    app_id = app_id_of(item)
+    moved = {**item, 'pk': _partition_for(app_id)}
+    if _entry_type(item) is None:
+        values, remove = _index_attributes(app_id, {
+            'status': _status_entries(item),
+            'company': item.get('company', ''),
+            'top_job': item.get('top_job', False),
+        })
+        for name in remove:
+            moved.pop(name, None)
+        moved.update(values, item_type=_index_key(ITEM_TYPE, app_id))
+        moved[CHANGES_HASH_KEY] = _index_key(CHANGE_FEED, app_id)
+    return moved
+
+
+def move_tombstones(from_shards: int) -> None:
+    """Move the change-feed tombstones of the legacy layout and of ``from_shards`` to their current shard."""
+    table = get_table()
+    sources = [_shard_key(TOMBSTONE_PARTITION, shard, from_shards) for shard in range(from_shards)]
+    for partition in dict.fromkeys([TOMBSTONE_PARTITION, *sources]):
+        for items in _query_partition(partition):
+            moves = [item for item in items if item['pk'] != _index_key(TOMBSTONE_PARTITION, app_id_of(item))]
+            with table.batch_writer() as batch:
+                for item in moves:
+                    app_id = app_id_of(item)
+                    batch.put_item(Item={
+                        **item,
+                        'pk': _index_key(TOMBSTONE_PARTITION, app_id),
+                        CHANGES_HASH_KEY: _index_key(CHANGE_FEED, app_id),
+                    })
+            with table.batch_writer() as batch:
+                for item in moves:
+                    batch.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
+
+
+def fold_counters(from_shards: int) -> None:
+    """Add the counter items of shards no longer read to the unsuffixed partitions, then delete them."""
+    table = get_table()
+    for key in (stats.STATS_PARTITION, DATA_VERSION_PARTITION, search.SEARCH_PARTITION):
+        dropped = {_shard_key(key, shard, from_shards) for shard in range(from_shards)}
+        for partition in sorted(dropped - set(shard_keys(key))):
+            for items in _query_partition(partition):
+                for item in items:
+                    counters = {name: value for name, value in item.items() if name not in ('pk', 'sk')}
+                    if counters:
+                        [update] = stats.counter_updates({item['sk']: counters}, key)
+                        table.update_item(**update)
+                    table.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
+
+
+def migrate(from_shards: int = 1, dry_run: bool = False) -> dict[str, int]:
+    """Move items into the current shard layout. Returns counts by outcome."""
+    table = get_table()
+    source_partitions = dict.fromkeys(_partitions(1) + _partitions(from_shards))
+    counts = {'scanned': 0, 'moved': 0, 'unchanged': 0}
+
+    for partition in source_partitions:
+        for items in _query_partition(partition):
+            moves: list[dict[str, Any]] = []
+            for item in items:
+                counts['scanned'] += 1
+                target = _partition_for(app_id_of(item))
+                if target == item['pk']:
+                    counts['unchanged'] += 1
+                else:
+                    moves.append(item)
+            counts['moved'] += len(moves)
+            if dry_run or not moves:
+                continue
+
+            with table.batch_writer() as batch:
+                for item in moves:
+                    batch.put_item(Item=_moved(item))
+            with table.batch_writer() as batch:
+                for item in moves:
+                    batch.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
+
+    if not dry_run:
+        move_tombstones(from_shards)
+        fold_counters(from_shards)
+    return counts
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--from-shards', type=int, default=1,
+        help='shard count of the layout being migrated from (default: 1, the legacy layout)',
+    )
+    parser.add_argument('--dry-run', action='store_true', help='report counts without writing')
+    args = parser.parse_args(argv)
+
+    counts = migrate(from_shards=args.from_shards, dry_run=args.dry_run)
+    print(
+        f'{settings.dynamodb_table}: scanned {counts["scanned"]}, '
+        f'moved {counts["moved"]}, unchanged {counts["unchanged"]} '
+        f'(shard_count={settings.shard_count}{", dry run" if args.dry_run else ""})'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Rebuild the search index from the stored applications.
+
+Writes keep the index up to date, but applications written before it
+existed are missing from it, and an index write that failed after its
+application write leaves it stale. This drops every document, posting and
+corpus item and indexes every application again, counting the corpus in
+the unsuffixed corpus item. Searches return partial results while it runs.
+
+    python -m app.tools.rebuild_search [--dry-run]
+"""
+import argparse
+from typing import Any
+
+from app.config import settings
+from app.db.batch import batch_write
+from app.db.dynamodb import get_table
+from app.services import search
+from app.services.job_application_service import app_id_of, iter_application_pages, shard_keys
+
+
+def _index_keys() -> list[dict[str, Any]]:
+    """Keys of every document and posting item, and of the corpus items of every shard."""
+    table = get_table()
+    keys: list[dict[str, Any]] = []
+    kwargs: dict[str, Any] = {
+        'KeyConditionExpression': 'pk = :pk',
+        'ExpressionAttributeValues': {':pk': search.SEARCH_PARTITION},
+        'ProjectionExpression': 'pk, sk, terms',
+    }
+    while True:
+        response = table.query(**kwargs)
+        for item in response['Items']:
+            keys.append({'pk': item['pk'], 'sk': item['sk']})
+            app_id = item['sk'].removeprefix(search.DOC_PREFIX)
+            keys.extend(search.posting_key(term, app_id) for term in item.get('terms', {}))
+        if 'LastEvaluatedKey' not in response:
+            break
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    # The unsuffixed corpus item lives in the partition read above
+    keys.extend(search.corpus_key(partition) for partition in shard_keys(search.SEARCH_PARTITION)[1:])
+    return keys
+
+
+def rebuild(dry_run: bool = False) -> tuple[int, int]:
+    """Index every application again. Returns the application and posting counts."""
+    requests: list[dict[str, Any]] = []
+    changes: list[dict[str, int]] = []
+    count = postings = 0
+    for items in iter_application_pages():
+        for item in items:
+            count += 1
+            writes, document, change = search.index_writes(app_id_of(item), None, item)
+            postings += len(writes)
+            requests.extend([*writes, document] if document else writes)
+            changes.append(change)
+    if dry_run:
+        return count, postings
+
+    batch_write([{'DeleteRequest': {'Key': key}} for key in _index_keys()])
+    batch_write(requests)
+    corpus = search.combine(changes)
+    if corpus:
+        get_table().update_item(**search.corpus_update(corpus))
+    return count, postings
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dry-run', action='store_true', help='report without writing')
+    args = parser.parse_args(argv)
+
+    count, postings = rebuild(dry_run=args.dry_run)
+    print(f'{settings.dynamodb_table}: indexed {count} applications, {postings} postings'
+          f'{" (dry run)" if args.dry_run else ""}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Recompute the statistics counter items from the stored applications.
+
+Writes keep the counters up to date, but applications written before the
+counters existed are missing from them, and batch writes update them outside
+the application's transaction. This scans every application, replaces the
+counter items of every STATS shard with freshly computed ones in the
+unsuffixed STATS partition and prints the result. Run it while nothing else
+writes to the table.
+
+    python -m app.tools.rebuild_stats [--dry-run]
+"""
+import argparse
+
+from app.config import settings
+from app.db.dynamodb import get_table
+from app.models.job_application import ApplicationStats
+from app.services import stats
+from app.services.job_application_service import iter_application_pages, shard_keys
+
+
+def compute() -> dict[str, stats.Counters]:
+    """Counters of every stored application, by stats item sort key."""
+    return stats.combine(
+        stats.contribution(item)
+        for items in iter_application_pages()
+        for item in items
+    )
+
+
+def rebuild(dry_run: bool = False) -> ApplicationStats:
+    """Replace the stored counter items. Returns the statistics they now give."""
+    counters = compute()
+    items = [{'pk': stats.STATS_PARTITION, 'sk': sk, **values} for sk, values in counters.items()]
+    if dry_run:
+        return stats.summarize(items)
+
+    table = get_table()
+    existing = []
+    for partition in shard_keys(stats.STATS_PARTITION):
+        kwargs = {
+            'KeyConditionExpression': 'pk = :pk',
+            'ExpressionAttributeValues': {':pk': partition},
+            'ProjectionExpression': 'pk, sk',
+        }
+        while True:
+            response = table.query(**kwargs)
+            existing.extend(response['Items'])
+            if 'LastEvaluatedKey' not in response:
+                break
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    with table.batch_writer(overwrite_by_pkeys=['pk', 'sk']) as batch:
+        for key in existing:
+            batch.delete_item(Key={'pk': key['pk'], 'sk': key['sk']})
+        for item in items:
+            batch.put_item(Item=item)
+    return stats.summarize(items)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dry-run', action='store_true', help='report without writing')
+    args = parser.parse_args(argv)
+
+    result = rebuild(dry_run=args.dry_run)
+    print(f'{settings.dynamodb_table}: {result.total} applications, {len(result.per_week)} weeks, '
+          f'{result.responded} responded{" (dry run)" if args.dry_run else ""}')
+
+
+if __name__ == '__main__':
+    main()
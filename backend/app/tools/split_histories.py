@@ -0,0 +1,116 @@
+"""Move status and note lists stored on application items into child items.
+
+Applications written before the history entries became child items carry
+them as ``status`` and ``notes`` lists on the application item itself. This
+writes every entry as a child item in the application's item collection,
+removes the lists and sets the latest status and the headers index key, in
+one transaction per application that only applies while the application is
+still at the version read. Applications that change meanwhile are counted
+as conflicts and left for the next run. Safe to run repeatedly; run
+app.tools.backfill_indexes first on tables that lack the headers index.
+
+    python -m app.tools.split_histories [--dry-run]
+"""
+import argparse
+from typing import Any
+
+from app.config import settings
+from app.db.batch import batch_write
+from app.db.dynamodb import HEADERS_RANGE_KEY
+from app.services.cache import invalidate_applications
+from app.services.job_application_service import (
+    HISTORY_FIELDS,
+    _build_update_expression,
+    _entry_type,
+    _header_sk,
+    _index_attributes,
+    _partitions,
+    _query_partition,
+    _read_collection,
+    _transact,
+    app_id_of,
+    assemble,
+    history_writes,
+    item_key,
+    with_child_writes,
+)
+
+
+def _inline_fields(item: dict[str, Any]) -> list[str]:
+    return sorted(field for field in HISTORY_FIELDS if isinstance(item.get(field), list))
+
+
+def _split_transaction(
+    collection: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """TransactItems moving the inline lists of an application into child items, and the writes left over."""
+    parent = collection[0]
+    item = assemble(collection)
+    fields = _inline_fields(parent)
+    values, remove = _index_attributes(app_id_of(parent), {'status': item['status'], 'notes': item['notes']})
+    values[HEADERS_RANGE_KEY] = _header_sk(parent.get('applied_date', ''), app_id_of(parent))
+    expression, names, expression_values = _build_update_expression(values, [*remove, *fields])
+    names['#ver'] = 'version'
+    if 'version' in parent:
+        condition = '#ver = :version'
+        expression_values[':version'] = parent['version']
+    else:
+        condition = 'attribute_not_exists(#ver)'
+    update = {
+        'Key': item_key(parent),
+        'UpdateExpression': expression,
+        'ConditionExpression': condition,
+        'ExpressionAttributeNames': names,
+        'ExpressionAttributeValues': expression_values,
+        'TableName': settings.dynamodb_table,
+    }
+    # The inline entries, merged with any children already written, replace those children
+    writes = history_writes(app_id_of(parent), collection, {field: item[field] for field in fields})
+    return with_child_writes([{'Update': update}], writes)
+
+
+def split(dry_run: bool = False) -> dict[str, int]:
+    """Move inline histories into child items. Returns counts by outcome."""
+    counts = {'scanned': 0, 'split': 0, 'unchanged': 0, 'conflicts': 0}
+    for partition in _partitions():
+        for items in _query_partition(partition):
+            for item in items:
+                if _entry_type(item) is not None:
+                    continue
+                counts['scanned'] += 1
+                if not _inline_fields(item):
+                    counts['unchanged'] += 1
+                    continue
+                if dry_run:
+                    counts['split'] += 1
+                    continue
+                collection = _read_collection(app_id_of(item), consistent=True)
+                if collection is None:
+                    counts['conflicts'] += 1
+                    continue
+                transaction, overflow = _split_transaction(collection)
+                if _transact(transaction):
+                    batch_write(overflow)
+                    counts['split'] += 1
+                else:
+                    counts['conflicts'] += 1
+    if counts['split'] and not dry_run:
+        invalidate_applications()
+    return counts
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dry-run', action='store_true', help='report counts without writing')
+    args = parser.parse_args(argv)
+
+    counts = split(dry_run=args.dry_run)
+    print(
+        f'{settings.dynamodb_table}: scanned {counts["scanned"]} applications, split {counts["split"]}, '
+        f'unchanged {counts["unchanged"]}, conflicts {counts["conflicts"]}'
+        f'{" (dry run)" if args.dry_run else ""}'
+    )
+
+
+if __name__ == '__main__':
+    main()
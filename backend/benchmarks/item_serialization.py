@@ -0,0 +1,122 @@
+"""Write-path serialization benchmark.
+
+Converts create and partial-update models into DynamoDB-ready dicts, once
+with the previous recursive serializer over model_dump() output (kept here
+as a reference copy) and once with app.db.serialization. Reports the median
+time per conversion over several runs.
+
+    python -m benchmarks.item_serialization [--items 10000] [--notes 5] [--runs 5] [--json]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, cast
+
+from app.db.serialization import model_to_dynamo
+from app.models.enums import ApplicationStatus
+from app.models.job_application import ApplicationNote, JobApplicationCreate, JobApplicationUpdate, StatusItem
+
+
+def previous_serialize(data: dict[str, Any]) -> dict[str, Any]:
+    """_serialize_for_dynamo as it was before the type-dispatched serializer."""
+    serialized: dict[str, Any] = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        if isinstance(value, (date, datetime)):
+            serialized[key] = value.isoformat()
+        elif isinstance(value, list):
+            serialized[key] = [
+                previous_serialize(cast(dict[str, Any], item)) if isinstance(item, dict) else item
+                for item in cast(list[Any], value)
+            ]
+        elif isinstance(value, dict):
+            serialized[key] = previous_serialize(cast(dict[str, Any], value))
+        elif hasattr(value, 'value'):
+            serialized[key] = value.value
+        else:
+            serialized[key] = value
+    return serialized
+
+
+def make_creates(count: int, notes: int) -> list[JobApplicationCreate]:
+    start = date(2025, 1, 1)
+    return [
+        JobApplicationCreate(
+            company=f'Company {i}', role='Software Engineer', description='Build and run services.',
+            salary='$150k', top_job=i % 7 == 0, applied_date=start + timedelta(days=i % 365),
+            status=[StatusItem(occur_date=start, status=ApplicationStatus.APPLIED)],
+            notes=[ApplicationNote(occur_date=start, description=f'Note {n}') for n in range(notes)],
+        )
+        for i in range(count)
+    ]
+
+
+def make_updates(count: int) -> list[JobApplicationUpdate]:
+    return [JobApplicationUpdate(company=f'Company {i}', salary='$160k') for i in range(count)]
+
+
+def _median_ms(fn: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run(count: int, notes: int, runs: int) -> dict:
+    creates = make_creates(count, notes)
+    updates = make_updates(count)
+    if [previous_serialize(m.model_dump()) for m in creates[:10]] != [model_to_dynamo(m) for m in creates[:10]]:
+        raise SystemExit('serializers disagree on create items')
+
+    cases = {
+        'create': (
+            lambda: [previous_serialize(m.model_dump()) for m in creates],
+            lambda: [model_to_dynamo(m) for m in creates],
+        ),
+        'update': (
+            lambda: [previous_serialize(m.model_dump(exclude_unset=True)) for m in updates],
+            lambda: [model_to_dynamo(m, exclude_unset=True) for m in updates],
+        ),
+    }
+    report: dict[str, Any] = {'items': count, 'notes_per_item': notes, 'runs': runs, 'python': sys.version.split()[0]}
+    for name, (previous, current) in cases.items():
+        previous_ms = _median_ms(previous, runs)
+        current_ms = _median_ms(current, runs)
+        report[name] = {
+            'previous_us_per_item': previous_ms * 1000 / count,
+            'current_us_per_item': current_ms * 1000 / count,
+            'speedup': previous_ms / current_ms,
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Compare the previous and type-dispatched item serializers.')
+    parser.add_argument('--items', type=int, default=10_000)
+    parser.add_argument('--notes', type=int, default=5, help='notes per created application')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.items, args.notes, args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f'Python {report["python"]}, {report["items"]} items x {report["notes_per_item"]} notes, '
+          f'median of {report["runs"]} runs')
+    print(f'  {"":8}{"previous us":>13}{"current us":>12}{"speedup":>9}')
+    for name in ('create', 'update'):
+        case = report[name]
+        print(f'  {name:8}{case["previous_us_per_item"]:13.1f}{case["current_us_per_item"]:12.1f}'
+              f'{case["speedup"]:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""Throughput and latency benchmark of the application CRUD paths.
+
+Seeds a fresh table with applications carrying realistic status and note
+histories, then drives create, get, list, patch and delete through the
+service functions and through the ASGI app (FastAPI TestClient). For each
+operation it reports ops/sec, p50/p95/p99 latency and the DynamoDB requests
+each call makes, by API operation. With --allocations it also samples the
+peak Python allocations of a few extra calls per operation under tracemalloc.
+
+Runs against moto in-process by default, or against DynamoDB Local (the
+dynamodb-local service of docker-compose.yml) with --endpoint. A table with
+a random name is created for the run and dropped afterwards. Under moto the
+latencies and allocations include moto's own work, so compare results of the
+same backend only; DynamoDB Local gives figures closer to the service alone.
+
+Under moto every transaction copies the table, so calls slow down as the
+table grows: ``--items 50 --ops 10`` takes about 30 s, and the default sizes
+are meant for DynamoDB Local. Allocation sampling traces every allocation
+moto makes too and roughly triples that time, so it is off by default.
+
+    python -m benchmarks.load [--items 1000] [--ops 200] [--drivers service,asgi]
+        [--endpoint http://localhost:8000] [--seed 1] [--allocations] [--json] [--output report.json]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from datetime import date, timedelta
+from typing import Any, Callable, Iterator
+from uuid import uuid4
+
+from app.config import settings
+from app.db.batch import batch_write
+from app.db.dynamodb import create_table_if_not_exists, get_table, reset_dynamodb
+from app.models.enums import ApplicationStatus
+from app.models.job_application import ApplicationNote, JobApplicationCreate, JobApplicationUpdate, StatusItem
+from app.services import job_application_service as svc
+
+OPERATIONS = ('create', 'get', 'list', 'patch', 'delete')
+DRIVERS = ('service', 'asgi')
+BASE_URL = '/api/v1/applications'
+
+# Status progressions an application goes through, cut short at random
+_PROGRESSION = [
+    ApplicationStatus.APPLIED, ApplicationStatus.SCREEN, ApplicationStatus.INTERVIEW,
+    ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER,
+]
+_WORDS = (
+    'recruiter called about the role team uses python and aws follow up next week '
+    'salary range discussed hiring manager interview loop take home exercise onsite'
+).split()
+
+# Peak allocations are sampled on this many calls per operation (--allocations)
+ALLOCATION_SAMPLES = 5
+
+
+def make_application(rng: random.Random, index: int) -> JobApplicationCreate:
+    applied = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+    steps = _PROGRESSION[:rng.randint(1, len(_PROGRESSION))]
+    if len(steps) < len(_PROGRESSION) and rng.random() < 0.4:
+        steps = [*steps, ApplicationStatus.REJECTED]
+    return JobApplicationCreate(
+        company=f'Company {rng.randrange(max(index // 4, 1) + 1)}',
+        role=rng.choice(['Software Engineer', 'Backend Developer', 'Platform Engineer', 'Data Engineer']),
+        description=' '.join(rng.choices(_WORDS, k=rng.randint(20, 120))),
+        salary=f'${rng.randrange(90, 250)}k',
+        top_job=rng.random() < 0.15,
+        source_page='https://example.com/jobs/' + str(index),
+        applied_date=applied,
+        status=[StatusItem(occur_date=applied + timedelta(days=7 * i), status=s) for i, s in enumerate(steps)],
+        notes=[
+            ApplicationNote(
+                occur_date=applied + timedelta(days=n),
+                description=' '.join(rng.choices(_WORDS, k=rng.randint(8, 40))),
+            )
+            for n in range(rng.randint(0, 12))
+        ],
+    )
+
+
+def seed(count: int, rng: random.Random) -> list[str]:
+    """Write ``count`` applications with BatchWriteItem. Returns their ids."""
+    items = [svc.new_item(make_application(rng, i)) for i in range(count)]
+    failed = batch_write([{'PutRequest': {'Item': stored}} for item in items for stored in svc.stored_items(item)])
+    if failed:
+        raise SystemExit(f'{len(failed)} seed writes failed')
+    return [svc.app_id_of(item) for item in items]
+
+
+class RequestCounter:
+    """Counts DynamoDB API calls made through the shared boto3 client."""
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, model: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self.counts[model.name] += 1
+
+    def attach(self) -> None:
+        get_table().meta.client.meta.events.register('before-call.dynamodb', self)
+
+    def take(self) -> Counter[str]:
+        with self._lock:
+            counts, self.counts = self.counts, Counter()
+        return counts
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(call: Callable[[int], Any], ops: int, counter: RequestCounter) -> dict[str, Any]:
+    """Time ``ops`` calls and count the DynamoDB requests they make."""
+    counter.take()
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for i in range(ops):
+        t0 = time.perf_counter()
+        call(i)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+    requests = counter.take()
+
+    latencies.sort()
+    return {
+        'ops': ops,
+        'ops_per_sec': ops / elapsed,
+        'p50_ms': _percentile(latencies, 0.50),
+        'p95_ms': _percentile(latencies, 0.95),
+        'p99_ms': _percentile(latencies, 0.99),
+        'mean_ms': statistics.fmean(latencies),
+        'dynamodb_requests_per_call': {name: count / ops for name, count in sorted(requests.items())},
+    }
+
+
+def allocations(call: Callable[[int], Any], samples: int, offset: int) -> float:
+    """Median peak of Python allocations during one call, in KiB."""
+    peaks: list[float] = []
+    tracemalloc.start()
+    try:
+        for i in range(samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call(offset + i)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append((peak - before) / 1024)
+    finally:
+        tracemalloc.stop()
+    return statistics.median(peaks)
+
+
+def service_calls(ids: list[str], created: list[str], rng: random.Random) -> dict[str, Callable[[int], Any]]:
+    return {
+        'create': lambda i: created.append(svc.create_application(make_application(rng, i)).id),
+        'get': lambda i: svc.get_application(ids[i % len(ids)]),
+        'list': lambda i: svc.list_applications_page(settings.list_default_page_size),
+        'patch': lambda i: svc.update_application(ids[i % len(ids)], JobApplicationUpdate(salary=f'${i}k')),
+        'delete': lambda i: svc.delete_application(created.pop()),
+    }
+
+
+def asgi_calls(client: Any, ids: list[str], created: list[str], rng: random.Random) -> dict[str, Callable[[int], Any]]:
+    def create(i: int) -> None:
+        body = make_application(rng, i).model_dump(mode='json', by_alias=True)
+        created.append(_ok(client.post(BASE_URL, json=body)).json()['id'])
+
+    return {
+        'create': create,
+        'get': lambda i: _ok(client.get(f'{BASE_URL}/{ids[i % len(ids)]}')),
+        'list': lambda i: _ok(client.get(BASE_URL)),
+        'patch': lambda i: _ok(client.patch(f'{BASE_URL}/{ids[i % len(ids)]}', json={'salary': f'${i}k'})),
+        'delete': lambda i: _ok(client.delete(f'{BASE_URL}/{created.pop()}')),
+    }
+
+
+def _ok(response: Any) -> Any:
+    if response.status_code >= 400:
+        raise SystemExit(f'{response.request.method} {response.request.url} -> {response.status_code}')
+    return response
+
+
+@contextmanager
+def benchmark_table(endpoint: str | None) -> Iterator[None]:
+    """A fresh table on DynamoDB Local at ``endpoint``, or on moto in-process."""
+    with ExitStack() as stack:
+        if endpoint is None:
+            from moto import mock_aws
+
+            for name in ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY'):
+                os.environ.setdefault(name, 'testing')
+            stack.enter_context(mock_aws())
+            # moto stands in for AWS, where the app refuses the default cursor secret
+            settings.cursor_secret = 'resumetry-bench-cursor-secret'
+        settings.dynamodb_endpoint = endpoint
+        settings.dynamodb_table = f'resumetry-bench-{uuid4().hex[:8]}'
+        reset_dynamodb()
+        table = create_table_if_not_exists()
+        try:
+            yield
+        finally:
+            table.delete()
+            reset_dynamodb()
+
+
+def run_driver(driver: str, ids: list[str], ops: int, rng: random.Random, samples: int = 0) -> dict[str, Any]:
+    """Measure every operation through one driver, sampling ``samples`` calls for allocations."""
+    counter = RequestCounter()
+    created: list[str] = []
+    with ExitStack() as stack:
+        if driver == 'asgi':
+            from fastapi.testclient import TestClient
+
+            from app.main import app
+
+            client = stack.enter_context(TestClient(app))
+            calls = asgi_calls(client, ids, created, rng)
+        else:
+            calls = service_calls(ids, created, rng)
+        counter.attach()
+
+        results: dict[str, Any] = {}
+        for name in OPERATIONS:
+            # Deletes remove what the create phase added, leaving the seeded data as it was
+            count = min(ops, len(created)) if name == 'delete' else ops
+            results[name] = measure(calls[name], count, counter)
+            if not samples:
+                continue
+            if name == 'create':
+                # Extra creates give the allocation samples of delete something to remove
+                results[name]['alloc_peak_kib'] = allocations(calls[name], samples, ops)
+            elif name == 'delete':
+                results[name]['alloc_peak_kib'] = allocations(calls[name], min(samples, len(created)), 0)
+            else:
+                results[name]['alloc_peak_kib'] = allocations(calls[name], samples, 0)
+        return results
+
+
+def run(
+    items: int,
+    ops: int,
+    drivers: list[str],
+    endpoint: str | None,
+    seed_value: int,
+    allocation_samples: int = 0,
+) -> dict[str, Any]:
+    rng = random.Random(seed_value)
+    report: dict[str, Any] = {
+        'items': items,
+        'ops': ops,
+        'backend': endpoint or 'moto',
+        'seed': seed_value,
+        'python': sys.version.split()[0],
+        'shard_count': settings.shard_count,
+        'cache_enabled': settings.cache_enabled,
+    }
+    with benchmark_table(endpoint):
+        started = time.perf_counter()
+        ids = seed(items, rng)
+        report['seed_seconds'] = time.perf_counter() - started
+        report['drivers'] = {driver: run_driver(driver, ids, ops, rng, allocation_samples) for driver in drivers}
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Load-test the CRUD paths through the service and the ASGI app.')
+    parser.add_argument('--items', type=int, default=1000, help='applications seeded before measuring')
+    parser.add_argument('--ops', type=int, default=200, help='calls per operation and driver')
+    parser.add_argument('--drivers', default=','.join(DRIVERS), help='comma-separated: service, asgi')
+    parser.add_argument('--endpoint', help='DynamoDB Local URL, e.g. http://localhost:8000 (default: moto)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed of the generated data')
+    parser.add_argument('--allocations', action='store_true',
+                        help=f'sample peak allocations of {ALLOCATION_SAMPLES} calls per operation (slow under moto)')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    args = parser.parse_args(argv)
+
+    drivers = [driver.strip() for driver in args.drivers.split(',') if driver.strip()]
+    unknown = set(drivers) - set(DRIVERS)
+    if unknown:
+        parser.error(f'unknown driver(s): {", ".join(sorted(unknown))}')
+
+    samples = ALLOCATION_SAMPLES if args.allocations else 0
+    report = run(args.items, args.ops, drivers, args.endpoint, args.seed, samples)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f'Python {report["python"]}, {report["backend"]}, {report["items"]} seeded applications '
+          f'({report["seed_seconds"]:.1f} s), {report["ops"]} calls per operation')
+    for driver, results in report['drivers'].items():
+        print(f'\n  {driver:8}{"ops/s":>9}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"KiB":>8}  DynamoDB calls per op')
+        for name, result in results.items():
+            calls = ', '.join(f'{op} {count:g}' for op, count in result['dynamodb_requests_per_call'].items())
+            kib = f'{result["alloc_peak_kib"]:8.0f}' if 'alloc_peak_kib' in result else f'{"-":>8}'
+            print(f'  {name:8}{result["ops_per_sec"]:9.0f}{result["p50_ms"]:9.2f}{result["p95_ms"]:9.2f}'
+                  f'{result["p99_ms"]:9.2f}{kib}  {calls}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Read-path serialization benchmark.
+
+Turns a list of stored application items into the JSON body of a list
+response, once the way the API used to (validate each item into a model,
+then let FastAPI's response_model validate and serialize it again) and once
+through the fast path (trusted construction plus a precompiled TypeAdapter
+writing JSON bytes). Reports the median time of each over several runs.
+
+    python -m benchmarks.serialization [--items 10000] [--notes 5] [--runs 5] [--json]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.models.job_application import JobApplicationResponse
+from app.routers.job_applications import _dump_applications
+from app.services.job_application_service import _deserialize_from_dynamo, to_responses
+
+_RESPONSE_LIST = TypeAdapter(list[JobApplicationResponse])
+
+
+def make_items(count: int, notes: int) -> list[dict[str, Any]]:
+    """Items in the shape the service stores them."""
+    start = date(2025, 1, 1)
+    items = []
+    for i in range(count):
+        applied = (start + timedelta(days=i % 365)).isoformat()
+        items.append({
+            'pk': 'JOB_APPS', 'sk': f'APP#{i:08d}-0000-0000-0000-000000000000',
+            'company': f'Company {i % 500}', 'role': 'Software Engineer',
+            'description': ('Build and run services. ' * 10).strip(), 'salary': '$150k',
+            'top_job': i % 7 == 0, 'source_page': 'https://example.com/jobs/1',
+            'review_page': '', 'login_hints': '', 'recruiter_name': 'Sam',
+            'recruiter_company': 'Agency', 'applied_date': applied,
+            'status': [
+                {'occur_date': applied, 'status': 'APPLIED'},
+                {'occur_date': applied, 'status': 'SCREEN'},
+            ],
+            'notes': [{'occur_date': applied, 'description': f'Note {n}'} for n in range(notes)], 'note_count': notes,
+            'current_status': 'SCREEN', 'company_key': f'company {i % 500}', 'item_type': 'JOB_APP',
+            'created_at': '2025-01-01T00:00:00', 'updated_at': '2025-01-01T00:00:00', 'version': 1,
+        })
+    return items
+
+
+def validated(items: list[dict[str, Any]]) -> bytes:
+    """The previous path: validating reads, then FastAPI's response_model round trip."""
+    apps = [JobApplicationResponse(**_deserialize_from_dynamo(item)) for item in items]
+    # What fastapi.routing.serialize_response does for a response_model
+    content = [app.model_dump(by_alias=True) for app in apps]
+    value = _RESPONSE_LIST.validate_python(content)
+    body = jsonable_encoder(_RESPONSE_LIST.dump_python(value, mode='json', by_alias=True))
+    return json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def fast(items: list[dict[str, Any]]) -> bytes:
+    return _dump_applications(to_responses(items), sparse=False)
+
+
+def _median_ms(fn: Callable[[list[dict[str, Any]]], bytes], items: list[dict[str, Any]], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn(items)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run(count: int, notes: int, runs: int) -> dict:
+    items = make_items(count, notes)
+    if json.loads(validated(items)) != json.loads(fast(items)):
+        raise SystemExit('fast path output differs from the validated path')
+    validated_ms = _median_ms(validated, items, runs)
+    fast_ms = _median_ms(fast, items, runs)
+    return {
+        'items': count,
+        'notes_per_item': notes,
+        'runs': runs,
+        'python': sys.version.split()[0],
+        'validated_ms': validated_ms,
+        'fast_ms': fast_ms,
+        'speedup': validated_ms / fast_ms,
+        'body_bytes': len(fast(items)),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Compare the validated and fast read serialization paths.')
+    parser.add_argument('--items', type=int, default=10_000)
+    parser.add_argument('--notes', type=int, default=5, help='notes per application')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.items, args.notes, args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f'Python {report["python"]}, {report["items"]} items x {report["notes_per_item"]} notes, '
+          f'median of {report["runs"]} runs, {report["body_bytes"]} byte body')
+    print(f'  validated + response_model  {report["validated_ms"]:8.1f} ms')
+    print(f'  construct + TypeAdapter     {report["fast_ms"]:8.1f} ms')
+    print(f'  speedup                     {report["speedup"]:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Cold-start benchmark for the Lambda entry point.
+
+Starts fresh interpreters that import ``app.main`` under ``-X importtime``
+and hand one synthetic API Gateway event to the Mangum handler. Reports the
+cumulative import cost per module and the time from interpreter start to
+the first handled event, as the median over several runs.
+
+    python -m benchmarks.startup [--runs 5] [--top 25] [--path /health] [--json]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter. Prints one JSON line with its timings.
+_CHILD = '''
+import json, sys, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+event = {
+    'resource': '/{proxy+}', 'path': PATH, 'httpMethod': 'GET',
+    'headers': {'Host': 'localhost', 'Accept': 'application/json'},
+    'multiValueHeaders': {}, 'queryStringParameters': None,
+    'multiValueQueryStringParameters': None, 'pathParameters': None,
+    'stageVariables': None, 'body': None, 'isBase64Encoded': False,
+    'requestContext': {
+        'resourcePath': '/{proxy+}', 'httpMethod': 'GET', 'path': PATH,
+        'stage': 'bench', 'identity': {'sourceIp': '127.0.0.1'},
+    },
+}
+response = app.main.handler(event, None)
+t2 = time.perf_counter()
+print(json.dumps({
+    'import_ms': (t1 - t0) * 1000,
+    'first_event_ms': (t2 - t1) * 1000,
+    'status': response['statusCode'],
+}))
+'''
+
+_IMPORTTIME = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def _run_once(path: str) -> tuple[dict, dict[str, tuple[int, int]]]:
+    env = {
+        **os.environ,
+        # Take the Lambda code path (eager client init) without touching AWS.
+        'AWS_LAMBDA_FUNCTION_NAME': 'startup-benchmark',
+        'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
+        'PYTHONDONTWRITEBYTECODE': '1',
+    }
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD.replace('PATH', repr(path))],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    modules: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us))
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result['process_ms'] = wall_ms
+    return result, modules
+
+
+def run(runs: int, path: str) -> dict:
+    timings: list[dict] = []
+    per_module: dict[str, list[tuple[int, int]]] = {}
+    for _ in range(runs):
+        result, modules = _run_once(path)
+        timings.append(result)
+        for name, cost in modules.items():
+            per_module.setdefault(name, []).append(cost)
+
+    def median(key: str) -> float:
+        return statistics.median(t[key] for t in timings)
+
+    modules_report = [
+        {
+            'module': name,
+            'self_ms': statistics.median(c[0] for c in costs) / 1000,
+            'cumulative_ms': statistics.median(c[1] for c in costs) / 1000,
+        }
+        for name, costs in per_module.items()
+    ]
+    modules_report.sort(key=lambda m: m['cumulative_ms'], reverse=True)
+
+    return {
+        'runs': runs,
+        'path': path,
+        'status': timings[-1]['status'],
+        'python': sys.version.split()[0],
+        'import_app_ms': median('import_ms'),
+        'first_event_ms': median('first_event_ms'),
+        'process_to_first_event_ms': median('process_ms'),
+        'modules': modules_report,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Measure Lambda cold-start import and first-event time.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=25, help='modules to list (text output)')
+    parser.add_argument('--path', default='/health', help='request path of the synthetic event')
+    parser.add_argument('--json', action='store_true', help='print the full report as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.runs, args.path)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f'Python {report["python"]}, median of {report["runs"]} runs, GET {report["path"]} -> {report["status"]}')
+    print(f'  import app.main          {report["import_app_ms"]:8.1f} ms')
+    print(f'  first Mangum event       {report["first_event_ms"]:8.1f} ms')
+    print(f'  process start -> event   {report["process_to_first_event_ms"]:8.1f} ms')
+    print()
+    print(f'  {"cumulative ms":>13}  {"self ms":>8}  module')
+    for module in report['modules'][:args.top]:
+        print(f'  {module["cumulative_ms"]:13.1f}  {module["self_ms"]:8.1f}  {module["module"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+"""Storage compression benchmark: read capacity and latency of large descriptions.
+
+Generates applications whose descriptions are pasted job postings (2-12 KB
+of the usual sections and boilerplate) and stores them three ways: plain
+text (storage compression disabled), compressed, and mixed, where every
+other application was written before compression was switched on, as
+during a rollout. For each layout it reports the stored item size and the
+read capacity a GetItem and a list page of them consume, computed from the
+item sizes with DynamoDB's 4 KB read units (moto and DynamoDB Local do not
+bill by size), then the latency of full gets, sparse gets that leave the
+description out, and list pages. It also times the codec alone per item.
+Under moto the latencies include moto's own handling of the item bytes, so
+the capacity figures are the ones to compare; DynamoDB Local (--endpoint)
+gives latencies closer to the service.
+
+    python -m benchmarks.storage_compression [--items 500] [--ops 200]
+        [--endpoint http://localhost:8000] [--seed 1] [--json]
+"""
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import time
+from typing import Any
+
+from app.config import settings
+from app.db.batch import batch_write
+from app.db.compression import compress_text, decompress_text
+from app.models.job_application import JobApplicationCreate
+from app.services import job_application_service as svc
+from app.services.cache import estimate_item_size
+from benchmarks.load import RequestCounter, benchmark_table, measure
+
+LAYOUTS = ('plain', 'compressed', 'mixed')
+READ_UNIT_BYTES = 4096
+SPARSE_FIELDS = ['company', 'role', 'status']
+
+_INTRO = (
+    'We are a fast-growing company building tools that help teams ship software with confidence.',
+    'Our platform serves millions of requests a day for customers around the world.',
+    'Join a remote-first team that values ownership, curiosity and clear writing.',
+)
+_RESPONSIBILITIES = (
+    'Design, build and operate backend services in Python.',
+    'Own features end to end, from the first design document to production monitoring.',
+    'Work with product and design to turn customer problems into simple solutions.',
+    'Improve the reliability, latency and cost of our data pipelines.',
+    'Review code and mentor other engineers on the team.',
+    'Take part in an on-call rotation shared fairly across the team.',
+    'Write clear technical documentation and decision records.',
+)
+_REQUIREMENTS = (
+    '5+ years of experience building production web services.',
+    'Strong knowledge of Python and at least one other backend language.',
+    'Experience with AWS, in particular DynamoDB, Lambda and S3.',
+    'Familiarity with infrastructure as code such as Terraform or CloudFormation.',
+    'A track record of shipping in small, incremental changes.',
+    'Excellent written and verbal communication skills.',
+    'Experience with observability tooling and incident response.',
+)
+_BENEFITS = (
+    'Competitive salary and equity.',
+    'Health, dental and vision insurance for you and your dependants.',
+    'Flexible working hours and a home office budget.',
+    'Twenty-five days of paid vacation plus public holidays.',
+    'A yearly learning budget for books, courses and conferences.',
+)
+_BOILERPLATE = (
+    'We are an equal opportunity employer and value diversity at our company. We do not discriminate on the '
+    'basis of race, religion, color, national origin, gender, sexual orientation, age, marital status, '
+    'veteran status, or disability status. If you need an accommodation during the hiring process, please '
+    'let us know and we will work with you to meet your needs.'
+)
+
+
+def _bullets(lines: list[str]) -> str:
+    return '\n'.join('- ' + line for line in lines)
+
+
+def make_posting(rng: random.Random) -> str:
+    """A job posting of the shape and size people paste into descriptions."""
+    sections = [
+        'About us\n' + ' '.join(rng.sample(_INTRO, k=len(_INTRO))),
+        'What you will do\n' + _bullets(rng.choices(_RESPONSIBILITIES, k=rng.randint(5, 25))),
+        'What we are looking for\n' + _bullets(rng.choices(_REQUIREMENTS, k=rng.randint(5, 25))),
+        'Benefits\n' + _bullets(rng.sample(_BENEFITS, k=len(_BENEFITS))),
+        _BOILERPLATE,
+        f'Reference {rng.randrange(10**8):08d}. Salary range ${rng.randrange(90, 160)}k-${rng.randrange(160, 260)}k.',
+    ]
+    return '\n\n'.join(sections * rng.randint(1, 3))
+
+
+def make_applications(count: int, rng: random.Random) -> list[JobApplicationCreate]:
+    return [
+        JobApplicationCreate(
+            company=f'Company {i % 50}', role='Backend Engineer',
+            description=make_posting(rng), source_page=f'https://example.com/jobs/{i}',
+        )
+        for i in range(count)
+    ]
+
+
+def seed(applications: list[JobApplicationCreate], layout: str) -> tuple[list[str], list[dict[str, Any]]]:
+    """Write the applications in ``layout``. Returns their ids and the stored application items."""
+    ids, headers, requests = [], [], []
+    enabled = settings.storage_compression_enabled
+    try:
+        for index, data in enumerate(applications):
+            settings.storage_compression_enabled = layout == 'compressed' or (layout == 'mixed' and index % 2 == 1)
+            header, *children = svc.stored_items(svc.new_item(data))
+            ids.append(svc.app_id_of(header))
+            headers.append(header)
+            requests.extend({'PutRequest': {'Item': item}} for item in (header, *children))
+    finally:
+        settings.storage_compression_enabled = enabled
+    failed = batch_write(requests)
+    if failed:
+        raise SystemExit(f'{len(failed)} seed writes failed')
+    return ids, headers
+
+
+def capacity(headers: list[dict[str, Any]]) -> dict[str, float]:
+    """Item sizes and the read units reading them costs, by DynamoDB's size rules."""
+    sizes = [estimate_item_size(item) for item in headers]
+    page = settings.list_default_page_size
+    # Queries round up the total size of the page read, not each item
+    pages = [sizes[start:start + page] for start in range(0, len(sizes), page)]
+    return {
+        'item_bytes_mean': statistics.fmean(sizes),
+        'item_bytes_p90': sorted(sizes)[int(0.9 * (len(sizes) - 1))],
+        'get_rcu_strong_mean': statistics.fmean(math.ceil(size / READ_UNIT_BYTES) for size in sizes),
+        'get_rcu_eventual_mean': statistics.fmean(math.ceil(size / READ_UNIT_BYTES) / 2 for size in sizes),
+        'list_page_rcu_mean': statistics.fmean(math.ceil(sum(chunk) / READ_UNIT_BYTES) / 2 for chunk in pages),
+    }
+
+
+def codec(postings: list[str]) -> dict[str, Any]:
+    """Median microseconds to compress and decompress one posting, and the size ratio."""
+    compress_us, decompress_us, ratios = [], [], []
+    for posting in postings:
+        t0 = time.perf_counter()
+        packed = compress_text(posting, min_size=0)
+        t1 = time.perf_counter()
+        decompress_text(packed)
+        t2 = time.perf_counter()
+        compress_us.append((t1 - t0) * 1e6)
+        decompress_us.append((t2 - t1) * 1e6)
+        ratios.append(len(packed) / len(posting.encode()))
+    return {
+        'codec': settings.storage_compression_codec,
+        'compress_us_p50': statistics.median(compress_us),
+        'decompress_us_p50': statistics.median(decompress_us),
+        'size_ratio_mean': statistics.fmean(ratios),
+    }
+
+
+def run_layout(
+    applications: list[JobApplicationCreate],
+    layout: str,
+    ops: int,
+    endpoint: str | None,
+) -> dict[str, Any]:
+    with benchmark_table(endpoint):
+        ids, headers = seed(applications, layout)
+        counter = RequestCounter()
+        counter.attach()
+        page = settings.list_default_page_size
+        calls = {
+            'get': lambda i: svc.get_application(ids[i % len(ids)]),
+            'get_sparse': lambda i: svc.get_application(ids[i % len(ids)], SPARSE_FIELDS),
+            'list_page': lambda i: svc.list_applications_page(page),
+            'list_page_sparse': lambda i: svc.list_applications_page(page, fields=SPARSE_FIELDS),
+        }
+        # Reads must give the original text whatever the layout
+        if svc.get_application(ids[-1]).description != applications[-1].description:
+            raise SystemExit(f'{layout}: description read back differs')
+        return {
+            **capacity(headers),
+            'compressed_items': sum(not isinstance(item['description'], str) for item in headers),
+            'reads': {name: measure(call, ops, counter) for name, call in calls.items()},
+        }
+
+
+def run(items: int, ops: int, endpoint: str | None, seed_value: int) -> dict[str, Any]:
+    rng = random.Random(seed_value)
+    applications = make_applications(items, rng)
+    report: dict[str, Any] = {
+        'items': items,
+        'ops': ops,
+        'backend': endpoint or 'moto',
+        'seed': seed_value,
+        'python': sys.version.split()[0],
+        'min_size': settings.storage_compression_min_size,
+        'codec': codec([app.description for app in applications]),
+        'layouts': {layout: run_layout(applications, layout, ops, endpoint) for layout in LAYOUTS},
+    }
+    plain, compressed = report['layouts']['plain'], report['layouts']['compressed']
+    report['savings'] = {
+        'item_bytes': 1 - compressed['item_bytes_mean'] / plain['item_bytes_mean'],
+        'get_rcu': 1 - compressed['get_rcu_strong_mean'] / plain['get_rcu_strong_mean'],
+        'list_page_rcu': 1 - compressed['list_page_rcu_mean'] / plain['list_page_rcu_mean'],
+    }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Compare read capacity and latency of plain and compressed storage.')
+    parser.add_argument('--items', type=int, default=500, help='applications seeded per layout')
+    parser.add_argument('--ops', type=int, default=200, help='calls per read and layout')
+    parser.add_argument('--endpoint', help='DynamoDB Local URL, e.g. http://localhost:8000 (default: moto)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed of the generated postings')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.items, args.ops, args.endpoint, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    codec_report = report['codec']
+    print(f'Python {report["python"]}, {report["backend"]}, {report["items"]} applications per layout, '
+          f'{report["ops"]} calls per read, min size {report["min_size"]} bytes')
+    print(f'  {codec_report["codec"]}: compress {codec_report["compress_us_p50"]:.0f} us, '
+          f'decompress {codec_report["decompress_us_p50"]:.0f} us per posting, '
+          f'{codec_report["size_ratio_mean"]:.0%} of the original size')
+    print(f'\n  {"layout":12}{"bytes":>8}{"get RCU":>9}{"page RCU":>10}   p50 ms: '
+          f'{"get":>7}{"sparse":>8}{"list":>8}{"sparse":>8}')
+    for layout, result in report['layouts'].items():
+        reads = result['reads']
+        print(f'  {layout:12}{result["item_bytes_mean"]:8.0f}{result["get_rcu_strong_mean"]:9.2f}'
+              f'{result["list_page_rcu_mean"]:10.1f}           '
+              f'{reads["get"]["p50_ms"]:7.2f}{reads["get_sparse"]["p50_ms"]:8.2f}'
+              f'{reads["list_page"]["p50_ms"]:8.2f}{reads["list_page_sparse"]["p50_ms"]:8.2f}')
+    savings = report['savings']
+    print(f'\n  compressed vs plain: {savings["item_bytes"]:.0%} fewer bytes, {savings["get_rcu"]:.0%} fewer '
+          f'GetItem RCU, {savings["list_page_rcu"]:.0%} fewer list page RCU')
+
+
+if __name__ == '__main__':
+    main()
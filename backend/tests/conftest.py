@@ -1,14 +1,20 @@
 import os
+import socket
 from typing import Any
 from unittest.mock import patch
+from uuid import uuid4
 from datetime import date
 
 import boto3
 import pytest
 from moto import mock_aws
+from moto.server import ThreadedMotoServer
 from fastapi.testclient import TestClient
 
 from app.config import settings
+from app.db.dynamodb import create_table_if_not_exists, reset_dynamodb, table_definition
+from app.services import reports
+from app.services.cache import reset_cache
 
 
 @pytest.fixture(scope='session')
@@ -21,6 +27,17 @@ def aws_credentials():
     os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
 
 
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    """Keep the in-process read cache off unless a test turns it on, and forget cached reports."""
+    monkeypatch.setattr(settings, 'cache_enabled', False)
+    reset_cache()
+    reports.reset()
+    yield
+    reset_cache()
+    reports.reset()
+
+
 @pytest.fixture()
 def dynamodb_mock(aws_credentials):
     """Create a mocked DynamoDB with the application table."""
@@ -28,32 +45,65 @@ def dynamodb_mock(aws_credentials):
         dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
         table = dynamodb.create_table(
             TableName=settings.dynamodb_table,
-            KeySchema=[
-                {'AttributeName': 'pk', 'KeyType': 'HASH'},
-                {'AttributeName': 'sk', 'KeyType': 'RANGE'},
-            ],
-            AttributeDefinitions=[
-                {'AttributeName': 'pk', 'AttributeType': 'S'},
-                {'AttributeName': 'sk', 'AttributeType': 'S'},
-            ],
-            BillingMode='PAY_PER_REQUEST',
+            **table_definition(),
         )
         table.wait_until_exists()
 
+        # Drop any pooled resource so the shared table handle is rebuilt
+        # against the mocked resource, and not leaked into the next test.
+        reset_dynamodb()
         with patch('app.db.dynamodb.get_dynamodb_resource', return_value=dynamodb):
             yield table
+        reset_dynamodb()
+
+
+@pytest.fixture(scope='session')
+def moto_server(aws_credentials):
+    """Moto running as a local HTTP server, for clients that moto can't patch in-process (aiobotocore)."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    server = ThreadedMotoServer(ip_address='127.0.0.1', port=port, verbose=False)
+    server.start()
+    yield f'http://127.0.0.1:{port}'
+    server.stop()
+
+
+@pytest.fixture()
+def dynamodb_server(moto_server, monkeypatch):
+    """A fresh application table on the moto server, with settings pointed at it."""
+    monkeypatch.setattr(settings, 'dynamodb_endpoint', moto_server)
+    monkeypatch.setattr(settings, 'dynamodb_table', f'resumetry-test-{uuid4().hex[:8]}')
+    reset_dynamodb()
+    table = create_table_if_not_exists()
+    yield table
+    table.delete()
+    reset_dynamodb()
 
 
 @pytest.fixture()
-def client(dynamodb_mock):
+def client(dynamodb_mock, monkeypatch):
     """FastAPI TestClient with mocked DynamoDB."""
     from app.main import app
 
+    # moto stands in for real AWS, where the default secret is refused
+    monkeypatch.setattr(settings, 'cursor_secret', 'test-cursor-secret')
+
     with patch('app.main.create_table_if_not_exists'):
         with TestClient(app) as c:
             yield c
 
 
+@pytest.fixture()
+def async_client(dynamodb_server, monkeypatch):
+    """FastAPI TestClient using the async DynamoDB backend against the moto server."""
+    from app.main import app
+
+    monkeypatch.setattr(settings, 'dynamodb_backend', 'async')
+    with TestClient(app) as c:
+        yield c
+
+
 @pytest.fixture()
 def sample_application_data() -> dict[str, Any]:
     """Minimal valid application payload (camelCase for API)."""
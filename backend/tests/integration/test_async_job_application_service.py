@@ -0,0 +1,197 @@
+"""Tests for the asyncio data path against a moto server."""
+import asyncio
+import inspect
+from datetime import date
+
+import pytest
+
+from app.config import settings
+from app.db.async_dynamodb import close_async_client
+from app.models.enums import ApplicationStatus, SortOrder
+from app.models.job_application import (
+    ApplicationFilters,
+    ApplicationNote,
+    JobApplicationCreate,
+    JobApplicationUpdate,
+    StatusItem,
+)
+from app.routers.common import ASYNC_FUNCTIONS
+from app.services import async_job_application_service as async_svc
+from app.services import job_application_service as svc
+from app.services import search
+from app.services.job_application_service import VersionConflictError
+
+
+def run(coro):
+    async def main():
+        try:
+            return await coro
+        finally:
+            await close_async_client()
+    return asyncio.run(main())
+
+
+class TestAsyncService:
+
+    def test_create_and_get(self, dynamodb_server):
+        created = run(async_svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev',
+            notes=[ApplicationNote(occur_date=date(2025, 3, 1), description='Applied')],
+        )))
+        fetched = run(async_svc.get_application(created.id))
+        assert fetched == created
+        assert fetched.notes[0].occur_date == date(2025, 3, 1)
+
+    def test_get_nonexistent_returns_none(self, dynamodb_server):
+        assert run(async_svc.get_application('nonexistent-id')) is None
+
+    def test_matches_sync_backend(self, dynamodb_server):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        assert run(async_svc.get_application(created.id)) == svc.get_application(created.id)
+
+    def test_update(self, dynamodb_server):
+        created = run(async_svc.create_application(JobApplicationCreate(company='Acme', role='Dev')))
+        updated = run(async_svc.update_application(created.id, JobApplicationUpdate(company='NewCo')))
+        assert updated.company == 'NewCo'
+        assert updated.role == 'Dev'
+
+    def test_update_nonexistent_returns_none(self, dynamodb_server):
+        assert run(async_svc.update_application('missing', JobApplicationUpdate(company='X'))) is None
+
+    def test_append_and_version_conflict(self, dynamodb_server):
+        created = run(async_svc.create_application(JobApplicationCreate(company='Acme', role='Dev')))
+        note = ApplicationNote(occur_date=date(2025, 3, 1), description='Call')
+        delta = run(async_svc.append_notes(created.id, [note], 1))
+        assert delta.notes == [note]
+        assert delta.item_version == 2
+        with pytest.raises(VersionConflictError):
+            run(async_svc.update_application(created.id, JobApplicationUpdate(company='X'), 1))
+        assert run(async_svc.append_notes('missing', [note])) is None
+
+    def test_stats_follow_writes(self, dynamodb_server):
+        created = run(async_svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev', applied_date=date(2025, 3, 3),
+        )))
+        run(async_svc.append_status(created.id, [StatusItem(occur_date=date(2025, 3, 5), status=ApplicationStatus.SCREEN)]))
+        result = run(async_svc.get_stats())
+        assert result == svc.get_stats()
+        assert result.by_status['SCREEN'] == 1
+        assert result.average_days_to_screen == 2
+        run(async_svc.delete_application(created.id))
+        assert run(async_svc.get_stats()).total == 0
+
+    def test_writes_maintain_search_index(self, dynamodb_server):
+        created = run(async_svc.create_application(JobApplicationCreate(company='Acme', role='Dev')))
+        run(async_svc.update_application(created.id, JobApplicationUpdate(role='Python Engineer')))
+        run(async_svc.append_notes(created.id, [ApplicationNote(occur_date=date(2025, 3, 1), description='Kafka')]))
+        assert [hit.application.id for hit in svc.search_applications('python kafka').items] == [created.id]
+        run(async_svc.delete_application(created.id))
+        assert svc.search_applications('acme').total == 0
+
+    def test_index_failure_does_not_fail_the_write(self, dynamodb_server, monkeypatch, caplog):
+        def unavailable(*args):
+            raise RuntimeError('Service unavailable')
+
+        monkeypatch.setattr(search, 'index_writes', unavailable)
+        created = run(async_svc.create_application(JobApplicationCreate(company='Acme', role='Dev')))
+        assert run(async_svc.get_application(created.id)).company == 'Acme'
+        assert 'Search index update failed' in caplog.text
+        assert 'resumetry.search' in {record.name for record in caplog.records}
+
+    def test_history_children_match_sync_backend(self, dynamodb_server):
+        created = run(async_svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev',
+            status=[StatusItem(occur_date=date(2025, 3, 1), status=ApplicationStatus.APPLIED)],
+            notes=[ApplicationNote(occur_date=date(2025, 3, 1), description='First')],
+        )))
+        run(async_svc.append_notes(created.id, [ApplicationNote(occur_date=date(2025, 3, 2), description='Second')]))
+        updated = run(async_svc.update_application(created.id, JobApplicationUpdate(
+            status=[StatusItem(occur_date=date(2025, 3, 4), status=ApplicationStatus.SCREEN)],
+        )))
+        assert [note.description for note in updated.notes] == ['First', 'Second']
+        assert [entry.status for entry in updated.status] == [ApplicationStatus.SCREEN]
+        assert run(async_svc.get_application(created.id)) == svc.get_application(created.id)
+        [listed] = run(async_svc.list_applications())
+        assert listed.notes == [] and listed.status == updated.status
+        assert listed.note_count == 2
+
+    def test_compressed_descriptions_match_sync_backend(self, dynamodb_server):
+        posting = ('Build python services on aws with a small team. ' * 60).strip()
+        created = run(async_svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev', description=posting,
+        )))
+        assert created.description == posting
+        assert run(async_svc.get_application(created.id)) == svc.get_application(created.id)
+        [listed] = run(async_svc.list_applications(fields=['description']))
+        assert listed.description == posting
+
+    def test_ordered_lists_match_sync_backend(self, dynamodb_server):
+        for applied in (date(2025, 2, 1), date(2025, 1, 1), date(2025, 3, 1)):
+            svc.create_application(JobApplicationCreate(company='Acme', role='Dev', applied_date=applied))
+        for order in SortOrder:
+            assert run(async_svc.list_applications(order=order)) == svc.list_applications(order=order)
+            page = run(async_svc.list_applications_page(2, order=order))
+            assert page.items == svc.list_applications_page(2, order=order).items
+        newest = run(async_svc.list_applications(fields=['applied_date'], order=SortOrder.DESC))
+        assert [app.applied_date for app in newest] == [date(2025, 3, 1), date(2025, 2, 1), date(2025, 1, 1)]
+
+    def test_delete(self, dynamodb_server):
+        created = run(async_svc.create_application(JobApplicationCreate(company='Acme', role='Dev')))
+        assert run(async_svc.delete_application(created.id)) is True
+        assert run(async_svc.delete_application(created.id)) is False
+
+    @pytest.mark.parametrize('shard_count', [1, 3])
+    def test_list_and_pages(self, dynamodb_server, monkeypatch, shard_count):
+        monkeypatch.setattr(settings, 'shard_count', shard_count)
+        ids = [
+            svc.create_application(JobApplicationCreate(company=f'C{i}', role='Dev')).id
+            for i in range(5)
+        ]
+        assert sorted(app.id for app in run(async_svc.list_applications())) == sorted(ids)
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = run(async_svc.list_applications_page(2, cursor))
+            seen.extend(app.id for app in page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        assert sorted(seen) == sorted(ids)
+
+    @pytest.mark.parametrize('shard_count', [1, 3])
+    def test_filtered_list_and_page(self, dynamodb_server, monkeypatch, shard_count):
+        monkeypatch.setattr(settings, 'shard_count', shard_count)
+        svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        other = svc.create_application(JobApplicationCreate(company='Globex', role='Dev', top_job=True))
+        filters = ApplicationFilters(top_job=True)
+        assert [app.id for app in run(async_svc.list_applications(filters))] == [other.id]
+        page = run(async_svc.list_applications_page(10, None, ApplicationFilters(company='globex')))
+        assert [app.id for app in page.items] == [other.id]
+
+    def test_projected_fields(self, dynamodb_server):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        app = run(async_svc.get_application(created.id, ['company']))
+        assert app.model_dump(exclude_unset=True) == {'id': created.id, 'company': 'Acme'}
+        [listed] = run(async_svc.list_applications(None, ['role']))
+        assert listed.model_dump(exclude_unset=True) == {'id': created.id, 'role': 'Dev'}
+
+
+class TestAsyncEndpoints:
+
+    def test_async_functions_have_both_backends(self):
+        for name in ASYNC_FUNCTIONS:
+            assert inspect.iscoroutinefunction(getattr(async_svc, name)), name
+            assert callable(getattr(svc, name)), name
+
+    def test_crud_round_trip(self, async_client, sample_application_data):
+        created = async_client.post('/api/v1/applications', json=sample_application_data)
+        assert created.status_code == 201
+        app_id = created.json()['id']
+
+        assert async_client.get(f'/api/v1/applications/{app_id}').json()['company'] == 'Acme Corp'
+        patched = async_client.patch(f'/api/v1/applications/{app_id}', json={'role': 'Lead'})
+        assert patched.json()['role'] == 'Lead'
+        assert len(async_client.get('/api/v1/applications').json()['items']) == 1
+        assert async_client.delete(f'/api/v1/applications/{app_id}').status_code == 204
+        assert async_client.get(f'/api/v1/applications/{app_id}').status_code == 404
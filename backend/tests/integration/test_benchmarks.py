@@ -0,0 +1,37 @@
+"""Smoke tests running the benchmarks at tiny sizes."""
+import pytest
+
+from app.config import settings
+from benchmarks import load, serialization
+
+
+class TestLoadBenchmark:
+
+    @pytest.fixture(autouse=True)
+    def restore_settings(self, aws_credentials, monkeypatch):
+        # The benchmark points the settings at its own table
+        for name in ('dynamodb_endpoint', 'dynamodb_table', 'cursor_secret'):
+            monkeypatch.setattr(settings, name, getattr(settings, name))
+
+    def test_reports_every_operation(self):
+        report = load.run(3, 2, list(load.DRIVERS), None, 1)
+        assert list(report['drivers']) == list(load.DRIVERS)
+        for results in report['drivers'].values():
+            assert list(results) == list(load.OPERATIONS)
+            assert [result['ops'] for result in results.values()] == [2] * len(load.OPERATIONS)
+            assert not any('alloc_peak_kib' in result for result in results.values())
+
+    def test_allocations_are_opt_in(self):
+        results = load.run(2, 1, ['service'], None, 1, allocation_samples=1)['drivers']['service']
+        assert all(result['alloc_peak_kib'] >= 0 for result in results.values())
+
+    def test_prints_a_table(self, capsys):
+        load.main(['--items', '2', '--ops', '1', '--drivers', 'service'])
+        assert 'delete' in capsys.readouterr().out
+
+
+class TestSerializationBenchmark:
+
+    def test_paths_agree(self):
+        result = serialization.run(5, 2, 1)
+        assert result['items'] == 5
@@ -0,0 +1,133 @@
+"""Tests for the bulk import tool."""
+import json
+from datetime import date
+
+import pytest
+from boto3.dynamodb.conditions import Attr
+
+from app.services import job_application_service as svc
+from app.tools import bulk_import
+
+CSV = (
+    'company,role,appliedDate,status,notes,topJob\n'
+    'Acme,Python Developer,2025-03-03,APPLIED,Found on a job board,true\n'
+    'Globex,Engineer,2025-03-04,"[{""occurDate"": ""2025-03-04"", ""status"": ""APPLIED""}, '
+    '{""occurDate"": ""2025-03-10"", ""status"": ""SCREEN""}]",,\n'
+    ',Missing Company,2025-03-05,,,\n'
+    'Initech,Go Developer,not-a-date,,,\n'
+    'Umbrella,Rust Developer,,,,\n'
+)
+
+
+def _write(tmp_path, name: str, text: str):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def _rejected(path) -> list[dict]:
+    return [json.loads(line) for line in path.with_name(path.name + '.rejected.jsonl').read_text().splitlines()]
+
+
+def _jsonl(count: int) -> str:
+    return ''.join(
+        json.dumps({'company': f'Company {i}', 'role': 'Dev', 'appliedDate': '2025-03-03'}) + '\n'
+        for i in range(count)
+    )
+
+
+def _app_items(table) -> list[dict]:
+    return table.scan(FilterExpression=Attr('item_type').eq(svc.ITEM_TYPE))['Items']
+
+
+class TestBulkImport:
+
+    def test_csv_import(self, dynamodb_mock, tmp_path):
+        path = _write(tmp_path, 'apps.csv', CSV)
+        assert bulk_import.import_file(path, workers=0) == {'imported': 3, 'rejected': 2}
+
+        apps = {app.company: app for app in svc.list_applications()}
+        assert list(apps) == ['Acme', 'Globex', 'Umbrella']
+        assert apps['Acme'].top_job is True
+        assert [note.description for note in svc.get_application(apps['Acme'].id).notes] == ['Found on a job board']
+        assert [entry.status.value for entry in svc.get_application(apps['Globex'].id).status] == ['APPLIED', 'SCREEN']
+        assert apps['Umbrella'].applied_date == date.today()
+        assert [row['row'] for row in _rejected(path)] == [3, 4]
+        assert _rejected(path)[0]['data']['role'] == 'Missing Company'
+
+        assert svc.get_stats().total == 3
+        assert svc.get_stats().by_status['SCREEN'] == 1
+        assert [hit.application.company for hit in svc.search_applications('python').items] == ['Acme']
+
+    def test_jsonl_rejects_bad_lines(self, dynamodb_mock, tmp_path):
+        path = _write(tmp_path, 'apps.jsonl', _jsonl(2) + '{"company": \n\n[1, 2]\n')
+        assert bulk_import.import_file(path, workers=0) == {'imported': 2, 'rejected': 2}
+        assert [row['row'] for row in _rejected(path)] == [3, 5]
+        assert _rejected(path)[1]['errors'] == [{'msg': 'Row is not a JSON object'}]
+
+    def test_process_pool(self, dynamodb_mock, tmp_path):
+        path = _write(tmp_path, 'apps.jsonl', _jsonl(60))
+        assert bulk_import.import_file(path, workers=2, chunk_size=7, writers=3) == {'imported': 60, 'rejected': 0}
+        apps = svc.list_applications()
+        # Ids follow row order
+        assert [app.company for app in apps] == [f'Company {i}' for i in range(60)]
+
+    def test_resume_after_crash(self, dynamodb_mock, tmp_path, monkeypatch):
+        rows = ''.join(f'Company {i},Dev,Note {i}\n' for i in range(40))
+        path = _write(tmp_path, 'apps.csv', 'company,role,notes\n' + rows)
+        original = bulk_import.write_chunk
+        calls = []
+
+        def crash_later(requests):
+            # The third write goes through, but the import never learns it did
+            calls.append(requests)
+            failed = original(requests)
+            if len(calls) > 2:
+                raise RuntimeError('Connection lost')
+            return failed
+
+        monkeypatch.setattr(bulk_import, 'CHECKPOINT_INTERVAL', 0)
+        monkeypatch.setattr(bulk_import, 'write_chunk', crash_later)
+        with pytest.raises(RuntimeError):
+            bulk_import.import_file(path, workers=0, chunk_size=10, writers=1)
+        checkpoint = json.loads(path.with_name('apps.csv.checkpoint.json').read_text())
+        assert 0 < checkpoint['row'] < 40
+
+        monkeypatch.setattr(bulk_import, 'write_chunk', original)
+        counts = bulk_import.import_file(path, workers=0, chunk_size=10)
+        assert counts['imported'] == 40 - checkpoint['row']
+        apps = svc.list_applications()
+        assert sorted(app.company for app in apps) == sorted(f'Company {i}' for i in range(40))
+        assert all(len(svc.get_application(app.id).notes) == 1 for app in apps)
+        assert svc.get_stats().total == 40
+
+    def test_failed_writes_are_rejected(self, dynamodb_mock, tmp_path, monkeypatch):
+        path = _write(tmp_path, 'apps.jsonl', _jsonl(3))
+        original = bulk_import.write_chunk
+
+        def drop_second(requests):
+            original(requests)
+            return [request for request in requests if request['PutRequest']['Item']['company'] == 'Company 1']
+
+        monkeypatch.setattr(bulk_import, 'write_chunk', drop_second)
+        assert bulk_import.import_file(path, workers=0) == {'imported': 2, 'rejected': 1}
+        assert sorted(item['company'] for item in _app_items(dynamodb_mock)) == ['Company 0', 'Company 2']
+        [rejected] = _rejected(path)
+        assert rejected['errors'] == [{'msg': bulk_import.WRITE_FAILED}]
+        # The row as read, so the report can be imported again
+        assert json.loads(rejected['data'])['company'] == 'Company 1'
+
+    def test_checkpoint_of_another_file(self, dynamodb_mock, tmp_path):
+        path = _write(tmp_path, 'apps.jsonl', _jsonl(2))
+        bulk_import.import_file(path, workers=0)
+        path.write_text(_jsonl(3))
+        with pytest.raises(SystemExit):
+            bulk_import.import_file(path, workers=0)
+        assert bulk_import.import_file(path, workers=0, restart=True)['imported'] == 3
+
+    def test_dry_run_writes_nothing(self, dynamodb_mock, tmp_path):
+        path = _write(tmp_path, 'apps.csv', CSV)
+        assert bulk_import.import_file(path, workers=0, dry_run=True) == {'imported': 3, 'rejected': 2}
+        assert _app_items(dynamodb_mock) == []
+        assert len(_rejected(path)) == 2
+        assert not path.with_name('apps.csv.checkpoint.json').exists()
@@ -0,0 +1,144 @@
+"""Tests for server-side filtering through the global secondary indexes."""
+from datetime import date
+
+import pytest
+
+from app.config import settings
+from app.models.enums import ApplicationStatus
+from app.models.job_application import (
+    ApplicationFilters,
+    JobApplicationCreate,
+    JobApplicationUpdate,
+    StatusItem,
+)
+from app.services import job_application_service as svc
+from app.tools.backfill_indexes import backfill
+
+BASE_URL = '/api/v1/applications'
+
+
+def _create(company: str, applied: date, status: list[tuple[date, ApplicationStatus]] = (), top_job=False):
+    return svc.create_application(JobApplicationCreate(
+        company=company, role='Dev', applied_date=applied, top_job=top_job,
+        status=[StatusItem(occur_date=d, status=s) for d, s in status],
+    ))
+
+
+@pytest.fixture()
+def seeded(dynamodb_mock):
+    return {
+        'acme': _create('Acme', date(2025, 1, 10), [
+            (date(2025, 1, 10), ApplicationStatus.APPLIED),
+            (date(2025, 1, 20), ApplicationStatus.INTERVIEW),
+        ], top_job=True),
+        'globex': _create('Globex', date(2025, 2, 5), [
+            (date(2025, 2, 5), ApplicationStatus.APPLIED),
+            (date(2025, 2, 9), ApplicationStatus.REJECTED),
+        ]),
+        'acme2': _create('ACME ', date(2025, 3, 1), [
+            (date(2025, 3, 1), ApplicationStatus.APPLIED),
+        ]),
+    }
+
+
+def _ids(apps) -> set[str]:
+    return {app.id for app in apps}
+
+
+class TestFilteredList:
+
+    def test_by_current_status(self, seeded):
+        result = svc.list_applications(ApplicationFilters(status=ApplicationStatus.INTERVIEW))
+        assert _ids(result) == {seeded['acme'].id}
+
+    def test_by_company_case_insensitive(self, seeded):
+        result = svc.list_applications(ApplicationFilters(company='acme'))
+        assert _ids(result) == {seeded['acme'].id, seeded['acme2'].id}
+
+    def test_by_date_range(self, seeded):
+        result = svc.list_applications(ApplicationFilters(
+            applied_from=date(2025, 2, 1), applied_to=date(2025, 3, 31),
+        ))
+        assert _ids(result) == {seeded['globex'].id, seeded['acme2'].id}
+
+    def test_by_top_job(self, seeded):
+        assert _ids(svc.list_applications(ApplicationFilters(top_job=True))) == {seeded['acme'].id}
+        assert _ids(svc.list_applications(ApplicationFilters(top_job=False))) == {
+            seeded['globex'].id, seeded['acme2'].id,
+        }
+
+    def test_combined_filters(self, seeded):
+        result = svc.list_applications(ApplicationFilters(
+            company='Acme', status=ApplicationStatus.APPLIED, applied_from=date(2025, 2, 1),
+        ))
+        assert _ids(result) == {seeded['acme2'].id}
+
+    def test_filtered_results_ordered_by_applied_date(self, seeded):
+        result = svc.list_applications(ApplicationFilters(applied_from=date(2025, 1, 1)))
+        assert [app.applied_date for app in result] == sorted(app.applied_date for app in result)
+
+    def test_update_keeps_index_attributes_in_sync(self, seeded):
+        svc.update_application(seeded['globex'].id, JobApplicationUpdate(
+            company='Initech',
+            top_job=True,
+            status=[StatusItem(occur_date=date(2025, 2, 20), status=ApplicationStatus.SCREEN)],
+        ))
+        assert _ids(svc.list_applications(ApplicationFilters(company='initech'))) == {seeded['globex'].id}
+        assert _ids(svc.list_applications(ApplicationFilters(status=ApplicationStatus.SCREEN))) == {
+            seeded['globex'].id,
+        }
+        svc.update_application(seeded['acme'].id, JobApplicationUpdate(top_job=False))
+        assert _ids(svc.list_applications(ApplicationFilters(top_job=True))) == {seeded['globex'].id}
+
+    def test_index_attributes_not_in_response(self, seeded):
+        fetched = svc.get_application(seeded['acme'].id)
+        assert not hasattr(fetched, 'current_status')
+
+    def test_filtered_pages(self, dynamodb_mock, monkeypatch):
+        monkeypatch.setattr(settings, 'shard_count', 3)
+        ids = {_create('Acme', date(2025, 1, day)).id for day in range(1, 8)}
+        _create('Other', date(2025, 1, 1))
+        seen: set[str] = set()
+        cursor = None
+        while True:
+            page = svc.list_applications_page(3, cursor, ApplicationFilters(company='Acme'))
+            seen |= _ids(page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        assert seen == ids
+
+
+class TestBackfill:
+
+    def test_backfills_items_without_index_attributes(self, dynamodb_mock):
+        dynamodb_mock.put_item(Item={
+            'pk': svc.PARTITION_KEY, 'sk': f'{svc.SK_PREFIX}legacy',
+            'company': 'Legacy Co', 'role': 'Dev', 'applied_date': '2024-05-01',
+            'status': [{'occur_date': '2024-05-01', 'status': 'OFFER'}],
+        })
+        assert svc.list_applications(ApplicationFilters(status=ApplicationStatus.OFFER)) == []
+        assert backfill() == 1
+        result = svc.list_applications(ApplicationFilters(status=ApplicationStatus.OFFER))
+        assert _ids(result) == {'legacy'}
+        item = dynamodb_mock.get_item(Key={'pk': svc.PARTITION_KEY, 'sk': f'{svc.SK_PREFIX}legacy'})['Item']
+        assert item['change_feed'] == svc.CHANGE_FEED
+
+
+class TestFilterEndpoint:
+
+    def test_query_parameters(self, client, seeded):
+        response = client.get(BASE_URL, params={'status': 'INTERVIEW'})
+        assert [item['id'] for item in response.json()['items']] == [seeded['acme'].id]
+        response = client.get(BASE_URL, params={'company': 'globex', 'all': 'true'})
+        assert [item['id'] for item in response.json()] == [seeded['globex'].id]
+        response = client.get(BASE_URL, params={'appliedFrom': '2025-03-01', 'topJob': 'false'})
+        assert [item['id'] for item in response.json()['items']] == [seeded['acme2'].id]
+
+    def test_cursor_from_other_filters_rejected(self, client, seeded):
+        cursor = client.get(BASE_URL, params={'limit': 1}).json()['nextCursor']
+        response = client.get(BASE_URL, params={'cursor': cursor, 'company': 'acme'})
+        assert response.status_code == 400
+
+    def test_invalid_status_rejected(self, client):
+        assert client.get(BASE_URL, params={'status': 'bogus'}).status_code == 422
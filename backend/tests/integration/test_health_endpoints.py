@@ -23,3 +23,19 @@ class TestPingEndpoint:
         data = client.get('/api/v1/ping').json()
         assert data['message'] == 'pong'
         assert data['version'] == '1.0.0'
+
+
+class TestCacheStatsEndpoint:
+
+    def test_cache_disabled(self, client):
+        data = client.get('/api/v1/cache/stats').json()
+        assert data == {
+            'enabled': False, 'entries': 0, 'bytes': 0,
+            'hits': 0, 'misses': 0, 'evictions': 0,
+        }
+
+
+class TestDocsEndpoints:
+
+    def test_openapi_served(self, client):
+        assert client.get('/api/openapi.json').status_code == 200
@@ -1,6 +1,16 @@
 """Tests for job application API endpoints via TestClient."""
+import io
+import json
+import logging
 from datetime import date
 
+import msgpack
+
+from app import encoding
+from app.config import settings
+from app.services import job_application_service as svc
+from app.services.cursor import encode_cursor
+from app.services.job_application_service import WriteConflictError
 
 BASE_URL = '/api/v1/applications'
 
@@ -72,7 +82,7 @@ class TestListEndpoint:
     def test_list_empty(self, client):
         response = client.get(BASE_URL)
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {'items': [], 'nextCursor': None}
 
     def test_list_after_creates(self, client, sample_application_data):
         client.post(BASE_URL, json=sample_application_data)
@@ -81,11 +91,11 @@ class TestListEndpoint:
         })
         response = client.get(BASE_URL)
         assert response.status_code == 200
-        assert len(response.json()) == 2
+        assert len(response.json()['items']) == 2
 
     def test_list_response_structure(self, client, created_application):
         response = client.get(BASE_URL)
-        data = response.json()
+        data = response.json()['items']
         assert len(data) == 1
         item = data[0]
         assert 'id' in item
@@ -93,6 +103,62 @@ class TestListEndpoint:
         assert 'role' in item
         assert 'interestLevel' in item
 
+    def test_list_pages_with_cursor(self, client, sample_application_data):
+        for _ in range(5):
+            client.post(BASE_URL, json=sample_application_data)
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {'limit': 2}
+            if cursor:
+                params['cursor'] = cursor
+            page = client.get(BASE_URL, params=params).json()
+            assert len(page['items']) <= 2
+            seen.extend(item['id'] for item in page['items'])
+            cursor = page['nextCursor']
+            if not cursor:
+                break
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_list_limit_is_capped(self, client, sample_application_data):
+        client.post(BASE_URL, json=sample_application_data)
+        response = client.get(BASE_URL, params={'limit': 100000})
+        assert response.status_code == 200
+        assert len(response.json()['items']) == 1
+
+    def test_list_invalid_cursor(self, client):
+        response = client.get(BASE_URL, params={'cursor': 'not-a-cursor'})
+        assert response.status_code == 400
+
+    def test_list_tampered_cursor(self, client, sample_application_data):
+        for _ in range(2):
+            client.post(BASE_URL, json=sample_application_data)
+        cursor = client.get(BASE_URL, params={'limit': 1}).json()['nextCursor']
+        payload, signature = cursor.split('.')
+        response = client.get(BASE_URL, params={'cursor': f'{payload}x.{signature}'})
+        assert response.status_code == 400
+
+    def test_list_order(self, client, sample_application_data):
+        for applied in ('2025-02-01', '2025-01-01', '2025-03-01'):
+            client.post(BASE_URL, json={**sample_application_data, 'appliedDate': applied})
+        newest = client.get(BASE_URL, params={'order': 'desc', 'limit': 2}).json()
+        assert [item['appliedDate'] for item in newest['items']] == ['2025-03-01', '2025-02-01']
+        rest = client.get(BASE_URL, params={'order': 'desc', 'cursor': newest['nextCursor']}).json()
+        assert [item['appliedDate'] for item in rest['items']] == ['2025-01-01']
+        oldest = client.get(BASE_URL, params={'all': 'true'}).json()
+        assert [item['appliedDate'] for item in oldest] == ['2025-01-01', '2025-02-01', '2025-03-01']
+        assert client.get(BASE_URL, params={'cursor': newest['nextCursor']}).status_code == 400
+        assert client.get(BASE_URL, params={'order': 'newest'}).status_code == 422
+
+    def test_list_all_flag_returns_plain_list(self, client, sample_application_data):
+        for _ in range(3):
+            client.post(BASE_URL, json=sample_application_data)
+        response = client.get(BASE_URL, params={'all': 'true'})
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+        assert len(response.json()) == 3
+
 
 class TestGetByIdEndpoint:
 
@@ -196,6 +262,392 @@ class TestDeleteEndpoint:
             'company': 'Other', 'role': 'PM', 'interestLevel': 1,
         })
         client.delete(f'{BASE_URL}/{resp1.json()["id"]}')
-        remaining = client.get(BASE_URL).json()
+        remaining = client.get(BASE_URL).json()['items']
         assert len(remaining) == 1
         assert remaining[0]['id'] == resp2.json()['id']
+
+
+class TestExportEndpoint:
+
+    def test_export_ndjson(self, client, sample_application_data):
+        for _ in range(3):
+            client.post(BASE_URL, json=sample_application_data)
+        response = client.get(f'{BASE_URL}/export')
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        lines = response.text.strip().split('\n')
+        assert len(lines) == 3
+        assert json.loads(lines[0])['company'] == 'Acme Corp'
+
+    def test_export_json(self, client, sample_application_data):
+        for _ in range(3):
+            client.post(BASE_URL, json=sample_application_data)
+        response = client.get(f'{BASE_URL}/export', params={'format': 'json'})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert 'appliedDate' in data[0]
+
+    def test_export_json_empty(self, client):
+        response = client.get(f'{BASE_URL}/export', params={'format': 'json'})
+        assert response.json() == []
+
+    def test_export_invalid_format(self, client):
+        response = client.get(f'{BASE_URL}/export', params={'format': 'xml'})
+        assert response.status_code == 422
+
+
+class TestBatchEndpoints:
+
+    def test_batch_create(self, client):
+        items = [{'company': f'Company{i}', 'role': 'Dev'} for i in range(30)]
+        response = client.post(f'{BASE_URL}:batchCreate', json={'items': items})
+        assert response.status_code == 200
+        results = response.json()['results']
+        assert len(results) == 30
+        assert all(result['success'] for result in results)
+        assert [result['index'] for result in results] == list(range(30))
+        assert len(client.get(BASE_URL, params={'all': 'true'}).json()) == 30
+
+    def test_batch_create_reports_invalid_items(self, client):
+        items = [
+            {'company': 'Acme', 'role': 'Dev'},
+            {'company': 'Missing role'},
+            {'company': 'Other', 'role': 'PM'},
+        ]
+        results = client.post(f'{BASE_URL}:batchCreate', json={'items': items}).json()['results']
+        assert [result['success'] for result in results] == [True, False, True]
+        assert results[1]['index'] == 1
+        assert 'role' in results[1]['error']
+        assert results[2]['application']['company'] == 'Other'
+
+    def test_batch_get(self, client, created_application):
+        app_id = created_application['id']
+        response = client.post(f'{BASE_URL}:batchGet', json={'ids': [app_id, 'missing-id']})
+        results = response.json()['results']
+        assert results[0]['success'] is True
+        assert results[0]['application']['id'] == app_id
+        assert results[1]['success'] is False
+        assert results[1]['error'] == 'Not found'
+
+    def test_batch_delete(self, client):
+        items = [{'company': f'Company{i}', 'role': 'Dev'} for i in range(3)]
+        created = client.post(f'{BASE_URL}:batchCreate', json={'items': items}).json()['results']
+        ids = [result['id'] for result in created]
+        response = client.post(f'{BASE_URL}:batchDelete', json={'ids': ids[:2]})
+        assert all(result['success'] for result in response.json()['results'])
+        remaining = client.get(BASE_URL, params={'all': 'true'}).json()
+        assert [app['id'] for app in remaining] == [ids[2]]
+
+    def test_batch_size_limit(self, client, monkeypatch):
+        from app.config import settings
+        monkeypatch.setattr(settings, 'batch_max_items', 2)
+        response = client.post(f'{BASE_URL}:batchGet', json={'ids': ['a', 'b', 'c']})
+        assert response.status_code == 413
+
+    def test_batch_empty_rejected(self, client):
+        assert client.post(f'{BASE_URL}:batchGet', json={'ids': []}).status_code == 422
+
+
+class TestConditionalGet:
+
+    def test_get_returns_validators(self, client, created_application):
+        response = client.get(f'{BASE_URL}/{created_application["id"]}')
+        assert response.headers['etag'].startswith('"')
+        assert response.headers['last-modified'].endswith('GMT')
+
+    def test_if_none_match_returns_304(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        etag = client.get(url).headers['etag']
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['etag'] == etag
+
+    def test_weak_and_listed_tags_match(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        etag = client.get(url).headers['etag']
+        response = client.get(url, headers={'If-None-Match': f'"other", W/{etag}'})
+        assert response.status_code == 304
+
+    def test_update_changes_etag(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        etag = client.get(url).headers['etag']
+        patched = client.patch(url, json={'company': 'NewCo'})
+        assert patched.headers['etag'] != etag
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['etag'] == patched.headers['etag']
+
+    def test_projection_has_its_own_etag(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        full = client.get(url).headers['etag']
+        sparse = client.get(url, params={'fields': 'company'}).headers['etag']
+        assert full != sparse
+
+    def test_if_modified_since(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        last_modified = client.get(url).headers['last-modified']
+        assert client.get(url, headers={'If-Modified-Since': last_modified}).status_code == 304
+        old = 'Mon, 01 Jan 2001 00:00:00 GMT'
+        assert client.get(url, headers={'If-Modified-Since': old}).status_code == 200
+
+    def test_list_304_until_write(self, client, sample_application_data):
+        client.post(BASE_URL, json=sample_application_data)
+        etag = client.get(BASE_URL).headers['etag']
+        assert client.get(BASE_URL, headers={'If-None-Match': etag}).status_code == 304
+        client.post(BASE_URL, json=sample_application_data)
+        response = client.get(BASE_URL, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert len(response.json()['items']) == 2
+
+    def test_list_etag_depends_on_query(self, client, created_application):
+        etag = client.get(BASE_URL).headers['etag']
+        response = client.get(BASE_URL, params={'limit': 1}, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+
+
+class TestAppendEndpoints:
+
+    def test_append_note(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        note = {'occurDate': '2025-03-02', 'description': 'Phone call'}
+        response = client.post(f'{url}/notes', json=[note])
+        assert response.status_code == 201
+        assert response.json() == {'id': created_application['id'], 'notes': [note]}
+        assert response.headers['etag'].startswith('"2-')
+        assert client.get(url).json()['notes'][-1] == note
+        [listed] = client.get(BASE_URL).json()['items']
+        assert listed['notes'] == [] and listed['noteCount'] == len(created_application['notes']) + 1
+
+    def test_append_status(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        entry = {'occurDate': str(date.today()), 'status': 'INTERVIEW'}
+        response = client.post(f'{url}/status', json=[entry])
+        assert response.status_code == 201
+        assert response.json()['status'] == [entry]
+        assert client.get(BASE_URL, params={'status': 'INTERVIEW'}).json()['items'][0]['id'] == created_application['id']
+
+    def test_append_nonexistent(self, client):
+        response = client.post(f'{BASE_URL}/missing/notes', json=[{'occurDate': '2025-03-02', 'description': 'x'}])
+        assert response.status_code == 404
+
+    def test_append_empty_rejected(self, client, created_application):
+        assert client.post(f'{BASE_URL}/{created_application["id"]}/notes', json=[]).status_code == 422
+
+
+class TestHistoryEndpoints:
+
+    def test_note_pages(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}/notes'
+        notes = [{'occurDate': f'2025-03-0{day}', 'description': f'Note {day}'} for day in range(1, 4)]
+        client.post(url, json=notes)
+        first = client.get(url, params={'limit': 2}).json()
+        assert first['items'] == notes[:2]
+        second = client.get(url, params={'limit': 2, 'cursor': first['nextCursor']}).json()
+        assert second == {'items': notes[2:], 'nextCursor': None}
+
+    def test_status_page(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}/status'
+        entry = {'occurDate': str(date.today()), 'status': 'INTERVIEW'}
+        client.post(url, json=[entry])
+        assert client.get(url).json()['items'][-1] == entry
+
+    def test_missing_application_and_bad_cursor(self, client, created_application):
+        assert client.get(f'{BASE_URL}/missing/notes').status_code == 404
+        url = f'{BASE_URL}/{created_application["id"]}/status'
+        assert client.get(url, params={'cursor': encode_cursor({'key': None})}).status_code == 400
+
+
+class TestIfMatch:
+
+    def test_patch_with_current_etag(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        etag = client.get(url).headers['etag']
+        response = client.patch(url, json={'company': 'NewCo'}, headers={'If-Match': etag})
+        assert response.status_code == 200
+
+    def test_patch_with_stale_etag(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        etag = client.get(url).headers['etag']
+        client.post(f'{url}/notes', json=[{'occurDate': '2025-03-02', 'description': 'x'}])
+        response = client.patch(url, json={'company': 'NewCo'}, headers={'If-Match': etag})
+        assert response.status_code == 412
+        assert client.get(url).json()['company'] == created_application['company']
+
+    def test_bare_version_and_star(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        assert client.patch(url, json={'role': 'A'}, headers={'If-Match': '1'}).status_code == 200
+        assert client.patch(url, json={'role': 'B'}, headers={'If-Match': '*'}).status_code == 200
+
+    def test_garbage_if_match(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        assert client.patch(url, json={'role': 'A'}, headers={'If-Match': '"abc"'}).status_code == 412
+
+
+class TestStatsEndpoint:
+
+    def test_stats(self, client, created_application):
+        url = f'{BASE_URL}/{created_application["id"]}'
+        client.post(f'{url}/status', json=[{'occurDate': str(date.today()), 'status': 'INTERVIEW'}])
+        body = client.get(f'{BASE_URL}/stats').json()
+        assert body['total'] == 1
+        assert body['byStatus']['INTERVIEW'] == 1
+        assert body['perWeek'][0]['applied'] == 1
+        assert body['responseRate'] == 1.0
+        assert body['averageDaysToScreen'] == 0
+
+    def test_write_conflict_is_409(self, client, sample_application_data, monkeypatch):
+        def conflict(data):
+            raise WriteConflictError('busy')
+        monkeypatch.setattr(svc, 'create_application', conflict)
+        assert client.post(BASE_URL, json=sample_application_data).status_code == 409
+
+
+class TestSearchEndpoint:
+
+    def test_search(self, client, created_application):
+        response = client.get(f'{BASE_URL}/search', params={'q': 'acme engineer'})
+        assert response.status_code == 200
+        body = response.json()
+        assert body['total'] == 1
+        assert body['items'][0]['application']['id'] == created_application['id']
+        assert body['items'][0]['score'] > 0
+
+    def test_query_required(self, client):
+        assert client.get(f'{BASE_URL}/search').status_code == 422
+
+
+class TestChangesEndpoint:
+
+    def test_sync_round_trip(self, client, created_application, monkeypatch):
+        monkeypatch.setattr(settings, 'change_feed_lag_seconds', 0)
+        first = client.get(f'{BASE_URL}/changes').json()
+        assert [change['id'] for change in first['items']] == [created_application['id']]
+        assert first['items'][0]['application']['company'] == created_application['company']
+        client.delete(f'{BASE_URL}/{created_application["id"]}')
+        body = client.get(f'{BASE_URL}/changes', params={'since': first['nextToken']}).json()
+        assert body['items'][0]['deleted'] is True
+        assert body['hasMore'] is False
+
+    def test_bad_and_expired_tokens(self, client):
+        assert client.get(f'{BASE_URL}/changes', params={'since': 'nope'}).status_code == 400
+        expired = encode_cursor({'t': '2000-01-01T00:00:00', 'id': 'x'})
+        assert client.get(f'{BASE_URL}/changes', params={'since': expired}).status_code == 410
+
+
+class TestInstrumentation:
+
+    def test_server_timing_counts_dynamodb_calls(self, client, created_application, caplog):
+        with caplog.at_level(logging.INFO, logger='resumetry.requests'):
+            response = client.get(f'{BASE_URL}/{created_application["id"]}')
+        assert 'dynamodb;dur=' in response.headers['server-timing']
+        assert '1 calls' in response.headers['server-timing']
+        line = json.loads(caplog.records[-1].getMessage())
+        assert line['route'] == '/api/v1/applications/{app_id}'
+        assert line['dynamodb_calls'] == {'Query': 1}
+        assert 'validation_ms' in line
+
+    def test_fan_out_threads_are_counted(self, client, caplog):
+        items = [{'company': f'C{i}', 'role': 'Dev'} for i in range(30)]
+        results = client.post(f'{BASE_URL}:batchCreate', json={'items': items}).json()['results']
+        with caplog.at_level(logging.INFO, logger='resumetry.requests'):
+            client.post(f'{BASE_URL}:batchGet', json={'ids': [result['id'] for result in results]})
+        assert json.loads(caplog.records[-1].getMessage())['dynamodb_calls']['Query'] == 30
+
+
+class TestResponseEncodings:
+
+    def _seed(self, client, count=20):
+        items = [{'company': f'Company{i}', 'role': 'Dev', 'description': 'Backend work ' * 20} for i in range(count)]
+        client.post(f'{BASE_URL}:batchCreate', json={'items': items})
+
+    def test_list_msgpack(self, client):
+        self._seed(client)
+        response = client.get(BASE_URL, headers={'Accept': 'application/msgpack'})
+        assert response.headers['content-type'] == 'application/msgpack'
+        page = msgpack.unpackb(response.content)
+        assert page['nextCursor'] is None
+        assert page['items'] == client.get(BASE_URL).json()['items']
+
+    def test_list_msgpack_sparse_and_all(self, client):
+        self._seed(client, 3)
+        response = client.get(
+            BASE_URL, params={'all': 'true', 'fields': 'company'}, headers={'Accept': 'application/msgpack'},
+        )
+        assert sorted(app['company'] for app in msgpack.unpackb(response.content)) == ['Company0', 'Company1', 'Company2']
+        assert set(msgpack.unpackb(response.content)[0]) == {'id', 'company'}
+
+    def test_representations_have_their_own_etag(self, client):
+        self._seed(client, 2)
+        etag = client.get(BASE_URL).headers['etag']
+        response = client.get(BASE_URL, headers={'Accept': 'application/msgpack', 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert 'Accept' in response.headers['vary']
+
+    def test_list_is_compressed(self, client):
+        self._seed(client)
+        response = client.get(BASE_URL, headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['content-encoding'] == 'gzip'
+        assert int(response.headers['content-length']) < len(response.content)
+        assert len(response.json()['items']) == 20
+
+    def test_compressed_list_revalidates(self, client):
+        self._seed(client, 2)
+        etag = client.get(BASE_URL, headers={'Accept-Encoding': 'gzip'}).headers['etag']
+        response = client.get(BASE_URL, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        assert response.status_code == 304
+
+    def test_export_msgpack(self, client):
+        self._seed(client, 3)
+        response = client.get(f'{BASE_URL}/export', params={'format': 'msgpack'})
+        assert response.headers['content-type'] == 'application/msgpack'
+        apps = list(msgpack.Unpacker(io.BytesIO(response.content)))
+        assert len(apps) == 3
+        assert 'appliedDate' in apps[0]
+
+    def test_export_negotiates_msgpack(self, client):
+        self._seed(client, 1)
+        response = client.get(f'{BASE_URL}/export', headers={'Accept': 'application/msgpack'})
+        assert response.headers['content-type'] == 'application/msgpack'
+
+    def test_export_msgpack_unavailable(self, client, monkeypatch):
+        monkeypatch.setattr(encoding, '_msgpack', lambda: None)
+        response = client.get(f'{BASE_URL}/export', params={'format': 'msgpack'})
+        assert response.status_code == 406
+
+
+class TestReportsEndpoint:
+
+    @staticmethod
+    def _create(client, *statuses: str) -> None:
+        client.post(BASE_URL, json={
+            'company': 'Acme', 'role': 'Dev',
+            'status': [{'occurDate': f'2025-03-0{i + 1}', 'status': s} for i, s in enumerate(statuses)],
+        })
+
+    def test_sankey(self, client):
+        self._create(client, 'APPLIED', 'INTERVIEW', 'OFFER')
+        response = client.get('/api/v1/reports/sankey')
+        assert response.status_code == 200
+        data = response.json()
+        assert data['total'] == 1
+        assert {(link['source'], link['target']) for link in data['links']} == {
+            ('APPLIED', 'RESPONDED'), ('RESPONDED', 'INTERVIEW'), ('INTERVIEW', 'OFFER'),
+        }
+
+    def test_funnel_and_all(self, client):
+        self._create(client, 'APPLIED')
+        funnel = client.get('/api/v1/reports/funnel').json()
+        assert funnel['stages'][0] == {'status': 'APPLIED', 'reached': 1, 'conversionRate': None}
+        assert 'timeInStage' in funnel
+        assert client.get('/api/v1/reports').json()['funnel'] == funnel
+
+    def test_not_modified_until_a_write(self, client, sample_application_data):
+        client.post(BASE_URL, json=sample_application_data)
+        etag = client.get('/api/v1/reports/sankey').headers['etag']
+        assert client.get('/api/v1/reports/sankey', headers={'If-None-Match': etag}).status_code == 304
+        client.post(BASE_URL, json=sample_application_data)
+        response = client.get('/api/v1/reports/sankey', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.json()['total'] == 2
@@ -1,13 +1,28 @@
 """Tests for job_application_service against mocked DynamoDB."""
+import time
 from datetime import date
+from uuid import UUID
 
-from app.models.enums import ApplicationStatus
+import pytest
+from boto3.dynamodb.types import Binary
+
+from app.config import settings
+from app.models.enums import ApplicationStatus, SortOrder
 from app.models.job_application import (
+    ApplicationFilters,
     ApplicationNote,
     JobApplicationCreate,
     JobApplicationUpdate,
+    StatusItem,
 )
 from app.services import job_application_service as svc
+from app.services import search, stats
+from app.services.cache import get_cache
+from app.services.cursor import InvalidCursorError, encode_cursor
+from app.services.job_application_service import ChangesExpiredError, VersionConflictError
+from app.tools.rebuild_search import rebuild as rebuild_search
+from app.tools.rebuild_stats import rebuild
+from app.tools.split_histories import split
 
 
 class TestCreateApplication:
@@ -150,3 +165,675 @@ class TestDeleteApplication:
         )
         svc.delete_application(created.id)
         assert svc.get_application(created.id) is None
+
+
+class TestIterApplications:
+
+    def test_yields_pages(self, dynamodb_mock):
+        for i in range(3):
+            svc.create_application(
+                JobApplicationCreate(company=f'Company{i}', role='Dev')
+            )
+        pages = list(svc.iter_applications())
+        assert sum(len(page) for page in pages) == 3
+
+    def test_empty_table_yields_empty_page(self, dynamodb_mock):
+        assert [app for page in svc.iter_applications() for app in page] == []
+
+
+class TestReadCache:
+
+    @pytest.fixture()
+    def cache_on(self, dynamodb_mock, monkeypatch):
+        monkeypatch.setattr(settings, 'cache_enabled', True)
+        return get_cache
+
+    def test_get_served_from_cache(self, cache_on, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.get_application(created.id)
+        dynamodb_mock.delete_item(Key=svc.app_key(created.id))
+        assert svc.get_application(created.id) is not None
+        assert get_cache().stats().hits == 1
+
+    def test_update_invalidates(self, cache_on):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.get_application(created.id)
+        svc.list_applications()
+        svc.update_application(created.id, JobApplicationUpdate(company='NewCo'))
+        assert svc.get_application(created.id).company == 'NewCo'
+        assert svc.list_applications()[0].company == 'NewCo'
+
+    def test_create_and_delete_invalidate_list(self, cache_on):
+        assert svc.list_applications() == []
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        assert len(svc.list_applications()) == 1
+        svc.delete_application(created.id)
+        assert svc.list_applications() == []
+        assert svc.get_application(created.id) is None
+
+    def test_disabled_cache_is_bypassed(self, dynamodb_mock):
+        assert get_cache() is None
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.get_application(created.id)
+        dynamodb_mock.delete_item(Key=svc.app_key(created.id))
+        assert svc.get_application(created.id) is None
+
+
+class TestVersions:
+
+    def test_item_version_increments_on_update(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        assert created.item_version == 1
+        updated = svc.update_application(created.id, JobApplicationUpdate(company='NewCo'))
+        assert updated.item_version == 2
+        assert svc.get_application(created.id).item_version == 2
+
+    def test_data_version_bumped_by_writes(self, dynamodb_mock):
+        assert svc.get_data_version() == 0
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.update_application(created.id, JobApplicationUpdate(company='NewCo'))
+        svc.delete_application(created.id)
+        assert svc.get_data_version() == 3
+
+    def test_failed_delete_keeps_data_version(self, dynamodb_mock):
+        svc.delete_application('nonexistent-id')
+        assert svc.get_data_version() == 0
+
+
+class TestAppend:
+
+    def test_append_notes_returns_delta(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev',
+            notes=[ApplicationNote(occur_date=date(2025, 3, 1), description='Applied')],
+        ))
+        note = ApplicationNote(occur_date=date(2025, 3, 2), description='Call')
+        delta = svc.append_notes(created.id, [note])
+        assert delta.notes == [note]
+        assert delta.item_version == 2
+        assert [n.description for n in svc.get_application(created.id).notes] == ['Applied', 'Call']
+
+    def test_append_to_missing_list(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        dynamodb_mock.update_item(Key=svc.app_key(created.id), UpdateExpression='REMOVE notes')
+        svc.append_notes(created.id, [ApplicationNote(occur_date=date.today(), description='Call')])
+        assert len(svc.get_application(created.id).notes) == 1
+
+    def test_append_status_moves_current_status(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev',
+            status=[StatusItem(occur_date=date(2025, 3, 1), status=ApplicationStatus.APPLIED)],
+        ))
+        svc.append_status(created.id, [StatusItem(occur_date=date(2025, 3, 5), status=ApplicationStatus.INTERVIEW)])
+        item = dynamodb_mock.get_item(Key=svc.app_key(created.id))['Item']
+        assert item['current_status'] == 'INTERVIEW'
+        assert item['version'] == 2
+
+    def test_back_dated_status_keeps_current_status(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev',
+            status=[StatusItem(occur_date=date(2025, 3, 5), status=ApplicationStatus.INTERVIEW)],
+        ))
+        delta = svc.append_status(
+            created.id, [StatusItem(occur_date=date(2025, 3, 1), status=ApplicationStatus.SCREEN)],
+        )
+        assert delta.item_version == 2
+        item = dynamodb_mock.get_item(Key=svc.app_key(created.id))['Item']
+        assert item['current_status'] == 'INTERVIEW'
+        assert item['latest_status'] == {'occur_date': '2025-03-05', 'status': 'INTERVIEW'}
+        assert len(svc.get_application(created.id).status) == 2
+
+    def test_append_nonexistent_returns_none(self, dynamodb_mock):
+        note = ApplicationNote(occur_date=date.today(), description='Call')
+        assert svc.append_notes('nonexistent-id', [note]) is None
+        assert svc.get_data_version() == 0
+
+
+class TestExpectedVersion:
+
+    def test_update_at_expected_version(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        updated = svc.update_application(created.id, JobApplicationUpdate(company='NewCo'), expected_version=1)
+        assert updated.item_version == 2
+
+    def test_stale_version_raises(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.update_application(created.id, JobApplicationUpdate(company='NewCo'))
+        with pytest.raises(VersionConflictError) as exc:
+            svc.update_application(created.id, JobApplicationUpdate(company='Other'), expected_version=1)
+        assert exc.value.current_version == 2
+        assert svc.get_application(created.id).company == 'NewCo'
+
+    def test_stale_version_on_append(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        with pytest.raises(VersionConflictError):
+            svc.append_notes(
+                created.id, [ApplicationNote(occur_date=date.today(), description='x')], expected_version=5,
+            )
+
+    def test_missing_item_with_version_returns_none(self, dynamodb_mock):
+        assert svc.update_application('nonexistent-id', JobApplicationUpdate(company='X'), 1) is None
+
+
+class TestStats:
+
+    @staticmethod
+    def _create(applied: date, *statuses: tuple[date, ApplicationStatus]) -> str:
+        return svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev', applied_date=applied,
+            status=[StatusItem(occur_date=d, status=s) for d, s in statuses]
+            or [StatusItem(occur_date=applied, status=ApplicationStatus.APPLIED)],
+        )).id
+
+    def test_empty_table(self, dynamodb_mock):
+        result = svc.get_stats()
+        assert result.total == 0
+        assert result.per_week == []
+        assert result.response_rate == 0.0
+        assert result.average_days_to_screen is None
+
+    def test_counts_creates(self, dynamodb_mock):
+        self._create(date(2025, 3, 3))
+        self._create(date(2025, 3, 4), (date(2025, 3, 4), ApplicationStatus.APPLIED),
+                     (date(2025, 3, 8), ApplicationStatus.SCREEN))
+        self._create(date(2025, 3, 10), (date(2025, 3, 10), ApplicationStatus.REJECTED))
+        result = svc.get_stats()
+        assert result.total == 3
+        assert result.by_status['APPLIED'] == 1
+        assert result.by_status['SCREEN'] == 1
+        assert result.by_status['REJECTED'] == 1
+        assert [(w.week, w.applied) for w in result.per_week] == [('2025-W10', 2), ('2025-W11', 1)]
+        assert result.responded == 2
+        assert result.screened == 1
+        assert result.average_days_to_screen == 4
+
+    def test_status_append_moves_counters(self, dynamodb_mock):
+        app_id = self._create(date(2025, 3, 3))
+        svc.append_status(app_id, [StatusItem(occur_date=date(2025, 3, 5), status=ApplicationStatus.INTERVIEW)])
+        result = svc.get_stats()
+        assert result.by_status['APPLIED'] == 0
+        assert result.by_status['INTERVIEW'] == 1
+        assert result.screened == 1
+        assert result.average_days_to_screen == 2
+
+    def test_status_update_replaces_counters(self, dynamodb_mock):
+        app_id = self._create(date(2025, 3, 3), (date(2025, 3, 4), ApplicationStatus.REJECTED))
+        svc.update_application(app_id, JobApplicationUpdate(
+            status=[StatusItem(occur_date=date(2025, 3, 3), status=ApplicationStatus.APPLIED)],
+        ))
+        result = svc.get_stats()
+        assert result.by_status['REJECTED'] == 0
+        assert result.by_status['APPLIED'] == 1
+        assert result.responded == 0
+
+    def test_delete_removes_counters(self, dynamodb_mock):
+        app_id = self._create(date(2025, 3, 3))
+        self._create(date(2025, 3, 3))
+        assert svc.delete_application(app_id)
+        result = svc.get_stats()
+        assert result.total == 1
+        assert result.per_week[0].applied == 1
+
+    def test_batch_writes_update_counters(self, dynamodb_mock):
+        results = svc.batch_create_applications([
+            JobApplicationCreate(company=f'Co {i}', role='Dev', applied_date=date(2025, 3, 3)) for i in range(3)
+        ])
+        assert svc.get_stats().total == 3
+        svc.batch_delete_applications([results[0].id, 'nonexistent-id'])
+        assert svc.get_stats().total == 2
+
+    def test_stats_items_not_listed(self, dynamodb_mock):
+        self._create(date(2025, 3, 3))
+        assert len(svc.list_applications()) == 1
+
+    def test_stale_version_leaves_counters(self, dynamodb_mock):
+        app_id = self._create(date(2025, 3, 3))
+        with pytest.raises(VersionConflictError):
+            svc.update_application(app_id, JobApplicationUpdate(
+                status=[StatusItem(occur_date=date(2025, 3, 5), status=ApplicationStatus.OFFER)],
+            ), expected_version=3)
+        assert svc.get_stats().by_status['OFFER'] == 0
+
+    def test_rebuild_restores_counters(self, dynamodb_mock):
+        self._create(date(2025, 3, 3), (date(2025, 3, 6), ApplicationStatus.OFFER))
+        expected = svc.get_stats()
+        dynamodb_mock.put_item(Item={'pk': stats.STATS_PARTITION, 'sk': f'{stats.WEEK_PREFIX}2020-W01', 'applied': 4})
+        dynamodb_mock.delete_item(Key={'pk': stats.STATS_PARTITION, 'sk': stats.TOTALS_SK})
+        assert rebuild(dry_run=True) == expected
+        assert svc.get_stats() != expected
+        assert rebuild() == expected
+        assert svc.get_stats() == expected
+
+
+class TestSearch:
+
+    @staticmethod
+    def _hits(query: str) -> list[str]:
+        return [hit.application.company for hit in svc.search_applications(query).items]
+
+    def test_ranks_matches(self, dynamodb_mock):
+        svc.create_application(JobApplicationCreate(company='Acme', role='Python Developer'))
+        svc.create_application(JobApplicationCreate(
+            company='Globex', role='Engineer', description='Python, Python and more Python',
+        ))
+        svc.create_application(JobApplicationCreate(company='Initech', role='Go Developer'))
+        result = svc.search_applications('python')
+        assert result.total == 2
+        assert [hit.application.company for hit in result.items] == ['Globex', 'Acme']
+        assert result.items[0].score > result.items[1].score
+
+    def test_no_terms_or_matches(self, dynamodb_mock):
+        svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        assert svc.search_applications('the and').total == 0
+        assert svc.search_applications('kotlin').items == []
+
+    def test_update_and_notes_reindex(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.update_application(created.id, JobApplicationUpdate(company='Globex'))
+        assert self._hits('acme') == []
+        assert self._hits('globex') == ['Globex']
+        svc.append_notes(created.id, [ApplicationNote(occur_date=date.today(), description='Recruiter mentioned Kubernetes')])
+        assert self._hits('kubernetes') == ['Globex']
+
+    def test_delete_removes_postings(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.delete_application(created.id)
+        assert self._hits('acme') == []
+        assert dynamodb_mock.get_item(Key=search.doc_key(created.id)).get('Item') is None
+
+    def test_batch_writes_reindex(self, dynamodb_mock):
+        results = svc.batch_create_applications([
+            JobApplicationCreate(company=f'Acme {i}', role='Dev') for i in range(3)
+        ])
+        assert svc.search_applications('acme').total == 3
+        svc.batch_delete_applications([results[0].id])
+        assert svc.search_applications('acme').total == 2
+
+    def test_index_failure_does_not_fail_the_write(self, dynamodb_mock, monkeypatch, caplog):
+        def unavailable(*args):
+            raise RuntimeError('Service unavailable')
+
+        monkeypatch.setattr(search, 'index_writes', unavailable)
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        assert svc.get_application(created.id).company == 'Acme'
+        assert self._hits('acme') == []
+        assert 'Search index update failed' in caplog.text
+        assert 'resumetry.search' in {record.name for record in caplog.records}
+
+    def test_rebuild_indexes_existing_items(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        dynamodb_mock.delete_item(Key=search.posting_key('acme', created.id))
+        assert self._hits('acme') == []
+        assert rebuild_search() == (1, 2)
+        assert self._hits('acme') == ['Acme']
+        assert self._corpus() == {'docs': 1, 'length': 2}
+
+    @staticmethod
+    def _corpus() -> dict[str, int]:
+        keys = [search.corpus_key(partition) for partition in svc.shard_keys(search.SEARCH_PARTITION)]
+        found, _ = svc.batch_get(keys)
+        return search.corpus_totals(found)
+
+    def test_corpus_counters_are_sharded(self, dynamodb_mock, monkeypatch):
+        monkeypatch.setattr(settings, 'shard_count', 4)
+        created = [svc.create_application(JobApplicationCreate(company=f'Acme {i}', role='Dev')) for i in range(8)]
+        partitions = {svc._counter_partition(search.SEARCH_PARTITION, app.id) for app in created}
+        assert {item['pk'] for item in svc.batch_get([search.corpus_key(p) for p in partitions])[0]} == partitions
+        svc.batch_create_applications([JobApplicationCreate(company='Globex', role='Python Dev')] * 2)
+        svc.delete_application(created[0].id)
+        assert self._corpus() == {'docs': 9, 'length': 20}
+
+    def test_concurrent_index_updates_count_once(self, dynamodb_mock, monkeypatch):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        index_writes = search.index_writes
+        calls = []
+
+        def interleaved(*args):
+            # A second update indexes between this one's document read and its write
+            calls.append(args)
+            if len(calls) == 1:
+                svc.update_application(created.id, JobApplicationUpdate(role='Senior Go Platform Engineer'))
+            return index_writes(*args)
+
+        monkeypatch.setattr(search, 'index_writes', interleaved)
+        svc.update_application(created.id, JobApplicationUpdate(role='Python Developer'))
+        doc = dynamodb_mock.get_item(Key=search.doc_key(created.id))['Item']
+        assert doc['version'] == svc.get_application(created.id).item_version
+        assert self._corpus() == {'docs': 1, 'length': 5}
+        assert self._hits('platform') == ['Acme']
+        assert self._hits('python') == []
+
+
+class TestChanges:
+
+    @pytest.fixture(autouse=True)
+    def no_lag(self, monkeypatch):
+        monkeypatch.setattr(settings, 'change_feed_lag_seconds', 0)
+
+    def test_first_sync_returns_everything(self, dynamodb_mock):
+        first = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        second = svc.create_application(JobApplicationCreate(company='Globex', role='Dev'))
+        page = svc.list_changes()
+        assert [change.id for change in page.items] == [first.id, second.id]
+        assert page.items[0].application == first
+        assert not page.has_more
+
+    def test_only_changes_after_token(self, dynamodb_mock):
+        kept = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        gone = svc.create_application(JobApplicationCreate(company='Globex', role='Dev'))
+        token = svc.list_changes().next_token
+        assert svc.list_changes(token).items == []
+
+        svc.update_application(kept.id, JobApplicationUpdate(role='Lead'))
+        svc.delete_application(gone.id)
+        page = svc.list_changes(token)
+        assert [(change.id, change.deleted) for change in page.items] == [(kept.id, False), (gone.id, True)]
+        assert page.items[0].application.role == 'Lead'
+        assert page.items[1].application is None
+        assert svc.list_changes(page.next_token).items == []
+
+    def test_pages(self, dynamodb_mock):
+        ids = [svc.create_application(JobApplicationCreate(company=f'C{i}', role='Dev')).id for i in range(5)]
+        seen: list[str] = []
+        token = None
+        while True:
+            page = svc.list_changes(token, 2)
+            seen.extend(change.id for change in page.items)
+            token = page.next_token
+            if not page.has_more:
+                break
+        assert seen == ids
+
+    def test_batch_delete_leaves_tombstones(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        token = svc.list_changes().next_token
+        svc.batch_delete_applications([created.id, 'nonexistent-id'])
+        assert [(change.id, change.deleted) for change in svc.list_changes(token).items] == [(created.id, True)]
+
+    def test_failed_batch_delete_leaves_application(self, dynamodb_mock, monkeypatch):
+        kept, removed = (svc.create_application(JobApplicationCreate(company=name, role='Dev')) for name in 'AB')
+        token = svc.list_changes().next_token
+        batch_write = svc.batch_write
+
+        def failing(requests):
+            key = svc.app_key(kept.id)
+            failed = [request for request in requests if request.get('DeleteRequest', {}).get('Key') == key]
+            return [*batch_write([request for request in requests if request not in failed]), *failed]
+
+        monkeypatch.setattr(svc, 'batch_write', failing)
+        results = svc.batch_delete_applications([kept.id, removed.id])
+        assert [result.success for result in results] == [False, True]
+        assert svc.get_application(kept.id) == kept
+        assert svc.get_stats().total == 1
+        assert [(change.id, change.deleted) for change in svc.list_changes(token).items] == [(removed.id, True)]
+
+    def test_recent_changes_held_back(self, dynamodb_mock, monkeypatch):
+        svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        monkeypatch.setattr(settings, 'change_feed_lag_seconds', 60)
+        assert svc.list_changes().items == []
+
+    def test_expired_and_invalid_tokens(self, dynamodb_mock):
+        with pytest.raises(ChangesExpiredError):
+            svc.list_changes(encode_cursor({'t': '2000-01-01T00:00:00', 'id': 'x'}))
+        with pytest.raises(InvalidCursorError):
+            svc.list_changes(encode_cursor({'pk': 'JOB_APPS'}))
+
+    def test_tombstone_expires(self, dynamodb_mock):
+        created = svc.create_application(JobApplicationCreate(company='Acme', role='Dev'))
+        svc.delete_application(created.id)
+        tombstone = dynamodb_mock.get_item(Key={'pk': svc.TOMBSTONE_PARTITION, 'sk': f'{svc.SK_PREFIX}{created.id}'})['Item']
+        assert tombstone['expires_at'] > time.time() + (settings.change_retention_days - 1) * 86400
+
+
+class TestReports:
+
+    @staticmethod
+    def _create(*statuses: tuple[date, ApplicationStatus]) -> str:
+        return svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev',
+            status=[StatusItem(occur_date=d, status=s) for d, s in statuses],
+        )).id
+
+    def test_reports_follow_writes(self, dynamodb_mock):
+        app_id = self._create((date(2025, 3, 1), ApplicationStatus.APPLIED))
+        version, result = svc.get_reports()
+        assert result.sankey.links[0].target == 'NO RESPONSE'
+
+        svc.update_application(app_id, JobApplicationUpdate(status=[
+            StatusItem(occur_date=date(2025, 3, 1), status=ApplicationStatus.APPLIED),
+            StatusItem(occur_date=date(2025, 3, 5), status=ApplicationStatus.REJECTED),
+        ]))
+        new_version, result = svc.get_reports()
+        assert new_version > version
+        assert {(link.source, link.target) for link in result.sankey.links} == {
+            ('APPLIED', 'RESPONDED'), ('RESPONDED', 'REJECTED'),
+        }
+
+        svc.delete_application(app_id)
+        assert svc.get_reports()[1].sankey.total == 0
+
+    def test_unchanged_data_is_not_read_again(self, dynamodb_mock, monkeypatch):
+        self._create((date(2025, 3, 1), ApplicationStatus.APPLIED))
+        first = svc.get_reports()[1]
+        monkeypatch.setattr(svc, '_read_query', lambda *args: pytest.fail('histories read again'))
+        assert svc.get_reports()[1] is first
+
+    def test_sharded_table(self, dynamodb_mock, monkeypatch):
+        monkeypatch.setattr(settings, 'shard_count', 4)
+        for _ in range(6):
+            self._create((date(2025, 3, 1), ApplicationStatus.APPLIED), (date(2025, 3, 3), ApplicationStatus.SCREEN))
+        result = svc.get_reports()[1]
+        assert result.funnel.stages[1].reached == 6
+        assert result.funnel.time_in_stage[0].average_days == 2.0
+
+
+class TestHistoryItems:
+
+    @staticmethod
+    def _create(notes: int = 0) -> str:
+        return svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev',
+            status=[
+                StatusItem(occur_date=date(2025, 3, 1), status=ApplicationStatus.APPLIED),
+                StatusItem(occur_date=date(2025, 3, 4), status=ApplicationStatus.SCREEN),
+            ],
+            notes=[ApplicationNote(occur_date=date(2025, 3, 2), description=f'Note {i}') for i in range(notes)],
+        )).id
+
+    @staticmethod
+    def _collection(table, app_id: str) -> list[dict]:
+        key = svc.app_key(app_id)
+        return table.query(
+            KeyConditionExpression='pk = :pk AND begins_with(sk, :sk)',
+            ExpressionAttributeValues={':pk': key['pk'], ':sk': key['sk']},
+        )['Items']
+
+    def test_entries_are_child_items(self, dynamodb_mock):
+        app_id = self._create(notes=2)
+        parent, *children = self._collection(dynamodb_mock, app_id)
+        assert 'status' not in parent and 'notes' not in parent
+        assert parent['latest_status'] == {'occur_date': '2025-03-04', 'status': 'SCREEN'}
+        assert [child['sk'].split('#')[2] for child in children] == ['NOTE', 'NOTE', 'STATUS', 'STATUS']
+
+        app = svc.get_application(app_id)
+        assert [entry.status for entry in app.status] == [ApplicationStatus.APPLIED, ApplicationStatus.SCREEN]
+        assert [note.description for note in app.notes] == ['Note 0', 'Note 1']
+
+    def test_lists_read_headers(self, dynamodb_mock):
+        app_id = self._create(notes=3)
+        [app] = svc.list_applications()
+        assert app.id == app_id
+        assert [entry.status for entry in app.status] == [ApplicationStatus.SCREEN]
+        assert app.notes == [] and app.note_count == 3
+        [app] = svc.list_applications_page(10).items
+        assert [entry.status for entry in app.status] == [ApplicationStatus.SCREEN]
+        assert app.note_count == 3
+        assert svc.get_application(app_id).note_count == 3
+
+    def test_append_notes_writes_children_only(self, dynamodb_mock):
+        app_id = self._create(notes=1)
+        delta = svc.append_notes(app_id, [ApplicationNote(occur_date=date(2025, 3, 1), description='Earlier')])
+        assert delta.item_version == 2
+        assert [note.description for note in svc.get_application(app_id).notes] == ['Earlier', 'Note 0']
+        assert [app.note_count for app in svc.list_applications()] == [2]
+        assert svc.append_notes('missing', [ApplicationNote(occur_date=date(2025, 3, 1), description='x')]) is None
+        with pytest.raises(VersionConflictError):
+            svc.append_notes(app_id, [ApplicationNote(occur_date=date(2025, 3, 1), description='x')], 1)
+
+    def test_update_replaces_children(self, dynamodb_mock):
+        app_id = self._create(notes=2)
+        app = svc.update_application(app_id, JobApplicationUpdate(
+            notes=[ApplicationNote(occur_date=date(2025, 4, 1), description='Only')],
+        ))
+        assert [note.description for note in app.notes] == ['Only']
+        assert len(app.status) == 2
+        assert [app.note_count for app in svc.list_applications()] == [1]
+        assert len(self._collection(dynamodb_mock, app_id)) == 4
+
+    def test_delete_removes_children(self, dynamodb_mock):
+        app_id = self._create(notes=2)
+        assert svc.delete_application(app_id)
+        assert self._collection(dynamodb_mock, app_id) == []
+
+    def test_batch_operations(self, dynamodb_mock):
+        app_id = self._create(notes=2)
+        [result] = svc.batch_get_applications([app_id])
+        assert len(result.application.notes) == 2
+        svc.batch_delete_applications([app_id])
+        assert self._collection(dynamodb_mock, app_id) == []
+
+    def test_histories_larger_than_a_transaction(self, dynamodb_mock):
+        app_id = self._create(notes=svc.TRANSACT_ITEMS_LIMIT + 20)
+        assert len(svc.get_application(app_id).notes) == svc.TRANSACT_ITEMS_LIMIT + 20
+        assert svc.delete_application(app_id)
+        assert self._collection(dynamodb_mock, app_id) == []
+
+    def test_history_pages(self, dynamodb_mock):
+        app_id = self._create(notes=5)
+        first = svc.list_notes(app_id, 3)
+        assert [note.description for note in first.items] == ['Note 0', 'Note 1', 'Note 2']
+        second = svc.list_notes(app_id, 3, first.next_cursor)
+        assert [note.description for note in second.items] == ['Note 3', 'Note 4']
+        assert second.next_cursor is None
+        assert [entry.status for entry in svc.list_status(app_id, 10).items] == [
+            ApplicationStatus.APPLIED, ApplicationStatus.SCREEN,
+        ]
+        assert svc.list_notes('missing', 10) is None
+        with pytest.raises(InvalidCursorError):
+            svc.list_status(app_id, 3, first.next_cursor)
+
+    def test_split_moves_inline_histories(self, dynamodb_mock):
+        dynamodb_mock.put_item(Item={
+            'pk': svc.PARTITION_KEY, 'sk': f'{svc.SK_PREFIX}legacy', 'version': 1,
+            'company': 'Legacy Co', 'role': 'Dev', 'applied_date': '2024-05-01',
+            'status': [{'occur_date': '2024-05-01', 'status': 'APPLIED'}, {'occur_date': '2024-05-09', 'status': 'OFFER'}],
+            'notes': [{'occur_date': '2024-05-02', 'description': 'Inline'}],
+        })
+        self._create(notes=1)
+        assert [app.company for app in svc.list_applications()] == ['Acme']  # not in the headers index yet
+
+        assert split() == {'scanned': 2, 'split': 1, 'unchanged': 1, 'conflicts': 0}
+        parent, *children = self._collection(dynamodb_mock, 'legacy')
+        assert 'status' not in parent and len(children) == 3
+        assert parent['latest_status']['status'] == 'OFFER'
+        app = svc.get_application('legacy')
+        assert [entry.status for entry in app.status] == [ApplicationStatus.APPLIED, ApplicationStatus.OFFER]
+        assert [note.description for note in app.notes] == ['Inline']
+        assert len(svc.list_applications()) == 2
+        assert split()['split'] == 0
+
+
+class TestStorageCompression:
+
+    POSTING = ' '.join(f'Requirement {i}: experience with python, aws and distributed systems.' for i in range(60))
+
+    def _create(self) -> str:
+        return svc.create_application(JobApplicationCreate(
+            company='Acme', role='Dev', description=self.POSTING, login_hints='user: sam',
+        )).id
+
+    def test_large_text_is_stored_compressed(self, dynamodb_mock):
+        app_id = self._create()
+        item = dynamodb_mock.get_item(Key=svc.app_key(app_id))['Item']
+        assert isinstance(item['description'], Binary)
+        assert len(item['description'].value) < len(self.POSTING) // 2
+        assert item['login_hints'] == 'user: sam'
+
+        assert svc.get_application(app_id).description == self.POSTING
+        assert svc.get_application(app_id, ['description']).description == self.POSTING
+        [app] = svc.list_applications()
+        assert app.description == self.POSTING
+
+    def test_sparse_reads_skip_compressed_fields(self, dynamodb_mock):
+        app_id = self._create()
+        app = svc.get_application(app_id, ['company'])
+        assert app.company == 'Acme'
+        assert 'description' not in app.model_dump(exclude_unset=True)
+
+    def test_updates_compress_and_reads_accept_both_forms(self, dynamodb_mock, monkeypatch):
+        monkeypatch.setattr(settings, 'storage_compression_enabled', False)
+        app_id = self._create()
+        assert isinstance(dynamodb_mock.get_item(Key=svc.app_key(app_id))['Item']['description'], str)
+
+        monkeypatch.setattr(settings, 'storage_compression_enabled', True)
+        svc.update_application(app_id, JobApplicationUpdate(login_hints=self.POSTING))
+        item = dynamodb_mock.get_item(Key=svc.app_key(app_id))['Item']
+        assert isinstance(item['description'], str) and isinstance(item['login_hints'], Binary)
+        app = svc.get_application(app_id)
+        assert app.description == app.login_hints == self.POSTING
+
+    def test_search_reads_compressed_descriptions(self, dynamodb_mock):
+        app_id = self._create()
+        svc.update_application(app_id, JobApplicationUpdate(description=self.POSTING + ' kubernetes'))
+        assert [hit.application.id for hit in svc.search_applications('kubernetes').items] == [app_id]
+
+
+class TestOrdering:
+
+    @staticmethod
+    def _create(applied: date, company: str) -> str:
+        return svc.create_application(JobApplicationCreate(company=company, role='Dev', applied_date=applied)).id
+
+    def _seed(self) -> list[str]:
+        # Created out of applied date order; same-day applications follow creation order
+        ids = [
+            self._create(date(2025, 3, 10), 'C'),
+            self._create(date(2025, 1, 5), 'A'),
+            self._create(date(2025, 2, 1), 'B1'),
+        ]
+        time.sleep(0.002)
+        ids.append(self._create(date(2025, 2, 1), 'B2'))
+        return ids
+
+    def test_lists_follow_applied_date_in_either_order(self, dynamodb_mock):
+        self._seed()
+        assert [app.company for app in svc.list_applications()] == ['A', 'B1', 'B2', 'C']
+        assert [app.company for app in svc.list_applications(order=SortOrder.DESC)] == ['C', 'B2', 'B1', 'A']
+        sparse = svc.list_applications(fields=['company'], order=SortOrder.DESC)
+        assert [app.company for app in sparse] == ['C', 'B2', 'B1', 'A']
+
+    def test_pages_in_descending_order(self, dynamodb_mock):
+        self._seed()
+        first = svc.list_applications_page(3, order=SortOrder.DESC)
+        assert [app.company for app in first.items] == ['C', 'B2', 'B1']
+        second = svc.list_applications_page(3, first.next_cursor, order=SortOrder.DESC)
+        assert [app.company for app in second.items] == ['A']
+        with pytest.raises(InvalidCursorError):
+            svc.list_applications_page(3, first.next_cursor)
+
+    def test_date_bounded_lists_are_ordered(self, dynamodb_mock):
+        self._seed()
+        filters = ApplicationFilters(applied_from=date(2025, 2, 1), applied_to=date(2025, 2, 28))
+        assert [app.company for app in svc.list_applications(filters, order=SortOrder.DESC)] == ['B2', 'B1']
+        page = svc.list_applications_page(10, filters=filters, order=SortOrder.DESC)
+        assert [app.company for app in page.items] == ['B2', 'B1']
+
+    def test_new_ids_are_time_ordered_and_old_ids_resolve(self, dynamodb_mock):
+        legacy_id = '1f0c8a52-4b7e-4c1e-9a43-2f3a7d9e6b10'
+        dynamodb_mock.put_item(Item={
+            **svc.app_key(legacy_id), 'company': 'Legacy', 'role': 'Dev', 'applied_date': '2024-12-01', 'version': 1,
+        })
+        app_id = self._create(date(2025, 1, 1), 'New')
+        assert UUID(app_id).version == 7
+        assert svc.get_application(legacy_id).company == 'Legacy'
+        assert svc.get_application(app_id).company == 'New'
@@ -0,0 +1,266 @@
+"""Tests for write-sharded partition keys and the shard migration tool."""
+from datetime import date
+
+import pytest
+from boto3.dynamodb.conditions import Attr
+
+from app.config import settings
+from app.models.enums import ApplicationStatus, SortOrder
+from app.models.job_application import ApplicationFilters, JobApplicationCreate, JobApplicationUpdate
+from app.services import job_application_service as svc
+from app.services import search, stats
+from app.tools.migrate_shards import migrate
+from app.tools.rebuild_stats import rebuild
+
+
+@pytest.fixture()
+def sharded(dynamodb_mock, monkeypatch):
+    monkeypatch.setattr(settings, 'shard_count', 4)
+    return dynamodb_mock
+
+
+def _app_items(table) -> list[dict]:
+    return table.scan(FilterExpression=Attr('sk').begins_with(svc.SK_PREFIX))['Items']
+
+
+def _counter_partitions(table) -> set[str]:
+    counters = Attr('sk').eq(stats.TOTALS_SK) | Attr('sk').eq(svc.DATA_VERSION_SK) | Attr('sk').eq(search.CORPUS_SK)
+    items = table.scan(FilterExpression=counters)['Items']
+    return {item['pk'] for item in items}
+
+
+def _create(n: int) -> list[str]:
+    return [
+        svc.create_application(JobApplicationCreate(company=f'Company{i}', role='Dev')).id
+        for i in range(n)
+    ]
+
+
+class TestShardedCrud:
+
+    def test_items_spread_over_shards(self, sharded):
+        _create(20)
+        partitions = {item['pk'] for item in _app_items(sharded)}
+        assert len(partitions) > 1
+        assert partitions <= set(svc._partitions())
+
+    def test_get_update_delete_route_to_shard(self, sharded):
+        app_id = _create(1)[0]
+        assert svc.get_application(app_id).company == 'Company0'
+        assert svc.update_application(app_id, JobApplicationUpdate(role='Lead')).role == 'Lead'
+        assert svc.delete_application(app_id) is True
+        assert svc.get_application(app_id) is None
+
+    def test_list_merges_shards_in_stable_order(self, sharded):
+        ids = _create(12)
+        listed = [app.id for app in svc.list_applications()]
+        assert sorted(listed) == sorted(ids)
+        assert listed == sorted(listed)
+        assert [app.id for app in svc.list_applications(order=SortOrder.DESC)] == listed[::-1]
+        assert [app.id for app in svc.list_applications(fields=['company'], order=SortOrder.DESC)] == listed[::-1]
+
+    def test_page_walks_all_shards(self, sharded):
+        ids = _create(9)
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = svc.list_applications_page(2, cursor)
+            seen.extend(app.id for app in page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        assert sorted(seen) == sorted(ids)
+
+    @pytest.mark.parametrize('order', [SortOrder.ASC, SortOrder.DESC])
+    @pytest.mark.parametrize('filters', [None, ApplicationFilters(company='acme')])
+    def test_pages_follow_the_overall_order(self, sharded, order, filters):
+        for month in (8, 5, 7, 6, 4, 3, 9, 2, 1, 8, 5):
+            svc.create_application(JobApplicationCreate(company='Acme', role='Dev', applied_date=date(2025, month, 1)))
+        expected = [app.id for app in svc.list_applications(filters, order=order)]
+        seen: list[str] = []
+        pages = 0
+        cursor = None
+        while True:
+            page = svc.list_applications_page(3, cursor, filters, order=order)
+            seen.extend(app.id for app in page.items)
+            pages += 1
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        assert seen == expected
+        assert pages == 4
+        dates = [app.applied_date for app in svc.list_applications(filters, order=order)]
+        assert dates == sorted(dates, reverse=order is SortOrder.DESC)
+
+    def test_projected_pages_follow_the_overall_order(self, sharded):
+        ids = _create(7)
+        first = svc.list_applications_page(4, fields=['company'], order=SortOrder.DESC)
+        second = svc.list_applications_page(4, first.next_cursor, fields=['company'], order=SortOrder.DESC)
+        assert [app.id for app in [*first.items, *second.items]] == sorted(ids, reverse=True)
+        assert second.next_cursor is None
+
+    def test_export_covers_all_shards(self, sharded):
+        ids = _create(7)
+        exported = [app.id for page in svc.iter_applications() for app in page]
+        assert sorted(exported) == sorted(ids)
+
+
+class TestShardedIndexes:
+
+    def _create_mixed(self, n: int) -> dict[str, str]:
+        return {
+            svc.create_application(JobApplicationCreate(
+                company='Acme' if i % 2 else 'Globex', role='Dev', top_job=i % 3 == 0,
+                applied_date=date(2025, 3, 1 + i),
+            )).id: f'2025-03-{1 + i:02d}'
+            for i in range(n)
+        }
+
+    def test_index_keys_spread_over_shards(self, sharded):
+        self._create_mixed(12)
+        items = _app_items(sharded)
+        assert len({item['item_type'] for item in items}) > 1
+        assert len({item['company_key'] for item in items}) > 2
+        assert all(item['item_type'] == svc._index_key(svc.ITEM_TYPE, svc.app_id_of(item)) for item in items)
+
+    def test_filtered_list_merges_shards(self, sharded):
+        dates = self._create_mixed(12)
+        acme = svc.list_applications(ApplicationFilters(company='ACME'))
+        assert len(acme) == 6
+        assert [str(app.applied_date) for app in acme] == sorted(dates[app.id] for app in acme)
+        top = svc.list_applications(ApplicationFilters(top_job=True), order=SortOrder.DESC)
+        assert [app.applied_date for app in top] == sorted((app.applied_date for app in top), reverse=True)
+        assert len(top) == 4
+        assert len(svc.list_applications(ApplicationFilters(status=ApplicationStatus.APPLIED, company='globex'))) == 6
+        assert len(svc.list_applications(ApplicationFilters(applied_from=date(2025, 3, 5)))) == 8
+        assert svc.get_stats().by_status['APPLIED'] == 12
+
+    def test_filtered_pages_walk_all_shards(self, sharded):
+        dates = self._create_mixed(9)
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = svc.list_applications_page(2, cursor, ApplicationFilters(company='globex'))
+            seen.extend(app.id for app in page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        assert sorted(seen) == sorted(app_id for i, app_id in enumerate(dates) if i % 2 == 0)
+
+
+class TestShardedChangeFeed:
+
+    @pytest.fixture(autouse=True)
+    def no_lag(self, monkeypatch):
+        monkeypatch.setattr(settings, 'change_feed_lag_seconds', 0)
+
+    @staticmethod
+    def _feed(limit: int) -> list[tuple[str, bool]]:
+        seen: list[tuple[str, bool]] = []
+        token = None
+        while True:
+            page = svc.list_changes(token, limit)
+            seen.extend((change.id, change.deleted) for change in page.items)
+            token = page.next_token
+            if not page.has_more:
+                return seen
+
+    def test_feed_merges_shards(self, sharded):
+        ids = _create(10)
+        svc.delete_application(ids[3])
+        svc.batch_delete_applications([ids[5]])
+        assert len({item['change_feed'] for item in _app_items(sharded)}) > 1
+        tombstones = sharded.scan(FilterExpression=Attr('pk').begins_with(svc.TOMBSTONE_PARTITION))['Items']
+        assert {item['pk'] for item in tombstones} == {
+            svc._index_key(svc.TOMBSTONE_PARTITION, ids[3]), svc._index_key(svc.TOMBSTONE_PARTITION, ids[5]),
+        }
+        kept = [(app_id, False) for i, app_id in enumerate(ids) if i not in (3, 5)]
+        assert self._feed(3) == [*kept, (ids[3], True), (ids[5], True)]
+
+    def test_migrate_moves_the_feed(self, dynamodb_mock, monkeypatch):
+        ids = _create(6)
+        svc.delete_application(ids[0])
+        monkeypatch.setattr(settings, 'shard_count', 4)
+        migrate()
+        assert self._feed(100) == [*((app_id, False) for app_id in ids[1:]), (ids[0], True)]
+        assert all(item['change_feed'] == svc._index_key(svc.CHANGE_FEED, svc.app_id_of(item))
+                   for item in _app_items(dynamodb_mock) if 'change_feed' in item)
+        [tombstone] = dynamodb_mock.scan(FilterExpression=Attr('pk').begins_with(svc.TOMBSTONE_PARTITION))['Items']
+        assert tombstone['pk'] == svc._index_key(svc.TOMBSTONE_PARTITION, ids[0])
+
+
+class TestShardedCounters:
+
+    def test_counters_spread_over_shards(self, sharded):
+        ids = _create(12)
+        svc.delete_application(ids[0])
+        partitions = _counter_partitions(sharded)
+        assert {'STATS', 'META'}.isdisjoint(partitions)
+        assert len({pk for pk in partitions if pk.startswith('STATS#')}) > 1
+        assert svc.get_stats().total == 11
+        assert svc.get_stats().by_status['APPLIED'] == 11
+        assert svc.get_data_version() == 13
+
+    def test_unsharded_counters_still_count(self, dynamodb_mock, monkeypatch):
+        _create(3)
+        version = svc.get_data_version()
+        monkeypatch.setattr(settings, 'shard_count', 4)
+        _create(2)
+        assert svc.get_stats().total == 5
+        assert svc.get_data_version() == version + 2
+
+    def test_rebuild(self, sharded):
+        _create(6)
+        expected = svc.get_stats()
+        assert rebuild() == expected
+        assert svc.get_stats() == expected
+        assert {item['pk'] for item in sharded.scan(FilterExpression=Attr('pk').begins_with('STATS'))['Items']} == {
+            stats.STATS_PARTITION,
+        }
+
+
+class TestMigrateShards:
+
+    def test_moves_legacy_items(self, dynamodb_mock, monkeypatch):
+        ids = _create(10)
+        monkeypatch.setattr(settings, 'shard_count', 4)
+
+        counts = migrate()
+
+        assert counts['scanned'] == 10
+        assert counts['moved'] + counts['unchanged'] == 10
+        items = _app_items(dynamodb_mock)
+        assert len(items) == 10
+        assert all(item['pk'] == svc._partition_for(item['sk'][4:]) for item in items)
+        assert all(svc.get_application(app_id) is not None for app_id in ids)
+
+    def test_dry_run_writes_nothing(self, dynamodb_mock, monkeypatch):
+        _create(5)
+        monkeypatch.setattr(settings, 'shard_count', 4)
+        counts = migrate(dry_run=True)
+        assert counts['moved'] > 0
+        assert {item['pk'] for item in _app_items(dynamodb_mock)} == {svc.PARTITION_KEY}
+
+    def test_reshard(self, dynamodb_mock, monkeypatch):
+        monkeypatch.setattr(settings, 'shard_count', 2)
+        ids = _create(8)
+        monkeypatch.setattr(settings, 'shard_count', 5)
+        migrate(from_shards=2)
+        assert sorted(app.id for app in svc.list_applications()) == sorted(ids)
+        assert len(svc.list_applications(ApplicationFilters(status=ApplicationStatus.APPLIED))) == 8
+        headers = [item for item in _app_items(dynamodb_mock) if 'current_status' in item]
+        assert all(item['current_status'] == svc._index_key('APPLIED', svc.app_id_of(item)) for item in headers)
+
+    def test_fewer_shards_keep_counters(self, dynamodb_mock, monkeypatch):
+        monkeypatch.setattr(settings, 'shard_count', 4)
+        _create(10)
+        version = svc.get_data_version()
+        monkeypatch.setattr(settings, 'shard_count', 2)
+        migrate(from_shards=4)
+        assert svc.get_stats().total == 10
+        assert svc.get_data_version() == version
+        corpus, _ = svc.batch_get([search.corpus_key(key) for key in svc.shard_keys(search.SEARCH_PARTITION)])
+        assert search.corpus_totals(corpus) == {'docs': 10, 'length': 20}
+        assert _counter_partitions(dynamodb_mock) <= {
+            'STATS', 'STATS#0', 'STATS#1', 'META', 'META#0', 'META#1', 'SEARCH', 'SEARCH#0', 'SEARCH#1',
+        }
@@ -0,0 +1,79 @@
+"""Tests for sparse field projection on list and get."""
+import pytest
+
+from app.models.job_application import JobApplicationCreate, JobApplicationPartial
+from app.services import job_application_service as svc
+
+BASE_URL = '/api/v1/applications'
+
+
+@pytest.fixture()
+def created(dynamodb_mock):
+    return svc.create_application(JobApplicationCreate(
+        company='Acme', role='Dev', description='A very long job posting ' * 50,
+        login_hints='Use SSO',
+    ))
+
+
+class TestParseFields:
+
+    def test_accepts_aliases_and_names(self):
+        assert svc.parse_fields('company, appliedDate,login_hints') == [
+            'company', 'applied_date', 'login_hints',
+        ]
+
+    def test_empty_means_all_fields(self):
+        assert svc.parse_fields(None) is None
+        assert svc.parse_fields(' , ') is None
+
+    def test_unknown_field(self):
+        with pytest.raises(svc.UnknownFieldError):
+            svc.parse_fields('company,salaryBand')
+
+
+class TestSparseService:
+
+    def test_get_reads_only_requested_fields(self, created):
+        app = svc.get_application(created.id, ['company', 'applied_date'])
+        assert isinstance(app, JobApplicationPartial)
+        assert app.model_dump(exclude_unset=True) == {
+            'id': created.id, 'company': 'Acme', 'applied_date': created.applied_date,
+        }
+
+    def test_list_and_page(self, created):
+        [listed] = svc.list_applications(fields=['role'])
+        assert listed.model_dump(exclude_unset=True) == {'id': created.id, 'role': 'Dev'}
+        page = svc.list_applications_page(10, fields=['company'])
+        assert page.items[0].model_dump(exclude_unset=True) == {'id': created.id, 'company': 'Acme'}
+        [listed] = svc.list_applications(fields=['note_count'])
+        assert listed.model_dump(exclude_unset=True) == {'id': created.id, 'note_count': 0}
+
+
+class TestSparseEndpoints:
+
+    def test_get_with_fields(self, client, created):
+        response = client.get(f'{BASE_URL}/{created.id}', params={'fields': 'company,appliedDate'})
+        assert response.status_code == 200
+        assert response.json() == {
+            'id': created.id, 'company': 'Acme', 'appliedDate': str(created.applied_date),
+        }
+
+    def test_list_with_fields(self, client, created):
+        page = client.get(BASE_URL, params={'fields': 'company,role,status'}).json()
+        assert page == {
+            'items': [{'id': created.id, 'company': 'Acme', 'role': 'Dev', 'status': []}],
+            'nextCursor': None,
+        }
+
+    def test_list_all_with_fields_and_filter(self, client, created):
+        data = client.get(BASE_URL, params={'fields': 'company', 'company': 'acme', 'all': 'true'}).json()
+        assert data == [{'id': created.id, 'company': 'Acme'}]
+
+    def test_unknown_field_is_400(self, client, created):
+        response = client.get(f'{BASE_URL}/{created.id}', params={'fields': 'bogus'})
+        assert response.status_code == 400
+        assert 'bogus' in response.json()['detail']
+
+    def test_without_fields_returns_full_model(self, client, created):
+        data = client.get(f'{BASE_URL}/{created.id}').json()
+        assert data['loginHints'] == 'Use SSO'
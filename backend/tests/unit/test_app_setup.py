@@ -0,0 +1,50 @@
+"""Tests for application setup options."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.config import DEFAULT_CURSOR_SECRET, check_settings, settings
+from app.main import _docs_urls
+
+
+class TestDocsUrls:
+
+    def test_enabled_by_default(self):
+        urls = _docs_urls()
+        assert urls['docs_url'] == '/api/docs'
+        assert urls['openapi_url'] == '/api/openapi.json'
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, 'docs_enabled', False)
+        assert _docs_urls() == {'docs_url': None, 'redoc_url': None, 'openapi_url': None}
+
+
+class TestCheckSettings:
+
+    def test_default_cursor_secret_refused_on_aws(self, monkeypatch):
+        monkeypatch.setattr(settings, 'dynamodb_endpoint', None)
+        monkeypatch.setattr(settings, 'cursor_secret', DEFAULT_CURSOR_SECRET)
+        with pytest.raises(RuntimeError, match='RESUMETRY_CURSOR_SECRET'):
+            check_settings()
+
+    def test_default_cursor_secret_allowed_locally(self, monkeypatch):
+        monkeypatch.setattr(settings, 'dynamodb_endpoint', 'http://localhost:8000')
+        monkeypatch.setattr(settings, 'cursor_secret', DEFAULT_CURSOR_SECRET)
+        check_settings()
+
+    def test_configured_secret(self, monkeypatch):
+        monkeypatch.setattr(settings, 'dynamodb_endpoint', None)
+        monkeypatch.setattr(settings, 'cursor_secret', 'x' * 32)
+        check_settings()
+
+
+class TestColdStart:
+
+    def test_optional_encodings_not_imported(self):
+        # brotli may still come in through urllib3, so only msgpack is checked
+        code = 'import sys, app.main; print("msgpack" in sys.modules)'
+        backend = Path(__file__).resolve().parents[2]
+        result = subprocess.run([sys.executable, '-c', code], cwd=backend, capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'False'
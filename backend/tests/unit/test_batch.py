@@ -0,0 +1,65 @@
+"""Tests for chunking and UnprocessedItems/UnprocessedKeys retries."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.config import settings
+from app.db import batch
+
+
+def _fake_table(client: MagicMock) -> SimpleNamespace:
+    return SimpleNamespace(name='tbl', meta=SimpleNamespace(client=client))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(settings, 'batch_backoff_base', 0)
+
+
+class TestChunked:
+
+    def test_splits_evenly_and_remainder(self):
+        assert [len(c) for c in batch.chunked(list(range(60)), 25)] == [25, 25, 10]
+
+    def test_empty(self):
+        assert list(batch.chunked([], 25)) == []
+
+
+class TestWriteChunk:
+
+    def test_retries_unprocessed_items(self):
+        requests = [{'PutRequest': {'Item': {'sk': str(i)}}} for i in range(3)]
+        client = MagicMock()
+        client.batch_write_item.side_effect = [
+            {'UnprocessedItems': {'tbl': requests[1:]}},
+            {'UnprocessedItems': {}},
+        ]
+        with patch.object(batch, 'get_table', return_value=_fake_table(client)):
+            assert batch.write_chunk(requests) == []
+        assert client.batch_write_item.call_count == 2
+        assert client.batch_write_item.call_args.kwargs['RequestItems'] == {'tbl': requests[1:]}
+
+    def test_gives_up_after_max_retries(self, monkeypatch):
+        monkeypatch.setattr(settings, 'batch_max_retries', 2)
+        requests = [{'PutRequest': {'Item': {'sk': '1'}}}]
+        client = MagicMock()
+        client.batch_write_item.return_value = {'UnprocessedItems': {'tbl': requests}}
+        with patch.object(batch, 'get_table', return_value=_fake_table(client)):
+            assert batch.write_chunk(requests) == requests
+        assert client.batch_write_item.call_count == 3
+
+
+class TestGetChunk:
+
+    def test_retries_unprocessed_keys(self):
+        keys = [{'sk': '1'}, {'sk': '2'}]
+        client = MagicMock()
+        client.batch_get_item.side_effect = [
+            {'Responses': {'tbl': [{'sk': '1'}]}, 'UnprocessedKeys': {'tbl': {'Keys': keys[1:]}}},
+            {'Responses': {'tbl': [{'sk': '2'}]}},
+        ]
+        with patch.object(batch, 'get_table', return_value=_fake_table(client)):
+            found, failed = batch._get_chunk(keys)
+        assert found == [{'sk': '1'}, {'sk': '2'}]
+        assert failed == []
@@ -0,0 +1,62 @@
+"""Tests for the TTL/LRU read cache."""
+from decimal import Decimal
+
+from app.services import cache as cache_module
+from app.services.cache import TTLCache, estimate_item_size
+
+
+class TestTTLCache:
+
+    def test_hit_and_miss_counters(self):
+        cache = TTLCache(max_entries=10, max_bytes=1000, ttl_seconds=60)
+        assert cache.get('a') is None
+        cache.set('a', 1, size=10)
+        assert cache.get('a') == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = TTLCache(max_entries=2, max_bytes=1000, ttl_seconds=60)
+        cache.set('a', 1, size=1)
+        cache.set('b', 2, size=1)
+        cache.get('a')
+        cache.set('c', 3, size=1)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.stats().evictions == 1
+
+    def test_eviction_by_bytes(self):
+        cache = TTLCache(max_entries=10, max_bytes=100, ttl_seconds=60)
+        cache.set('a', 1, size=60)
+        cache.set('b', 2, size=60)
+        assert cache.get('a') is None
+        assert cache.stats().bytes == 60
+
+    def test_oversized_value_not_cached(self):
+        cache = TTLCache(max_entries=10, max_bytes=100, ttl_seconds=60)
+        cache.set('a', 1, size=101)
+        assert cache.get('a') is None
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+        cache = TTLCache(max_entries=10, max_bytes=100, ttl_seconds=5)
+        cache.set('a', 1, size=1)
+        now[0] += 6
+        assert cache.get('a') is None
+        assert cache.stats().entries == 0
+
+    def test_invalidate(self):
+        cache = TTLCache(max_entries=10, max_bytes=100, ttl_seconds=60)
+        cache.set('a', 1, size=1)
+        cache.invalidate('a', 'missing')
+        assert cache.get('a') is None
+
+
+class TestEstimateItemSize:
+
+    def test_counts_names_and_values(self):
+        assert estimate_item_size({'company': 'Acme'}) == 3 + len('company') + 4
+
+    def test_nested_and_numbers(self):
+        assert estimate_item_size({'n': Decimal('12345'), 'l': ['ab', True]}) > 0
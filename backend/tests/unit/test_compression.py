@@ -0,0 +1,70 @@
+"""Tests for the storage compression of large text attributes."""
+import zlib
+
+import pytest
+from boto3.dynamodb.types import Binary
+
+from app.config import settings
+from app.db import compression
+from app.db.compression import (
+    ZLIB,
+    UnknownFormatError,
+    compress_fields,
+    compress_text,
+    decompress_fields,
+    decompress_text,
+)
+
+POSTING = 'We are hiring a backend engineer to build python services on aws. ' * 40
+
+
+class TestCompressText:
+
+    def test_large_text_round_trips(self):
+        packed = compress_text(POSTING, min_size=1024)
+        assert isinstance(packed, bytes) and packed[0] == ZLIB
+        assert len(packed) < len(POSTING)
+        assert decompress_text(packed) == POSTING
+        assert decompress_text(Binary(packed)) == POSTING
+
+    def test_short_text_is_unchanged(self):
+        assert compress_text('Short posting', min_size=1024) == 'Short posting'
+
+    def test_incompressible_text_is_unchanged(self):
+        # Too short to make up for the zlib header and checksum
+        assert compress_text('Senior engineer', min_size=1) == 'Senior engineer'
+
+    def test_plain_values_pass_through(self):
+        assert decompress_text('plain') == 'plain'
+        assert decompress_text(None) is None
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(UnknownFormatError):
+            decompress_text(Binary(b'\x09' + zlib.compress(b'text')))
+
+    def test_zstd_needs_zstandard(self, monkeypatch):
+        monkeypatch.setattr(compression, 'zstandard', None)
+        monkeypatch.setattr(settings, 'storage_compression_codec', 'zstd')
+        # Writes fall back to zlib; zstd values cannot be read
+        assert compress_text(POSTING, min_size=0)[0] == ZLIB
+        with pytest.raises(UnknownFormatError):
+            decompress_text(bytes([compression.ZSTD]) + b'data')
+
+
+class TestCompressFields:
+
+    def test_only_text_fields_are_compressed(self):
+        item = {'sk': 'APP#1', 'company': POSTING, 'description': POSTING, 'login_hints': 'hint'}
+        stored = compress_fields(item)
+        assert isinstance(stored['description'], bytes)
+        assert stored['company'] == POSTING and stored['login_hints'] == 'hint'
+        assert item['description'] == POSTING  # not modified in place
+        assert decompress_fields(stored) == item
+
+    def test_unchanged_items_are_returned_as_is(self, monkeypatch):
+        item = {'sk': 'APP#1', 'description': 'short'}
+        assert compress_fields(item) is item
+        assert decompress_fields(item) is item
+        monkeypatch.setattr(settings, 'storage_compression_enabled', False)
+        large = {'description': POSTING}
+        assert compress_fields(large) is large
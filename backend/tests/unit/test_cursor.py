@@ -0,0 +1,32 @@
+"""Tests for signed pagination cursors."""
+import pytest
+
+from app.services.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class TestCursor:
+
+    def test_round_trip(self):
+        key = {'pk': 'JOB_APPS', 'sk': 'APP#abc-123'}
+        assert decode_cursor(encode_cursor(key)) == key
+
+    def test_cursor_is_opaque(self):
+        cursor = encode_cursor({'pk': 'JOB_APPS', 'sk': 'APP#abc-123'})
+        assert 'APP#' not in cursor
+
+    def test_tampered_payload_rejected(self):
+        payload, signature = encode_cursor({'sk': 'APP#a'}).split('.')
+        forged, _ = encode_cursor({'sk': 'APP#b'}).split('.')
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(f'{forged}.{signature}')
+
+    def test_garbage_rejected(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor('garbage')
+
+    def test_wrong_secret_rejected(self, monkeypatch):
+        from app.config import settings
+        cursor = encode_cursor({'sk': 'APP#a'})
+        monkeypatch.setattr(settings, 'cursor_secret', 'another-secret')
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
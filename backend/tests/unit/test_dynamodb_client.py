@@ -0,0 +1,41 @@
+"""Tests for the pooled DynamoDB resource and table handle."""
+import pytest
+
+from app.config import settings
+from app.db import dynamodb
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    dynamodb.reset_dynamodb()
+    yield
+    dynamodb.reset_dynamodb()
+
+
+class TestPooledResource:
+
+    def test_resource_is_reused(self):
+        first = dynamodb.get_dynamodb_resource()
+        second = dynamodb.get_dynamodb_resource()
+        assert first is second
+
+    def test_table_is_reused(self):
+        first = dynamodb.get_table()
+        second = dynamodb.get_table()
+        assert first is second
+        assert first.name == settings.dynamodb_table
+
+    def test_reset_builds_new_resource(self):
+        first = dynamodb.get_dynamodb_resource()
+        dynamodb.reset_dynamodb()
+        second = dynamodb.get_dynamodb_resource()
+        assert first is not second
+
+    def test_client_config_from_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, 'dynamodb_max_pool_connections', 7)
+        monkeypatch.setattr(settings, 'dynamodb_read_timeout', 1.5)
+        monkeypatch.setattr(settings, 'dynamodb_retry_mode', 'adaptive')
+        config = dynamodb.get_dynamodb_resource().meta.client.meta.config
+        assert config.max_pool_connections == 7
+        assert config.read_timeout == 1.5
+        assert config.retries['mode'] == 'adaptive'
@@ -0,0 +1,170 @@
+"""Tests for response compression and content negotiation."""
+import base64
+import gzip
+import json
+
+import brotli
+import msgpack
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+from mangum import Mangum
+
+from app import encoding
+from app.encoding import CompressionMiddleware, base64_encoded_bodies, preferred_encoding, wants_msgpack
+
+LARGE = json.dumps([{'description': 'python aws backend ' * 10}] * 20).encode()
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get('/large')
+    def large() -> Response:
+        return Response(LARGE, media_type='application/json', headers={'ETag': '"3-abc"'})
+
+    @app.get('/small')
+    def small() -> Response:
+        return Response(b'{"ok":true}', media_type='application/json')
+
+    @app.get('/binary')
+    def binary() -> Response:
+        return Response(b'\x00' * 4096, media_type='image/png')
+
+    @app.get('/stream')
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b'{"n":1}\n' * 200, b'{"n":2}\n' * 200]), media_type='application/x-ndjson')
+
+    @app.get('/not-modified')
+    def not_modified() -> Response:
+        return Response(status_code=304, headers={'ETag': '"3-abc"'})
+
+    return TestClient(app)
+
+
+class TestNegotiation:
+
+    @pytest.mark.parametrize('header, expected', [
+        ('gzip, deflate, br', 'br'),
+        ('gzip', 'gzip'),
+        ('br;q=0.5, gzip', 'gzip'),
+        ('*', 'br'),
+        ('gzip;q=0, identity', None),
+        ('', None),
+    ])
+    def test_preferred_encoding(self, header, expected):
+        assert preferred_encoding(header) == expected
+
+    def test_gzip_only_without_brotli(self, monkeypatch):
+        monkeypatch.setattr(encoding, '_brotli', lambda: None)
+        assert preferred_encoding('br, gzip') == 'gzip'
+        assert preferred_encoding('br') is None
+
+    @pytest.mark.parametrize('header, expected', [
+        ('application/msgpack', True),
+        ('application/x-msgpack', True),
+        ('application/json, application/msgpack', False),
+        ('application/json;q=0.5, application/msgpack', True),
+        ('*/*', False),
+        (None, False),
+    ])
+    def test_wants_msgpack(self, header, expected):
+        assert wants_msgpack(header) is expected
+
+    def test_json_only_without_msgpack(self, monkeypatch):
+        monkeypatch.setattr(encoding, '_msgpack', lambda: None)
+        assert wants_msgpack('application/msgpack') is False
+
+
+class TestCompressionMiddleware:
+
+    def test_gzip(self):
+        response = _client().get('/large', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.headers['vary'] == 'Accept-Encoding'
+        assert response.headers['etag'] == 'W/"3-abc"'
+        assert int(response.headers['content-length']) < len(LARGE)
+        assert response.content == LARGE
+
+    def test_brotli(self):
+        response = _client().get('/large', headers={'Accept-Encoding': 'br'})
+        assert response.headers['content-encoding'] == 'br'
+        assert response.content == LARGE
+
+    def test_below_threshold_is_not_compressed(self):
+        response = _client().get('/small', headers={'Accept-Encoding': 'gzip'})
+        assert 'content-encoding' not in response.headers
+        assert response.headers['vary'] == 'Accept-Encoding'
+
+    def test_identity(self):
+        response = _client().get('/large', headers={'Accept-Encoding': 'identity'})
+        assert 'content-encoding' not in response.headers
+        assert response.headers['etag'] == '"3-abc"'
+
+    def test_other_content_types_are_not_compressed(self):
+        response = _client().get('/binary', headers={'Accept-Encoding': 'gzip'})
+        assert 'content-encoding' not in response.headers
+        assert 'vary' not in response.headers
+
+    def test_not_modified_is_untouched(self):
+        response = _client().get('/not-modified', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 304
+        assert response.headers['etag'] == '"3-abc"'
+
+    def test_streamed_response(self):
+        response = _client().get('/stream', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['content-encoding'] == 'gzip'
+        assert 'content-length' not in response.headers
+        assert response.text == '{"n":1}\n' * 200 + '{"n":2}\n' * 200
+
+
+class TestLambdaBodies:
+
+    def _handler(self, response):
+        return base64_encoded_bodies(lambda event, context: response)
+
+    def test_encoded_text_body_is_base64_encoded(self):
+        raw = brotli.compress(b'{"ok":true}')
+        body = raw.decode('latin-1')  # stands in for a body that happened to decode
+        response = self._handler({
+            'statusCode': 200,
+            'headers': {'content-type': 'application/json', 'content-encoding': 'br'},
+            'body': body,
+            'isBase64Encoded': False,
+        })(None, None)
+        assert response['isBase64Encoded'] is True
+        assert base64.b64decode(response['body']) == body.encode()
+
+    def test_already_encoded_and_plain_bodies_are_kept(self):
+        encoded = {'headers': {'content-encoding': 'gzip'}, 'body': 'H4sI', 'isBase64Encoded': True}
+        plain = {'headers': {'content-type': 'application/json'}, 'body': '{}', 'isBase64Encoded': False}
+        assert self._handler(dict(encoded))(None, None) == encoded
+        assert self._handler(dict(plain))(None, None) == plain
+
+    @pytest.mark.parametrize('coding, decompress', [('gzip', gzip.decompress), ('br', brotli.decompress)])
+    def test_mangum_round_trip(self, coding, decompress):
+        handler = base64_encoded_bodies(Mangum(_client().app, lifespan='off'))
+        event = {
+            'version': '2.0',
+            'routeKey': '$default',
+            'rawPath': '/large',
+            'rawQueryString': '',
+            'headers': {'accept-encoding': coding, 'host': 'example.com'},
+            'requestContext': {
+                'http': {'method': 'GET', 'path': '/large', 'protocol': 'HTTP/1.1', 'sourceIp': '127.0.0.1'},
+                'stage': '$default',
+            },
+            'isBase64Encoded': False,
+        }
+        response = handler(event, None)
+        assert response['headers']['content-encoding'] == coding
+        assert response['isBase64Encoded'] is True
+        assert decompress(base64.b64decode(response['body'])) == LARGE
+
+
+class TestMsgpack:
+
+    def test_packb(self):
+        assert msgpack.unpackb(encoding.packb({'a': [1, 'x']})) == {'a': [1, 'x']}
@@ -0,0 +1,96 @@
+"""Tests for per-request instrumentation."""
+import json
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.instrumentation import (
+    InstrumentationMiddleware,
+    MetricsRegistry,
+    RequestMetrics,
+    _current,
+    current_metrics,
+    registry,
+    timed,
+)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(InstrumentationMiddleware, record_metrics=True)
+
+    @timed('serialization')
+    def render(size: int) -> str:
+        return 'x' * size
+
+    @app.get('/items/{item_id}')
+    def get_item(item_id: str) -> dict:
+        current_metrics().add_call('GetItem', 0.002, {'CapacityUnits': 0.5})
+        return {'id': item_id, 'body': render(100)}
+
+    return app
+
+
+class TestRequestMetrics:
+
+    def test_capacity_split_by_operation(self):
+        metrics = RequestMetrics()
+        metrics.add_call('Query', 0.01, {'CapacityUnits': 2.5})
+        metrics.add_call('TransactWriteItems', 0.02, [{'CapacityUnits': 2}, {'CapacityUnits': 1}])
+        metrics.add_call('GetItem', 0.01, None)
+        assert metrics.read_units == 2.5
+        assert metrics.write_units == 3
+        assert sum(metrics.dynamodb_calls.values()) == 3
+        assert metrics.server_timing().startswith('dynamodb;dur=40.0;desc="3 calls, 2.5 RCU, 3 WCU"')
+
+    def test_timed_without_request_is_a_no_op(self):
+        assert timed('validation')(lambda: 42)() == 42
+
+    def test_timed_adds_phase(self):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            timed('validation')(lambda: None)()
+        finally:
+            _current.reset(token)
+        assert metrics.phases['validation'] > 0
+
+
+class TestMiddleware:
+
+    def test_server_timing_log_and_registry(self, caplog):
+        registry.reset()
+        with caplog.at_level(logging.INFO, logger='resumetry.requests'):
+            response = TestClient(_app()).get('/items/a1')
+        assert 'dynamodb;dur=2.0;desc="1 calls, 0.5 RCU, 0 WCU"' in response.headers['server-timing']
+        line = json.loads(caplog.records[-1].getMessage())
+        assert line['route'] == '/items/{item_id}'
+        assert line['dynamodb_calls'] == {'GetItem': 1}
+        assert 'serialization_ms' in line
+        assert line['response_bytes'] == len(response.content)
+
+        text = registry.render()
+        assert 'resumetry_requests_total{method="GET",route="/items/{item_id}",status="200"} 1' in text
+        assert 'resumetry_dynamodb_calls_total{operation="GetItem"} 1' in text
+        assert 'resumetry_dynamodb_read_capacity_units_total 0.5' in text
+        registry.reset()
+
+    def test_unmatched_route_label(self, caplog):
+        with caplog.at_level(logging.INFO, logger='resumetry.requests'):
+            assert TestClient(_app()).get('/nope').status_code == 404
+        assert json.loads(caplog.records[-1].getMessage())['route'] == 'unmatched'
+
+
+class TestRegistry:
+
+    def test_histogram_is_cumulative(self):
+        metrics = MetricsRegistry()
+        for seconds in (0.004, 0.03, 20.0):
+            metrics.observe('GET', '/r', 200, seconds, RequestMetrics())
+        text = metrics.render()
+        assert 'resumetry_request_duration_seconds_bucket{route="/r",le="0.005"} 1' in text
+        assert 'resumetry_request_duration_seconds_bucket{route="/r",le="0.05"} 2' in text
+        assert 'resumetry_request_duration_seconds_bucket{route="/r",le="10.0"} 2' in text
+        assert 'resumetry_request_duration_seconds_bucket{route="/r",le="+Inf"} 3' in text
+        assert 'resumetry_request_duration_seconds_count{route="/r"} 3' in text
@@ -0,0 +1,121 @@
+"""Tests for the status flow reports."""
+from app.models.reports import ApplicationReports
+from app.services import reports
+
+
+def _item(*statuses: tuple[str, str]) -> dict:
+    return {'status': [{'occur_date': d, 'status': s} for d, s in statuses]}
+
+
+def _columns(*items: dict) -> reports.StatusColumns:
+    return reports.StatusColumns.from_items(items)
+
+
+def _links(report) -> dict[tuple[str, str], int]:
+    return {(link.source, link.target): link.value for link in report.links}
+
+
+class TestStatusColumns:
+
+    def test_entries_in_date_order(self):
+        columns = _columns(
+            _item(('2025-03-10', 'INTERVIEW'), ('2025-03-01', 'APPLIED')),
+            _item(),
+            _item(('2025-03-02', 'APPLIED')),
+        )
+        assert columns.applications == 3
+        assert list(columns.owners) == [0, 0, 2]
+        assert [reports.STATUSES[code].value for code in columns.codes] == ['APPLIED', 'INTERVIEW', 'APPLIED']
+        assert columns.days[1] - columns.days[0] == 9
+
+    def test_histories_group_identical_applications(self):
+        columns = _columns(*[_item(('2025-03-01', 'APPLIED'), ('2025-03-05', 'SCREEN'))] * 3, _item())
+        assert list(columns.histories().values()) == [3]
+
+
+class TestSankey:
+
+    def test_flows(self):
+        report = reports.sankey(_columns(
+            _item(('2025-03-01', 'APPLIED')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-04', 'REJECTED')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-04', 'SCREEN'), ('2025-03-09', 'OFFER')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-04', 'INTERVIEW'), ('2025-03-20', 'NOOFFER')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-04', 'SCREEN'), ('2025-03-06', 'REJECTED')),
+        ))
+        assert report.total == 5
+        assert _links(report) == {
+            ('APPLIED', 'NO RESPONSE'): 1,
+            ('APPLIED', 'RESPONDED'): 4,
+            ('RESPONDED', 'REJECTED'): 2,
+            ('RESPONDED', 'INTERVIEW'): 2,
+            ('INTERVIEW', 'OFFER'): 1,
+            ('INTERVIEW', 'NOOFFER'): 1,
+        }
+        assert [link.value for link in report.links] == sorted((link.value for link in report.links), reverse=True)
+        nodes = {node.status: node.value for node in report.nodes}
+        assert nodes['APPLIED'] == 5
+        assert nodes['RESPONDED'] == 4
+
+    def test_applications_without_status_are_skipped(self):
+        report = reports.sankey(_columns(_item()))
+        assert report.total == 1
+        assert report.links == []
+
+
+class TestFunnel:
+
+    def test_stages(self):
+        report = reports.funnel(_columns(
+            _item(('2025-03-01', 'APPLIED')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-04', 'SCREEN')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-04', 'INTERVIEW'), ('2025-03-09', 'OFFER')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-02', 'REJECTED')),
+        ))
+        assert [(stage.status.value, stage.reached) for stage in report.stages] == [
+            ('APPLIED', 4), ('SCREEN', 2), ('INTERVIEW', 1), ('OFFER', 1),
+        ]
+        assert report.stages[0].conversion_rate is None
+        assert report.stages[1].conversion_rate == 0.5
+
+    def test_time_in_stage(self):
+        report = reports.funnel(_columns(
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-04', 'SCREEN'), ('2025-03-14', 'INTERVIEW')),
+            _item(('2025-03-01', 'APPLIED'), ('2025-03-08', 'REJECTED')),
+            _item(('2025-03-01', 'APPLIED')),
+        ))
+        durations = {stage.status.value: stage for stage in report.time_in_stage}
+        assert set(durations) == {'APPLIED', 'SCREEN'}
+        assert durations['APPLIED'].count == 2
+        assert durations['APPLIED'].average_days == 5.0
+        assert durations['APPLIED'].median_days == 5
+        assert durations['APPLIED'].p90_days == 7
+        assert durations['SCREEN'].average_days == 10.0
+
+    def test_empty(self):
+        report = reports.funnel(_columns())
+        assert report.total == 0
+        assert [stage.reached for stage in report.stages] == [0, 0, 0, 0]
+        assert report.time_in_stage == []
+
+
+class TestCache:
+
+    def _reports(self) -> ApplicationReports:
+        return reports.build(_columns())
+
+    def test_keyed_by_data_version(self):
+        reports.reset()
+        computed = self._reports()
+        reports.store(3, computed)
+        assert reports.cached(3) is computed
+        assert reports.cached(4) is None
+        reports.reset()
+
+    def test_older_version_does_not_replace_newer(self):
+        reports.reset()
+        newer = self._reports()
+        reports.store(5, newer)
+        reports.store(4, self._reports())
+        assert reports.cached(5) is newer
+        reports.reset()
@@ -0,0 +1,95 @@
+"""Tests for the search tokenizer, index diffs and BM25 ranking."""
+from app.services import search
+
+
+def _item(**fields) -> dict:
+    return {'company': 'Acme', 'role': 'Dev', **fields}
+
+
+def _puts(requests: list[dict]) -> dict[str, dict]:
+    return {
+        request['PutRequest']['Item']['pk']: request['PutRequest']['Item']
+        for request in requests if 'PutRequest' in request
+    }
+
+
+class TestTokenize:
+
+    def test_lowercases_and_drops_stopwords(self):
+        assert search.tokenize('The Python and Go role at ACME') == ['python', 'go', 'role', 'acme']
+
+    def test_unicode_words(self):
+        assert search.tokenize('Zürich café, C++') == ['zürich', 'café']
+
+    def test_document_terms_include_notes(self):
+        terms = search.document_terms(_item(description='Python python', notes=[{'description': 'Python call'}]))
+        assert terms['python'] == 3
+        assert terms['call'] == 1
+
+
+class TestIndexWrites:
+
+    def test_new_document(self):
+        requests, document, corpus = search.index_writes('a1', None, _item(version=3))
+        puts = _puts(requests)
+        assert puts['TERM#acme'] == {'pk': 'TERM#acme', 'sk': 'a1', 'tf': 1, 'dl': 2}
+        assert document['PutRequest']['Item'] == {
+            'pk': 'SEARCH', 'sk': 'DOC#a1', 'terms': {'acme': 1, 'dev': 1}, 'length': 2, 'version': 3,
+        }
+        assert corpus == {'docs': 1, 'length': 2}
+
+    def test_unchanged_document_writes_nothing(self):
+        _, document, _ = search.index_writes('a1', None, _item())
+        assert search.index_writes('a1', document['PutRequest']['Item'], _item()) == ([], None, {})
+
+    def test_changed_term_rewrites_postings(self):
+        _, document, _ = search.index_writes('a1', None, _item())
+        requests, document, corpus = search.index_writes('a1', document['PutRequest']['Item'], _item(company='Globex'))
+        assert {'DeleteRequest': {'Key': {'pk': 'TERM#acme', 'sk': 'a1'}}} in requests
+        assert set(_puts(requests)) == {'TERM#globex'}
+        assert document['PutRequest']['Item']['terms'] == {'globex': 1, 'dev': 1}
+        assert corpus == {}
+
+    def test_removal(self):
+        _, document, _ = search.index_writes('a1', None, _item())
+        requests, document, corpus = search.index_writes('a1', document['PutRequest']['Item'], None)
+        assert all('DeleteRequest' in request for request in requests)
+        assert len(requests) == 2
+        assert document == {'DeleteRequest': {'Key': search.doc_key('a1')}}
+        assert corpus == {'docs': -1, 'length': -2}
+
+
+class TestCorpus:
+
+    def test_totals_sum_the_shards(self):
+        items = [{**search.corpus_key('SEARCH'), 'docs': 2, 'length': 9}, {**search.corpus_key('SEARCH#1'), 'docs': 1}]
+        assert search.corpus_totals(items) == {'docs': 3, 'length': 9}
+
+    def test_update_adds_to_the_partition(self):
+        update = search.corpus_update({'docs': 1}, 'SEARCH#2')
+        assert update['Key'] == {'pk': 'SEARCH#2', 'sk': 'CORPUS'}
+        assert update['UpdateExpression'] == 'ADD #c0 :c0'
+
+
+class TestRank:
+
+    def test_rarer_term_and_shorter_document_rank_higher(self):
+        postings = {
+            'python': [{'sk': 'a', 'tf': 1, 'dl': 10}, {'sk': 'b', 'tf': 1, 'dl': 100}],
+            'rust': [{'sk': 'b', 'tf': 1, 'dl': 100}],
+        }
+        best, total = search.rank(postings, {'docs': 10, 'length': 500}, 10)
+        assert total == 2
+        assert [app_id for app_id, _ in best] == ['b', 'a']
+        only_python, _ = search.rank({'python': postings['python']}, {'docs': 10, 'length': 500}, 10)
+        assert [app_id for app_id, _ in only_python] == ['a', 'b']
+
+    def test_limit(self):
+        postings = {'go': [{'sk': str(i), 'tf': 1, 'dl': 5} for i in range(5)]}
+        best, total = search.rank(postings, {'docs': 5, 'length': 25}, 2)
+        assert len(best) == 2
+        assert total == 5
+
+    def test_stale_corpus_counts(self):
+        best, _ = search.rank({'go': [{'sk': 'a', 'tf': 1, 'dl': 5}]}, {}, 5)
+        assert best[0][1] > 0
@@ -0,0 +1,68 @@
+"""Tests for the DynamoDB value serializer."""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+
+from app.db.serialization import model_to_dynamo, to_dynamo
+from app.models.base import BaseSchema
+from app.models.enums import ApplicationStatus
+from app.models.job_application import ApplicationNote, JobApplicationCreate, JobApplicationUpdate
+
+
+class Scored(BaseSchema):
+    name: str
+    score: float
+    seen: Optional[datetime] = None
+    tags: list[str] = []
+
+
+class TestToDynamo:
+
+    def test_float_to_decimal(self):
+        assert to_dynamo(0.1) == Decimal('0.1')
+        assert to_dynamo({'a': [1.5]}) == {'a': [Decimal('1.5')]}
+
+    def test_bool_and_int_unchanged(self):
+        assert to_dynamo(True) is True
+        assert to_dynamo(3) == 3
+
+    def test_enum_and_dates(self):
+        assert to_dynamo(ApplicationStatus.OFFER) == 'OFFER'
+        assert to_dynamo(date(2025, 3, 1)) == '2025-03-01'
+        assert to_dynamo(datetime(2025, 3, 1, 10, 30)) == '2025-03-01T10:30:00'
+
+    def test_none_dropped_from_maps_only(self):
+        assert to_dynamo({'a': None, 'b': [None, 1]}) == {'b': [None, 1]}
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError):
+            to_dynamo(object())
+
+
+class TestModelToDynamo:
+
+    def test_matches_model_dump_conversion(self):
+        data = JobApplicationCreate(
+            company='Acme', role='Dev', applied_date=date(2025, 3, 1),
+            notes=[ApplicationNote(occur_date=date(2025, 3, 2), description='Call')],
+        )
+        item = model_to_dynamo(data)
+        assert item['applied_date'] == '2025-03-01'
+        assert item['notes'] == [{'occur_date': '2025-03-02', 'description': 'Call'}]
+        assert item['company'] == 'Acme'
+        assert set(item) == set(data.model_dump())
+
+    def test_exclude_unset(self):
+        assert model_to_dynamo(JobApplicationUpdate(company='NewCo'), exclude_unset=True) == {'company': 'NewCo'}
+
+    def test_explicit_none_dropped(self):
+        assert model_to_dynamo(JobApplicationUpdate(company=None), exclude_unset=True) == {}
+
+    def test_output_is_storable(self):
+        item = model_to_dynamo(Scored(name='a', score=0.25, seen=datetime(2025, 1, 1), tags=['x']))
+        assert item == {'name': 'a', 'score': Decimal('0.25'), 'seen': '2025-01-01T00:00:00', 'tags': ['x']}
+        serializer = TypeSerializer()
+        assert serializer.serialize(item)['M']['score'] == {'N': '0.25'}
@@ -1,15 +1,31 @@
 """Tests for service layer helper functions."""
 import pytest
+import time
 from datetime import date, datetime
 from decimal import Decimal
+from uuid import UUID
 
+from app.config import settings
 from app.models.enums import ApplicationStatus
 from app.services.job_application_service import (
     _serialize_for_dynamo,
     _deserialize_from_dynamo,
     _build_update_expression,
+    _current_status,
+    _index_attributes,
+    _shard_of,
+    to_response,
+    to_responses,
+    _assembled,
+    _history_items,
+    history_writes,
+    with_child_writes,
+    _new_id,
+    uuid7,
     SK_PREFIX,
+    TRANSACT_ITEMS_LIMIT,
 )
+from app.models.job_application import JobApplicationResponse
 
 
 class TestSerializeForDynamo:
@@ -161,3 +177,154 @@ class TestBuildUpdateExpression:
         assert ':val0' in values
         assert ':val1' in values
         assert ':val2' in values
+
+
+class TestIndexAttributes:
+
+    def test_current_status_is_latest_by_date(self):
+        status = [
+            {'occur_date': '2025-01-05', 'status': 'INTERVIEW'},
+            {'occur_date': '2025-01-01', 'status': 'APPLIED'},
+        ]
+        assert _current_status(status) == 'INTERVIEW'
+
+    def test_current_status_ties_use_last_entry(self):
+        status = [
+            {'occur_date': '2025-01-01', 'status': 'APPLIED'},
+            {'occur_date': '2025-01-01', 'status': 'REJECTED'},
+        ]
+        assert _current_status(status) == 'REJECTED'
+
+    def test_current_status_defaults_to_applied(self):
+        assert _current_status([]) == 'APPLIED'
+
+    def test_top_job_false_removes_key(self):
+        values, remove = _index_attributes('abc', {'top_job': False, 'company': ' Acme '})
+        assert values == {'company_key': 'acme'}
+        assert remove == ['top_job_key']
+
+    def test_index_keys_carry_the_shard(self, monkeypatch):
+        monkeypatch.setattr(settings, 'shard_count', 4)
+        shard = _shard_of('abc', 4)
+        values, _ = _index_attributes('abc', {'top_job': True, 'company': 'Acme', 'status': []})
+        assert values['company_key'] == f'acme#{shard}'
+        assert values['top_job_key'] == f'TOP#{shard}'
+        assert values['current_status'] == f'APPLIED#{shard}'
+
+    def test_remove_clause(self):
+        expr, names, _ = _build_update_expression({'a': 1}, ['top_job_key'])
+        assert expr == 'SET #attr0 = :val0 REMOVE #rm0'
+        assert names['#rm0'] == 'top_job_key'
+
+
+class TestTrustedResponse:
+
+    ITEM = {
+        'pk': 'JOB_APPS', 'sk': f'{SK_PREFIX}abc', 'company': 'Acme', 'role': 'Dev',
+        'top_job': True, 'applied_date': '2025-03-01',
+        'status': [{'occur_date': '2025-03-02', 'status': 'SCREEN'}],
+        'notes': [{'occur_date': '2025-03-03', 'description': 'Call'}],
+        'current_status': 'SCREEN', 'note_count': Decimal('1'), 'version': Decimal('3'),
+        'updated_at': '2025-03-03T10:00:00',
+    }
+
+    def test_matches_validated_model(self):
+        validated = JobApplicationResponse(**_deserialize_from_dynamo(self.ITEM))
+        trusted = to_response(self.ITEM)
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_dump_json(by_alias=True) == validated.model_dump_json(by_alias=True)
+        assert trusted.item_version == 3
+
+    @pytest.mark.parametrize('drop, extra, expected', [
+        ((), {}, 1),
+        (('note_count',), {}, 1),
+        (('notes',), {'note_count': Decimal('4')}, 4),
+        (('notes', 'note_count'), {}, 0),
+    ])
+    def test_note_count_matches_validated_path(self, drop, extra, expected):
+        item = {**{key: value for key, value in self.ITEM.items() if key not in drop}, **extra}
+        [trusted] = to_responses([item])
+        validated = JobApplicationResponse(**_deserialize_from_dynamo(item))
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.note_count == expected
+
+    def test_missing_optional_fields_get_defaults(self):
+        item = {'sk': f'{SK_PREFIX}abc', 'company': 'Acme', 'role': 'Dev', 'applied_date': '2025-03-01'}
+        app = to_response(item)
+        assert app.salary == ''
+        assert app.notes == []
+
+    def test_unexpected_shape_is_validated(self):
+        item = {'sk': f'{SK_PREFIX}abc', 'company': 'Acme', 'role': 'Dev'}
+        with pytest.raises(ValueError):
+            to_response(item)
+
+
+class TestHistoryItems:
+
+    STATUS = [
+        {'occur_date': '2025-03-05', 'status': 'SCREEN'},
+        {'occur_date': '2025-03-01', 'status': 'APPLIED'},
+        {'occur_date': '2025-03-05', 'status': 'INTERVIEW'},
+    ]
+
+    def _collection(self, **fields):
+        parent = {'pk': 'JOB_APPS', 'sk': f'{SK_PREFIX}abc', 'company': 'Acme'}
+        return [parent, *sorted(_history_items('abc', fields), key=lambda item: item['sk'])]
+
+    def test_children_sort_by_date_then_write_order(self):
+        [item] = _assembled(self._collection(status=self.STATUS))
+        assert [entry['status'] for entry in item['status']] == ['APPLIED', 'SCREEN', 'INTERVIEW']
+        assert item['notes'] == []
+
+    def test_collections_are_grouped_and_orphans_skipped(self):
+        orphan = {'pk': 'JOB_APPS', 'sk': f'{SK_PREFIX}aaa#NOTE#2025-01-01#1', 'occur_date': '2025-01-01',
+                  'description': 'Left behind'}
+        other = {'pk': 'JOB_APPS', 'sk': f'{SK_PREFIX}xyz', 'company': 'Globex'}
+        items = list(_assembled([orphan, *self._collection(notes=[{'occur_date': '2025-03-02', 'description': 'Call'}]),
+                                 other]))
+        assert [item['company'] for item in items] == ['Acme', 'Globex']
+        assert items[0]['notes'] == [{'occur_date': '2025-03-02', 'description': 'Call'}]
+
+    def test_inline_entries_come_first(self):
+        collection = self._collection(notes=[{'occur_date': '2025-03-01', 'description': 'Child'}])
+        collection[0]['notes'] = [{'occur_date': '2025-03-09', 'description': 'Inline'}]
+        [item] = _assembled(collection)
+        assert [note['description'] for note in item['notes']] == ['Inline', 'Child']
+
+    def test_appending_only_writes_new_entries(self):
+        collection = self._collection(status=self.STATUS[:1])
+        new = {'occur_date': '2025-03-09', 'status': 'OFFER'}
+        writes = history_writes('abc', collection, {'status': [self.STATUS[0], new]})
+        assert [list(write) for write in writes] == [['PutRequest']]
+        assert writes[0]['PutRequest']['Item']['status'] == 'OFFER'
+
+    def test_replacing_deletes_stored_entries(self):
+        collection = self._collection(status=self.STATUS)
+        writes = history_writes('abc', collection, {'status': [self.STATUS[1]]})
+        assert [list(write)[0] for write in writes] == ['DeleteRequest'] * 3 + ['PutRequest']
+
+    def test_transaction_overflow(self):
+        requests = [{'PutRequest': {'Item': {'sk': str(i)}}} for i in range(TRANSACT_ITEMS_LIMIT)]
+        transaction, overflow = with_child_writes([{'Put': {}}] * 3, requests)
+        assert len(transaction) == TRANSACT_ITEMS_LIMIT
+        assert overflow == requests[-3:]
+
+
+class TestNewId:
+
+    def test_ids_are_version_7_uuids(self):
+        value = UUID(_new_id())
+        assert value.version == 7
+        assert value.variant == 'specified in RFC 4122'
+
+    def test_ids_start_with_the_creation_time(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_ids_sort_in_creation_order(self):
+        first = _new_id()
+        time.sleep(0.002)
+        assert _new_id() > first
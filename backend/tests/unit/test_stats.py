@@ -0,0 +1,89 @@
+"""Tests for the statistics counter arithmetic."""
+from app.services import stats
+
+
+def _item(applied: str, *statuses: tuple[str, str]) -> dict:
+    return {
+        'applied_date': applied,
+        'status': [{'occur_date': d, 'status': s} for d, s in statuses],
+        'current_status': statuses[-1][1] if statuses else 'APPLIED',
+    }
+
+
+class TestContribution:
+
+    def test_applied_only(self):
+        assert stats.contribution(_item('2025-03-03', ('2025-03-03', 'APPLIED'))) == {
+            'TOTALS': {'total': 1, 'status_APPLIED': 1},
+            'WEEK#2025-W10': {'applied': 1},
+        }
+
+    def test_rejection_counts_as_response_not_screen(self):
+        totals = stats.contribution(_item('2025-03-03', ('2025-03-05', 'REJECTED')))['TOTALS']
+        assert totals['responded'] == 1
+        assert 'screened' not in totals
+
+    def test_days_to_first_screen(self):
+        item = _item('2025-03-03', ('2025-03-10', 'INTERVIEW'), ('2025-03-06', 'SCREEN'))
+        assert stats.contribution(item)['TOTALS']['screen_days'] == 3
+
+    def test_missing_item(self):
+        assert stats.contribution(None) == {}
+
+    def test_week_crosses_year(self):
+        assert stats.week_of('2024-12-30') == '2025-W01'
+
+
+class TestDelta:
+
+    def test_unchanged_item_has_no_delta(self):
+        item = _item('2025-03-03', ('2025-03-03', 'APPLIED'))
+        assert stats.delta(item, dict(item)) == {}
+
+    def test_status_change(self):
+        old = _item('2025-03-03', ('2025-03-03', 'APPLIED'))
+        new = _item('2025-03-03', ('2025-03-03', 'APPLIED'), ('2025-03-04', 'SCREEN'))
+        assert stats.delta(old, new) == {
+            'TOTALS': {'status_APPLIED': -1, 'status_SCREEN': 1, 'responded': 1, 'screened': 1, 'screen_days': 1},
+        }
+
+    def test_delete(self):
+        item = _item('2025-03-03', ('2025-03-03', 'APPLIED'))
+        assert stats.delta(item, None)['WEEK#2025-W10'] == {'applied': -1}
+
+
+class TestSummarize:
+
+    def test_rates_and_weeks(self):
+        result = stats.summarize([
+            {'sk': 'WEEK#2025-W11', 'applied': 1},
+            {'sk': 'TOTALS', 'total': 4, 'status_APPLIED': 3, 'status_SCREEN': 1,
+             'responded': 1, 'screened': 1, 'screen_days': 5},
+            {'sk': 'WEEK#2025-W10', 'applied': 3},
+            {'sk': 'WEEK#2025-W09', 'applied': 0},
+        ])
+        assert result.total == 4
+        assert result.by_status['SCREEN'] == 1
+        assert result.by_status['OFFER'] == 0
+        assert [w.week for w in result.per_week] == ['2025-W10', '2025-W11']
+        assert result.response_rate == 0.25
+        assert result.average_days_to_screen == 5
+
+    def test_adds_up_shards(self):
+        result = stats.summarize([
+            {'pk': 'STATS', 'sk': 'TOTALS', 'total': 2, 'status_APPLIED': 2},
+            {'pk': 'STATS#1', 'sk': 'TOTALS', 'total': 1, 'status_APPLIED': -1, 'status_SCREEN': 2},
+            {'pk': 'STATS#0', 'sk': 'WEEK#2025-W10', 'applied': 2},
+            {'pk': 'STATS#1', 'sk': 'WEEK#2025-W10', 'applied': 1},
+        ])
+        assert result.total == 3
+        assert result.by_status['APPLIED'] == 1 and result.by_status['SCREEN'] == 2
+        assert [(w.week, w.applied) for w in result.per_week] == [('2025-W10', 3)]
+
+    def test_counter_updates(self):
+        [update] = stats.counter_updates({'TOTALS': {'total': 1, 'status_APPLIED': -1}})
+        assert update['Key'] == {'pk': 'STATS', 'sk': 'TOTALS'}
+        assert update['UpdateExpression'] == 'ADD #c0 :c0, #c1 :c1'
+        assert update['ExpressionAttributeValues'] == {':c0': 1, ':c1': -1}
+        [update] = stats.counter_updates({'TOTALS': {'total': 1}}, 'STATS#3')
+        assert update['Key'] == {'pk': 'STATS#3', 'sk': 'TOTALS'}
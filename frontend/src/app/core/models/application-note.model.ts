@@ -2,3 +2,8 @@ export interface ApplicationNote {
   occurDate: string;  // ISO date string
   description: string;
 }
+
+export interface ApplicationNotePage {
+  items: ApplicationNote[];
+  nextCursor: string | null;
+}
@@ -16,6 +16,7 @@ export interface JobApplication {
   recruiterCompany: string;
   appliedDate: string;
   notes: ApplicationNote[];
+  noteCount: number;  // filled in lists, which leave `notes` empty
 }
 
 export interface JobApplicationCreate {
@@ -48,3 +49,15 @@ export interface JobApplicationUpdate {
   recruiterCompany?: string;
   notes?: ApplicationNote[];
 }
+
+export interface BatchItemResult {
+  index: number;
+  id: string | null;
+  success: boolean;
+  error: string | null;
+  application: JobApplication | null;
+}
+
+export interface BatchResponse {
+  results: BatchItemResult[];
+}
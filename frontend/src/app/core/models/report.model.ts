@@ -0,0 +1,16 @@
+export interface SankeyNode {
+  status: string;
+  value: number;
+}
+
+export interface SankeyLink {
+  source: string;
+  target: string;
+  value: number;
+}
+
+export interface SankeyReport {
+  total: number;
+  nodes: SankeyNode[];
+  links: SankeyLink[];
+}
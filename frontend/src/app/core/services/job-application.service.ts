@@ -1,13 +1,18 @@
 import { Injectable, signal, inject } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
 import { Observable, tap } from 'rxjs';
-import { JobApplication, JobApplicationCreate, JobApplicationUpdate } from '../models/job-application.model';
+import {
+  BatchResponse, JobApplication, JobApplicationCreate, JobApplicationUpdate
+} from '../models/job-application.model';
+import { ApplicationNotePage } from '../models/application-note.model';
 
 @Injectable({
   providedIn: 'root'
 })
 export class JobApplicationService {
   private readonly apiUrl = '/api/v1/applications';
+  // Ids per batch request, the API's batch_max_items
+  readonly batchMaxItems = 1000;
   private readonly http = inject(HttpClient);
 
   // Signal-based cache for applications list
@@ -15,7 +20,8 @@ export class JobApplicationService {
   public readonly applications = this.applicationsSignal.asReadonly();
 
   getApplications(): Observable<JobApplication[]> {
-    return this.http.get<JobApplication[]>(this.apiUrl).pipe(
+    // `all=true` keeps the unpaginated list response until the views move to cursor paging
+    return this.http.get<JobApplication[]>(this.apiUrl, { params: { all: 'true' } }).pipe(
       tap(apps => this.applicationsSignal.set(apps))
     );
   }
@@ -24,6 +30,18 @@ export class JobApplicationService {
     return this.http.get<JobApplication>(`${this.apiUrl}/${id}`);
   }
 
+  // List responses carry the latest status and the note count only; notes come from
+  // their own paged endpoint, or with the full applications from `batchGet`
+  getNotes(id: string, cursor?: string): Observable<ApplicationNotePage> {
+    const params: Record<string, string> = cursor ? { cursor } : {};
+    return this.http.get<ApplicationNotePage>(`${this.apiUrl}/${id}/notes`, { params });
+  }
+
+  // Full applications, notes included, of up to `batchMaxItems` ids in one request
+  batchGet(ids: string[]): Observable<BatchResponse> {
+    return this.http.post<BatchResponse>(`${this.apiUrl}:batchGet`, { ids });
+  }
+
   createApplication(data: JobApplicationCreate): Observable<JobApplication> {
     return this.http.post<JobApplication>(this.apiUrl, data).pipe(
       tap(() => this.refreshCache())
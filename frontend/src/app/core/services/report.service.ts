@@ -0,0 +1,16 @@
+import { Injectable, inject } from '@angular/core';
+import { HttpClient } from '@angular/common/http';
+import { Observable } from 'rxjs';
+import { SankeyReport } from '../models/report.model';
+
+@Injectable({
+  providedIn: 'root'
+})
+export class ReportService {
+  private readonly apiUrl = '/api/v1/reports';
+  private readonly http = inject(HttpClient);
+
+  getSankeyReport(): Observable<SankeyReport> {
+    return this.http.get<SankeyReport>(`${this.apiUrl}/sankey`);
+  }
+}
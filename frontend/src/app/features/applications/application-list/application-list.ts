@@ -22,6 +22,9 @@ export class ApplicationListComponent implements OnInit {
   isLoading = signal(true);
   error = signal<string | null>(null);
 
+  // Notes of the recruiter view by application id, loaded when the view opens
+  recruiterNotes = signal<Record<string, ApplicationNote[]>>({});
+
   // Computed signal for filtered & sorted applications
   displayedApplications = computed(() => {
     let apps = this.service.applications();
@@ -70,6 +73,27 @@ export class ApplicationListComponent implements OnInit {
     this.router.navigate(['/reports/sankey']);
   }
 
+  showRecruiterView(): void {
+    this.viewMode.set('recruiter');
+    // Only applications with notes that aren't loaded yet, in as few batch requests as the API allows
+    const ids = this.recruiterApplications()
+      .filter(app => app.noteCount > 0 && !(app.id in this.recruiterNotes()))
+      .map(app => app.id);
+    const size = this.service.batchMaxItems;
+    for (let start = 0; start < ids.length; start += size) {
+      this.service.batchGet(ids.slice(start, start + size)).subscribe({
+        next: response => this.recruiterNotes.update(notes => {
+          const loaded = { ...notes };
+          for (const result of response.results) {
+            if (result.id && result.application) loaded[result.id] = result.application.notes;
+          }
+          return loaded;
+        }),
+        error: (err) => console.error(err)
+      });
+    }
+  }
+
   onFilterChange(event: Event): void {
     const input = event.target as HTMLInputElement;
     this.filterText.set(input.value);
@@ -1,6 +1,7 @@
 import { Component, inject, OnInit, signal, computed, ElementRef, viewChild, afterNextRender, Injector } from '@angular/core';
 import { Router } from '@angular/router';
-import { JobApplicationService } from '../../../core/services/job-application.service';
+import { ReportService } from '../../../core/services/report.service';
+import { SankeyReport } from '../../../core/models/report.model';
 import { ApplicationStatus } from '../../../core/models/application-status.enum';
 import * as d3 from 'd3';
 import { sankey, sankeyLinkHorizontal, SankeyNode, SankeyLink } from 'd3-sankey';
@@ -32,7 +33,7 @@ type SLink = SankeyLink<NodeExtra, LinkExtra>;
   styleUrl: './sankey-report.css'
 })
 export class SankeyReportComponent implements OnInit {
-  private readonly service = inject(JobApplicationService);
+  private readonly reportService = inject(ReportService);
   private readonly router = inject(Router);
   private readonly injector = inject(Injector);
 
@@ -41,16 +42,7 @@ export class SankeyReportComponent implements OnInit {
   isLoading = signal(true);
   error = signal<string | null>(null);
 
-  private readonly respondedStatuses: ReadonlySet<ApplicationStatus> = new Set([
-    ApplicationStatus.REJECTED,
-    ApplicationStatus.SCREEN,
-    ApplicationStatus.INTERVIEW
-  ]);
-
-  private readonly interviewStatuses: ReadonlySet<ApplicationStatus> = new Set([
-    ApplicationStatus.SCREEN,
-    ApplicationStatus.INTERVIEW
-  ]);
+  private readonly report = signal<SankeyReport | null>(null);
 
   private readonly statusColors: Record<SankeyStatus, string> = {
     [ApplicationStatus.APPLIED]: '#2196f3',
@@ -64,75 +56,30 @@ export class SankeyReportComponent implements OnInit {
     'NO RESPONSE': '#00bcd4'
   };
 
-  transitions = computed<SankeyTransition[]>(() => {
-    const apps = this.service.applications();
-    const transitionMap = new Map<string, SankeyTransition>();
-
-    const appliedNoresponseKey = 'APPLIED->NO RESPONSE';
-    const appliedRespondedKey = 'APPLIED->RESPONDED';
-    const respondedRejectedKey = 'RESPONDED->REJECTED';
-    const respondedInterviewKey = 'RESPONDED->INTERVIEW';
-    const interviewOfferKey = 'INTERVIEW->OFFER';
-    const interviewNoofferKey = 'INTERVIEW->NO OFFER';
-
-    for (const app of apps) {
-      if (app.status.length === 0) continue;
-
-      if (app.status.length === 1) {
-        this.addTransition(appliedNoresponseKey, { from: ApplicationStatus.APPLIED, to: 'NO RESPONSE', count: 1 }, transitionMap);
-        continue;
-      }
-
-      const response = app.status.find(s => this.respondedStatuses.has(s.status));
-      if (response) {
-        this.addTransition(appliedRespondedKey, { from: ApplicationStatus.APPLIED, to: 'RESPONDED', count: 1 }, transitionMap);
-      }
-
-      const rejected = app.status.find(s => s.status === ApplicationStatus.REJECTED);
-      if (rejected) {
-        this.addTransition(respondedRejectedKey, { from: 'RESPONDED', to: ApplicationStatus.REJECTED, count: 1 }, transitionMap);
-        continue;
-      }
-
-      const interview = app.status.find(s => this.interviewStatuses.has(s.status));
-      if (interview) {
-        this.addTransition(respondedInterviewKey, { from: 'RESPONDED', to: ApplicationStatus.INTERVIEW, count: 1 }, transitionMap);
-      }
-
-      const offer = app.status.find(s => s.status === ApplicationStatus.OFFER);
-      if (offer) {
-        this.addTransition(interviewOfferKey, { from: ApplicationStatus.INTERVIEW, to: ApplicationStatus.OFFER, count: 1 }, transitionMap);
-      } else {
-        this.addTransition(interviewNoofferKey, { from: ApplicationStatus.INTERVIEW, to: ApplicationStatus.NOOFFER, count: 1 }, transitionMap);
-      }
-    }
-
-    return Array.from(transitionMap.values()).sort((a, b) => b.count - a.count);
-  });
-
-  private addTransition(key: string, transition: SankeyTransition, map: Map<string, SankeyTransition>): void {
-    const existing = map.get(key);
-    if (existing) {
-      existing.count++;
-    } else {
-      map.set(key, { ...transition });
-    }
-  }
+  // The backend computes the flows (GET /api/v1/reports/sankey), largest first
+  transitions = computed<SankeyTransition[]>(() =>
+    (this.report()?.links ?? []).map(link => ({
+      from: link.source as SankeyStatus,
+      to: link.target as SankeyStatus,
+      count: link.value
+    }))
+  );
 
-  totalApplications = computed(() => this.service.applications().length);
+  totalApplications = computed(() => this.report()?.total ?? 0);
 
   ngOnInit(): void {
     this.isLoading.set(true);
     this.error.set(null);
 
-    this.service.getApplications().subscribe({
-      next: () => {
+    this.reportService.getSankeyReport().subscribe({
+      next: report => {
+        this.report.set(report);
         this.isLoading.set(false);
         // Defer render until Angular has updated the DOM with the chart container
         afterNextRender(() => this.renderChart(), { injector: this.injector });
       },
       error: (err) => {
-        this.error.set('Failed to load applications');
+        this.error.set('Failed to load the report');
         this.isLoading.set(false);
         console.error(err);
       }